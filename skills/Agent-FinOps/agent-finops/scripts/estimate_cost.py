@@ -3,8 +3,10 @@
 import argparse
 import re
 import sys
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import ModuleType
 
 MODEL_PRICING = {
     "gpt-4o": {"input": 2.50, "output": 10.00},
@@ -21,6 +23,8 @@ MODEL_PRICING = {
     "deepseek-r1": {"input": 0.55, "output": 2.19},
 }
 
+DEFAULT_MODELS = ["gpt-4o-mini", "gpt-4o"]
+
 TIER_THRESHOLDS = {
     "lightweight": 1.00,
     "standard": 5.00,
@@ -55,12 +59,7 @@ class CostEstimate:
 
     @property
     def tier(self) -> str:
-        price_per_m = MODEL_PRICING.get(self.model, {}).get("input", 0)
-        if price_per_m <= TIER_THRESHOLDS["lightweight"]:
-            return "lightweight"
-        if price_per_m <= TIER_THRESHOLDS["standard"]:
-            return "standard"
-        return "premium"
+        return model_tier(self.model)
 
 
 @dataclass
@@ -72,6 +71,11 @@ class FinOpsReport:
     has_caching: bool = False
     has_budgets: bool = False
     issues: list[ValidationResult] = field(default_factory=list)
+    skipped_checks: list[str] = field(default_factory=list)
+
+    @property
+    def partial(self) -> bool:
+        return bool(self.skipped_checks)
 
     @property
     def score(self) -> int:
@@ -86,6 +90,15 @@ class FinOpsReport:
         return max(0, min(10, base))
 
 
+def model_tier(model: str) -> str:
+    price_per_m = MODEL_PRICING.get(model, {}).get("input", 0)
+    if price_per_m <= TIER_THRESHOLDS["lightweight"]:
+        return "lightweight"
+    if price_per_m <= TIER_THRESHOLDS["standard"]:
+        return "standard"
+    return "premium"
+
+
 def estimate_tokens(content: str) -> int:
     return len(content) // 4
 
@@ -98,69 +111,155 @@ def detect_models(content: str) -> list[str]:
     return found
 
 
-def validate_file(file_path: Path) -> FinOpsReport:
-    content = file_path.read_text(encoding="utf-8")
+def estimate_call(model: str, input_tokens: int) -> CostEstimate:
+    pricing = MODEL_PRICING.get(model, {"input": 1.0, "output": 3.0})
+    output_estimate = input_tokens // 2
+    cost_per_call = (
+        (input_tokens / 1_000_000) * pricing["input"]
+        + (output_estimate / 1_000_000) * pricing["output"]
+    )
+    return CostEstimate(
+        model=model,
+        input_tokens=input_tokens,
+        output_tokens=output_estimate,
+        cost_per_call=cost_per_call,
+        monthly_cost_1k=cost_per_call * 1_000,
+        monthly_cost_10k=cost_per_call * 10_000,
+    )
+
+
+LINE_RULES: list[tuple[str, str, re.Pattern, str]] = [
+    (code, severity, re.compile(pattern, re.IGNORECASE), message)
+    for code, severity, pattern, message in ANTI_PATTERNS
+]
+
+Content = str | bytes | memoryview
+
+
+def decode_content(content: Content) -> str:
+    text = content if isinstance(content, str) else str(content, "utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def load_scheduler() -> ModuleType:
+    parents = Path(__file__).resolve().parents
+    tools = str(parents[4] / "tools") if len(parents) > 4 else ""
+    if tools and Path(tools, "check_scheduler.py").is_file() and tools not in sys.path:
+        sys.path.append(tools)
+    try:
+        import check_scheduler
+    except ImportError:
+        raise ValueError("--time-budget needs check_scheduler.py, which is not installed next to this script") from None
+    return check_scheduler
+
+
+def build_checks(
+    content: str,
+    report: FinOpsReport,
+    line_rules: list[tuple[str, str, re.Pattern, str]],
+    split_rules: bool = False,
+) -> list[tuple]:
     lines = content.split("\n")
-    report = FinOpsReport(file_path=file_path)
 
-    report.models_detected = detect_models(content)
-    input_tokens = estimate_tokens(content)
-    output_estimate = input_tokens // 2
+    def model_costs() -> None:
+        report.models_detected = detect_models(content)
+        input_tokens = estimate_tokens(content)
 
-    for model in report.models_detected or ["gpt-4o-mini", "gpt-4o"]:
-        pricing = MODEL_PRICING.get(model, {"input": 1.0, "output": 3.0})
-        cost_per_call = (
-            (input_tokens / 1_000_000) * pricing["input"]
-            + (output_estimate / 1_000_000) * pricing["output"]
-        )
-        estimate = CostEstimate(
-            model=model,
-            input_tokens=input_tokens,
-            output_tokens=output_estimate,
-            cost_per_call=cost_per_call,
-            monthly_cost_1k=cost_per_call * 1_000,
-            monthly_cost_10k=cost_per_call * 10_000,
-        )
-        report.estimates.append(estimate)
-
-    report.has_tiering = bool(re.search(
-        r"(?:tier|routing|fallback|cascade)\s*(?:model|strategy|level)",
-        content, re.IGNORECASE,
-    ))
-
-    report.has_caching = bool(re.search(
-        r"(?:cache|memo|deduplic|reuse)",
-        content, re.IGNORECASE,
-    ))
-
-    report.has_budgets = bool(re.search(
-        r"(?:budget|limit|cap|threshold|alert)\s*(?:cost|spend|token|dollar|\$)",
-        content, re.IGNORECASE,
-    ))
-
-    for line_num, line in enumerate(lines, start=1):
-        for code, severity, pattern, message in ANTI_PATTERNS:
-            if re.search(pattern, line, re.IGNORECASE):
-                report.issues.append(ValidationResult(
-                    code=code, severity=severity, line=line_num, message=message,
-                ))
-
-    if not report.has_tiering:
-        report.issues.append(ValidationResult(
-            code="F010", severity="WARNING", line=None,
-            message="No model tiering strategy detected — use lightweight models for simple tasks",
+        for model in report.models_detected or DEFAULT_MODELS:
+            report.estimates.append(estimate_call(model, input_tokens))
+
+    def model_tiering() -> None:
+        report.has_tiering = bool(re.search(
+            r"(?:tier|routing|fallback|cascade)\s*(?:model|strategy|level)",
+            content, re.IGNORECASE,
         ))
 
+        if not report.has_tiering:
+            report.issues.append(ValidationResult(
+                code="F010", severity="WARNING", line=None,
+                message="No model tiering strategy detected — use lightweight models for simple tasks",
+            ))
+
+    def caching() -> None:
+        report.has_caching = bool(re.search(
+            r"(?:cache|memo|deduplic|reuse)",
+            content, re.IGNORECASE,
+        ))
+
+    def cost_budgets() -> None:
+        report.has_budgets = bool(re.search(
+            r"(?:budget|limit|cap|threshold|alert)\s*(?:cost|spend|token|dollar|\$)",
+            content, re.IGNORECASE,
+        ))
+
+    def scan_lines(rules: list[tuple[str, str, re.Pattern, str]]) -> Callable[[], None]:
+        def scan() -> None:
+            for line_num, line in enumerate(lines, start=1):
+                for code, severity, pattern, message in rules:
+                    if pattern.search(line):
+                        report.issues.append(ValidationResult(
+                            code=code, severity=severity, line=line_num, message=message,
+                        ))
+        return scan
+
+    checks = [
+        ("model_costs", "INFO", 0, model_costs, False),
+        ("model_tiering", "WARNING", 1, model_tiering, False),
+        ("caching", "WARNING", 0, caching, False),
+        ("cost_budgets", "WARNING", 0, cost_budgets, False),
+    ]
+    if split_rules:
+        checks.extend((rule[0], rule[1], 0, scan_lines([rule]), True) for rule in line_rules)
+    elif line_rules:
+        checks.append(("line_rules", "WARNING", 0, scan_lines(line_rules), True))
+    return checks
+
+
+def validate_file(file_path: Path, time_budget_ms: float | None = None) -> FinOpsReport:
+    return validate_content(file_path.read_text(encoding="utf-8"), file_path, time_budget_ms=time_budget_ms)
+
+
+def validate_content(
+    content: Content,
+    file_path: Path | str = "<inline>",
+    line_rules: list[tuple[str, str, re.Pattern, str]] = LINE_RULES,
+    time_budget_ms: float | None = None,
+) -> FinOpsReport:
+    content = decode_content(content)
+    report = FinOpsReport(file_path=Path(file_path))
+
+    if time_budget_ms is None:
+        for _, _, _, run, _ in sorted(build_checks(content, report, line_rules), key=lambda check: check[2]):
+            run()
+    else:
+        report.skipped_checks = load_scheduler().run_checks(
+            "estimate_cost",
+            build_checks(content, report, line_rules, split_rules=True),
+            report.issues,
+            content,
+            time_budget_ms,
+            lambda sample: build_checks(sample, FinOpsReport(file_path=Path(file_path)), line_rules, split_rules=True),
+        )
     return report
 
 
+def validate_batch(items: Iterable[tuple[str, Content]]) -> Iterator[FinOpsReport]:
+    for item_id, content in items:
+        yield validate_content(content, item_id)
+
+
 def format_report(report: FinOpsReport) -> str:
     out: list[str] = [f"\n💰 Agent FinOps Cost Estimation: {report.file_path}"]
     out.append(f"   Models detected: {', '.join(report.models_detected) or 'None (using defaults)'}")
     out.append(f"   Model tiering: {'✅' if report.has_tiering else '❌ Missing'}")
     out.append(f"   Caching: {'✅' if report.has_caching else '❌ Missing'}")
     out.append(f"   Cost budgets: {'✅' if report.has_budgets else '❌ Missing'}")
-    out.append(f"   Score: {report.score}/10")
+    score = "not scored (partial run)" if report.partial else f"{report.score}/10"
+    out.append(f"   Score: {score}")
+    if report.partial:
+        out.append(f"   ⏱️  Partial: time budget reached, skipped {', '.join(report.skipped_checks)}")
 
     if report.estimates:
         out.append("\n   Cost Estimates (prompt as system message):")
@@ -192,8 +291,17 @@ def main() -> None:
     )
     parser.add_argument("files", type=Path, nargs="+", help="Agent config/prompt file(s)")
     parser.add_argument("--strict", action="store_true", help="Exit 1 on any warnings")
+    parser.add_argument(
+        "--time-budget", type=float, metavar="MS",
+        help="Run the most valuable checks first and stop after MS milliseconds per file; skipped checks are listed",
+    )
 
     args = parser.parse_args()
+    if args.time_budget is not None:
+        try:
+            load_scheduler()
+        except ValueError as exc:
+            parser.error(str(exc))
     exit_code = 0
 
     for file_path in args.files:
@@ -202,10 +310,10 @@ def main() -> None:
             exit_code = 1
             continue
 
-        report = validate_file(file_path)
+        report = validate_file(file_path, args.time_budget)
         print(format_report(report))
 
-        if args.strict and any(i.severity in ("ERROR", "WARNING") for i in report.issues):
+        if args.strict and (report.partial or any(i.severity in ("ERROR", "WARNING") for i in report.issues)):
             exit_code = 1
 
     sys.exit(exit_code)
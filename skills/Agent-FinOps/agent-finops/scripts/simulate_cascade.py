@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+
+import argparse
+import itertools
+import json
+import math
+import random
+import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from estimate_cost import MODEL_PRICING, TIER_THRESHOLDS, model_tier
+
+TIERS = list(TIER_THRESHOLDS)
+
+DIFFICULTIES = ["easy", "medium", "hard"]
+
+DEFAULT_TIERS = {
+    "lightweight": {
+        "model": "gpt-4o-mini",
+        "first_token_ms": 250,
+        "ms_per_output_token": 6,
+        "escalation": {"easy": 0.10, "medium": 0.40, "hard": 0.80},
+    },
+    "standard": {
+        "model": "gpt-4o",
+        "first_token_ms": 450,
+        "ms_per_output_token": 14,
+        "escalation": {"easy": 0.02, "medium": 0.15, "hard": 0.45},
+    },
+    "premium": {
+        "model": "claude-3-opus",
+        "first_token_ms": 800,
+        "ms_per_output_token": 28,
+        "escalation": {"easy": 0.00, "medium": 0.03, "hard": 0.10},
+    },
+}
+
+SYNTHETIC_MIX = {"easy": 0.6, "medium": 0.3, "hard": 0.1}
+
+SYNTHETIC_TOKENS = {
+    "easy": (800, 150),
+    "medium": (2000, 400),
+    "hard": (4000, 900),
+}
+
+LATENCY_METRICS = ["mean", "p50", "p90", "p95", "p99"]
+
+MAX_GROUPS = 64
+
+
+@dataclass
+class TierSpec:
+    name: str
+    model: str
+    first_token_ms: float
+    ms_per_output_token: float
+    escalation: dict[str, float]
+
+    def cost(self, input_tokens: float, output_tokens: float) -> float:
+        pricing = MODEL_PRICING[self.model]
+        return (input_tokens * pricing["input"] + output_tokens * pricing["output"]) / 1_000_000
+
+    def latency_ms(self, output_tokens: float) -> float:
+        return self.first_token_ms + self.ms_per_output_token * output_tokens
+
+
+@dataclass
+class TaskGroup:
+    difficulty: str
+    weight: float
+    input_tokens: float
+    output_tokens: float
+
+
+@dataclass
+class Workload:
+    groups: list[TaskGroup] = field(default_factory=list)
+    tasks: int = 0
+    mix: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def difficulties(self) -> list[str]:
+        return [d for d in self.mix if self.mix[d]]
+
+
+@dataclass
+class Policy:
+    chain: tuple[str, ...]
+    entry: dict[str, int]
+
+    def route(self, difficulty: str) -> tuple[str, ...]:
+        return self.chain[self.entry.get(difficulty, 0):]
+
+    @property
+    def name(self) -> str:
+        name = ">".join(self.chain)
+        skips = [f"{d}@{self.chain[i]}" for d, i in sorted(self.entry.items()) if i]
+        return f"{name} [{', '.join(skips)}]" if skips else name
+
+
+@dataclass
+class PolicyResult:
+    policy: Policy
+    cost_per_task: float
+    latency: dict[str, float]
+    escalation_rate: float
+    calls_per_task: float
+    unresolved_rate: float
+
+    def metric(self, name: str) -> float:
+        return self.latency[name]
+
+
+@dataclass
+class RouteStats:
+    weight: float = 0.0
+    cost: float = 0.0
+    calls: float = 0.0
+    escalated: float = 0.0
+    unresolved: float = 0.0
+    latencies: list[tuple[float, float]] = field(default_factory=list)
+
+
+def load_tiers(overrides: dict | None = None) -> dict[str, TierSpec]:
+    overrides = overrides or {}
+    unknown = set(overrides) - set(TIERS)
+    if unknown:
+        raise ValueError(f"Unknown tier: {', '.join(sorted(unknown))} (expected one of {', '.join(TIERS)})")
+
+    tiers: dict[str, TierSpec] = {}
+    for name in TIERS:
+        raw = {**DEFAULT_TIERS[name], **overrides.get(name, {})}
+        escalation = {**DEFAULT_TIERS[name]["escalation"], **overrides.get(name, {}).get("escalation", {})}
+        model = raw["model"]
+        if model not in MODEL_PRICING:
+            raise ValueError(f"Tier {name}: unknown model {model}")
+        if model_tier(model) != name:
+            raise ValueError(
+                f"Tier {name}: {model} is priced as {model_tier(model)} "
+                f"(${MODEL_PRICING[model]['input']:.2f}/M input, thresholds {TIER_THRESHOLDS})"
+            )
+        for difficulty, probability in escalation.items():
+            if not 0.0 <= probability <= 1.0:
+                raise ValueError(f"Tier {name}: escalation probability for {difficulty} must be in [0, 1]")
+        tiers[name] = TierSpec(
+            name=name,
+            model=model,
+            first_token_ms=float(raw["first_token_ms"]),
+            ms_per_output_token=float(raw["ms_per_output_token"]),
+            escalation=escalation,
+        )
+    return tiers
+
+
+def read_tasks(path: Path) -> Iterator[tuple[str, int, int, int]]:
+    with path.open(encoding="utf-8") as handle:
+        for line_num, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                yield (
+                    str(record["difficulty"]),
+                    int(record["input_tokens"]),
+                    int(record.get("output_tokens", record["input_tokens"] // 2)),
+                    int(record.get("count", 1)),
+                )
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError) as exc:
+                raise ValueError(f"{path}:{line_num}: invalid task record ({exc})") from exc
+
+
+def synthetic_tasks(count: int, seed: int = 0) -> Iterator[tuple[str, int, int, int]]:
+    rng = random.Random(seed)
+    labels, weights = list(SYNTHETIC_MIX), list(SYNTHETIC_MIX.values())
+    sigma = 0.6
+    for _ in range(count):
+        difficulty = rng.choices(labels, weights)[0]
+        input_mean, output_mean = SYNTHETIC_TOKENS[difficulty]
+        yield (
+            difficulty,
+            max(1, round(rng.lognormvariate(math.log(input_mean) - sigma ** 2 / 2, sigma))),
+            max(1, round(rng.lognormvariate(math.log(output_mean) - sigma ** 2 / 2, sigma))),
+            1,
+        )
+
+
+def sketch_workload(tasks: Iterable[tuple[str, int, int, int]], max_groups: int = MAX_GROUPS) -> Workload:
+    counts: dict[str, dict[tuple[int, int], int]] = {}
+    for difficulty, input_tokens, output_tokens, count in tasks:
+        if count < 1 or input_tokens < 0 or output_tokens < 0:
+            raise ValueError(f"Invalid task: {difficulty} {input_tokens}/{output_tokens} x{count}")
+        sizes = counts.setdefault(difficulty, {})
+        sizes[(input_tokens, output_tokens)] = sizes.get((input_tokens, output_tokens), 0) + count
+
+    workload = Workload()
+    order = sorted(counts, key=lambda d: (DIFFICULTIES.index(d) if d in DIFFICULTIES else len(DIFFICULTIES), d))
+    for difficulty in order:
+        sizes = counts[difficulty]
+        total = sum(sizes.values())
+        workload.tasks += total
+        workload.mix[difficulty] = total
+        # Latency depends on output size, so equal-weight buckets in output order keep the tail intact.
+        ordered = sorted(sizes.items(), key=lambda item: (item[0][1], item[0][0]))
+        if len(ordered) <= max_groups:
+            workload.groups.extend(TaskGroup(difficulty, n, i, o) for (i, o), n in ordered)
+            continue
+        bucket_size = total / max_groups
+        weight = input_sum = output_sum = 0.0
+        for (input_tokens, output_tokens), n in ordered:
+            weight += n
+            input_sum += input_tokens * n
+            output_sum += output_tokens * n
+            if weight >= bucket_size:
+                workload.groups.append(TaskGroup(difficulty, weight, input_sum / weight, output_sum / weight))
+                weight = input_sum = output_sum = 0.0
+        if weight:
+            workload.groups.append(TaskGroup(difficulty, weight, input_sum / weight, output_sum / weight))
+    return workload
+
+
+def enumerate_policies(difficulties: list[str]) -> list[Policy]:
+    policies: list[Policy] = []
+    seen: set[tuple] = set()
+    for size in range(1, len(TIERS) + 1):
+        for chain in itertools.combinations(TIERS, size):
+            for entries in itertools.product(range(size), repeat=len(difficulties)):
+                entry = dict(zip(difficulties, entries))
+                policy = Policy(chain=chain, entry={d: i for d, i in entry.items() if i})
+                # A chain entered past its first tier everywhere is the shorter chain; keep one copy.
+                key = tuple(policy.route(d) for d in difficulties)
+                if key not in seen:
+                    seen.add(key)
+                    policies.append(policy)
+    return policies
+
+
+def parse_policy(spec: str, entries: list[str]) -> Policy:
+    chain = tuple(part.strip() for part in spec.split(">") if part.strip())
+    for tier in chain:
+        if tier not in TIERS:
+            raise ValueError(f"Unknown tier in policy: {tier} (expected one of {', '.join(TIERS)})")
+    if list(chain) != sorted(set(chain), key=TIERS.index):
+        raise ValueError(f"Policy tiers must escalate upward without repeats: {spec}")
+    entry: dict[str, int] = {}
+    for item in entries:
+        difficulty, _, tier = item.partition("=")
+        if tier not in chain:
+            raise ValueError(f"Entry tier {tier or '?'} for {difficulty} is not in the policy chain")
+        entry[difficulty] = chain.index(tier)
+    return Policy(chain=chain, entry={d: i for d, i in entry.items() if i})
+
+
+class CascadeSimulator:
+    def __init__(self, workload: Workload, tiers: dict[str, TierSpec]) -> None:
+        self.workload = workload
+        self.tiers = tiers
+        for difficulty in workload.difficulties:
+            for tier in tiers.values():
+                if difficulty not in tier.escalation:
+                    raise ValueError(f"Tier {tier.name}: no escalation probability for difficulty {difficulty}")
+        self.by_difficulty: dict[str, list[TaskGroup]] = {}
+        for group in workload.groups:
+            self.by_difficulty.setdefault(group.difficulty, []).append(group)
+        # Every policy is a combination of per-difficulty routes, so each route is priced once per sweep.
+        self.cost = {
+            name: [tier.cost(g.input_tokens, g.output_tokens) for g in workload.groups] for name, tier in tiers.items()
+        }
+        self.latency = {name: [tier.latency_ms(g.output_tokens) for g in workload.groups] for name, tier in tiers.items()}
+        self.index = {id(g): i for i, g in enumerate(workload.groups)}
+        self.routes: dict[tuple[str, tuple[str, ...]], RouteStats] = {}
+
+    def route_stats(self, difficulty: str, route: tuple[str, ...]) -> RouteStats:
+        key = (difficulty, route)
+        if key in self.routes:
+            return self.routes[key]
+        stats = RouteStats()
+        escalate = [self.tiers[tier].escalation[difficulty] for tier in route]
+        for group in self.by_difficulty.get(difficulty, []):
+            i = self.index[id(group)]
+            reach, elapsed = group.weight, 0.0
+            stats.weight += group.weight
+            for depth, tier in enumerate(route):
+                stats.calls += reach
+                stats.cost += reach * self.cost[tier][i]
+                elapsed += self.latency[tier][i]
+                passed_on = reach * escalate[depth]
+                if depth == len(route) - 1:
+                    stats.latencies.append((elapsed, reach))
+                    stats.unresolved += passed_on
+                else:
+                    stats.latencies.append((elapsed, reach - passed_on))
+                    stats.escalated += passed_on if depth == 0 else 0.0
+                reach = passed_on
+                if not reach:
+                    break
+        self.routes[key] = stats
+        return stats
+
+    def evaluate(self, policy: Policy) -> PolicyResult:
+        parts = [self.route_stats(d, policy.route(d)) for d in self.workload.difficulties]
+        weight = sum(p.weight for p in parts) or 1.0
+        latencies = sorted(pair for p in parts for pair in p.latencies)
+        return PolicyResult(
+            policy=policy,
+            cost_per_task=sum(p.cost for p in parts) / weight,
+            latency=latency_summary(latencies, weight),
+            escalation_rate=sum(p.escalated for p in parts) / weight,
+            calls_per_task=sum(p.calls for p in parts) / weight,
+            unresolved_rate=sum(p.unresolved for p in parts) / weight,
+        )
+
+    def sweep(self, policies: list[Policy]) -> list[PolicyResult]:
+        return [self.evaluate(policy) for policy in policies]
+
+
+def latency_summary(latencies: list[tuple[float, float]], weight: float) -> dict[str, float]:
+    summary = {"mean": sum(value * w for value, w in latencies) / weight}
+    targets = [(name, float(name[1:]) / 100 * weight) for name in LATENCY_METRICS if name != "mean"]
+    cumulative, position = 0.0, 0
+    for value, w in latencies:
+        cumulative += w
+        while position < len(targets) and cumulative >= targets[position][1] - 1e-9:
+            summary[targets[position][0]] = value
+            position += 1
+    for name, _ in targets[position:]:
+        summary[name] = latencies[-1][0] if latencies else 0.0
+    return summary
+
+
+def pareto_frontier(results: list[PolicyResult], metric: str, max_unresolved: float = 0.05) -> list[PolicyResult]:
+    candidates = [r for r in results if r.unresolved_rate <= max_unresolved + 1e-12]
+    frontier: list[PolicyResult] = []
+    best = math.inf
+    for result in sorted(candidates, key=lambda r: (r.cost_per_task, r.metric(metric))):
+        if result.metric(metric) < best - 1e-9:
+            frontier.append(result)
+            best = result.metric(metric)
+    return frontier
+
+
+def result_to_dict(result: PolicyResult) -> dict:
+    return {
+        "policy": result.policy.name,
+        "chain": list(result.policy.chain),
+        "entry": {d: result.policy.chain[i] for d, i in sorted(result.policy.entry.items())},
+        "cost_per_task": round(result.cost_per_task, 8),
+        "cost_per_1k_tasks": round(result.cost_per_task * 1_000, 4),
+        "latency_ms": {name: round(value, 1) for name, value in result.latency.items()},
+        "escalation_rate": round(result.escalation_rate, 4),
+        "calls_per_task": round(result.calls_per_task, 4),
+        "unresolved_rate": round(result.unresolved_rate, 4),
+    }
+
+
+def format_report(
+    workload: Workload,
+    tiers: dict[str, TierSpec],
+    results: list[PolicyResult],
+    frontier: list[PolicyResult],
+    metric: str,
+    show_all: bool = False,
+) -> str:
+    mix = ", ".join(f"{d} {n / workload.tasks:.0%}" for d, n in workload.mix.items())
+    lines: list[str] = [f"\n🪜 Cascade Routing Simulation: {workload.tasks:,} tasks ({mix})"]
+    for tier in tiers.values():
+        escalation = ", ".join(f"{d} {p:.0%}" for d, p in tier.escalation.items() if d in workload.mix)
+        lines.append(
+            f"   {tier.name:<12} {tier.model:<18} {tier.first_token_ms:>5.0f}ms + {tier.ms_per_output_token:g}ms/tok  "
+            f"escalates: {escalation}"
+        )
+
+    shown = results if show_all else frontier
+    title = "All policies" if show_all else f"Pareto frontier (cost vs {metric} latency)"
+    width = max((len(r.policy.name) for r in shown), default=6)
+    lines.append(f"\n   {title}: {len(shown)} of {len(results)} policies")
+    if not shown:
+        lines.append("   ⚠️  No policy meets --max-unresolved; raise it or lower the top tier's escalation rates")
+        return "\n".join(lines)
+    lines.append(
+        f"   {'Policy':<{width}} {'$/1k':>9} {'Mean':>7} {'P50':>7} {'P95':>7} {'P99':>7} {'Esc':>6} {'Calls':>6} {'Unres':>6}"
+    )
+    lines.append(f"   {'─' * width} {'─' * 9} {'─' * 7} {'─' * 7} {'─' * 7} {'─' * 7} {'─' * 6} {'─' * 6} {'─' * 6}")
+    on_frontier = {id(r) for r in frontier}
+    for result in sorted(shown, key=lambda r: r.cost_per_task):
+        marker = "★" if show_all and id(result) in on_frontier else " "
+        latency = result.latency
+        lines.append(
+            f" {marker} {result.policy.name:<{width}} {result.cost_per_task * 1_000:>9.4f} {latency['mean']:>7.0f} "
+            f"{latency['p50']:>7.0f} {latency['p95']:>7.0f} {latency['p99']:>7.0f} "
+            f"{result.escalation_rate:>6.1%} {result.calls_per_task:>6.2f} {result.unresolved_rate:>6.1%}"
+        )
+
+    premium = next((r for r in results if r.policy.chain == ("premium",)), None)
+    if premium and frontier:
+        cheapest = min(frontier, key=lambda r: r.cost_per_task)
+        lines.append(
+            f"\n   💡 Premium-only costs ${premium.cost_per_task * 1_000:.4f}/1k tasks; "
+            f"the cheapest frontier policy costs ${cheapest.cost_per_task * 1_000:.4f}/1k "
+            f"({1 - cheapest.cost_per_task / premium.cost_per_task:.0%} less)"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Simulate cascade model routing (lightweight → standard → premium) and sweep policies for the cost/latency frontier",
+    )
+    parser.add_argument("workload", type=Path, nargs="?", help="JSONL tasks: difficulty, input_tokens, output_tokens, count")
+    parser.add_argument("--synthetic", type=int, metavar="N", help="Generate N synthetic tasks instead of reading a workload")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for --synthetic (default: 0)")
+    parser.add_argument("--config", type=Path, help="JSON tier overrides: model, first_token_ms, ms_per_output_token, escalation")
+    parser.add_argument("--policy", help='Evaluate one chain, e.g. "lightweight>premium", instead of sweeping')
+    parser.add_argument(
+        "--entry", action="append", default=[], metavar="DIFFICULTY=TIER",
+        help="With --policy, start tasks of DIFFICULTY at TIER (repeatable)",
+    )
+    parser.add_argument(
+        "--latency", choices=LATENCY_METRICS, default="p95", help="Latency metric for the frontier (default: p95)",
+    )
+    parser.add_argument(
+        "--max-unresolved", type=float, default=0.05, metavar="RATE",
+        help="Exclude policies whose top tier would still escalate more than RATE of tasks (default: 0.05)",
+    )
+    parser.add_argument("--all", action="store_true", help="List every policy, marking the frontier")
+    parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format (default: text)")
+    parser.add_argument("--output", type=Path, help="Write the report to a file instead of stdout")
+
+    args = parser.parse_args()
+
+    if (args.synthetic is None) == (args.workload is None):
+        parser.error("provide either a workload file or --synthetic N")
+    if args.entry and not args.policy:
+        parser.error("--entry requires --policy")
+
+    try:
+        overrides = None
+        if args.config:
+            if not args.config.exists():
+                print(f"Error: File not found: {args.config}", file=sys.stderr)
+                sys.exit(1)
+            overrides = json.loads(args.config.read_text(encoding="utf-8")).get("tiers", {})
+        tiers = load_tiers(overrides)
+
+        if args.workload:
+            if not args.workload.exists():
+                print(f"Error: File not found: {args.workload}", file=sys.stderr)
+                sys.exit(1)
+            workload = sketch_workload(read_tasks(args.workload))
+        else:
+            workload = sketch_workload(synthetic_tasks(args.synthetic, args.seed))
+        if not workload.tasks:
+            raise ValueError("Workload contains no tasks")
+
+        simulator = CascadeSimulator(workload, tiers)
+        if args.policy:
+            policies = [parse_policy(args.policy, args.entry)]
+        else:
+            policies = enumerate_policies(workload.difficulties)
+        results = simulator.sweep(policies)
+    except (ValueError, json.JSONDecodeError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    frontier = pareto_frontier(results, args.latency, args.max_unresolved)
+
+    if args.format == "json":
+        output = json.dumps({
+            "tasks": workload.tasks,
+            "mix": workload.mix,
+            "groups": len(workload.groups),
+            "latency_metric": args.latency,
+            "tiers": {
+                t.name: {
+                    "model": t.model,
+                    "first_token_ms": t.first_token_ms,
+                    "ms_per_output_token": t.ms_per_output_token,
+                    "escalation": t.escalation,
+                }
+                for t in tiers.values()
+            },
+            "frontier": [result_to_dict(r) for r in frontier],
+            "policies": [result_to_dict(r) for r in results] if args.all or args.policy else [],
+        }, indent=2)
+    else:
+        output = format_report(workload, tiers, results, frontier, args.latency, show_all=args.all or bool(args.policy))
+
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from simulate_topology import TopologyGraph, build_reference_graph, load_graph, plan_request
+from validate_topology import VALID_TOPOLOGIES
+
+
+@dataclass
+class ModelProfile:
+    latency_ms: float = 50.0
+    jitter_ms: float = 20.0
+    error_rate: float = 0.0
+
+
+@dataclass
+class HarnessOptions:
+    requests: int = 200
+    arrival_rate: float = 50.0
+    max_inflight: int = 64
+    max_queue: int = 256
+    timeout: float = 5.0
+    retries: int = 2
+    seed: int = 0
+
+
+@dataclass
+class HarnessReport:
+    topology: str
+    endpoint: str
+    requests: int
+    succeeded: int = 0
+    failed: int = 0
+    shed: int = 0
+    model_calls: int = 0
+    model_errors: int = 0
+    retries: int = 0
+    timeouts: int = 0
+    partial_broadcasts: int = 0
+    peak_concurrency: int = 0
+    concurrency_samples: list[int] = field(default_factory=list)
+    loop_lag_ms: list[float] = field(default_factory=list)
+    admission_wait_ms: list[float] = field(default_factory=list)
+    latencies_ms: list[float] = field(default_factory=list)
+    wall_time: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        return self.succeeded / self.wall_time if self.wall_time > 0 else 0.0
+
+    @property
+    def mean_concurrency(self) -> float:
+        samples = self.concurrency_samples
+        return sum(samples) / len(samples) if samples else 0.0
+
+
+class ShedError(Exception):
+    pass
+
+
+class ModelCallError(Exception):
+    pass
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[rank]
+
+
+async def start_stub_server(profile: ModelProfile, seed: int, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+    rng = random.Random(seed)
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await reader.readline()
+            length = 0
+            while True:
+                header = await reader.readline()
+                if header in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = header.decode("latin-1").partition(":")
+                if name.strip().lower() == "content-length":
+                    length = int(value.strip())
+            body = json.loads(await reader.readexactly(length)) if length else {}
+
+            await asyncio.sleep(max(0.0, rng.gauss(profile.latency_ms, profile.jitter_ms)) / 1000)
+
+            if not request_line.startswith(b"POST") or rng.random() < profile.error_rate:
+                status, payload = "503 Service Unavailable", {"error": "stub model overloaded"}
+            else:
+                status, payload = "200 OK", {
+                    "model": "stub",
+                    "agent": body.get("agent"),
+                    "choices": [{"message": {"role": "assistant", "content": "ok"}}],
+                }
+            data = json.dumps(payload).encode()
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(data)}\r\nConnection: close\r\n\r\n".encode() + data
+            )
+            await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, json.JSONDecodeError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
+
+
+async def call_model(host: str, port: int, agent: str, prompt: str) -> dict:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        body = json.dumps({"agent": agent, "messages": [{"role": "user", "content": prompt}]}).encode()
+        writer.write(
+            f"POST /v1/chat/completions HTTP/1.1\r\nHost: {host}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+            f"Connection: close\r\n\r\n".encode() + body
+        )
+        await writer.drain()
+        status_line = await reader.readline()
+        raw = await reader.read()
+    finally:
+        writer.close()
+
+    parts = status_line.split()
+    if len(parts) < 2 or parts[1] != b"200":
+        raise ModelCallError(status_line.decode("latin-1").strip() or "empty response")
+    return json.loads(raw.partition(b"\r\n\r\n")[2])
+
+
+class AgentRuntime:
+    def __init__(self, name: str, concurrency: int, harness: "Harness") -> None:
+        self.name = name
+        self.slots = asyncio.Semaphore(concurrency)
+        self.waiting = 0
+        self.harness = harness
+
+    async def invoke(self, prompt: str) -> dict:
+        harness = self.harness
+        if self.waiting >= harness.options.max_queue:
+            raise ShedError(f"{self.name} queue full")
+        self.waiting += 1
+        try:
+            await self.slots.acquire()
+        finally:
+            self.waiting -= 1
+
+        try:
+            for attempt in range(harness.options.retries + 1):
+                harness.active_calls += 1
+                harness.report.model_calls += 1
+                harness.report.peak_concurrency = max(harness.report.peak_concurrency, harness.active_calls)
+                try:
+                    return await asyncio.wait_for(
+                        call_model(harness.host, harness.port, self.name, prompt),
+                        timeout=harness.options.timeout,
+                    )
+                except asyncio.TimeoutError:
+                    harness.report.timeouts += 1
+                except (ModelCallError, ConnectionError, json.JSONDecodeError):
+                    harness.report.model_errors += 1
+                finally:
+                    harness.active_calls -= 1
+                if attempt < harness.options.retries:
+                    harness.report.retries += 1
+                    await asyncio.sleep(0.01 * 2 ** attempt)
+            raise ModelCallError(f"{self.name} failed after {harness.options.retries + 1} attempts")
+        finally:
+            self.slots.release()
+
+
+class Harness:
+    def __init__(self, graph: TopologyGraph, host: str, port: int, options: HarnessOptions) -> None:
+        self.graph = graph
+        self.host = host
+        self.port = port
+        self.options = options
+        self.rng = random.Random(options.seed)
+        self.active_calls = 0
+        self.agents = {
+            name: AgentRuntime(name, spec.concurrency, self)
+            for name, spec in graph.agents.items()
+        }
+        self.report = HarnessReport(
+            topology=graph.topology,
+            endpoint=f"http://{host}:{port}",
+            requests=options.requests,
+        )
+
+    async def execute(self, step: tuple, prompt: str) -> None:
+        kind, payload = step
+        if kind == "call":
+            await self.agents[payload].invoke(prompt)
+        elif kind == "seq":
+            for child in payload:
+                await self.execute(child, prompt)
+        else:
+            results = await asyncio.gather(
+                *(self.execute(child, prompt) for child in payload),
+                return_exceptions=True,
+            )
+            failures = [r for r in results if isinstance(r, Exception)]
+            if len(failures) == len(results):
+                raise failures[0]
+            if failures:
+                self.report.partial_broadcasts += 1
+
+    async def handle_request(self, request_id: int, admission: asyncio.Semaphore) -> None:
+        started = time.perf_counter()
+        try:
+            await self.execute(plan_request(self.graph, self.rng), f"request {request_id}")
+            self.report.succeeded += 1
+            self.report.latencies_ms.append((time.perf_counter() - started) * 1000)
+        except ShedError:
+            self.report.shed += 1
+        except ModelCallError:
+            self.report.failed += 1
+        finally:
+            admission.release()
+
+    async def monitor(self, interval: float = 0.005) -> None:
+        while True:
+            expected = time.perf_counter() + interval
+            await asyncio.sleep(interval)
+            self.report.loop_lag_ms.append(max(0.0, time.perf_counter() - expected) * 1000)
+            self.report.concurrency_samples.append(self.active_calls)
+
+    async def run(self) -> HarnessReport:
+        admission = asyncio.Semaphore(self.options.max_inflight)
+        monitor = asyncio.create_task(self.monitor())
+        tasks: list[asyncio.Task] = []
+        started = time.perf_counter()
+
+        for request_id in range(self.options.requests):
+            await asyncio.sleep(self.rng.expovariate(self.options.arrival_rate))
+            waited_from = time.perf_counter()
+            await admission.acquire()
+            self.report.admission_wait_ms.append((time.perf_counter() - waited_from) * 1000)
+            tasks.append(asyncio.create_task(self.handle_request(request_id, admission)))
+
+        await asyncio.gather(*tasks)
+        self.report.wall_time = time.perf_counter() - started
+        monitor.cancel()
+        return self.report
+
+
+async def run_harness(
+    graph: TopologyGraph,
+    options: HarnessOptions,
+    profile: ModelProfile,
+    endpoint: tuple[str, int] | None = None,
+) -> HarnessReport:
+    if endpoint:
+        return await Harness(graph, endpoint[0], endpoint[1], options).run()
+
+    server = await start_stub_server(profile, options.seed)
+    host, port = server.sockets[0].getsockname()[:2]
+    try:
+        return await Harness(graph, host, port, options).run()
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+def format_report(report: HarnessReport) -> str:
+    lines: list[str] = [f"\n🚦 Orchestration Harness Run: {report.topology}"]
+    lines.append(f"   Endpoint:     {report.endpoint}")
+    lines.append(
+        f"   Requests:     {report.succeeded} ok, {report.failed} failed, "
+        f"{report.shed} shed of {report.requests}"
+    )
+    lines.append(f"   Throughput:   {report.throughput:.1f} req/s over {report.wall_time:.2f}s")
+    lines.append(
+        f"   Latency:      p50 {percentile(report.latencies_ms, 50):.1f}ms  "
+        f"p95 {percentile(report.latencies_ms, 95):.1f}ms  p99 {percentile(report.latencies_ms, 99):.1f}ms"
+    )
+    lines.append(f"   Concurrency:  peak {report.peak_concurrency}, mean {report.mean_concurrency:.1f} model calls in flight")
+    lines.append(
+        f"   Loop lag:     p50 {percentile(report.loop_lag_ms, 50):.2f}ms  "
+        f"p99 {percentile(report.loop_lag_ms, 99):.2f}ms"
+    )
+    lines.append(
+        f"   Backpressure: admission wait p95 {percentile(report.admission_wait_ms, 95):.1f}ms, "
+        f"max {max(report.admission_wait_ms, default=0.0):.1f}ms"
+    )
+    lines.append(
+        f"   Error paths:  {report.model_errors} model errors, {report.timeouts} timeouts, "
+        f"{report.retries} retries, {report.partial_broadcasts} partial broadcasts"
+    )
+
+    if report.failed or report.shed:
+        lines.append("   ⚠️  Some requests exhausted retries or were shed — review fallback and queue limits")
+    else:
+        lines.append("   ✅ All requests completed")
+
+    return "\n".join(lines)
+
+
+def report_to_dict(report: HarnessReport) -> dict:
+    return {
+        "topology": report.topology,
+        "endpoint": report.endpoint,
+        "requests": report.requests,
+        "succeeded": report.succeeded,
+        "failed": report.failed,
+        "shed": report.shed,
+        "throughput": round(report.throughput, 3),
+        "wall_time": round(report.wall_time, 3),
+        "latency_ms": {p: round(percentile(report.latencies_ms, int(p[1:])), 3) for p in ("p50", "p95", "p99")},
+        "concurrency": {"peak": report.peak_concurrency, "mean": round(report.mean_concurrency, 3)},
+        "loop_lag_ms": {p: round(percentile(report.loop_lag_ms, int(p[1:])), 3) for p in ("p50", "p99")},
+        "admission_wait_ms": {
+            "p95": round(percentile(report.admission_wait_ms, 95), 3),
+            "max": round(max(report.admission_wait_ms, default=0.0), 3),
+        },
+        "model_calls": report.model_calls,
+        "model_errors": report.model_errors,
+        "timeouts": report.timeouts,
+        "retries": report.retries,
+        "partial_broadcasts": report.partial_broadcasts,
+    }
+
+
+def parse_endpoint(value: str) -> tuple[str, int]:
+    host, _, port = value.removeprefix("http://").rstrip("/").rpartition(":")
+    if not host or not port.isdigit():
+        raise argparse.ArgumentTypeError(f"expected host:port, got {value}")
+    return host, int(port)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Execute an orchestration topology with asyncio against a local stub model server",
+    )
+    parser.add_argument("config", type=Path, nargs="?", help="JSON topology config (same format as simulate_topology.py)")
+    parser.add_argument("--topology", choices=sorted(VALID_TOPOLOGIES), help="Run a reference graph instead of a config")
+    parser.add_argument("--workers", type=int, default=8, help="Worker agents for --topology (default: 8)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrency per agent for --topology (default: 4)")
+    parser.add_argument("--requests", type=int, default=200, help="Requests to run (default: 200)")
+    parser.add_argument("--arrival-rate", type=float, default=50.0, help="Requests per second offered (default: 50)")
+    parser.add_argument("--max-inflight", type=int, default=64, help="Admission limit for concurrent requests (default: 64)")
+    parser.add_argument("--max-queue", type=int, default=256, help="Per-agent wait queue before shedding (default: 256)")
+    parser.add_argument("--timeout", type=float, default=5.0, help="Per-call timeout in seconds (default: 5)")
+    parser.add_argument("--retries", type=int, default=2, help="Retries per failed model call (default: 2)")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Stub model mean latency (default: 50)")
+    parser.add_argument("--jitter-ms", type=float, default=20.0, help="Stub model latency std deviation (default: 20)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Stub model error probability (default: 0)")
+    parser.add_argument("--endpoint", type=parse_endpoint, help="Use an existing host:port model endpoint instead of the stub")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format (default: text)")
+
+    args = parser.parse_args()
+
+    if bool(args.topology) == bool(args.config):
+        parser.error("provide either a config file or --topology")
+
+    try:
+        if args.topology:
+            graph = build_reference_graph(args.topology, args.workers, args.concurrency)
+        else:
+            if not args.config.exists():
+                print(f"Error: File not found: {args.config}", file=sys.stderr)
+                sys.exit(1)
+            graph = load_graph(json.loads(args.config.read_text(encoding="utf-8")))
+    except (ValueError, json.JSONDecodeError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    options = HarnessOptions(
+        requests=args.requests,
+        arrival_rate=args.arrival_rate,
+        max_inflight=args.max_inflight,
+        max_queue=args.max_queue,
+        timeout=args.timeout,
+        retries=args.retries,
+        seed=args.seed,
+    )
+    profile = ModelProfile(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate)
+
+    try:
+        report = asyncio.run(run_harness(graph, options, profile, args.endpoint))
+    except OSError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.format == "json":
+        print(json.dumps(report_to_dict(report), indent=2))
+    else:
+        print(format_report(report))
+
+    sys.exit(1 if report.failed or report.shed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+
+import argparse
+import heapq
+import json
+import math
+import random
+import sys
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from validate_topology import VALID_TOPOLOGIES
+
+DISTRIBUTIONS = {"constant", "exponential", "lognormal", "uniform"}
+
+DEFAULT_SERVICE = {"distribution": "lognormal", "mean": 1.0, "cv": 0.5}
+
+# A coordinator's per-call work (routing, tracking, merging results) grows with the agents it manages,
+# which is what makes a wide hub the bottleneck that O006 warns about.
+COORDINATOR_SERVICE = {"distribution": "lognormal", "mean": 0.1, "cv": 0.5}
+COORDINATION_PER_AGENT = 0.025
+
+DEFAULT_COMPARE_RATE = 0.5
+
+
+@dataclass
+class ServiceTime:
+    distribution: str = "exponential"
+    mean: float = 1.0
+    cv: float = 1.0
+    low: float = 0.0
+    high: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        if self.distribution == "constant":
+            return self.mean
+        if self.distribution == "exponential":
+            return rng.expovariate(1.0 / self.mean)
+        if self.distribution == "uniform":
+            return rng.uniform(self.low, self.high)
+        sigma = math.sqrt(math.log(1.0 + self.cv ** 2))
+        mu = math.log(self.mean) - sigma ** 2 / 2
+        return rng.lognormvariate(mu, sigma)
+
+
+@dataclass
+class AgentSpec:
+    name: str
+    service: ServiceTime
+    concurrency: int = 1
+
+
+@dataclass
+class TopologyGraph:
+    topology: str
+    entry: str | None
+    agents: dict[str, AgentSpec]
+    edges: dict[str, list[str]] = field(default_factory=dict)
+    mesh_hops: int = 3
+
+
+@dataclass
+class AgentStats:
+    name: str
+    concurrency: int
+    served: int = 0
+    busy_time: float = 0.0
+    queue_area: float = 0.0
+    max_queue: int = 0
+    busy: int = 0
+    last_change: float = 0.0
+    queue: deque = field(default_factory=deque)
+
+    def advance(self, now: float) -> None:
+        elapsed = now - self.last_change
+        self.busy_time += self.busy * elapsed
+        self.queue_area += len(self.queue) * elapsed
+        self.last_change = now
+
+
+@dataclass
+class AgentMetrics:
+    name: str
+    concurrency: int
+    served: int
+    utilization: float
+    mean_queue: float
+    max_queue: int
+
+
+@dataclass
+class SimulationReport:
+    topology: str
+    arrival_rate: float
+    requests: int
+    completed: int
+    makespan: float
+    agents: list[AgentMetrics] = field(default_factory=list)
+    latencies: list[float] = field(default_factory=list)
+
+    @property
+    def throughput(self) -> float:
+        return self.completed / self.makespan if self.makespan > 0 else 0.0
+
+    @property
+    def bottleneck(self) -> AgentMetrics | None:
+        return max(self.agents, key=lambda a: a.utilization, default=None)
+
+    @property
+    def saturated(self) -> bool:
+        bottleneck = self.bottleneck
+        return bottleneck is not None and bottleneck.utilization >= 0.95
+
+    def percentile(self, pct: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        rank = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+        return ordered[rank]
+
+
+def parse_service(raw: dict | None) -> ServiceTime:
+    raw = dict(raw or DEFAULT_SERVICE)
+    distribution = raw.get("distribution", "exponential")
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown service distribution: {distribution}")
+    if distribution == "uniform":
+        low, high = float(raw.get("low", 0.0)), float(raw.get("high", 0.0))
+        if high <= low:
+            raise ValueError("Uniform service time requires high > low")
+        return ServiceTime(distribution=distribution, mean=(low + high) / 2, low=low, high=high)
+    mean = float(raw.get("mean", 1.0))
+    if mean <= 0:
+        raise ValueError("Service time mean must be positive")
+    return ServiceTime(distribution=distribution, mean=mean, cv=float(raw.get("cv", 1.0)))
+
+
+def load_graph(data: dict) -> TopologyGraph:
+    topology = data.get("topology")
+    if topology not in VALID_TOPOLOGIES:
+        raise ValueError(f"Unknown topology: {topology} (expected one of {', '.join(sorted(VALID_TOPOLOGIES))})")
+
+    agents: dict[str, AgentSpec] = {}
+    for name, spec in data.get("agents", {}).items():
+        concurrency = int(spec.get("concurrency", 1))
+        if concurrency < 1:
+            raise ValueError(f"Agent {name}: concurrency must be >= 1")
+        agents[name] = AgentSpec(name=name, service=parse_service(spec.get("service")), concurrency=concurrency)
+    if not agents:
+        raise ValueError("Config defines no agents")
+
+    edges = {name: list(targets) for name, targets in data.get("edges", {}).items()}
+    for source, targets in edges.items():
+        for target in [source, *targets]:
+            if target not in agents:
+                raise ValueError(f"Edge references undefined agent: {target}")
+
+    entry = data.get("entry", None if topology == "mesh" else next(iter(agents)))
+    if entry is not None and entry not in agents:
+        raise ValueError(f"Entry agent not defined: {entry}")
+
+    return TopologyGraph(
+        topology=topology,
+        entry=entry,
+        agents=agents,
+        edges=edges,
+        mesh_hops=int(data.get("mesh_hops", 3)),
+    )
+
+
+def coordinator_service(managed: int) -> ServiceTime:
+    return parse_service({**COORDINATOR_SERVICE, "mean": COORDINATOR_SERVICE["mean"] + COORDINATION_PER_AGENT * managed})
+
+
+def build_reference_graph(topology: str, workers: int, concurrency: int = 1) -> TopologyGraph:
+    if workers < 1 or concurrency < 1:
+        raise ValueError("Reference graphs need workers >= 1 and concurrency >= 1")
+    worker_service = parse_service(DEFAULT_SERVICE)
+    names = [f"worker_{i + 1}" for i in range(workers)]
+    agents = {name: AgentSpec(name, worker_service, concurrency) for name in names}
+    edges: dict[str, list[str]] = {}
+
+    if topology in ("hub-and-spoke", "broadcast"):
+        agents["hub"] = AgentSpec("hub", coordinator_service(workers), concurrency)
+        edges["hub"] = names
+        entry = "hub"
+    elif topology == "pipeline":
+        for current, following in zip(names, names[1:]):
+            edges[current] = [following]
+        entry = names[0]
+    elif topology == "hierarchical":
+        groups = max(1, round(math.sqrt(workers)))
+        agents["lead"] = AgentSpec("lead", coordinator_service(groups), concurrency)
+        edges["lead"] = []
+        for g in range(groups):
+            sub = f"sub_{g + 1}"
+            edges["lead"].append(sub)
+            edges[sub] = names[g::groups]
+            agents[sub] = AgentSpec(sub, coordinator_service(len(edges[sub])), concurrency)
+        entry = "lead"
+    else:
+        for name in names:
+            edges[name] = [peer for peer in names if peer != name]
+        entry = None
+
+    return TopologyGraph(topology=topology, entry=entry, agents=agents, edges=edges)
+
+
+def plan_request(graph: TopologyGraph, rng: random.Random) -> tuple:
+    children = graph.edges
+
+    if graph.topology == "hub-and-spoke":
+        workers = children.get(graph.entry, [])
+        if not workers:
+            return ("call", graph.entry)
+        return ("seq", [("call", graph.entry), ("call", rng.choice(workers)), ("call", graph.entry)])
+
+    if graph.topology == "pipeline":
+        stages, current, seen = [], graph.entry, set()
+        while current is not None and current not in seen:
+            seen.add(current)
+            stages.append(("call", current))
+            following = children.get(current, [])
+            current = following[0] if following else None
+        return ("seq", stages)
+
+    if graph.topology == "broadcast":
+        workers = children.get(graph.entry, [])
+        if not workers:
+            return ("call", graph.entry)
+        return ("seq", [
+            ("call", graph.entry),
+            ("par", [("call", w) for w in workers]),
+            ("call", graph.entry),
+        ])
+
+    if graph.topology == "hierarchical":
+        # The lead only routes; each sub-lead dispatches to its workers and aggregates their results.
+        def delegate(node: str, depth: int) -> tuple:
+            subordinates = children.get(node, [])
+            if not subordinates or depth > len(graph.agents):
+                return ("call", node)
+            steps = [("call", node), delegate(rng.choice(subordinates), depth + 1)]
+            return ("seq", steps if depth == 0 else [*steps, ("call", node)])
+        return delegate(graph.entry, 0)
+
+    current = graph.entry or rng.choice(list(graph.agents))
+    steps = [("call", current)]
+    for _ in range(graph.mesh_hops):
+        peers = children.get(current, [])
+        if not peers:
+            break
+        current = rng.choice(peers)
+        steps.append(("call", current))
+    return ("seq", steps)
+
+
+class Simulator:
+    def __init__(self, graph: TopologyGraph, seed: int) -> None:
+        self.graph = graph
+        self.rng = random.Random(seed)
+        self.now = 0.0
+        self.events: list[tuple[float, int, object]] = []
+        self.sequence = 0
+        self.stats = {
+            name: AgentStats(name=name, concurrency=spec.concurrency)
+            for name, spec in graph.agents.items()
+        }
+
+    def schedule(self, at: float, callback) -> None:
+        self.sequence += 1
+        heapq.heappush(self.events, (at, self.sequence, callback))
+
+    def submit(self, agent: str, on_done) -> None:
+        stats = self.stats[agent]
+        stats.advance(self.now)
+        if stats.busy < stats.concurrency:
+            self.start(agent, on_done)
+        else:
+            stats.queue.append(on_done)
+            stats.max_queue = max(stats.max_queue, len(stats.queue))
+
+    def start(self, agent: str, on_done) -> None:
+        stats = self.stats[agent]
+        stats.busy += 1
+        duration = self.graph.agents[agent].service.sample(self.rng)
+        self.schedule(self.now + duration, lambda: self.finish(agent, on_done))
+
+    def finish(self, agent: str, on_done) -> None:
+        stats = self.stats[agent]
+        stats.advance(self.now)
+        stats.busy -= 1
+        stats.served += 1
+        if stats.queue:
+            self.start(agent, stats.queue.popleft())
+        on_done()
+
+    def execute(self, step: tuple, on_done) -> None:
+        kind, payload = step
+        if kind == "call":
+            self.submit(payload, on_done)
+        elif kind == "seq":
+            self.execute_sequence(payload, 0, on_done)
+        else:
+            remaining = [len(payload)]
+
+            def branch_done() -> None:
+                remaining[0] -= 1
+                if remaining[0] == 0:
+                    on_done()
+
+            for branch in payload:
+                self.execute(branch, branch_done)
+
+    def execute_sequence(self, steps: list, index: int, on_done) -> None:
+        if index == len(steps):
+            on_done()
+            return
+        self.execute(steps[index], lambda: self.execute_sequence(steps, index + 1, on_done))
+
+    def run(self, arrival_rate: float, requests: int) -> SimulationReport:
+        report = SimulationReport(
+            topology=self.graph.topology,
+            arrival_rate=arrival_rate,
+            requests=requests,
+            completed=0,
+            makespan=0.0,
+        )
+
+        arrival = 0.0
+        for _ in range(requests):
+            arrival += self.rng.expovariate(arrival_rate)
+            self.schedule(arrival, self.make_arrival(arrival, report))
+
+        while self.events:
+            self.now, _, callback = heapq.heappop(self.events)
+            callback()
+
+        report.makespan = self.now
+        for stats in self.stats.values():
+            stats.advance(self.now)
+            report.agents.append(AgentMetrics(
+                name=stats.name,
+                concurrency=stats.concurrency,
+                served=stats.served,
+                utilization=stats.busy_time / (stats.concurrency * self.now) if self.now else 0.0,
+                mean_queue=stats.queue_area / self.now if self.now else 0.0,
+                max_queue=stats.max_queue,
+            ))
+        return report
+
+    def make_arrival(self, arrived_at: float, report: SimulationReport):
+        def on_arrival() -> None:
+            def on_complete() -> None:
+                report.completed += 1
+                report.latencies.append(self.now - arrived_at)
+            self.execute(plan_request(self.graph, self.rng), on_complete)
+        return on_arrival
+
+
+def simulate(graph: TopologyGraph, arrival_rate: float, requests: int, seed: int = 0) -> SimulationReport:
+    if arrival_rate <= 0:
+        raise ValueError("Arrival rate must be positive")
+    return Simulator(graph, seed).run(arrival_rate, requests)
+
+
+def format_report(report: SimulationReport, top_agents: int = 5) -> str:
+    lines: list[str] = [f"\n⏱️  Topology Simulation: {report.topology}"]
+    lines.append(f"   Arrival rate: {report.arrival_rate:.2f} req/s  |  Requests: {report.completed}/{report.requests}")
+    lines.append(f"   Throughput:   {report.throughput:.2f} req/s")
+    lines.append(
+        f"   Latency:      p50 {report.percentile(50):.2f}s  "
+        f"p95 {report.percentile(95):.2f}s  p99 {report.percentile(99):.2f}s"
+    )
+    bottleneck = report.bottleneck
+    if bottleneck:
+        status = "⚠️  saturated" if report.saturated else "✅ stable"
+        lines.append(f"   Bottleneck:   {bottleneck.name} ({bottleneck.utilization:.0%} utilized, {status})")
+
+    lines.append(f"\n   {'Agent':<16} {'Conc':>5} {'Served':>8} {'Util':>6} {'AvgQ':>7} {'MaxQ':>6}")
+    lines.append(f"   {'─' * 16} {'─' * 5} {'─' * 8} {'─' * 6} {'─' * 7} {'─' * 6}")
+    ranked = sorted(report.agents, key=lambda a: a.utilization, reverse=True)
+    for agent in ranked[:top_agents]:
+        lines.append(
+            f"   {agent.name:<16} {agent.concurrency:>5} {agent.served:>8} "
+            f"{agent.utilization:>6.0%} {agent.mean_queue:>7.2f} {agent.max_queue:>6}"
+        )
+    if len(ranked) > top_agents:
+        lines.append(f"   ... {len(ranked) - top_agents} more agents")
+
+    return "\n".join(lines)
+
+
+def format_sweep(reports: list[SimulationReport]) -> str:
+    rates = sorted({report.arrival_rate for report in reports})
+    topologies = list(dict.fromkeys(report.topology for report in reports))
+    cells = {(report.topology, report.arrival_rate): report for report in reports}
+    lines = ["\n⏱️  Topology sweep: p95 latency (s) by arrival rate (req/s), * = saturated bottleneck"]
+    lines.append(f"\n   {'Topology':<16}" + "".join(f" {rate:>9.2f}/s" for rate in rates))
+    lines.append(f"   {'─' * 16}" + "".join(f" {'─' * 11}" for _ in rates))
+    for topology in topologies:
+        row = [cells[topology, rate] for rate in rates]
+        lines.append(f"   {topology:<16}" + "".join(
+            f" {report.percentile(95):>10.2f}{'*' if report.saturated else ' '}" for report in row
+        ))
+    return "\n".join(lines)
+
+
+def report_to_dict(report: SimulationReport) -> dict:
+    return {
+        "topology": report.topology,
+        "arrival_rate": report.arrival_rate,
+        "requests": report.requests,
+        "completed": report.completed,
+        "throughput": round(report.throughput, 4),
+        "latency": {
+            "p50": round(report.percentile(50), 4),
+            "p95": round(report.percentile(95), 4),
+            "p99": round(report.percentile(99), 4),
+        },
+        "saturated": report.saturated,
+        "agents": [
+            {
+                "name": a.name,
+                "concurrency": a.concurrency,
+                "served": a.served,
+                "utilization": round(a.utilization, 4),
+                "mean_queue": round(a.mean_queue, 4),
+                "max_queue": a.max_queue,
+            }
+            for a in report.agents
+        ],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Discrete-event throughput simulation of multi-agent orchestration topologies",
+    )
+    parser.add_argument("config", type=Path, nargs="?", help="JSON topology config (agents, edges, service times)")
+    parser.add_argument("--compare", action="store_true", help="Simulate reference graphs for all five topologies")
+    parser.add_argument("--workers", type=int, default=12, help="Worker agents per reference graph (default: 12)")
+    parser.add_argument("--concurrency", type=int, default=1, help="Concurrency per reference agent (default: 1)")
+    parser.add_argument("--arrival-rate", type=float, help=f"Requests per second (overrides config; --compare default: {DEFAULT_COMPARE_RATE})")
+    parser.add_argument("--sweep", metavar="RATES", help="With --compare, comma-separated arrival rates to tabulate, e.g. 0.25,0.5,1,2")
+    parser.add_argument("--requests", type=int, help="Requests to simulate (default: 5000)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format (default: text)")
+
+    args = parser.parse_args()
+
+    if args.compare == bool(args.config):
+        parser.error("provide either a config file or --compare")
+    if args.workers < 1 or args.concurrency < 1:
+        parser.error("--workers and --concurrency must be >= 1")
+    if args.sweep and not args.compare:
+        parser.error("--sweep needs --compare")
+    try:
+        rates = [float(rate) for rate in args.sweep.split(",")] if args.sweep else []
+    except ValueError:
+        parser.error(f"--sweep takes comma-separated numbers, not {args.sweep!r}")
+
+    try:
+        if args.compare:
+            rates = rates or [args.arrival_rate or DEFAULT_COMPARE_RATE]
+            requests = args.requests or 5000
+            reports = [
+                simulate(build_reference_graph(t, args.workers, args.concurrency), rate, requests, args.seed)
+                for rate in rates
+                for t in sorted(VALID_TOPOLOGIES)
+            ]
+        else:
+            if not args.config.exists():
+                print(f"Error: File not found: {args.config}", file=sys.stderr)
+                sys.exit(1)
+            data = json.loads(args.config.read_text(encoding="utf-8"))
+            graph = load_graph(data)
+            arrival_rate = args.arrival_rate or float(data.get("arrival_rate", 1.0))
+            requests = args.requests or int(data.get("requests", 5000))
+            reports = [simulate(graph, arrival_rate, requests, args.seed)]
+    except (ValueError, json.JSONDecodeError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.format == "json":
+        print(json.dumps([report_to_dict(r) for r in reports], indent=2))
+    elif args.sweep:
+        print(format_sweep(reports))
+    else:
+        for report in reports:
+            print(format_report(report))
+
+
+if __name__ == "__main__":
+    main()
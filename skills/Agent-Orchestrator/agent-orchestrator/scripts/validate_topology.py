@@ -3,8 +3,10 @@
 import argparse
 import re
 import sys
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import ModuleType
 
 VALID_TOPOLOGIES = {"hub-and-spoke", "pipeline", "broadcast", "hierarchical", "mesh"}
 
@@ -40,6 +42,11 @@ class TopologyReport:
     sections_found: list[str] = field(default_factory=list)
     sections_missing: list[str] = field(default_factory=list)
     issues: list[ValidationResult] = field(default_factory=list)
+    skipped_checks: list[str] = field(default_factory=list)
+
+    @property
+    def partial(self) -> bool:
+        return bool(self.skipped_checks)
 
     @property
     def score(self) -> int:
@@ -71,53 +78,132 @@ def count_agents(content: str) -> int:
     return max(len(agents), 1)
 
 
-def validate_file(file_path: Path) -> TopologyReport:
-    content = file_path.read_text(encoding="utf-8")
+LINE_RULES: list[tuple[str, str, re.Pattern, str]] = [
+    (code, severity, re.compile(pattern, re.IGNORECASE), message)
+    for code, severity, pattern, message in ANTI_PATTERNS
+]
+
+Content = str | bytes | memoryview
+
+
+def decode_content(content: Content) -> str:
+    text = content if isinstance(content, str) else str(content, "utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def load_scheduler() -> ModuleType:
+    parents = Path(__file__).resolve().parents
+    tools = str(parents[4] / "tools") if len(parents) > 4 else ""
+    if tools and Path(tools, "check_scheduler.py").is_file() and tools not in sys.path:
+        sys.path.append(tools)
+    try:
+        import check_scheduler
+    except ImportError:
+        raise ValueError("--time-budget needs check_scheduler.py, which is not installed next to this script") from None
+    return check_scheduler
+
+
+def build_checks(
+    content: str,
+    report: TopologyReport,
+    line_rules: list[tuple[str, str, re.Pattern, str]],
+    split_rules: bool = False,
+) -> list[tuple]:
     lines = content.split("\n")
-    report = TopologyReport(file_path=file_path)
 
-    report.topology_detected = detect_topology(content)
-    report.agent_count = count_agents(content)
+    def topology() -> None:
+        report.topology_detected = detect_topology(content)
+        report.agent_count = count_agents(content)
 
-    for section_name, pattern in REQUIRED_SECTIONS.items():
-        if re.search(pattern, content, re.IGNORECASE):
-            report.sections_found.append(section_name)
-        else:
-            report.sections_missing.append(section_name)
+        if report.topology_detected == "hub-and-spoke" and report.agent_count > 10:
             report.issues.append(ValidationResult(
-                code="O010",
+                code="O006",
                 severity="WARNING",
                 line=None,
-                message=f"Missing recommended section: {section_name}",
+                message=f"Hub-and-spoke with {report.agent_count} agents — consider hierarchical topology",
             ))
 
-    for line_num, line in enumerate(lines, start=1):
-        for code, severity, pattern, message in ANTI_PATTERNS:
-            if re.search(pattern, line, re.IGNORECASE):
+    def required_sections() -> None:
+        for section_name, pattern in REQUIRED_SECTIONS.items():
+            if re.search(pattern, content, re.IGNORECASE):
+                report.sections_found.append(section_name)
+            else:
+                report.sections_missing.append(section_name)
                 report.issues.append(ValidationResult(
-                    code=code,
-                    severity=severity,
-                    line=line_num,
-                    message=message,
+                    code="O010",
+                    severity="WARNING",
+                    line=None,
+                    message=f"Missing recommended section: {section_name}",
                 ))
 
-    if report.topology_detected == "hub-and-spoke" and report.agent_count > 10:
-        report.issues.append(ValidationResult(
-            code="O006",
-            severity="WARNING",
-            line=None,
-            message=f"Hub-and-spoke with {report.agent_count} agents — consider hierarchical topology",
-        ))
+    def scan_lines(rules: list[tuple[str, str, re.Pattern, str]]) -> Callable[[], None]:
+        def scan() -> None:
+            for line_num, line in enumerate(lines, start=1):
+                for code, severity, pattern, message in rules:
+                    if pattern.search(line):
+                        report.issues.append(ValidationResult(
+                            code=code,
+                            severity=severity,
+                            line=line_num,
+                            message=message,
+                        ))
+        return scan
+
+    checks = [
+        ("topology", "WARNING", 2, topology, False),
+        ("required_sections", "WARNING", 0, required_sections, False),
+    ]
+    if split_rules:
+        checks.extend((rule[0], rule[1], 1, scan_lines([rule]), True) for rule in line_rules)
+    elif line_rules:
+        checks.append(("line_rules", "ERROR", 1, scan_lines(line_rules), True))
+    return checks
+
+
+def validate_file(file_path: Path, time_budget_ms: float | None = None) -> TopologyReport:
+    return validate_content(file_path.read_text(encoding="utf-8"), file_path, time_budget_ms=time_budget_ms)
+
+
+def validate_content(
+    content: Content,
+    file_path: Path | str = "<inline>",
+    line_rules: list[tuple[str, str, re.Pattern, str]] = LINE_RULES,
+    time_budget_ms: float | None = None,
+) -> TopologyReport:
+    content = decode_content(content)
+    report = TopologyReport(file_path=Path(file_path))
 
+    if time_budget_ms is None:
+        for _, _, _, run, _ in sorted(build_checks(content, report, line_rules), key=lambda check: check[2]):
+            run()
+    else:
+        report.skipped_checks = load_scheduler().run_checks(
+            "validate_topology",
+            build_checks(content, report, line_rules, split_rules=True),
+            report.issues,
+            content,
+            time_budget_ms,
+            lambda sample: build_checks(sample, TopologyReport(file_path=Path(file_path)), line_rules, split_rules=True),
+        )
     return report
 
 
+def validate_batch(items: Iterable[tuple[str, Content]]) -> Iterator[TopologyReport]:
+    for item_id, content in items:
+        yield validate_content(content, item_id)
+
+
 def format_report(report: TopologyReport) -> str:
     lines: list[str] = [f"\n📐 Orchestration Topology Validation: {report.file_path}"]
     lines.append(f"   Topology: {report.topology_detected or 'Not detected'}")
     lines.append(f"   Agents:   ~{report.agent_count}")
     lines.append(f"   Sections: {len(report.sections_found)}/{len(REQUIRED_SECTIONS)} found")
-    lines.append(f"   Score:    {report.score}/10")
+    score = "not scored (partial run)" if report.partial else f"{report.score}/10"
+    lines.append(f"   Score:    {score}")
+    if report.partial:
+        lines.append(f"   ⏱️  Partial: time budget reached, skipped {', '.join(report.skipped_checks)}")
 
     if report.issues:
         lines.append("\n   Issues:")
@@ -139,8 +225,17 @@ def main() -> None:
     )
     parser.add_argument("files", type=Path, nargs="+", help="Orchestration config file(s)")
     parser.add_argument("--strict", action="store_true", help="Exit 1 on any warnings")
+    parser.add_argument(
+        "--time-budget", type=float, metavar="MS",
+        help="Run the most valuable checks first and stop after MS milliseconds per file; skipped checks are listed",
+    )
 
     args = parser.parse_args()
+    if args.time_budget is not None:
+        try:
+            load_scheduler()
+        except ValueError as exc:
+            parser.error(str(exc))
     exit_code = 0
 
     for file_path in args.files:
@@ -149,10 +244,10 @@ def main() -> None:
             exit_code = 1
             continue
 
-        report = validate_file(file_path)
+        report = validate_file(file_path, args.time_budget)
         print(format_report(report))
 
-        if args.strict and any(i.severity in ("ERROR", "WARNING") for i in report.issues):
+        if args.strict and (report.partial or any(i.severity in ("ERROR", "WARNING") for i in report.issues)):
             exit_code = 1
 
     sys.exit(exit_code)
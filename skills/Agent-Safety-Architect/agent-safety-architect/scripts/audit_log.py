@@ -0,0 +1,705 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator
+
+SEGMENT_MAGIC = b"AGAUDIT1"
+# Record: payload length, CRC32 over timestamp + payload, timestamp (ns since epoch), payload.
+RECORD_HEADER = struct.Struct("<IIQ")
+# Sparse index entry: timestamp, sequence number and file offset of the first record in a block.
+INDEX_ENTRY = struct.Struct("<QQQ")
+TIMESTAMP = struct.Struct("<Q")
+LENGTH_CRC = struct.Struct("<II")
+
+ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+DURABILITY_MODES = {
+    "none": "write at batch boundaries, fsync only on rotation and close (fastest; a crash loses the page cache)",
+    "group": "fsync every --batch records or --max-delay-ms, whichever comes first (bounded loss window)",
+    "sync": "append returns once its record is fsynced; concurrent writers share one fsync (group commit)",
+}
+
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+DEFAULT_BATCH = 1000
+DEFAULT_MAX_DELAY_MS = 10.0
+DEFAULT_INDEX_INTERVAL = 64 * 1024
+MAX_RECORD_BYTES = 16 * 1024 * 1024
+
+
+def segment_name(first_seq: int) -> str:
+    return f"{first_seq:020d}.log"
+
+
+def encode_record(payload: bytes, timestamp_ns: int) -> bytes:
+    body = TIMESTAMP.pack(timestamp_ns) + payload
+    return LENGTH_CRC.pack(len(payload), zlib.crc32(body)) + body
+
+
+@dataclass
+class ScanResult:
+    records: int = 0
+    end_offset: int = 0
+    last_timestamp: int = 0
+    backwards_at: int = -1
+    error: str = ""
+
+
+def scan_records(data: bytes | memoryview, offset: int, last_timestamp: int = 0) -> ScanResult:
+    result = ScanResult(end_offset=offset, last_timestamp=last_timestamp)
+    size = len(data)
+    header_size = RECORD_HEADER.size
+    while offset + header_size <= size:
+        length, crc, timestamp_ns = RECORD_HEADER.unpack_from(data, offset)
+        end = offset + header_size + length
+        if length > MAX_RECORD_BYTES or end > size:
+            result.error = f"torn record at offset {offset}"
+            return result
+        payload = data[offset + header_size:end]
+        if zlib.crc32(payload, zlib.crc32(TIMESTAMP.pack(timestamp_ns))) != crc:
+            result.error = f"checksum mismatch at offset {offset}"
+            return result
+        result.records += 1
+        if timestamp_ns < result.last_timestamp and result.backwards_at < 0:
+            result.backwards_at = offset
+        result.last_timestamp = timestamp_ns
+        offset = end
+        result.end_offset = offset
+    if offset != size:
+        result.error = f"torn record header at offset {offset}"
+    return result
+
+
+@dataclass
+class WriterStats:
+    records: int = 0
+    bytes: int = 0
+    writes: int = 0
+    fsyncs: int = 0
+    segments: int = 0
+    recovered_bytes: int = 0
+
+
+class AuditLog:
+    def __init__(
+        self,
+        directory: Path,
+        durability: str = "group",
+        batch: int = DEFAULT_BATCH,
+        max_delay_ms: float = DEFAULT_MAX_DELAY_MS,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        index_interval: int = DEFAULT_INDEX_INTERVAL,
+    ) -> None:
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"Unknown durability mode: {durability} (expected one of {', '.join(DURABILITY_MODES)})")
+        if batch < 1 or segment_bytes < 4096 or index_interval < 1 or max_delay_ms < 0:
+            raise ValueError("batch and index_interval must be >= 1, segment_bytes >= 4096 and max_delay_ms >= 0")
+        self.directory = Path(directory)
+        self.durability = durability
+        self.batch = batch
+        self.max_delay = max_delay_ms / 1000
+        self.segment_bytes = segment_bytes
+        self.index_interval = index_interval
+        self.stats = WriterStats()
+
+        self.lock = threading.Lock()
+        self.durable = threading.Condition(self.lock)
+        self.buffer = bytearray()
+        self.pending_index = bytearray()
+        self.pending = 0
+        self.pending_since = 0.0
+        self.next_seq = 0
+        self.written_seq = 0
+        self.durable_seq = 0
+        self.committing = False
+        self.last_timestamp = 0
+        self.closed = False
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.open_tail()
+
+        self.flusher = None
+        self.stop = threading.Event()
+        if durability == "group" and max_delay_ms > 0:
+            self.flusher = threading.Thread(target=self.flush_loop, name="audit-log-flusher", daemon=True)
+            self.flusher.start()
+
+    def __enter__(self) -> "AuditLog":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def open_tail(self) -> None:
+        segments = sorted(self.directory.glob("*.log"))
+        if not segments:
+            self.open_segment(0)
+            return
+        # Recover the last segment: count its records and truncate a torn tail left by a crash.
+        path = segments[-1]
+        first_seq = int(path.stem)
+        entries = read_index(path.with_suffix(".idx"))
+        data = path.read_bytes()
+        if not data.startswith(SEGMENT_MAGIC):
+            raise ValueError(f"{path} is not an audit segment")
+        start_offset, start_seq = len(SEGMENT_MAGIC), first_seq
+        for timestamp_ns, seq, offset in reversed(entries):
+            if offset < len(data):
+                start_offset, start_seq = offset, seq
+                break
+        result = scan_records(memoryview(data), start_offset)
+        self.next_seq = self.written_seq = self.durable_seq = start_seq + result.records
+        self.last_timestamp = result.last_timestamp or (entries[-1][0] if entries else 0)
+        if result.end_offset < len(data):
+            self.stats.recovered_bytes = len(data) - result.end_offset
+            with open(path, "r+b") as handle:
+                handle.truncate(result.end_offset)
+                os.fsync(handle.fileno())
+        valid = [entry for entry in entries if entry[2] < result.end_offset]
+        if len(valid) != len(entries):
+            write_index(path.with_suffix(".idx"), valid)
+        self.segment_path = path
+        self.segment = open(path, "ab", buffering=0)
+        self.index = open(path.with_suffix(".idx"), "ab", buffering=0)
+        self.segment_size = result.end_offset
+        self.indexed_at = valid[-1][2] if valid else -self.index_interval
+
+    def open_segment(self, first_seq: int) -> None:
+        self.segment_path = self.directory / segment_name(first_seq)
+        self.segment = open(self.segment_path, "wb", buffering=0)
+        self.segment.write(SEGMENT_MAGIC)
+        self.index = open(self.segment_path.with_suffix(".idx"), "wb", buffering=0)
+        self.segment_size = len(SEGMENT_MAGIC)
+        self.indexed_at = -self.index_interval
+        self.stats.segments += 1
+        fsync_directory(self.directory)
+
+    def append(self, record: dict | str | bytes, timestamp_ns: int | None = None) -> int:
+        if isinstance(record, dict):
+            payload = ENCODER.encode(record).encode("utf-8")
+        elif isinstance(record, str):
+            payload = record.encode("utf-8")
+        elif isinstance(record, (bytes, bytearray, memoryview)):
+            payload = bytes(record)
+        else:
+            raise ValueError(f"Audit records must be a dict, str or bytes, not {type(record).__name__}")
+        if len(payload) > MAX_RECORD_BYTES:
+            raise ValueError(f"Record of {len(payload):,} bytes exceeds the {MAX_RECORD_BYTES:,}-byte limit")
+
+        size = RECORD_HEADER.size + len(payload)
+        with self.lock:
+            # Waiting out another writer's group commit releases the lock, so settle the segment
+            # first; the timestamp is taken once nothing can append ahead of this record.
+            while True:
+                if self.closed:
+                    raise ValueError("Audit log is closed")
+                offset = self.segment_size + len(self.buffer)
+                if offset + size <= self.segment_bytes or offset <= len(SEGMENT_MAGIC):
+                    break
+                if self.committing:
+                    self.durable.wait()
+                    continue
+                self.rotate()
+            # Timestamps never go backwards within a log, so the sparse index stays sorted.
+            timestamp_ns = max(timestamp_ns or time.time_ns(), self.last_timestamp)
+            self.last_timestamp = timestamp_ns
+            encoded = encode_record(payload, timestamp_ns)
+            if offset - self.indexed_at >= self.index_interval:
+                self.pending_index += INDEX_ENTRY.pack(timestamp_ns, self.next_seq, offset)
+                self.indexed_at = offset
+            seq = self.next_seq
+            self.next_seq += 1
+            if not self.pending:
+                self.pending_since = time.monotonic()
+            self.buffer += encoded
+            self.pending += 1
+
+            if self.durability == "sync":
+                self.wait_durable(seq + 1)
+            elif self.pending >= self.batch:
+                self.commit_locked(fsync=self.durability == "group")
+        return seq
+
+    def wait_durable(self, target: int) -> None:
+        # Leader/follower group commit: one waiter writes and fsyncs everything buffered so far,
+        # the others sleep until the durable sequence passes their record.
+        while self.durable_seq < target:
+            if self.committing:
+                self.durable.wait()
+                continue
+            self.committing = True
+            buffer, index, upto = self.take_pending()
+            self.lock.release()
+            try:
+                self.write_out(buffer, index, fsync=True)
+            finally:
+                self.lock.acquire()
+                self.committing = False
+            self.written_seq = self.durable_seq = max(self.durable_seq, upto)
+            self.durable.notify_all()
+
+    def take_pending(self) -> tuple[bytes, bytes, int]:
+        buffer, index = bytes(self.buffer), bytes(self.pending_index)
+        self.stats.records += self.pending
+        self.stats.bytes += len(buffer)
+        self.buffer.clear()
+        self.pending_index.clear()
+        self.pending = 0
+        self.segment_size += len(buffer)
+        return buffer, index, self.next_seq
+
+    def write_out(self, buffer: bytes, index: bytes, fsync: bool) -> None:
+        if buffer:
+            self.segment.write(buffer)
+            self.stats.writes += 1
+        if index:
+            self.index.write(index)
+        if fsync:
+            os.fsync(self.segment.fileno())
+            os.fsync(self.index.fileno())
+            self.stats.fsyncs += 1
+
+    def commit_locked(self, fsync: bool) -> None:
+        while self.committing:
+            self.durable.wait()
+        if not self.pending and (not fsync or self.durable_seq == self.written_seq):
+            return
+        buffer, index, upto = self.take_pending()
+        self.write_out(buffer, index, fsync)
+        self.written_seq = upto
+        if fsync:
+            self.durable_seq = upto
+            self.durable.notify_all()
+
+    def commit(self, fsync: bool = True) -> None:
+        with self.lock:
+            self.commit_locked(fsync)
+
+    def rotate(self) -> None:
+        self.commit_locked(fsync=True)
+        self.segment.close()
+        self.index.close()
+        self.open_segment(self.next_seq)
+
+    def flush_loop(self) -> None:
+        while not self.stop.wait(self.max_delay):
+            with self.lock:
+                if self.pending and time.monotonic() - self.pending_since >= self.max_delay:
+                    self.commit_locked(fsync=True)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.stop.set()
+        if self.flusher is not None:
+            self.flusher.join()
+        with self.lock:
+            self.commit_locked(fsync=True)
+            self.closed = True
+            self.segment.close()
+            self.index.close()
+
+
+def fsync_directory(directory: Path) -> None:
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def read_index(path: Path) -> list[tuple[int, int, int]]:
+    if not path.exists():
+        return []
+    data = path.read_bytes()
+    usable = len(data) - len(data) % INDEX_ENTRY.size
+    return list(INDEX_ENTRY.iter_unpack(data[:usable]))
+
+
+def write_index(path: Path, entries: list[tuple[int, int, int]]) -> None:
+    tmp = path.with_suffix(".idx.tmp")
+    tmp.write_bytes(b"".join(INDEX_ENTRY.pack(*entry) for entry in entries))
+    os.replace(tmp, path)
+
+
+@dataclass
+class Segment:
+    path: Path
+    first_seq: int
+    index: list[tuple[int, int, int]] = field(default_factory=list)
+
+    @property
+    def first_timestamp(self) -> int | None:
+        return self.index[0][0] if self.index else None
+
+
+@dataclass
+class AuditEntry:
+    seq: int
+    timestamp_ns: int
+    payload: bytes
+
+    @property
+    def record(self) -> dict | str:
+        text = self.payload.decode("utf-8", errors="replace")
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            return text
+
+    @property
+    def time(self) -> str:
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9, tz=timezone.utc).isoformat(timespec="microseconds")
+
+
+class AuditReader:
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+        self.segments = [
+            Segment(path, int(path.stem), read_index(path.with_suffix(".idx")))
+            for path in sorted(self.directory.glob("*.log"))
+        ]
+        self.errors: list[str] = []
+        self.blocks_read = 0
+
+    def scan(self, since_ns: int = 0, until_ns: int | None = None) -> Iterator[AuditEntry]:
+        until_ns = 2**64 - 1 if until_ns is None else until_ns
+        for position, segment in enumerate(self.segments):
+            following = self.segments[position + 1].first_timestamp if position + 1 < len(self.segments) else None
+            # Timestamps are non-decreasing across the log: a segment whose successor starts before
+            # `since` cannot hold a match, and nothing after a segment starting past `until` can.
+            if following is not None and following < since_ns:
+                continue
+            if segment.first_timestamp is not None and segment.first_timestamp > until_ns:
+                break
+            yield from self.scan_segment(segment, since_ns, until_ns)
+
+    def scan_segment(self, segment: Segment, since_ns: int, until_ns: int) -> Iterator[AuditEntry]:
+        with open(segment.path, "rb") as handle:
+            if handle.read(len(SEGMENT_MAGIC)) != SEGMENT_MAGIC:
+                self.errors.append(f"{segment.path.name}: not an audit segment")
+                return
+            offset, seq = len(SEGMENT_MAGIC), segment.first_seq
+            # Start from the last indexed block that begins strictly before `since`; equal timestamps
+            # may continue from the block before.
+            position = bisect_left(segment.index, (since_ns,)) - 1
+            if position >= 0:
+                _, seq, offset = segment.index[position]
+            handle.seek(offset)
+            header_size = RECORD_HEADER.size
+            while True:
+                header = handle.read(header_size)
+                if not header:
+                    return
+                if len(header) < header_size:
+                    self.errors.append(f"{segment.path.name}: torn record header at offset {offset}")
+                    return
+                length, crc, timestamp_ns = RECORD_HEADER.unpack(header)
+                payload = handle.read(length) if length <= MAX_RECORD_BYTES else b""
+                if len(payload) != length:
+                    self.errors.append(f"{segment.path.name}: torn record at offset {offset}")
+                    return
+                if zlib.crc32(payload, zlib.crc32(header[8:])) != crc:
+                    self.errors.append(f"{segment.path.name}: checksum mismatch at offset {offset}")
+                    return
+                if timestamp_ns > until_ns:
+                    return
+                if timestamp_ns >= since_ns:
+                    yield AuditEntry(seq, timestamp_ns, payload)
+                offset += header_size + length
+                seq += 1
+
+    def verify(self) -> dict:
+        totals = {"segments": len(self.segments), "records": 0, "bytes": 0, "index_entries": 0, "errors": []}
+        last_timestamp = 0
+        for segment in self.segments:
+            data = segment.path.read_bytes()
+            totals["bytes"] += len(data)
+            totals["index_entries"] += len(segment.index)
+            if not data.startswith(SEGMENT_MAGIC):
+                totals["errors"].append(f"{segment.path.name}: not an audit segment")
+                continue
+            result = scan_records(memoryview(data), len(SEGMENT_MAGIC), last_timestamp)
+            totals["records"] += result.records
+            last_timestamp = result.last_timestamp
+            if result.error:
+                totals["errors"].append(f"{segment.path.name}: {result.error}")
+            if result.backwards_at >= 0:
+                totals["errors"].append(f"{segment.path.name}: timestamp goes backwards at offset {result.backwards_at}")
+            for timestamp_ns, seq, offset in segment.index:
+                if offset >= result.end_offset or RECORD_HEADER.unpack_from(data, offset)[2] != timestamp_ns:
+                    totals["errors"].append(f"{segment.path.name}: index entry for seq {seq} does not match offset {offset}")
+                    break
+        return totals
+
+
+def parse_time(value: str) -> int:
+    try:
+        return int(float(value) * 1e9)
+    except ValueError:
+        pass
+    try:
+        moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise ValueError(f"Invalid time: {value} (use ISO 8601 or epoch seconds)") from None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp() * 1e9)
+
+
+def bench_records(count: int) -> list[dict]:
+    actions = [
+        ("file_write", "src/app.py", "success"),
+        ("shell", "pytest -q", "success"),
+        ("http_get", "https://api.github.com/repos", "success"),
+        ("file_read", ".env", "denied"),
+        ("shell", "git push origin main", "approval-required"),
+    ]
+    return [
+        {"agent": f"agent-{i % 8}", "action": action, "target": target, "status": status, "tier": "supervised"}
+        for i, (action, target, status) in ((i, actions[i % len(actions)]) for i in range(min(count, 4096)))
+    ]
+
+
+@dataclass
+class BenchResult:
+    durability: str
+    records: int
+    threads: int
+    elapsed_s: float
+    stats: WriterStats
+    latencies_us: list[float]
+    scan_s: float = 0.0
+    scanned: int = 0
+
+    @property
+    def per_second(self) -> float:
+        return self.records / self.elapsed_s if self.elapsed_s else 0.0
+
+    def latency(self, quantile: float) -> float:
+        if not self.latencies_us:
+            return 0.0
+        ordered = sorted(self.latencies_us)
+        return ordered[min(len(ordered) - 1, int(quantile * len(ordered)))]
+
+
+def run_bench(
+    directory: Path, durability: str, records: int, threads: int = 1, sample_every: int = 64, **options
+) -> BenchResult:
+    payloads = bench_records(records)
+    latencies: list[float] = []
+    log = AuditLog(directory, durability=durability, **options)
+    per_thread = records // threads
+
+    def worker(offset: int) -> None:
+        append = log.append
+        clock = time.perf_counter
+        for i in range(per_thread):
+            if i % sample_every:
+                append(payloads[(offset + i) % len(payloads)])
+            else:
+                started = clock()
+                append(payloads[(offset + i) % len(payloads)])
+                latencies.append((clock() - started) * 1e6)
+
+    started = time.perf_counter()
+    if threads == 1:
+        worker(0)
+    else:
+        pool = [threading.Thread(target=worker, args=(n * per_thread,)) for n in range(threads)]
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+    log.close()
+    elapsed = time.perf_counter() - started
+    result = BenchResult(durability, per_thread * threads, threads, elapsed, log.stats, latencies)
+
+    reader = AuditReader(directory)
+    timestamps = [segment.first_timestamp for segment in reader.segments if segment.first_timestamp]
+    if timestamps:
+        # Time-range scan over the middle tenth of the log, located through the sparse index.
+        span = log.last_timestamp - timestamps[0]
+        since = timestamps[0] + int(span * 0.45)
+        started = time.perf_counter()
+        result.scanned = sum(1 for _ in reader.scan(since, since + span // 10))
+        result.scan_s = time.perf_counter() - started
+    return result
+
+
+def format_bench(results: list[BenchResult], options: dict) -> str:
+    lines = [
+        f"\n🧾 Audit log benchmark (batch {options['batch']}, max delay {options['max_delay_ms']:g}ms, "
+        f"segments {options['segment_bytes'] / 1024 / 1024:g} MiB, index every {options['index_interval'] / 1024:g} KiB)",
+        f"\n   {'Mode':<6} {'Thr':>3} {'Records':>10} {'Rec/s':>10} {'MB/s':>7} {'p50µs':>7} {'p99µs':>8} {'fsyncs':>7} {'Segs':>5} {'Scan 10%':>14}",
+        f"   {'─' * 6} {'─' * 3} {'─' * 10} {'─' * 10} {'─' * 7} {'─' * 7} {'─' * 8} {'─' * 7} {'─' * 5} {'─' * 14}",
+    ]
+    for result in results:
+        scan = f"{result.scanned:,} in {result.scan_s * 1000:.0f}ms"
+        lines.append(
+            f"   {result.durability:<6} {result.threads:>3} {result.records:>10,} {result.per_second:>10,.0f} "
+            f"{result.stats.bytes / result.elapsed_s / 1e6:>7.1f} {result.latency(0.5):>7.1f} {result.latency(0.99):>8.1f} "
+            f"{result.stats.fsyncs:>7,} {result.stats.segments:>5} {scan:>14}"
+        )
+    lines.append("")
+    for mode in dict.fromkeys(result.durability for result in results):
+        lines.append(f"   {mode}: {DURABILITY_MODES[mode]}")
+    return "\n".join(lines)
+
+
+def bench_to_dict(result: BenchResult) -> dict:
+    return {
+        "durability": result.durability,
+        "threads": result.threads,
+        "records": result.records,
+        "elapsed_s": round(result.elapsed_s, 4),
+        "records_per_second": round(result.per_second),
+        "mb_per_second": round(result.stats.bytes / result.elapsed_s / 1e6, 2),
+        "p50_us": round(result.latency(0.5), 2),
+        "p99_us": round(result.latency(0.99), 2),
+        "fsyncs": result.stats.fsyncs,
+        "segments": result.stats.segments,
+        "scan_records": result.scanned,
+        "scan_ms": round(result.scan_s * 1000, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Append-only audit log for agent actions — checksummed segments, group commit, time-range reads",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_writer_args(p: argparse.ArgumentParser) -> None:
+        p.add_argument("--durability", choices=list(DURABILITY_MODES), default="group", help="Durability mode (default: group)")
+        p.add_argument("--batch", type=int, default=DEFAULT_BATCH, help=f"Records per group commit (default: {DEFAULT_BATCH})")
+        p.add_argument("--max-delay-ms", type=float, default=DEFAULT_MAX_DELAY_MS, help=f"Longest a record waits for fsync in group mode (default: {DEFAULT_MAX_DELAY_MS:g})")
+        p.add_argument("--segment-mb", type=float, default=DEFAULT_SEGMENT_BYTES / 1024 / 1024, help="Rotate segments at this size (default: 64)")
+        p.add_argument("--index-kb", type=float, default=DEFAULT_INDEX_INTERVAL / 1024, help="Sparse index interval (default: 64)")
+
+    append = sub.add_parser("append", help="Append JSONL records from a file or stdin")
+    append.add_argument("log", type=Path, help="Audit log directory")
+    append.add_argument("records", nargs="?", default="-", help="JSONL file, or - for stdin (default: -)")
+    add_writer_args(append)
+
+    read = sub.add_parser("read", help="Print records in a time range as JSONL")
+    read.add_argument("log", type=Path, help="Audit log directory")
+    read.add_argument("--since", help="Start time, ISO 8601 or epoch seconds (inclusive)")
+    read.add_argument("--until", help="End time, ISO 8601 or epoch seconds (inclusive)")
+    read.add_argument("--limit", type=int, help="Stop after this many records")
+
+    verify = sub.add_parser("verify", help="Check every record checksum, index entry and timestamp order")
+    verify.add_argument("log", type=Path, help="Audit log directory")
+    verify.add_argument("--format", choices=["text", "json"], default="text", help="Output format (default: text)")
+
+    bench = sub.add_parser("bench", help="Measure sustained append throughput per durability mode")
+    bench.add_argument("--records", type=int, default=500_000, help="Records per run (default: 500000)")
+    bench.add_argument("--modes", default="none,group", help="Comma-separated durability modes (default: none,group)")
+    bench.add_argument("--threads", type=int, default=1, help="Writer threads (default: 1; sync mode shares fsyncs across them)")
+    bench.add_argument("--dir", type=Path, help="Directory to benchmark in (default: a temporary directory)")
+    bench.add_argument("--min-rate", type=float, help="Exit 1 if any mode sustains fewer records/s than this")
+    bench.add_argument("--format", choices=["text", "json"], default="text", help="Output format (default: text)")
+    add_writer_args(bench)
+
+    args = parser.parse_args()
+
+    options = {}
+    if args.command in ("append", "bench"):
+        options = {
+            "batch": args.batch,
+            "max_delay_ms": args.max_delay_ms,
+            "segment_bytes": int(args.segment_mb * 1024 * 1024),
+            "index_interval": max(1, int(args.index_kb * 1024)),
+        }
+
+    try:
+        if args.command == "append":
+            source = sys.stdin if args.records == "-" else open(args.records, encoding="utf-8")
+            count = 0
+            with source, AuditLog(args.log, durability=args.durability, **options) as log:
+                for line in source:
+                    if line.strip():
+                        log.append(json.loads(line))
+                        count += 1
+            print(f"🧾 Appended {count:,} records to {args.log} ({log.stats.fsyncs} fsyncs)", file=sys.stderr)
+
+        elif args.command == "read":
+            if not args.log.is_dir():
+                print(f"Error: Audit log not found: {args.log}", file=sys.stderr)
+                sys.exit(1)
+            reader = AuditReader(args.log)
+            since = parse_time(args.since) if args.since else 0
+            until = parse_time(args.until) if args.until else None
+            for count, entry in enumerate(reader.scan(since, until)):
+                if args.limit is not None and count >= args.limit:
+                    break
+                print(json.dumps({"seq": entry.seq, "time": entry.time, "record": entry.record}, ensure_ascii=False))
+            for error in reader.errors:
+                print(f"⚠️  {error}", file=sys.stderr)
+            sys.exit(1 if reader.errors else 0)
+
+        elif args.command == "verify":
+            if not args.log.is_dir():
+                print(f"Error: Audit log not found: {args.log}", file=sys.stderr)
+                sys.exit(1)
+            totals = AuditReader(args.log).verify()
+            if args.format == "json":
+                print(json.dumps(totals, indent=2))
+            else:
+                status = "✅ intact" if not totals["errors"] else f"❌ {len(totals['errors'])} problem(s)"
+                print(f"\n🧾 Audit log {args.log}: {status}")
+                print(f"   {totals['records']:,} records in {totals['segments']} segment(s), {totals['bytes']:,} bytes, {totals['index_entries']:,} index entries")
+                for error in totals["errors"]:
+                    print(f"   ❌ {error}")
+            sys.exit(1 if totals["errors"] else 0)
+
+        else:
+            modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+            unknown = [mode for mode in modes if mode not in DURABILITY_MODES]
+            if unknown or not modes:
+                parser.error(f"--modes must name {', '.join(DURABILITY_MODES)}")
+            if args.threads < 1 or args.records < args.threads:
+                parser.error("--threads must be >= 1 and no more than --records")
+            base = args.dir or Path(tempfile.mkdtemp(prefix="audit-bench-"))
+            results = []
+            try:
+                for mode in modes:
+                    directory = base / mode
+                    if directory.exists():
+                        shutil.rmtree(directory)
+                    results.append(run_bench(directory, mode, args.records, args.threads, **options))
+            finally:
+                if args.dir is None:
+                    shutil.rmtree(base, ignore_errors=True)
+            if args.format == "json":
+                print(json.dumps([bench_to_dict(result) for result in results], indent=2))
+            else:
+                print(format_bench(results, options))
+            slow = [r for r in results if args.min_rate is not None and r.per_second < args.min_rate]
+            if slow:
+                print(f"Error: {', '.join(r.durability for r in slow)} below --min-rate {args.min_rate:,.0f} records/s", file=sys.stderr)
+                sys.exit(1)
+    except (ValueError, OSError, json.JSONDecodeError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
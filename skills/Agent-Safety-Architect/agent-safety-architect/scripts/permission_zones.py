@@ -0,0 +1,689 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import random
+import re
+import shlex
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import urlsplit
+
+ALLOW = "allow"
+DENY = "deny"
+APPROVAL = "approval-required"
+
+# On equally specific matches the more restrictive verdict wins.
+RESTRICTIVENESS = {ALLOW: 0, APPROVAL: 1, DENY: 2}
+
+OPERATIONS = ("read", "write", "create", "append", "delete")
+
+ACCESS_LEVELS = {
+    "read-write": {"read", "write", "create", "append", "delete"},
+    "read-only": {"read"},
+    "write-only": {"write", "create", "append"},
+    "append-only": {"create", "append"},
+    "denied": set(),
+}
+
+NETWORK_ACCESS = {"permitted": ALLOW, "allowed": ALLOW, "denied": DENY, "browser_tool": APPROVAL}
+
+GLOB_CHARS = frozenset("*?[")
+COMMAND_SEPARATORS = {"&&", "||", ";", "|", "&", "\n", "\r"}
+UNANALYZABLE = re.compile(r"\$\(|`|<\(|>\(")
+# Unquoted commands split with one regex pass; shlex is only needed when quoting is present.
+COMMAND_TOKENS = re.compile(r"[^\s;|&<>]+|&&|\|\||&>>?|>>|>\||>&|<<<|<<|<&|<>|[;|&<>\n\r]")
+QUOTING = frozenset("'\"\\")
+PUNCTUATION = frozenset(";&|<>\n\r")
+# File descriptors tokenize as ordinary words ("2", ">&", "1"); only the operator and its target matter.
+REDIRECT = re.compile(r"&>>?|>>|>\||>&|<<<|<<|<&|<>|[<>]")
+REDIRECT_OPERATIONS = {">": "write", ">|": "write", "<>": "write", "&>": "write", ">>": "append", "&>>": "append", "<": "read"}
+HARMLESS_TARGETS = {"/dev/null", "/dev/stdout", "/dev/stderr"}
+# A run of letter-only short options ("-r -f", "-fr") compiles to one sorted cluster ("-fr").
+SHORT_FLAGS = re.compile(r"-[A-Za-z]+")
+# A "**" token in a command prefix matches any number of words, so "find ** -exec" sees -exec anywhere.
+ANY_WORDS = "**"
+
+ZONE_TAG = re.compile(r"<zone\s+([^>]*)>(.*?)</zone>", re.DOTALL)
+ZONE_ATTR = re.compile(r'(\w+)="([^"]*)"')
+ENDPOINT_TAG = re.compile(r"<endpoint>\s*([^<\s]+)\s*</endpoint>")
+EXCLUDES_LINE = re.compile(r"Excludes:\s*(.+)")
+PLACEHOLDER = re.compile(r"\[([A-Z_]+)\]")
+
+REFERENCE_ZONES = {
+    "paths": [
+        {"name": "workspace", "path": "[PROJECT_ROOT]", "access": "read-write",
+         "exclude": [".env", ".env.*", "*.pem", ".git/config", "secrets/"]},
+        {"name": "uploads", "path": "[UPLOAD_DIR]", "access": "read-only"},
+        {"name": "output", "path": "[OUTPUT_DIR]", "access": "write-only"},
+        {"name": "audit", "path": "[AUDIT_DIR]", "access": "append-only"},
+        {"name": "system", "path": ["/etc", "/usr", "/var", "/bin", "/sbin", "/boot", "/proc", "/sys"], "access": "denied"},
+        {"name": "home", "path": "~/", "access": "denied"},
+        {"name": "ssh-keys", "path": "~/.ssh/**", "access": "denied"},
+    ],
+    "commands": [
+        {"prefix": ["ls", "cat", "head", "tail", "grep", "rg", "find", "wc", "diff", "pwd", "echo"], "decision": ALLOW},
+        {"prefix": ["find ** -exec", "find ** -execdir", "find ** -ok", "find ** -okdir", "find ** -delete",
+                    "find ** -fprint", "find ** -fprint0", "find ** -fprintf", "find ** -fls", "rg ** --pre"],
+         "decision": APPROVAL},
+        {"prefix": ["git status", "git diff", "git log", "git show", "git add", "git commit", "git checkout"], "decision": ALLOW},
+        {"prefix": ["python3", "python", "pytest", "node", "npm test", "npm run"], "decision": ALLOW},
+        {"prefix": ["git push", "git reset --hard", "npm publish", "pip install", "npm install", "docker"], "decision": APPROVAL},
+        {"prefix": ["rm"], "decision": APPROVAL},
+        {"prefix": ["rm -rf /", "rm -rf ~", "sudo", "su", "dd", "mkfs", "chmod 777", "chown", "shutdown"], "decision": DENY},
+        {"prefix": ["curl", "wget", "nc", "ssh", "scp"], "decision": DENY},
+        {"prefix": ["python3 -c", "python -c", "node -e", "bash -c", "sh -c", "eval"], "decision": APPROVAL},
+    ],
+    "hosts": [
+        {"host": ["api.github.com", "registry.npmjs.org", "pypi.org", "files.pythonhosted.org"], "decision": ALLOW},
+        {"host": ["*.githubusercontent.com"], "decision": APPROVAL},
+    ],
+    "defaults": {"path": DENY, "command": DENY, "host": DENY},
+}
+
+
+@dataclass
+class Decision:
+    verdict: str
+    rule: str
+    kind: str
+    subject: str
+    reason: str = ""
+
+    @property
+    def allowed(self) -> bool:
+        return self.verdict == ALLOW
+
+
+@dataclass
+class Rule:
+    name: str
+    pattern: str
+    specificity: tuple[int, int, int]
+    verdict: str = DENY
+    access: set[str] | None = None
+    regex: re.Pattern | None = None
+
+    def verdict_for(self, operation: str) -> str:
+        if self.access is None:
+            return self.verdict
+        return ALLOW if operation in self.access else DENY
+
+
+@dataclass
+class TrieNode:
+    children: dict[str, "TrieNode"] = field(default_factory=dict)
+    subtree: list[Rule] = field(default_factory=list)
+    exact: list[Rule] = field(default_factory=list)
+    globs: list[Rule] = field(default_factory=list)
+    flags: list[tuple[frozenset[str], "TrieNode"]] = field(default_factory=list)
+
+    def child(self, key: str) -> "TrieNode":
+        node = self.children.get(key)
+        if node is None:
+            node = self.children[key] = TrieNode()
+        return node
+
+
+def glob_to_regex(pattern: str) -> re.Pattern:
+    parts: list[str] = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+            continue
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                parts.append(re.escape(char))
+            else:
+                body = pattern[i + 1:end]
+                parts.append("[" + ("^" + body[1:] if body.startswith("!") else body) + "]")
+                i = end
+        else:
+            parts.append(re.escape(char))
+        i += 1
+    return re.compile("".join(parts) + r"\Z")
+
+
+def normalize_operand(token: str) -> str:
+    if "/" not in token:
+        return token
+    # "/", "/*", "//" and "/." all name the same target for a destructive command, as do "~" and "~/".
+    while True:
+        stripped = token.rstrip("/")
+        if not stripped.endswith(("/*", "/.")):
+            return stripped or "/"
+        token = stripped[:-1]
+
+
+def normalize_words(tokens: list[str]) -> list[str]:
+    words = tokens[:1]
+    cluster = False
+    options = True
+    for token in tokens[1:]:
+        if options and token[:1] == "-":
+            if token == "--":
+                options = cluster = False
+                continue
+            if SHORT_FLAGS.fullmatch(token):
+                letters = set(token[1:])
+                if cluster:
+                    letters.update(words.pop()[1:])
+                words.append("-" + "".join(sorted(letters)))
+                cluster = True
+                continue
+        cluster = False
+        words.append(normalize_operand(token))
+    return words
+
+
+def pick(current: tuple | None, rule: Rule, verdict: str) -> tuple:
+    candidate = (rule.specificity, RESTRICTIVENESS[verdict], rule, verdict)
+    if current is None or candidate[:2] > current[:2]:
+        return candidate
+    return current
+
+
+class ZoneMatcher:
+    def __init__(self, home: str | None = None, cwd: str | None = None) -> None:
+        self.paths = TrieNode()
+        self.commands = TrieNode()
+        self.hosts = TrieNode()
+        self.defaults = {"path": DENY, "command": DENY, "host": DENY}
+        self.home = home or os.path.expanduser("~")
+        self.cwd = cwd or os.getcwd()
+        self.rule_count = Counter()
+
+    def normalize_path(self, path: str) -> str:
+        if path.startswith("~"):
+            path = self.home + path[1:]
+        if not path.startswith("/"):
+            path = self.cwd + "/" + path
+        return os.path.normpath(path)
+
+    def add_path_zone(self, name: str, path: str, access: str, exclude: list[str] | None = None) -> None:
+        if access not in ACCESS_LEVELS and access not in RESTRICTIVENESS:
+            raise ValueError(f"Zone {name}: unknown access {access} (expected one of {', '.join([*ACCESS_LEVELS, APPROVAL])})")
+        levels = ACCESS_LEVELS.get(access)
+        verdict = DENY if levels is not None else access
+        root = self.normalize_path(path.rstrip("/") or "/") if not GLOB_CHARS & set(path) else path
+        self.add_path_rule(name, root, verdict, levels, subtree=not GLOB_CHARS & set(path))
+        for pattern in exclude or []:
+            pattern = pattern.strip()
+            if not pattern:
+                continue
+            # gitignore-style: a bare name matches at any depth, a path is relative to the zone root.
+            relative = pattern.rstrip("/") if "/" in pattern.rstrip("/") else "**/" + pattern.rstrip("/")
+            self.add_path_rule(f"{name} (excludes {pattern})", root.rstrip("/") + "/" + relative, DENY, None)
+            if pattern.endswith("/"):
+                self.add_path_rule(f"{name} (excludes {pattern})", root.rstrip("/") + "/" + relative + "/**", DENY, None)
+
+    def add_path_rule(self, name: str, pattern: str, verdict: str, access: set[str] | None, subtree: bool = False) -> None:
+        if not GLOB_CHARS & set(pattern):
+            pattern = self.normalize_path(pattern)
+        elif pattern.startswith("~") or not pattern.startswith("/"):
+            pattern = (self.home + pattern[1:]) if pattern.startswith("~") else self.cwd + "/" + pattern
+        segments = [s for s in pattern.split("/") if s]
+        node, depth = self.paths, 0
+        for segment in segments:
+            if GLOB_CHARS & set(segment):
+                break
+            node = node.child(segment)
+            depth += 1
+        literal = "/".join(segments[:depth])
+        if depth == len(segments):
+            rule = Rule(name, pattern, (depth, 2 if not subtree else 0, len(pattern)), verdict, access)
+            (node.subtree if subtree else node.exact).append(rule)
+        else:
+            rest = "/".join(segments[depth:])
+            rule = Rule(name, pattern, (depth, 1, len(literal) + len(rest)), verdict, access, glob_to_regex(rest))
+            node.globs.append(rule)
+        self.rule_count["path"] += 1
+
+    def add_command_rule(self, prefix: str, verdict: str) -> None:
+        if verdict not in RESTRICTIVENESS:
+            raise ValueError(f"Command {prefix!r}: unknown decision {verdict}")
+        tokens = normalize_words(shlex.split(prefix))
+        if not tokens:
+            raise ValueError("Command prefix must not be empty")
+        node = self.commands
+        for token in tokens:
+            if token not in node.children and SHORT_FLAGS.fullmatch(token):
+                node.flags.append((frozenset(token[1:]), node.child(token)))
+            node = node.child(token)
+        literal = sum(token not in ("*", ANY_WORDS) for token in tokens)
+        node.subtree.append(Rule(f"command:{prefix}", prefix, (literal, len(tokens), len(prefix)), verdict))
+        self.rule_count["command"] += 1
+
+    def add_host_rule(self, host: str, verdict: str) -> None:
+        if verdict not in RESTRICTIVENESS:
+            raise ValueError(f"Host {host!r}: unknown decision {verdict}")
+        labels = host.lower().strip(".").split(".")
+        wildcard = labels[0] == "*"
+        node = self.hosts
+        for label in reversed(labels[1:] if wildcard else labels):
+            node = node.child(label)
+        rule = Rule(f"host:{host}", host, (len(labels) - wildcard, 0 if wildcard else 1, len(host)), verdict)
+        (node.subtree if wildcard else node.exact).append(rule)
+        self.rule_count["host"] += 1
+
+    def check_path(self, path: str, operation: str = "read") -> Decision:
+        if operation not in OPERATIONS:
+            raise ValueError(f"Unknown operation: {operation} (expected one of {', '.join(OPERATIONS)})")
+        normalized = self.normalize_path(path)
+        segments = normalized.split("/")[1:] if normalized != "/" else []
+        best = None
+        node = self.paths
+        depth = 0
+        while True:
+            for rule in node.subtree:
+                best = pick(best, rule, rule.verdict_for(operation))
+            if depth == len(segments):
+                for rule in node.exact:
+                    best = pick(best, rule, rule.verdict_for(operation))
+            if node.globs:
+                rest = "/".join(segments[depth:])
+            for rule in node.globs:
+                if rule.regex.match(rest):
+                    best = pick(best, rule, rule.verdict_for(operation))
+            if depth == len(segments):
+                break
+            node = node.children.get(segments[depth])
+            if node is None:
+                break
+            depth += 1
+        return self.decide(best, "path", normalized, f"{operation} ")
+
+    def check_command(self, command: str) -> Decision:
+        if UNANALYZABLE.search(command):
+            return Decision(APPROVAL, "command substitution", "command", command, "cannot be checked statically")
+        if QUOTING.isdisjoint(command):
+            tokens = COMMAND_TOKENS.findall(command)
+        else:
+            try:
+                lexer = shlex.shlex(command, posix=True, punctuation_chars=";&|<>\n\r")
+                lexer.whitespace = " \t"
+                lexer.whitespace_split = True
+                # shlex glues a run of operators (";\n", "|>") into one token; split it like the fast path.
+                tokens = [
+                    part
+                    for token in lexer
+                    for part in (COMMAND_TOKENS.findall(token) if token and PUNCTUATION.issuperset(token) else [token])
+                ]
+            except ValueError as exc:
+                return Decision(APPROVAL, "unparseable command", "command", command, str(exc))
+
+        # A compound command is as restrictive as its most restrictive part.
+        check = self.check_simple_command if "<" in command or ">" in command else self.check_words
+        worst: Decision | None = None
+        segment: list[str] = []
+        for token in [*tokens, ";"]:
+            if token not in COMMAND_SEPARATORS:
+                segment.append(token)
+                continue
+            if segment:
+                decision = check(segment)
+                if worst is None or RESTRICTIVENESS[decision.verdict] > RESTRICTIVENESS[worst.verdict]:
+                    worst = decision
+            segment = []
+        if worst is None:
+            return Decision(self.defaults["command"], "default", "command", command, "empty command")
+        worst.subject = command
+        return worst
+
+    def check_simple_command(self, tokens: list[str]) -> Decision:
+        words: list[str] = []
+        targets: list[Decision] = []
+        index = 0
+        while index < len(tokens):
+            match = REDIRECT.fullmatch(tokens[index])
+            if match is None:
+                words.append(tokens[index])
+                index += 1
+                continue
+            operator = match.group(0)
+            if index + 1 == len(tokens):
+                return Decision(APPROVAL, "unparseable command", "command", " ".join(tokens), f"{operator} has no target")
+            target = tokens[index + 1]
+            index += 2
+            # Here-documents and fd duplication (2>&1, >&-) name no file.
+            if operator in ("<<", "<<<") or target in HARMLESS_TARGETS:
+                continue
+            if operator in (">&", "<&"):
+                if target.isdigit() or target == "-":
+                    continue
+                operator = ">" if operator == ">&" else "<"
+            targets.append(self.check_path(target, REDIRECT_OPERATIONS[operator]))
+
+        if not words and not targets:
+            return self.decide(None, "command", " ".join(tokens))
+        decision = self.check_words(words) if words else None
+        for target in targets:
+            if decision is None or RESTRICTIVENESS[target.verdict] > RESTRICTIVENESS[decision.verdict]:
+                decision = target
+        return decision
+
+    def check_words(self, tokens: list[str]) -> Decision:
+        start = 0
+        while start < len(tokens) - 1 and "=" in tokens[start] and not tokens[start].startswith("-"):
+            start += 1
+        tokens = normalize_words([tokens[start].rsplit("/", 1)[-1], *tokens[start + 1:]])
+        best = None
+        frontier = [(self.commands, 0)]
+        while frontier:
+            node, depth = frontier.pop()
+            for rule in node.subtree:
+                best = pick(best, rule, rule.verdict)
+            if ANY_WORDS in node.children:
+                child = node.children[ANY_WORDS]
+                frontier.extend((child, skipped) for skipped in range(depth, len(tokens) + 1))
+            if depth < len(tokens):
+                token = tokens[depth]
+                keys = (token, "*")
+                if token[:1] == "-" and len(token) > 2:
+                    if SHORT_FLAGS.fullmatch(token):
+                        # A flag cluster satisfies every rule whose flags it includes: -frv matches -fr.
+                        letters = set(token[1:])
+                        keys = ("*",)
+                        frontier.extend((child, depth + 1) for flags, child in node.flags if flags <= letters)
+                    else:
+                        # An option may carry its value attached: -c"code", --config=path.
+                        keys += (token.split("=", 1)[0] if token[1] == "-" else token[:2],)
+                for key in keys:
+                    child = node.children.get(key)
+                    if child is not None:
+                        frontier.append((child, depth + 1))
+        return self.decide(best, "command", " ".join(tokens))
+
+    def check_url(self, url: str) -> Decision:
+        host = (urlsplit(url if "//" in url else "//" + url).hostname or "").lower()
+        labels = host.split(".")
+        best = None
+        node = self.hosts
+        for index, label in enumerate(reversed(labels)):
+            node = node.children.get(label)
+            if node is None:
+                break
+            last = index == len(labels) - 1
+            for rule in node.exact if last else node.subtree:
+                best = pick(best, rule, rule.verdict)
+        return self.decide(best, "host", host)
+
+    def decide(self, best: tuple | None, kind: str, subject: str, action: str = "") -> Decision:
+        if best is None:
+            return Decision(self.defaults[kind], "default", kind, subject, f"{action}no zone matches (default {self.defaults[kind]})")
+        rule, verdict = best[2], best[3]
+        return Decision(verdict, rule.name, kind, subject, f"{action}matched {rule.pattern}")
+
+
+def expand(value: str, variables: dict[str, str]) -> str | None:
+    missing = [name for name in PLACEHOLDER.findall(value) if name not in variables]
+    if missing:
+        return None
+    return PLACEHOLDER.sub(lambda m: variables[m.group(1)], value)
+
+
+def as_list(value: str | list[str]) -> list[str]:
+    if isinstance(value, list):
+        return value
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+def compile_zones(config: dict, variables: dict[str, str] | None = None, home: str | None = None, cwd: str | None = None) -> ZoneMatcher:
+    matcher = ZoneMatcher(home=home, cwd=cwd)
+    cwd = matcher.cwd
+    variables = {
+        "PROJECT_ROOT": cwd,
+        "UPLOAD_DIR": cwd + "/uploads",
+        "OUTPUT_DIR": cwd + "/output",
+        "AUDIT_DIR": cwd + "/.audit",
+        **(variables or {}),
+    }
+    for name, verdict in config.get("defaults", {}).items():
+        if name not in matcher.defaults or verdict not in RESTRICTIVENESS:
+            raise ValueError(f"Invalid default: {name}={verdict}")
+        matcher.defaults[name] = verdict
+
+    for zone in config.get("paths", []):
+        for raw in as_list(zone["path"]):
+            path = expand(raw, variables)
+            if path is not None:
+                matcher.add_path_zone(zone.get("name", raw), path, zone.get("access", DENY), as_list(zone.get("exclude", [])))
+    for entry in config.get("commands", []):
+        for prefix in as_list(entry["prefix"]):
+            matcher.add_command_rule(prefix, entry.get("decision", DENY))
+    for entry in config.get("hosts", []):
+        for host in as_list(entry["host"]):
+            host = expand(host, variables)
+            if host is not None:
+                matcher.add_host_rule(host, entry.get("decision", ALLOW))
+    return matcher
+
+
+def parse_markdown_zones(content: str) -> dict:
+    config: dict = {"paths": [], "commands": [], "hosts": [], "defaults": {}}
+    for attributes, body in ZONE_TAG.findall(content):
+        attrs = dict(ZONE_ATTR.findall(attributes))
+        endpoints = ENDPOINT_TAG.findall(body)
+        if "path" in attrs:
+            excludes = EXCLUDES_LINE.search(body)
+            config["paths"].append({
+                "name": attrs.get("name", attrs["path"]),
+                "path": attrs["path"],
+                "access": attrs.get("access", "denied"),
+                "exclude": as_list(excludes.group(1)) if excludes else [],
+            })
+        elif endpoints:
+            config["hosts"].append({"host": endpoints, "decision": NETWORK_ACCESS.get(attrs.get("access", ""), DENY)})
+        elif attrs.get("access") == "denied":
+            config["defaults"]["host"] = DENY
+    return config
+
+
+def load_zones(path: Path) -> dict:
+    content = path.read_text(encoding="utf-8")
+    if path.suffix == ".json":
+        return json.loads(content)
+    config = parse_markdown_zones(content)
+    if not config["paths"] and not config["hosts"]:
+        raise ValueError(f"No <zone> definitions found in {path}")
+    return config
+
+
+def bench_inputs(matcher: ZoneMatcher, count: int, seed: int = 0) -> list[tuple[str, str, str]]:
+    rng = random.Random(seed)
+    root = matcher.cwd
+    names = ["src", "tests", "docs", "lib", "app", "config", "secrets", ".git", "node_modules"]
+    files = ["main.py", "README.md", ".env", "config", "id_rsa", "index.ts", "data.json", "key.pem"]
+    prefixes = [root, root + "/uploads", root + "/output", root + "/.audit", "/etc", "/usr/lib", "/tmp", "~", "~/.ssh"]
+    commands = [
+        "ls -la", "git status", "git push origin main", "rm -rf build", "rm -rf /", "sudo apt install x",
+        "python3 -m pytest -q", "curl https://example.com", "cat a.txt | grep x && rm b", "FOO=1 npm run build",
+        "/usr/bin/git diff HEAD~1", "docker run alpine", "echo $(whoami)", "make all",
+    ]
+    urls = [
+        "https://api.github.com/repos", "https://registry.npmjs.org/pkg", "https://evil.example.com/x",
+        "https://raw.githubusercontent.com/a/b", "http://169.254.169.254/latest", "pypi.org/simple",
+    ]
+    inputs = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.6:
+            depth = rng.randrange(0, 5)
+            path = "/".join([rng.choice(prefixes), *(rng.choice(names) for _ in range(depth)), rng.choice(files)])
+            inputs.append(("path", path, rng.choice(OPERATIONS)))
+        elif roll < 0.9:
+            inputs.append(("command", rng.choice(commands), ""))
+        else:
+            inputs.append(("url", rng.choice(urls), ""))
+    return inputs
+
+
+@dataclass
+class BenchReport:
+    decisions: int
+    elapsed_s: float
+    per_kind: dict[str, tuple[int, float]]
+    verdicts: Counter
+
+    @property
+    def per_second(self) -> float:
+        return self.decisions / self.elapsed_s if self.elapsed_s else 0.0
+
+    @property
+    def mean_us(self) -> float:
+        return self.elapsed_s * 1e6 / self.decisions if self.decisions else 0.0
+
+
+def run_bench(matcher: ZoneMatcher, decisions: int, pool: int = 10_000, seed: int = 0) -> BenchReport:
+    inputs = bench_inputs(matcher, min(pool, decisions), seed)
+    by_kind: dict[str, list[tuple[str, str]]] = {"path": [], "command": [], "url": []}
+    for kind, subject, operation in inputs:
+        by_kind[kind].append((subject, operation))
+    check = {
+        "path": matcher.check_path,
+        "command": lambda subject, _: matcher.check_command(subject),
+        "url": lambda subject, _: matcher.check_url(subject),
+    }
+
+    verdicts: Counter = Counter()
+    per_kind: dict[str, tuple[int, float]] = {}
+    total = 0.0
+    for kind, items in by_kind.items():
+        if not items:
+            continue
+        count = round(decisions * len(items) / len(inputs))
+        fn = check[kind]
+        started = time.perf_counter()
+        for index in range(count):
+            subject, operation = items[index % len(items)]
+            fn(subject, operation)
+        elapsed = time.perf_counter() - started
+        per_kind[kind] = (count, elapsed)
+        total += elapsed
+        for subject, operation in items:
+            verdicts[fn(subject, operation).verdict] += 1
+    return BenchReport(sum(c for c, _ in per_kind.values()), total, per_kind, verdicts)
+
+
+def format_decision(decision: Decision) -> str:
+    icon = {ALLOW: "✅", APPROVAL: "⚠️ ", DENY: "❌"}[decision.verdict]
+    return f"   {icon} {decision.verdict:<17} {decision.kind:<7} {decision.subject}  ← {decision.rule} ({decision.reason})"
+
+
+def format_bench(report: BenchReport, matcher: ZoneMatcher) -> str:
+    rules = ", ".join(f"{count} {kind}" for kind, count in sorted(matcher.rule_count.items()))
+    lines = [
+        f"\n🛡️  Permission-zone benchmark: {report.decisions:,} decisions ({rules} rules)",
+        f"   Throughput: {report.per_second:,.0f} decisions/s  |  mean {report.mean_us:.2f}µs  |  total {report.elapsed_s:.2f}s",
+    ]
+    for kind, (count, elapsed) in report.per_kind.items():
+        lines.append(f"   {kind:<8} {count:>10,} decisions  {elapsed * 1e6 / count:>7.2f}µs each")
+    total = sum(report.verdicts.values())
+    lines.append(
+        "   Verdict mix: " + ", ".join(f"{v} {report.verdicts[v] / total:.0%}" for v in (ALLOW, APPROVAL, DENY))
+    )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compile permission zones (paths, command prefixes, URL hosts) and answer allow/deny/approval-required",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_zone_args(p: argparse.ArgumentParser) -> None:
+        p.add_argument("zones", type=Path, nargs="?", help="Zone definitions: JSON, or markdown with <zone> blocks (default: reference zones)")
+        p.add_argument("--var", action="append", default=[], metavar="NAME=VALUE", help="Placeholder value, e.g. PROJECT_ROOT=/work")
+        p.add_argument("--cwd", help="Directory relative paths resolve against (default: current directory)")
+
+    check = sub.add_parser("check", help="Decide paths, commands and URLs")
+    add_zone_args(check)
+    check.add_argument("--path", action="append", default=[], help="File path to check (repeatable)")
+    check.add_argument("--op", choices=OPERATIONS, default="read", help="File operation for --path (default: read)")
+    check.add_argument("--cmd", action="append", default=[], help="Shell command to check (repeatable)")
+    check.add_argument("--url", action="append", default=[], help="URL or host to check (repeatable)")
+    check.add_argument("--strict", action="store_true", help="Exit 1 on approval-required as well as deny")
+    check.add_argument("--format", choices=["text", "json"], default="text", help="Output format (default: text)")
+
+    bench = sub.add_parser("bench", help="Time decisions over a mixed path/command/URL workload")
+    add_zone_args(bench)
+    bench.add_argument("--decisions", type=int, default=1_000_000, help="Decisions to time (default: 1000000)")
+    bench.add_argument("--max-us", type=float, help="Exit 1 if the mean decision takes longer than this")
+    bench.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    bench.add_argument("--format", choices=["text", "json"], default="text", help="Output format (default: text)")
+
+    args = parser.parse_args()
+
+    try:
+        variables = dict(item.split("=", 1) for item in args.var)
+    except ValueError:
+        print("Error: --var expects NAME=VALUE", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        if args.zones:
+            if not args.zones.exists():
+                print(f"Error: File not found: {args.zones}", file=sys.stderr)
+                sys.exit(1)
+            config = load_zones(args.zones)
+        else:
+            config = REFERENCE_ZONES
+        matcher = compile_zones(config, variables, cwd=args.cwd)
+    except (ValueError, KeyError, json.JSONDecodeError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.command == "bench":
+        report = run_bench(matcher, args.decisions, seed=args.seed)
+        if args.format == "json":
+            print(json.dumps({
+                "decisions": report.decisions,
+                "elapsed_s": round(report.elapsed_s, 4),
+                "decisions_per_second": round(report.per_second),
+                "mean_us": round(report.mean_us, 3),
+                "per_kind_us": {k: round(e * 1e6 / c, 3) for k, (c, e) in report.per_kind.items()},
+                "verdicts": dict(report.verdicts),
+            }, indent=2))
+        else:
+            print(format_bench(report, matcher))
+        if args.max_us is not None and report.mean_us > args.max_us:
+            print(f"Error: mean decision {report.mean_us:.2f}µs exceeds --max-us {args.max_us}", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    if not (args.path or args.cmd or args.url):
+        parser.error("check needs at least one --path, --cmd or --url")
+    decisions = (
+        [matcher.check_path(path, args.op) for path in args.path]
+        + [matcher.check_command(command) for command in args.cmd]
+        + [matcher.check_url(url) for url in args.url]
+    )
+    if args.format == "json":
+        print(json.dumps([vars(d) for d in decisions], indent=2))
+    else:
+        print(f"\n🛡️  Permission-zone decisions ({len(decisions)})")
+        for decision in decisions:
+            print(format_decision(decision))
+
+    blocked = {DENY, APPROVAL} if args.strict else {DENY}
+    sys.exit(1 if any(d.verdict in blocked for d in decisions) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,20 @@
 #!/usr/bin/env python3
 
 import argparse
+import base64
+import json
+import math
+import os
 import re
+import subprocess
 import sys
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import ModuleType
 
 AUTONOMY_TIERS = {
     "full-auto": r"(?:full[- ]?auto|autonomous|auto[- ]?approve|no[- ]?confirmation)",
@@ -34,6 +44,50 @@ ANTI_PATTERNS = [
     ("S008", "WARNING", r"(?:execute|run|eval)\s+(?:arbitrary|user[- ]?provided|untrusted)", "Arbitrary execution of untrusted input"),
 ]
 
+VENDORED_DIRS = {
+    ".git", ".hg", ".svn", "node_modules", "bower_components", "vendor", "third_party",
+    ".venv", "venv", "site-packages", "__pycache__", ".tox", ".mypy_cache", "dist", "build",
+}
+
+LOCKFILES = {
+    "package-lock.json", "yarn.lock", "pnpm-lock.yaml", "poetry.lock",
+    "Pipfile.lock", "Cargo.lock", "go.sum", "composer.lock", "Gemfile.lock",
+}
+
+BINARY_SIGNATURES = (
+    b"\x89PNG", b"\xff\xd8\xff", b"GIF8", b"%PDF", b"PK\x03\x04", b"\x1f\x8b", b"BZh",
+    b"\xfd7zXZ", b"7z\xbc\xaf", b"\x7fELF", b"MZ", b"\xca\xfe\xba\xbe", b"\xcf\xfa\xed\xfe",
+    b"\x00asm", b"SQLite format 3", b"RIFF", b"OggS", b"fLaC", b"ID3", b"\x00\x00\x01\x00",
+)
+
+SCAN_ANCHORS = {
+    "S001": (b"key", b"password", b"secret", b"token"),
+    "S002": (b"sk-", b"ghp_", b"gho_", b"akia", b"xoxb-", b"xoxp-", b"xoxs-"),
+    "S003": (b"curl", b"wget", b"fetch"),
+}
+
+# Scan patterns run case-sensitively over lowercased content, which is several times faster than
+# re.IGNORECASE, and never cross a newline, so whole-buffer and per-line matching agree.
+SCAN_PATTERNS = [
+    (code, severity, re.compile(pattern.lower().replace(r"\s", r"[^\S\n]").encode()), message, SCAN_ANCHORS[code])
+    for code, severity, pattern, message in CREDENTIAL_PATTERNS
+]
+
+# Above roughly one anchor hit per this many bytes, one regex pass over the whole buffer beats
+# searching each anchored line separately.
+DENSE_ANCHOR_BYTES = 400
+
+TOKEN_MIN_LENGTH = 32
+
+TOKEN_CLASS = bytes(
+    1 if chr(b).isascii() and (chr(b).isalnum() or chr(b) in "+/=_-") else 0
+    for b in range(256)
+)
+
+TOKEN_CONTEXT = frozenset(b"=:\"'`")
+
+SEQUENTIAL_RUNS = (b"abcdefgh", b"ABCDEFGH", b"01234567")
+
 
 @dataclass
 class ValidationResult:
@@ -51,6 +105,11 @@ class SafetyReport:
     checks_found: list[str] = field(default_factory=list)
     checks_missing: list[str] = field(default_factory=list)
     issues: list[ValidationResult] = field(default_factory=list)
+    skipped_checks: list[str] = field(default_factory=list)
+
+    @property
+    def partial(self) -> bool:
+        return bool(self.skipped_checks)
 
     @property
     def score(self) -> int:
@@ -61,55 +120,617 @@ class SafetyReport:
         return max(0, min(10, base))
 
 
-def validate_file(file_path: Path) -> SafetyReport:
-    content = file_path.read_text(encoding="utf-8")
+LINE_RULES: list[tuple[str, str, re.Pattern, str]] = [
+    (code, severity, re.compile(pattern, re.IGNORECASE), message)
+    for code, severity, pattern, message in CREDENTIAL_PATTERNS + ANTI_PATTERNS
+]
+
+Content = str | bytes | memoryview
+
+
+def decode_content(content: Content) -> str:
+    text = content if isinstance(content, str) else str(content, "utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def load_scheduler() -> ModuleType:
+    parents = Path(__file__).resolve().parents
+    tools = str(parents[4] / "tools") if len(parents) > 4 else ""
+    if tools and Path(tools, "check_scheduler.py").is_file() and tools not in sys.path:
+        sys.path.append(tools)
+    try:
+        import check_scheduler
+    except ImportError:
+        raise ValueError("--time-budget needs check_scheduler.py, which is not installed next to this script") from None
+    return check_scheduler
+
+
+def build_checks(
+    content: str,
+    report: SafetyReport,
+    line_rules: list[tuple[str, str, re.Pattern, str]],
+    split_rules: bool = False,
+) -> list[tuple]:
     lines = content.split("\n")
-    report = SafetyReport(file_path=file_path)
 
-    for tier_name, pattern in AUTONOMY_TIERS.items():
-        if re.search(pattern, content, re.IGNORECASE):
-            report.tiers_found.append(tier_name)
-        else:
-            report.tiers_missing.append(tier_name)
+    def autonomy_tiers() -> None:
+        for tier_name, pattern in AUTONOMY_TIERS.items():
+            if re.search(pattern, content, re.IGNORECASE):
+                report.tiers_found.append(tier_name)
+            else:
+                report.tiers_missing.append(tier_name)
 
-    for check_name, pattern in SAFETY_CHECKS.items():
-        if re.search(pattern, content, re.IGNORECASE):
-            report.checks_found.append(check_name)
-        else:
-            report.checks_missing.append(check_name)
+        if not report.tiers_found:
             report.issues.append(ValidationResult(
-                code="S010",
-                severity="WARNING",
+                code="S009",
+                severity="ERROR",
                 line=None,
-                message=f"Missing safety mechanism: {check_name.replace('_', ' ')}",
+                message="No autonomy tier definitions found — define full-auto/supervised/human-led boundaries",
             ))
 
-    for line_num, line in enumerate(lines, start=1):
-        for code, severity, pattern, message in CREDENTIAL_PATTERNS + ANTI_PATTERNS:
-            if re.search(pattern, line, re.IGNORECASE):
+    def safety_mechanisms() -> None:
+        for check_name, pattern in SAFETY_CHECKS.items():
+            if re.search(pattern, content, re.IGNORECASE):
+                report.checks_found.append(check_name)
+            else:
+                report.checks_missing.append(check_name)
                 report.issues.append(ValidationResult(
-                    code=code,
-                    severity=severity,
-                    line=line_num,
-                    message=message,
+                    code="S010",
+                    severity="WARNING",
+                    line=None,
+                    message=f"Missing safety mechanism: {check_name.replace('_', ' ')}",
+                ))
+
+    def scan_lines(rules: list[tuple[str, str, re.Pattern, str]]) -> Callable[[], None]:
+        def scan() -> None:
+            for line_num, line in enumerate(lines, start=1):
+                for code, severity, pattern, message in rules:
+                    if pattern.search(line):
+                        report.issues.append(ValidationResult(
+                            code=code,
+                            severity=severity,
+                            line=line_num,
+                            message=message,
+                        ))
+        return scan
+
+    checks = [
+        ("autonomy_tiers", "ERROR", 2, autonomy_tiers, False),
+        ("safety_mechanisms", "WARNING", 0, safety_mechanisms, False),
+    ]
+    if split_rules:
+        checks.extend((rule[0], rule[1], 1, scan_lines([rule]), True) for rule in line_rules)
+    elif line_rules:
+        checks.append(("line_rules", "ERROR", 1, scan_lines(line_rules), True))
+    return checks
+
+
+def validate_file(file_path: Path, time_budget_ms: float | None = None) -> SafetyReport:
+    return validate_content(file_path.read_text(encoding="utf-8"), file_path, time_budget_ms=time_budget_ms)
+
+
+def validate_content(
+    content: Content,
+    file_path: Path | str = "<inline>",
+    line_rules: list[tuple[str, str, re.Pattern, str]] = LINE_RULES,
+    time_budget_ms: float | None = None,
+) -> SafetyReport:
+    content = decode_content(content)
+    report = SafetyReport(file_path=Path(file_path))
+
+    if time_budget_ms is None:
+        for _, _, _, run, _ in sorted(build_checks(content, report, line_rules), key=lambda check: check[2]):
+            run()
+    else:
+        report.skipped_checks = load_scheduler().run_checks(
+            "validate_safety",
+            build_checks(content, report, line_rules, split_rules=True),
+            report.issues,
+            content,
+            time_budget_ms,
+            lambda sample: build_checks(sample, SafetyReport(file_path=Path(file_path)), line_rules, split_rules=True),
+        )
+    return report
+
+
+@dataclass
+class ScanFinding:
+    path: str
+    line: int
+    code: str
+    severity: str
+    message: str
+    excerpt: str
+    blob: str | None = None
+    commit: str | None = None
+
+
+@dataclass
+class RepoScanReport:
+    root: Path
+    files_scanned: int = 0
+    bytes_scanned: int = 0
+    files_skipped: int = 0
+    elapsed: float = 0.0
+    findings: list[ScanFinding] = field(default_factory=list)
+
+    @property
+    def throughput_mb(self) -> float:
+        return self.bytes_scanned / 1_000_000 / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def validate_batch(items: Iterable[tuple[str, Content]]) -> Iterator[SafetyReport]:
+    for item_id, content in items:
+        yield validate_content(content, item_id)
+
+
+def mask_secret(value: str) -> str:
+    if len(value) <= 12:
+        return value[:2] + "..."
+    return f"{value[:4]}...{value[-4:]}"
+
+
+def shannon_entropy(token: bytes) -> float:
+    length = len(token)
+    return -sum(
+        count / length * math.log2(count / length)
+        for count in Counter(token).values()
+    )
+
+
+def is_binary(head: bytes) -> bool:
+    return head.startswith(BINARY_SIGNATURES) or b"\x00" in head
+
+
+def glob_to_regex(pattern: str) -> str:
+    regex, i = "", 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            regex, i = regex + "(?:.*/)?", i + 3
+        elif pattern.startswith("**", i):
+            regex, i = regex + ".*", i + 2
+        elif pattern[i] == "*":
+            regex, i = regex + "[^/]*", i + 1
+        elif pattern[i] == "?":
+            regex, i = regex + "[^/]", i + 1
+        elif pattern[i] == "[" and "]" in pattern[i + 1:]:
+            end = pattern.index("]", i + 1)
+            regex, i = regex + "[" + pattern[i + 1:end].replace("!", "^", 1) + "]", end + 1
+        else:
+            regex, i = regex + re.escape(pattern[i]), i + 1
+    return regex
+
+
+def compile_gitignore(prefix: str, path: Path) -> list[tuple[re.Pattern, bool, bool]]:
+    rules = []
+    for raw in path.read_text(encoding="utf-8", errors="replace").splitlines():
+        line = raw.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        line = line.removeprefix("!")
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        anchored = "/" in line
+        scope = re.escape(prefix) + ("" if anchored else "(?:.*/)?")
+        rules.append((re.compile(scope + glob_to_regex(line.lstrip("/"))), negate, dir_only))
+    return rules
+
+
+def is_ignored(path: str, is_dir: bool, rules: list[tuple[re.Pattern, bool, bool]]) -> bool:
+    ignored = False
+    for pattern, negate, dir_only in rules:
+        if dir_only and not is_dir:
+            continue
+        if pattern.fullmatch(path):
+            ignored = not negate
+    return ignored
+
+
+def walk_with_gitignore(root: Path):
+    inherited: dict[str, list[tuple[re.Pattern, bool, bool]]] = {"": []}
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_dir = Path(dirpath).relative_to(root).as_posix()
+        prefix = "" if rel_dir == "." else f"{rel_dir}/"
+        rules = list(inherited.get(prefix, []))
+        gitignore = Path(dirpath) / ".gitignore"
+        if gitignore.is_file():
+            rules += compile_gitignore(prefix, gitignore)
+
+        dirnames[:] = [
+            d for d in dirnames
+            if d not in VENDORED_DIRS and not is_ignored(prefix + d, True, rules)
+        ]
+        for d in dirnames:
+            inherited[f"{prefix}{d}/"] = rules
+        for name in filenames:
+            if not is_ignored(prefix + name, False, rules):
+                yield Path(dirpath) / name
+
+
+def iter_repository_files(root: Path):
+    try:
+        listed = subprocess.run(
+            ["git", "-C", str(root), "ls-files", "--cached", "--others", "--exclude-standard", "-z"],
+            capture_output=True, check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        yield from walk_with_gitignore(root)
+        return
+
+    for entry in listed.decode("utf-8", errors="surrogateescape").split("\0"):
+        if entry and not VENDORED_DIRS.intersection(Path(entry).parts[:-1]):
+            yield root / entry
+
+
+def anchored_lines(content: bytes, lowered: bytes, anchors: tuple[bytes, ...]) -> list[tuple[int, int]]:
+    spans: dict[int, int] = {}
+    for anchor in anchors:
+        pos = lowered.find(anchor)
+        while pos != -1:
+            start = content.rfind(b"\n", 0, pos) + 1
+            end = content.find(b"\n", pos)
+            end = len(content) if end == -1 else end
+            spans[start] = end
+            pos = lowered.find(anchor, end)
+    return sorted(spans.items())
+
+
+def token_candidates(content: bytes):
+    mask = content.translate(TOKEN_CLASS)
+    needle = b"\x01" * TOKEN_MIN_LENGTH
+    pos = mask.find(needle)
+    while pos != -1:
+        end = mask.find(b"\x00", pos)
+        end = len(content) if end == -1 else end
+        before = pos - 1
+        while before >= 0 and content[before] in (0x20, 0x09):
+            before -= 1
+        if before >= 0 and content[before] in TOKEN_CONTEXT:
+            yield pos, content[pos:end]
+        pos = mask.find(needle, end)
+
+
+def looks_random(token: bytes, entropy_threshold: float) -> bool:
+    if not (any(48 <= c <= 57 for c in token) and token.lower() != token and token.upper() != token):
+        return False
+    if any(run in token for run in SEQUENTIAL_RUNS):
+        return False
+    return shannon_entropy(token) >= entropy_threshold
+
+
+def scan_bytes(content: bytes, entropy_threshold: float = 4.3) -> list[tuple[int, str, str, str, str]]:
+    hits: list[tuple[int, str, str, str, str]] = []
+    lowered = content.lower()
+    for code, severity, pattern, message, anchors in SCAN_PATTERNS:
+        occurrences = sum(lowered.count(anchor) for anchor in anchors)
+        if not occurrences:
+            continue
+        if occurrences * DENSE_ANCHOR_BYTES > len(content):
+            matches = pattern.finditer(lowered)
+        else:
+            matches = (pattern.search(lowered, start, end) for start, end in anchored_lines(content, lowered, anchors))
+        for match in matches:
+            if match:
+                hits.append((match.start(), code, severity, message, content[match.start():match.end()].decode("utf-8", "replace")))
+
+    if entropy_threshold > 0:
+        for start, token in token_candidates(content):
+            if looks_random(token, entropy_threshold):
+                hits.append((
+                    start, "S011", "WARNING",
+                    "High-entropy token — possible secret", token.decode("ascii"),
                 ))
 
-    if not report.tiers_found:
-        report.issues.append(ValidationResult(
-            code="S009",
-            severity="ERROR",
-            line=None,
-            message="No autonomy tier definitions found — define full-auto/supervised/human-led boundaries",
-        ))
+    hits.sort()
+    results: list[tuple[int, str, str, str, str]] = []
+    seen: set[tuple[int, str]] = set()
+    flagged_lines: set[int] = set()
+    line, offset = 1, 0
+    for start, code, severity, message, value in hits:
+        line += content.count(b"\n", offset, start)
+        offset = start
+        if (line, code) in seen or (code == "S011" and line in flagged_lines):
+            continue
+        seen.add((line, code))
+        if code != "S011":
+            flagged_lines.add(line)
+        results.append((line, code, severity, message, mask_secret(value.strip())))
+    return results
+
+
+def scan_path(path: Path, max_bytes: int, entropy_threshold: float) -> tuple[int, list[ScanFinding]]:
+    try:
+        if path.name in LOCKFILES or path.stat().st_size > max_bytes:
+            return -1, []
+        with path.open("rb") as handle:
+            head = handle.read(8192)
+            if is_binary(head):
+                return -1, []
+            content = head + handle.read()
+    except OSError:
+        return -1, []
+
+    findings = [
+        ScanFinding(path=str(path), line=line, code=code, severity=severity, message=message, excerpt=excerpt)
+        for line, code, severity, message, excerpt in scan_bytes(content, entropy_threshold)
+    ]
+    return len(content), findings
+
+
+def scan_chunk(paths: list[Path], max_bytes: int, entropy_threshold: float) -> list[tuple[int, list[ScanFinding]]]:
+    return [scan_path(path, max_bytes, entropy_threshold) for path in paths]
+
+
+def scan_repository(
+    root: Path,
+    workers: int | None = None,
+    max_bytes: int = 2_000_000,
+    entropy_threshold: float = 4.3,
+    chunk_size: int = 64,
+) -> RepoScanReport:
+    report = RepoScanReport(root=root)
+    started = time.perf_counter()
+    paths = [p for p in iter_repository_files(root) if not p.is_symlink() and p.is_file()]
+    chunks = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(chunks) <= 1:
+        results = (scan_chunk(chunk, max_bytes, entropy_threshold) for chunk in chunks)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        results = executor.map(
+            scan_chunk, chunks, [max_bytes] * len(chunks), [entropy_threshold] * len(chunks),
+        )
+
+    try:
+        for chunk_results in results:
+            for size, findings in chunk_results:
+                if size < 0:
+                    report.files_skipped += 1
+                    continue
+                report.files_scanned += 1
+                report.bytes_scanned += size
+                report.findings.extend(findings)
+    finally:
+        if executor:
+            executor.shutdown()
+
+    report.elapsed = time.perf_counter() - started
+    return report
+
+
+def format_scan_report(report: RepoScanReport) -> str:
+    lines: list[str] = [f"\n🔍 Repository Secret Scan: {report.root}"]
+    lines.append(
+        f"   Files: {report.files_scanned} scanned, {report.files_skipped} skipped "
+        f"(binary, lockfile or oversized)"
+    )
+    lines.append(
+        f"   Bytes: {report.bytes_scanned / 1_000_000:.1f} MB in {report.elapsed:.2f}s "
+        f"({report.throughput_mb:.0f} MB/s)"
+    )
+
+    if report.findings:
+        lines.append("\n   Findings:")
+        for finding in sorted(report.findings, key=lambda f: (
+            {"ERROR": 0, "WARNING": 1, "INFO": 2}[f.severity], f.path, f.line,
+        )):
+            icon = {"ERROR": "❌", "WARNING": "⚠️ ", "INFO": "ℹ️ "}[finding.severity]
+            lines.append(f"   {icon} {finding.code} {finding.path}:{finding.line}: {finding.message} [{finding.excerpt}]")
+    else:
+        lines.append("\n   ✅ No credentials found")
+
+    return "\n".join(lines)
+
+
+@dataclass
+class HistoryState:
+    tips: list[str] = field(default_factory=list)
+    blobs: set[bytes] = field(default_factory=set)
+
 
+@dataclass
+class HistoryScanReport:
+    repository: Path
+    state_path: Path
+    commits_scanned: int = 0
+    blobs_scanned: int = 0
+    blobs_deduplicated: int = 0
+    blobs_skipped: int = 0
+    bytes_scanned: int = 0
+    elapsed: float = 0.0
+    findings: list[ScanFinding] = field(default_factory=list)
+
+
+def run_git(repo: Path, *args: str, stdin: bytes | None = None) -> bytes:
+    return subprocess.run(
+        ["git", "-C", str(repo), *args], input=stdin, capture_output=True, check=True,
+    ).stdout
+
+
+def default_state_path(repo: Path) -> Path:
+    git_dir = Path(run_git(repo, "rev-parse", "--absolute-git-dir").decode().strip())
+    return git_dir / "validate_safety-history.json"
+
+
+def load_history_state(path: Path) -> HistoryState:
+    if not path.exists():
+        return HistoryState()
+    data = json.loads(path.read_text(encoding="utf-8"))
+    packed = base64.b64decode(data.get("blobs", ""))
+    width = data.get("hash_bytes", 20)
+    return HistoryState(
+        tips=list(data.get("tips", [])),
+        blobs={packed[i:i + width] for i in range(0, len(packed), width)},
+    )
+
+
+def save_history_state(path: Path, state: HistoryState) -> None:
+    width = len(next(iter(state.blobs))) if state.blobs else 20
+    data = {
+        "version": 1,
+        "tips": sorted(state.tips),
+        "hash_bytes": width,
+        "blob_count": len(state.blobs),
+        "blobs": base64.b64encode(b"".join(sorted(state.blobs))).decode("ascii"),
+    }
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(data), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def existing_objects(repo: Path, shas: list[str]) -> list[str]:
+    if not shas:
+        return []
+    out = run_git(repo, "cat-file", "--batch-check", stdin="\n".join(shas).encode() + b"\n")
+    return [line.split()[0] for line in out.decode().splitlines() if not line.endswith(" missing")]
+
+
+def introducing_commits(repo: Path, blobs: set[str], exclude: list[str]) -> dict[str, str]:
+    # One oldest-first walk over the newly scanned commits; each commit's raw diff names the blobs it
+    # adds, so every finding's origin is resolved without a full-history walk per blob.
+    found: dict[str, str] = {}
+    if not blobs:
+        return found
+    walker = subprocess.Popen(
+        ["git", "-C", str(repo), "log", "--all", *exclude, "--reverse", "--topo-order", "--root", "--raw", "--no-abbrev",
+         "--no-renames", "--diff-merges=first-parent", "--format=commit %H"],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+    )
+    try:
+        commit = ""
+        for raw in walker.stdout:
+            if raw.startswith(b"commit "):
+                commit = raw[7:].strip().decode()
+            elif raw.startswith(b":"):
+                blob = raw.split(b"\t", 1)[0].split()[3].decode()
+                if blob in blobs and blob not in found:
+                    found[blob] = commit
+                    if len(found) == len(blobs):
+                        break
+    finally:
+        walker.kill()
+        walker.wait()
+    return found
+
+
+def scan_history(
+    repo: Path,
+    state_path: Path | None = None,
+    max_bytes: int = 2_000_000,
+    entropy_threshold: float = 4.3,
+) -> HistoryScanReport:
+    started = time.perf_counter()
+    state_path = state_path or default_state_path(repo)
+    state = load_history_state(state_path)
+    report = HistoryScanReport(repository=repo, state_path=state_path)
+
+    tips = sorted(set(run_git(repo, "rev-parse", "--all").decode().split()))
+    exclude = ["--not", *existing_objects(repo, state.tips)] if state.tips else []
+    report.commits_scanned = int(run_git(repo, "rev-list", "--count", "--all", *exclude).decode().strip() or 0)
+
+    paths: dict[str, str] = {}
+    for line in run_git(repo, "rev-list", "--objects", "--all", *exclude).decode("utf-8", "surrogateescape").splitlines():
+        sha, _, path = line.partition(" ")
+        if path:
+            paths.setdefault(sha, path)
+
+    candidates: list[str] = []
+    if paths:
+        checked = run_git(
+            repo, "cat-file", "--batch-check=%(objectname) %(objecttype) %(objectsize)",
+            stdin="\n".join(paths).encode() + b"\n",
+        )
+        for line in checked.decode().splitlines():
+            sha, kind, size = line.split()
+            if kind != "blob":
+                continue
+            path = Path(paths[sha])
+            if bytes.fromhex(sha) in state.blobs:
+                report.blobs_deduplicated += 1
+            elif int(size) > max_bytes or path.name in LOCKFILES or VENDORED_DIRS.intersection(path.parts[:-1]):
+                report.blobs_skipped += 1
+                state.blobs.add(bytes.fromhex(sha))
+            else:
+                candidates.append(sha)
+
+    if candidates:
+        reader = subprocess.Popen(
+            ["git", "-C", str(repo), "cat-file", "--batch"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+        )
+        try:
+            for sha in candidates:
+                reader.stdin.write(sha.encode() + b"\n")
+                reader.stdin.flush()
+                header = reader.stdout.readline().split()
+                content = reader.stdout.read(int(header[2]))
+                reader.stdout.read(1)
+                state.blobs.add(bytes.fromhex(sha))
+
+                if is_binary(content[:8192]):
+                    report.blobs_skipped += 1
+                    continue
+                report.blobs_scanned += 1
+                report.bytes_scanned += len(content)
+                for line, code, severity, message, excerpt in scan_bytes(content, entropy_threshold):
+                    report.findings.append(ScanFinding(
+                        path=paths[sha], line=line, code=code, severity=severity,
+                        message=message, excerpt=excerpt, blob=sha,
+                    ))
+        finally:
+            reader.stdin.close()
+            reader.wait()
+
+    origins = introducing_commits(repo, {finding.blob for finding in report.findings}, exclude)
+    for finding in report.findings:
+        finding.commit = origins.get(finding.blob)
+
+    state.tips = tips
+    save_history_state(state_path, state)
+    report.elapsed = time.perf_counter() - started
     return report
 
 
+def format_history_report(report: HistoryScanReport) -> str:
+    lines: list[str] = [f"\n🕰️  Git History Secret Scan: {report.repository}"]
+    lines.append(f"   Commits: {report.commits_scanned} new since last scan")
+    lines.append(
+        f"   Blobs:   {report.blobs_scanned} scanned, {report.blobs_deduplicated} already scanned, "
+        f"{report.blobs_skipped} skipped"
+    )
+    lines.append(f"   Bytes:   {report.bytes_scanned / 1_000_000:.1f} MB in {report.elapsed:.2f}s")
+    lines.append(f"   State:   {report.state_path}")
+
+    if report.findings:
+        lines.append("\n   Findings:")
+        for finding in sorted(report.findings, key=lambda f: (
+            {"ERROR": 0, "WARNING": 1, "INFO": 2}[f.severity], f.path, f.line,
+        )):
+            icon = {"ERROR": "❌", "WARNING": "⚠️ ", "INFO": "ℹ️ "}[finding.severity]
+            origin = f" (commit {finding.commit[:10]})" if finding.commit else f" (blob {finding.blob[:10]})"
+            lines.append(
+                f"   {icon} {finding.code} {finding.path}:{finding.line}{origin}: "
+                f"{finding.message} [{finding.excerpt}]"
+            )
+    else:
+        lines.append("\n   ✅ No credentials found in new history")
+
+    return "\n".join(lines)
+
+
 def format_report(report: SafetyReport) -> str:
     lines: list[str] = [f"\n🛡️  Safety Architecture Validation: {report.file_path}"]
     lines.append(f"   Autonomy tiers: {', '.join(report.tiers_found) or 'None detected'}")
     lines.append(f"   Safety checks:  {len(report.checks_found)}/{len(SAFETY_CHECKS)} present")
-    lines.append(f"   Score:          {report.score}/10")
+    score = "not scored (partial run)" if report.partial else f"{report.score}/10"
+    lines.append(f"   Score:          {score}")
+    if report.partial:
+        lines.append(f"   ⏱️  Partial: time budget reached, skipped {', '.join(report.skipped_checks)}")
 
     if report.issues:
         lines.append("\n   Issues:")
@@ -129,22 +750,59 @@ def main() -> None:
     parser = argparse.ArgumentParser(
         description="Validate agent safety architecture — autonomy tiers, permissions, secret handling",
     )
-    parser.add_argument("files", type=Path, nargs="+", help="Safety config file(s)")
+    parser.add_argument("files", type=Path, nargs="*", help="Safety config file(s)")
     parser.add_argument("--strict", action="store_true", help="Exit 1 on any warnings or errors")
+    parser.add_argument(
+        "--time-budget", type=float, metavar="MS",
+        help="Run the most valuable checks first and stop after MS milliseconds per file; skipped checks are listed",
+    )
+    parser.add_argument("--scan", type=Path, metavar="DIR", help="Scan a repository tree for credentials (honors .gitignore)")
+    parser.add_argument("--history", type=Path, metavar="REPO", help="Scan git history blobs incrementally since the last run")
+    parser.add_argument("--state", type=Path, help="History scan state file (default: <git-dir>/validate_safety-history.json)")
+    parser.add_argument("--workers", type=int, help="Parallel scan workers (default: CPU count)")
+    parser.add_argument("--max-file-size", type=int, default=2_000_000, help="Skip files larger than this many bytes")
+    parser.add_argument("--entropy-threshold", type=float, default=4.3, help="Shannon entropy (bits/char) for S011; 0 disables")
 
     args = parser.parse_args()
+    if args.time_budget is not None:
+        try:
+            load_scheduler()
+        except ValueError as exc:
+            parser.error(str(exc))
     exit_code = 0
 
+    if args.scan:
+        if not args.scan.is_dir():
+            print(f"Error: Directory not found: {args.scan}", file=sys.stderr)
+            sys.exit(1)
+        scan = scan_repository(args.scan, args.workers, args.max_file_size, args.entropy_threshold)
+        print(format_scan_report(scan))
+        blocking = ("ERROR", "WARNING") if args.strict else ("ERROR",)
+        if any(f.severity in blocking for f in scan.findings):
+            exit_code = 1
+    elif args.history:
+        try:
+            history = scan_history(args.history, args.state, args.max_file_size, args.entropy_threshold)
+        except (OSError, subprocess.CalledProcessError) as exc:
+            print(f"Error: Cannot scan git history of {args.history}: {exc}", file=sys.stderr)
+            sys.exit(1)
+        print(format_history_report(history))
+        blocking = ("ERROR", "WARNING") if args.strict else ("ERROR",)
+        if any(f.severity in blocking for f in history.findings):
+            exit_code = 1
+    elif not args.files:
+        parser.error("provide config file(s), --scan DIR or --history REPO")
+
     for file_path in args.files:
         if not file_path.exists():
             print(f"Error: File not found: {file_path}", file=sys.stderr)
             exit_code = 1
             continue
 
-        report = validate_file(file_path)
+        report = validate_file(file_path, args.time_budget)
         print(format_report(report))
 
-        if args.strict and any(i.severity in ("ERROR", "WARNING") for i in report.issues):
+        if args.strict and (report.partial or any(i.severity in ("ERROR", "WARNING") for i in report.issues)):
             exit_code = 1
 
     sys.exit(exit_code)
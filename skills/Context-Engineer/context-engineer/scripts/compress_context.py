@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import math
+import random
+import re
+import sys
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from skill_index import tokenize
+from validate_context import estimate_tokens
+
+DEFAULT_WINDOW = 4096
+DEFAULT_DEDUP_LINES = 100_000
+MIN_TERMS = 3
+QUERY_BOOST = 3.0
+MIN_ALPHA_RATIO = 0.35
+
+ANSI = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'(\[`*])")
+DIGITS = re.compile(r"\d+")
+LINE_NOISE = re.compile(
+    r"(?P<stack>\s*(?:at\s+[\w$.<>/]+\(.*\)|File \".*\", line \d+(?:, in \S+)?|\.\.\. \d+ more|\^{3,})\s*$)"
+    r"|(?P<debug>\W*[\d\-TZ:.,/ ]{8,}\W*\s*(?:DEBUG|TRACE|VERBOSE)\b|\s*(?:DEBUG|TRACE)[:\] ])"
+)
+# A bar needs real bar glyphs; "85% -- well above" and "40% ... and then" are prose.
+PROGRESS = re.compile(r"\d%\s*\|?(?:[█▉▊▋▌▍▎▏]|[#=]{3,})|\[[=#>\-. ]*[=#]{3,}[=#>\-. ]*\]")
+# Markdown and box-drawing table rows are content (budget tables, allocation charts), never noise.
+TABLE_EDGES = ("|", "│")
+# The "N tokens" form of validate_context's budget indicators, e.g. "8k tokens" or "2000 tokens".
+DECLARED_BUDGET = re.compile(r"\b(\d+)(k?)\s*tokens?\b", re.IGNORECASE)
+RULE_CHARS = frozenset(".─━═-=_*~ ")
+HEX_DIGITS = frozenset("0123456789abcdefABCDEFx")
+BASE64_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=")
+ASCII_LETTERS = b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+@dataclass
+class Candidate:
+    seq: int
+    line: int
+    text: str
+    terms: list[str]
+    tokens: int
+    score: float = 0.0
+    arrival_score: float = 0.0
+
+    @property
+    def density(self) -> float:
+        return self.score / self.tokens
+
+
+@dataclass
+class CompressionStats:
+    input_chars: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    lines: int = 0
+    noise_lines: Counter = field(default_factory=Counter)
+    duplicate_lines: int = 0
+    sentences: int = 0
+    kept_sentences: int = 0
+    salience_total: float = 0.0
+    salience_kept: float = 0.0
+    elapsed_s: float = 0.0
+
+    @property
+    def ratio(self) -> float:
+        return self.output_tokens / self.input_tokens if self.input_tokens else 0.0
+
+    @property
+    def throughput_mb_s(self) -> float:
+        return self.input_chars / 1e6 / self.elapsed_s if self.elapsed_s else 0.0
+
+    @property
+    def salience_retained(self) -> float:
+        return self.salience_kept / self.salience_total if self.salience_total else 0.0
+
+
+@dataclass
+class CompressionResult:
+    text: str
+    stats: CompressionStats
+
+
+# Cheap str checks gate each regex; this runs on every input line.
+def noise_kind(line: str) -> str | None:
+    match = LINE_NOISE.match(line)
+    if match:
+        return match.lastgroup
+    if ("%" in line or "[" in line) and PROGRESS.search(line):
+        return "progress"
+    stripped = line.strip()
+    if stripped.startswith(TABLE_EDGES):
+        return None
+    if len(stripped) >= 8 and RULE_CHARS.issuperset(stripped[-8:]):
+        return "progress"
+    if len(stripped) >= 32:
+        for word in stripped.split():
+            if (len(word) >= 64 and BASE64_CHARS.issuperset(word)) or (len(word) >= 32 and HEX_DIGITS.issuperset(word)):
+                return "blob"
+    if len(stripped) > 20:
+        ascii_only = stripped.encode("ascii", "ignore")
+        # Letter ratio is only meaningful for mostly-ASCII text.
+        if len(ascii_only) >= 0.9 * len(stripped):
+            letters = len(ascii_only) - len(ascii_only.translate(None, ASCII_LETTERS))
+            if letters / len(stripped) < MIN_ALPHA_RATIO:
+                return "symbols"
+    return None
+
+
+def dedup_key(line: str) -> str:
+    return " ".join(DIGITS.sub("0", line.lower()).split())
+
+
+# Term statistics grow as text streams in; the kept set never exceeds the budget and is
+# re-scored against the latest statistics at every window.
+class ContextCompressor:
+    def __init__(
+        self,
+        budget: int,
+        query: str = "",
+        window: int = DEFAULT_WINDOW,
+        dedup_lines: int = DEFAULT_DEDUP_LINES,
+    ) -> None:
+        if budget < 1:
+            raise ValueError("Budget must be at least 1 token")
+        self.budget = budget
+        self.query = set(tokenize(query))
+        self.window = window
+        self.dedup_lines = dedup_lines
+        self.stats = CompressionStats()
+        self.term_counts: Counter = Counter()
+        self.doc_freq: Counter = Counter()
+        self.weights: dict[str, float] = {}
+        self.seen: OrderedDict[str, None] = OrderedDict()
+        self.pending: list[Candidate] = []
+        self.kept: list[Candidate] = []
+        self.kept_tokens = 0
+        self.seq = 0
+        self.in_fence = False
+        self.started = time.perf_counter()
+
+    def feed(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            self.add_line(line)
+
+    def add_line(self, raw: str) -> None:
+        stats = self.stats
+        stats.lines += 1
+        stats.input_chars += len(raw)
+        stats.input_tokens += estimate_tokens(raw) + (1 if raw.strip() else 0)
+        line = ANSI.sub("", raw.rstrip("\r\n"))
+        if "\r" in line:
+            line = line.rsplit("\r", 1)[-1]
+        if not line.strip():
+            return
+        if line.lstrip().startswith("```"):
+            self.in_fence = not self.in_fence
+            return
+
+        kind = noise_kind(line)
+        if kind:
+            stats.noise_lines[kind] += 1
+            return
+
+        key = dedup_key(line)
+        if key in self.seen:
+            self.seen.move_to_end(key)
+            stats.duplicate_lines += 1
+            return
+        self.seen[key] = None
+        if len(self.seen) > self.dedup_lines:
+            self.seen.popitem(last=False)
+
+        # Code and tool output stay whole; prose is split into sentences.
+        parts = [line.strip()] if self.in_fence else SENTENCE_BREAK.split(line.strip())
+        for part in parts:
+            terms = tokenize(part)
+            # Fragments this short ("Done.", "## Notes") carry little on their own.
+            if len(terms) < MIN_TERMS:
+                continue
+            self.seq += 1
+            self.pending.append(Candidate(self.seq, stats.lines, part, terms, estimate_tokens(part) + 1))
+        if len(self.pending) >= self.window:
+            self.flush()
+
+    def weight(self, term: str) -> float:
+        weight = self.weights.get(term)
+        if weight is None:
+            # Frequent terms mark the topic, document frequency discounts boilerplate.
+            sentences = self.stats.sentences
+            weight = math.log1p(self.term_counts[term]) * math.log(1 + sentences / self.doc_freq[term])
+            self.weights[term] = weight
+        return weight
+
+    def score(self, candidate: Candidate) -> float:
+        unique = set(candidate.terms)
+        score = sum(map(self.weight, unique))
+        if self.query and unique & self.query:
+            score *= QUERY_BOOST
+        return score
+
+    def flush(self) -> None:
+        if not self.pending:
+            return
+        for candidate in self.pending:
+            self.term_counts.update(candidate.terms)
+            self.doc_freq.update(set(candidate.terms))
+        self.stats.sentences += len(self.pending)
+        self.weights = {}
+        for candidate in self.pending:
+            candidate.score = candidate.arrival_score = self.score(candidate)
+            self.stats.salience_total += candidate.score
+        for candidate in self.kept:
+            candidate.score = self.score(candidate)
+
+        # Keep the densest salience per token that fits; the kept set is bounded by the budget.
+        pool = self.kept + [c for c in self.pending if c.tokens <= self.budget]
+        self.pending = []
+        best = sorted(pool, key=lambda c: (-c.density, c.seq))
+        self.kept, self.kept_tokens = [], 0
+        for candidate in best:
+            if self.kept_tokens + candidate.tokens <= self.budget:
+                self.kept.append(candidate)
+                self.kept_tokens += candidate.tokens
+            elif self.kept_tokens >= self.budget:
+                break
+
+    def finish(self) -> CompressionResult:
+        self.flush()
+        kept = sorted(self.kept, key=lambda c: c.seq)
+        lines: list[str] = []
+        previous_line = None
+        for candidate in kept:
+            if candidate.line == previous_line:
+                lines[-1] += " " + candidate.text
+            else:
+                lines.append(candidate.text)
+            previous_line = candidate.line
+        text = "\n".join(lines)
+
+        stats = self.stats
+        stats.kept_sentences = len(kept)
+        stats.output_tokens = self.kept_tokens
+        stats.salience_kept = sum(c.arrival_score for c in kept)
+        stats.elapsed_s = time.perf_counter() - self.started
+        return CompressionResult(text=text, stats=stats)
+
+
+def compress_lines(lines: Iterable[str], budget: int, query: str = "", window: int = DEFAULT_WINDOW) -> CompressionResult:
+    compressor = ContextCompressor(budget, query=query, window=window)
+    compressor.feed(lines)
+    return compressor.finish()
+
+
+def compress_text(text: str, budget: int, query: str = "") -> CompressionResult:
+    return compress_lines(text.split("\n"), budget, query)
+
+
+PROSE = (
+    "The agent {verb} the {noun} because the {adj} {noun2} needed a {noun3} before the deploy. "
+    "We decided to {verb2} the {noun} and keep the {noun2} within the {adj} limit."
+)
+WORDS = {
+    "verb": ["retried", "cached", "summarized", "validated", "rejected", "indexed", "migrated", "throttled"],
+    "verb2": ["evict", "compress", "pin", "split", "shard", "retry", "rotate", "audit"],
+    "noun": ["invoice", "schema", "session", "budget", "index", "ticket", "webhook", "policy", "cluster", "report"],
+    "noun2": ["customer", "pipeline", "retriever", "planner", "gateway", "worker", "scheduler", "vector store"],
+    "noun3": ["approval", "rollback", "checkpoint", "summary", "migration", "review", "quota"],
+    "adj": ["strict", "stale", "regional", "nightly", "shared", "premium", "encrypted", "partial"],
+}
+
+
+def synthetic_transcript(chars: int, seed: int = 0) -> Iterator[str]:
+    rng = random.Random(seed)
+    produced = turn = 0
+    while produced < chars:
+        turn += 1
+        block: list[str] = [f"## Turn {turn}"]
+        block.append("User: " + PROSE.format(**{k: rng.choice(v) for k, v in WORDS.items()}))
+        kind = rng.random()
+        if kind < 0.3:
+            block.append("```")
+            block.extend(
+                f"2026-10-19T12:{rng.randrange(60):02d}:{rng.randrange(60):02d}Z DEBUG worker-{rng.randrange(8)} "
+                f"poll ok latency={rng.randrange(900)}ms"
+                for _ in range(rng.randrange(5, 30))
+            )
+            block.append(f"ERROR {rng.choice(WORDS['noun'])} sync failed: timeout after {rng.randrange(30)}s")
+            block.append("```")
+        elif kind < 0.5:
+            block.append("Traceback (most recent call last):")
+            block.extend(f'  File "/srv/app/{rng.choice(WORDS["noun"])}.py", line {rng.randrange(900)}, in run' for _ in range(6))
+            block.append(f"ValueError: invalid {rng.choice(WORDS['noun'])} id")
+        elif kind < 0.65:
+            block.append(json.dumps({"rows": [rng.randrange(10 ** 6) for _ in range(24)]}))
+            block.append("".join(rng.choice("ABCDEFabcdef0123456789+/") for _ in range(120)))
+        block.append("Assistant: " + PROSE.format(**{k: rng.choice(v) for k, v in WORDS.items()}))
+        if rng.random() < 0.3:
+            block.append("Assistant: I will check the logs and report back.")
+        for line in block:
+            produced += len(line) + 1
+            yield line
+
+
+def declared_budgets(config: str) -> list[int]:
+    return sorted({int(n) * (1000 if k else 1) for n, k in DECLARED_BUDGET.findall(config) if int(n)})
+
+
+@dataclass
+class BenchRow:
+    budget: int
+    stats: CompressionStats
+
+
+def run_bench(source: Path | None, size_mb: float, budgets: list[int], query: str, seed: int) -> list[BenchRow]:
+    rows = []
+    for budget in budgets:
+        if source:
+            with source.open(encoding="utf-8", errors="replace") as handle:
+                result = compress_lines(handle, budget, query)
+        else:
+            result = compress_lines(synthetic_transcript(int(size_mb * 1e6), seed), budget, query)
+        rows.append(BenchRow(budget, result.stats))
+    return rows
+
+
+def stats_to_dict(stats: CompressionStats) -> dict:
+    return {
+        "input_chars": stats.input_chars,
+        "input_tokens": stats.input_tokens,
+        "output_tokens": stats.output_tokens,
+        "ratio": round(stats.ratio, 6),
+        "lines": stats.lines,
+        "noise_lines": dict(stats.noise_lines),
+        "duplicate_lines": stats.duplicate_lines,
+        "sentences": stats.sentences,
+        "kept_sentences": stats.kept_sentences,
+        "salience_retained": round(stats.salience_retained, 4),
+        "elapsed_s": round(stats.elapsed_s, 4),
+        "throughput_mb_s": round(stats.throughput_mb_s, 3),
+    }
+
+
+def format_stats(stats: CompressionStats, budget: int) -> str:
+    noise = ", ".join(f"{kind} {count:,}" for kind, count in stats.noise_lines.most_common()) or "none"
+    return "\n".join([
+        f"\n🗜️  Context compression: ~{stats.input_tokens:,} → ~{stats.output_tokens:,} tokens "
+        f"(budget {budget:,}, {stats.ratio:.2%} of input)",
+        f"   Lines: {stats.lines:,}  |  noise dropped: {noise}  |  duplicates dropped: {stats.duplicate_lines:,}",
+        f"   Sentences: {stats.kept_sentences:,} kept of {stats.sentences:,}  |  "
+        f"salience retained: {stats.salience_retained:.1%}",
+        f"   Throughput: {stats.throughput_mb_s:.2f} MB/s ({stats.elapsed_s:.2f}s)",
+    ])
+
+
+def format_bench(rows: list[BenchRow], label: str) -> str:
+    first = rows[0].stats
+    lines = [
+        f"\n🗜️  Compression benchmark: {label} ({first.input_chars / 1e6:.1f} MB, ~{first.input_tokens:,} tokens)",
+        f"   Noise dropped: {sum(first.noise_lines.values()):,} lines  |  duplicates: {first.duplicate_lines:,}",
+        f"\n   {'Budget':>8} {'Output':>8} {'Ratio':>9} {'Kept':>8} {'Salience':>9} {'MB/s':>7} {'Time':>7}",
+        f"   {'─' * 8} {'─' * 8} {'─' * 9} {'─' * 8} {'─' * 9} {'─' * 7} {'─' * 7}",
+    ]
+    for row in rows:
+        s = row.stats
+        lines.append(
+            f"   {row.budget:>8,} {s.output_tokens:>8,} {s.ratio:>9.3%} {s.kept_sentences:>8,} "
+            f"{s.salience_retained:>9.1%} {s.throughput_mb_s:>7.2f} {s.elapsed_s:>6.2f}s"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Model-free extractive context compressor — salience scoring, dedup and tool-noise removal under a token budget",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    compress = sub.add_parser("compress", help="Compress a transcript or context file to a token budget")
+    compress.add_argument("file", help="Input file, or - for stdin")
+    compress.add_argument("--budget", type=int, required=True, help="Target output tokens")
+    compress.add_argument("--query", default="", help="Boost sentences that mention these terms")
+    compress.add_argument("--window", type=int, default=DEFAULT_WINDOW, help=f"Sentences per scoring window (default: {DEFAULT_WINDOW})")
+    compress.add_argument("--output", type=Path, help="Write compressed text here instead of stdout")
+    compress.add_argument("--stats", action="store_true", help="Print compression statistics to stderr")
+    compress.add_argument("--format", choices=["text", "json"], default="text", help="Output format (default: text)")
+
+    bench = sub.add_parser("bench", help="Measure compression ratio against throughput across budgets")
+    bench.add_argument("file", type=Path, nargs="?", help="Input file (default: synthetic agent transcript)")
+    bench.add_argument("--size-mb", type=float, default=10.0, help="Synthetic transcript size (default: 10)")
+    bench.add_argument("--budgets", default="500,2000,8000,32000", help="Comma-separated budgets (default: 500,2000,8000,32000)")
+    bench.add_argument("--config", type=Path, help="Also benchmark the token budgets declared in this context config")
+    bench.add_argument("--query", default="", help="Boost sentences that mention these terms")
+    bench.add_argument("--seed", type=int, default=0, help="Random seed for the synthetic transcript (default: 0)")
+    bench.add_argument("--format", choices=["text", "json"], default="text", help="Output format (default: text)")
+
+    args = parser.parse_args()
+
+    if args.command == "bench":
+        for path in (args.file, args.config):
+            if path and not path.exists():
+                print(f"Error: File not found: {path}", file=sys.stderr)
+                sys.exit(1)
+        try:
+            budgets = [int(b) for b in args.budgets.split(",") if b.strip()]
+            if args.config:
+                budgets = sorted(set(budgets) | set(declared_budgets(args.config.read_text(encoding="utf-8"))))
+            rows = run_bench(args.file, args.size_mb, budgets, args.query, args.seed)
+        except ValueError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            sys.exit(1)
+        if args.format == "json":
+            print(json.dumps([{"budget": r.budget, **stats_to_dict(r.stats)} for r in rows], indent=2))
+        else:
+            print(format_bench(rows, str(args.file) if args.file else "synthetic transcript"))
+        return
+
+    if args.file != "-" and not Path(args.file).exists():
+        print(f"Error: File not found: {args.file}", file=sys.stderr)
+        sys.exit(1)
+    try:
+        if args.file == "-":
+            result = compress_lines(sys.stdin, args.budget, args.query, args.window)
+        else:
+            with open(args.file, encoding="utf-8", errors="replace") as handle:
+                result = compress_lines(handle, args.budget, args.query, args.window)
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    output = (
+        json.dumps({"text": result.text, **stats_to_dict(result.stats)}, indent=2)
+        if args.format == "json" else result.text
+    )
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+    if args.stats:
+        print(format_stats(result.stats, args.budget), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
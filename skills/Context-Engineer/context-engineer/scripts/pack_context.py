@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from operator import attrgetter
+from pathlib import Path
+
+from validate_context import estimate_tokens
+
+# Context order from references/04-context-budgeting.md: fixed sections first, active task last
+# (recency), lower-priority material in the middle.
+LAYOUT = ["identity", "safety", "knowledge", "cache", "history", "task"]
+
+NEVER_EVICT = {"identity", "safety", "task"}
+
+DEFAULT_TIER = "knowledge"
+
+EXACT_MAX_ITEMS = 200
+EXACT_MAX_WORK = 4_000_000
+
+
+@dataclass
+class ContextItem:
+    id: str
+    tokens: int
+    value: float
+    tier: str
+    must_include: bool
+    position: int
+    text: str = ""
+
+    @property
+    def density(self) -> float:
+        return self.value / self.tokens if self.tokens else float("inf")
+
+
+@dataclass
+class TierUsage:
+    tier: str
+    candidates: int = 0
+    selected: int = 0
+    tokens: int = 0
+    value: float = 0.0
+
+
+@dataclass
+class PackResult:
+    budget: int
+    method: str
+    selected: list[ContextItem]
+    dropped: list[ContextItem]
+    value: float
+    upper_bound: float
+    elapsed_ms: float
+    tiers: list[TierUsage] = field(default_factory=list)
+
+    @property
+    def tokens(self) -> int:
+        return sum(item.tokens for item in self.selected)
+
+    @property
+    def utilization(self) -> float:
+        return self.tokens / self.budget if self.budget else 0.0
+
+    @property
+    def gap(self) -> float:
+        return (self.upper_bound - self.value) / self.upper_bound if self.upper_bound else 0.0
+
+
+def parse_item(raw: dict, position: int) -> ContextItem:
+    tier = str(raw.get("tier", DEFAULT_TIER))
+    if tier not in LAYOUT:
+        raise ValueError(f"Item {raw.get('id', position)}: unknown tier {tier} (expected one of {', '.join(LAYOUT)})")
+    text = str(raw.get("text", ""))
+    tokens = int(raw["tokens"]) if "tokens" in raw else estimate_tokens(text)
+    if tokens < 0:
+        raise ValueError(f"Item {raw.get('id', position)}: tokens must be >= 0")
+    return ContextItem(
+        id=str(raw.get("id", position)),
+        tokens=tokens,
+        value=float(raw.get("value", 1.0)),
+        tier=tier,
+        must_include=bool(raw.get("must_include", tier in NEVER_EVICT)),
+        position=position,
+        text=text,
+    )
+
+
+def load_items(path: Path) -> list[ContextItem]:
+    content = path.read_text(encoding="utf-8")
+    if content.lstrip().startswith("["):
+        records = json.loads(content)
+    else:
+        records = [json.loads(line) for line in content.split("\n") if line.strip()]
+    return [parse_item(record, position) for position, record in enumerate(records)]
+
+
+def synthetic_items(count: int, seed: int = 0) -> list[ContextItem]:
+    rng = random.Random(seed)
+    items = [
+        ContextItem("identity", 800, 100.0, "identity", True, 0),
+        ContextItem("safety", 400, 100.0, "safety", True, 1),
+        ContextItem("task", 1200, 100.0, "task", True, 2),
+    ]
+    tiers = ["knowledge", "history", "cache"]
+    for position in range(3, count + 3):
+        tier = rng.choices(tiers, [5, 3, 2])[0]
+        items.append(ContextItem(
+            id=f"{tier}-{position}",
+            tokens=max(1, int(rng.lognormvariate(5.0, 0.9))),
+            value=round(rng.paretovariate(1.5), 4),
+            tier=tier,
+            must_include=False,
+            position=position,
+        ))
+    return items
+
+
+def pack_exact(items: list[ContextItem], capacity: int) -> list[ContextItem] | None:
+    # Pareto frontier of (tokens, value) states; each state links back to the items it holds.
+    states: list[tuple[int, float, tuple | None]] = [(0, 0.0, None)]
+    work = 0
+    for index, item in enumerate(items):
+        shifted = [(w + item.tokens, v + item.value, (index, link)) for w, v, link in states if w + item.tokens <= capacity]
+        work += len(states)
+        if work > EXACT_MAX_WORK:
+            return None
+        merged: list[tuple[int, float, tuple | None]] = []
+        best = -1.0
+        i = j = 0
+        while i < len(states) or j < len(shifted):
+            if j == len(shifted) or (i < len(states) and (states[i][0], -states[i][1]) <= (shifted[j][0], -shifted[j][1])):
+                state = states[i]
+                i += 1
+            else:
+                state = shifted[j]
+                j += 1
+            if state[1] > best:
+                merged.append(state)
+                best = state[1]
+        states = merged
+
+    chosen: list[ContextItem] = []
+    link = states[-1][2]
+    while link is not None:
+        index, link = link
+        chosen.append(items[index])
+    return chosen
+
+
+def pack_greedy(items: list[ContextItem], capacity: int) -> tuple[list[ContextItem], float]:
+    # Items arrive in position order and the sort is stable, so ties keep their original order.
+    ranked = sorted(items, key=lambda item: item.value / item.tokens, reverse=True)
+    chosen: list[ContextItem] = []
+    used = 0
+    value = 0.0
+    upper_bound = None
+    for item in ranked:
+        if used + item.tokens <= capacity:
+            chosen.append(item)
+            used += item.tokens
+            value += item.value
+        elif upper_bound is None:
+            # Fractional (LP) relaxation: fill the remaining capacity with the first item that does not fit.
+            upper_bound = value + (capacity - used) * item.density
+            if used == capacity:
+                break
+    if upper_bound is None:
+        upper_bound = value
+
+    # Greedy alone can be arbitrarily bad when one large item dominates; taking the better of the
+    # two keeps the result within half of the optimum.
+    single = max(items, key=attrgetter("value"), default=None)
+    if single is not None and single.value > value:
+        return [single], upper_bound
+    return chosen, upper_bound
+
+
+def pack(items: list[ContextItem], budget: int, exact_max: int = EXACT_MAX_ITEMS) -> PackResult:
+    started = time.perf_counter()
+    required = [item for item in items if item.must_include]
+    required_tokens = sum(item.tokens for item in required)
+    if required_tokens > budget:
+        raise ValueError(
+            f"Must-include items need {required_tokens:,} tokens but the budget is {budget:,} "
+            f"({len(required)} items; mark fewer as must_include or raise the budget)"
+        )
+
+    capacity = budget - required_tokens
+    free = [item for item in items if not item.must_include and item.value > 0 and item.tokens == 0]
+    optional = [item for item in items if not item.must_include and item.value > 0 and 0 < item.tokens <= capacity]
+
+    method = "greedy"
+    chosen = None
+    if len(optional) <= exact_max:
+        chosen = pack_exact(optional, capacity)
+        if chosen is not None:
+            method = "exact"
+            upper_bound = sum(item.value for item in chosen)
+    if chosen is None:
+        chosen, upper_bound = pack_greedy(optional, capacity)
+
+    base_value = sum(item.value for item in required + free)
+    selected = sorted(required + free + chosen, key=lambda item: (LAYOUT.index(item.tier), item.position))
+    selected_ids = {id(item) for item in selected}
+    dropped = [item for item in items if id(item) not in selected_ids]
+
+    tiers = {tier: TierUsage(tier) for tier in LAYOUT}
+    for item in items:
+        tiers[item.tier].candidates += 1
+    for item in selected:
+        usage = tiers[item.tier]
+        usage.selected += 1
+        usage.tokens += item.tokens
+        usage.value += item.value
+
+    value = base_value + sum(item.value for item in chosen)
+    return PackResult(
+        budget=budget,
+        method=method,
+        selected=selected,
+        dropped=dropped,
+        value=value,
+        upper_bound=max(value, base_value + upper_bound),
+        elapsed_ms=(time.perf_counter() - started) * 1000,
+        tiers=[usage for usage in tiers.values() if usage.candidates],
+    )
+
+
+def assemble(result: PackResult) -> str:
+    return "\n\n".join(item.text for item in result.selected if item.text)
+
+
+def format_result(result: PackResult, top_dropped: int = 5) -> str:
+    bound = "optimal" if result.method == "exact" else f"≤ {result.upper_bound:,.2f} (gap ≤ {result.gap:.2%})"
+    lines: list[str] = [
+        f"\n📦 Context Packing: {len(result.selected):,} of {len(result.selected) + len(result.dropped):,} items "
+        f"({result.method}, {result.elapsed_ms:.1f}ms)",
+        f"   Budget: {result.tokens:,} / {result.budget:,} tokens ({result.utilization:.1%} utilized)",
+        f"   Value: {result.value:,.2f}  |  bound: {bound}",
+        f"\n   {'Tier':<10} {'Selected':>14} {'Tokens':>9} {'Share':>7} {'Value':>11}",
+        f"   {'─' * 10} {'─' * 14} {'─' * 9} {'─' * 7} {'─' * 11}",
+    ]
+    for usage in result.tiers:
+        share = usage.tokens / result.budget if result.budget else 0.0
+        lines.append(
+            f"   {usage.tier:<10} {f'{usage.selected:,}/{usage.candidates:,}':>14} {usage.tokens:>9,} "
+            f"{share:>7.1%} {usage.value:>11,.2f}"
+        )
+    if result.dropped:
+        best = sorted(result.dropped, key=lambda item: (-item.value, item.position))[:top_dropped]
+        lines.append("\n   Highest-value dropped items:")
+        for item in best:
+            lines.append(f"   ⚠️  {item.id} ({item.tier}, {item.tokens:,} tokens, value {item.value:,.2f})")
+    return "\n".join(lines)
+
+
+def result_to_dict(result: PackResult) -> dict:
+    return {
+        "budget": result.budget,
+        "method": result.method,
+        "tokens": result.tokens,
+        "utilization": round(result.utilization, 4),
+        "value": round(result.value, 4),
+        "upper_bound": round(result.upper_bound, 4),
+        "gap": round(result.gap, 6),
+        "elapsed_ms": round(result.elapsed_ms, 3),
+        "tiers": [
+            {"tier": u.tier, "candidates": u.candidates, "selected": u.selected, "tokens": u.tokens, "value": round(u.value, 4)}
+            for u in result.tiers
+        ],
+        "selected": [item.id for item in result.selected],
+        "dropped": len(result.dropped),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Pack context items into a token budget — exact for small sets, bounded greedy for large ones",
+    )
+    parser.add_argument("items", type=Path, nargs="?", help="JSONL or JSON array: id, tokens or text, value, tier, must_include")
+    parser.add_argument("--budget", type=int, required=True, help="Token budget for the assembled context")
+    parser.add_argument("--synthetic", type=int, metavar="N", help="Pack N synthetic items instead of reading a file")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for --synthetic (default: 0)")
+    parser.add_argument(
+        "--exact-max", type=int, default=EXACT_MAX_ITEMS,
+        help=f"Use the exact solver up to this many optional items (default: {EXACT_MAX_ITEMS})",
+    )
+    parser.add_argument("--emit", type=Path, help="Write the assembled context text to this file")
+    parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format (default: text)")
+
+    args = parser.parse_args()
+
+    if (args.synthetic is None) == (args.items is None):
+        parser.error("provide either an items file or --synthetic N")
+
+    try:
+        if args.items:
+            if not args.items.exists():
+                print(f"Error: File not found: {args.items}", file=sys.stderr)
+                sys.exit(1)
+            items = load_items(args.items)
+        else:
+            items = synthetic_items(args.synthetic, args.seed)
+        result = pack(items, args.budget, args.exact_max)
+    except (ValueError, KeyError, json.JSONDecodeError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.emit:
+        args.emit.write_text(assemble(result) + "\n", encoding="utf-8")
+
+    print(json.dumps(result_to_dict(result), indent=2) if args.format == "json" else format_result(result))
+
+
+if __name__ == "__main__":
+    main()
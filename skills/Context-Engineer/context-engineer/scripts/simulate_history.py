@@ -0,0 +1,529 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import math
+import random
+import sys
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+
+STRATEGIES = ["full", "sliding", "summary", "hierarchical"]
+
+DEFAULT_MODELS = ["gpt-4o-mini", "gpt-4o"]
+
+SUMMARY_PROMPT_TOKENS = 200
+
+TURN_BUCKETS = [10, 25, 50, 100, 250]
+
+
+@dataclass
+class TokenDist:
+    mean: float
+    cv: float = 0.5
+
+    def sample(self, rng: random.Random, count: int) -> list[int]:
+        if self.mean <= 0:
+            return [0] * count
+        if self.cv <= 0:
+            return [round(self.mean)] * count
+        sigma = math.sqrt(math.log(1.0 + self.cv ** 2))
+        mu = math.log(self.mean) - sigma ** 2 / 2
+        gauss, exp = rng.gauss, math.exp
+        return [max(1, round(exp(mu + sigma * gauss()))) for _ in range(count)]
+
+
+@dataclass
+class SessionShape:
+    turns: int
+    system_tokens: int = 1500
+    user: TokenDist = field(default_factory=lambda: TokenDist(150))
+    assistant: TokenDist = field(default_factory=lambda: TokenDist(400))
+    tool: TokenDist = field(default_factory=lambda: TokenDist(600, 1.0))
+
+
+@dataclass
+class StrategyConfig:
+    window: int = 6
+    summary_every: int = 8
+    summary_ratio: float = 0.15
+    summary_max: int = 1500
+    fanout: int = 4
+
+
+@dataclass
+class LatencyModel:
+    prefill_ms_per_1k: float = 40.0
+    first_token_ms: float = 300.0
+    ms_per_output_token: float = 15.0
+
+    def call_ms(self, input_tokens: float, output_tokens: float) -> float:
+        return self.prefill_ms_per_1k * input_tokens / 1000 + self.first_token_ms + self.ms_per_output_token * output_tokens
+
+
+@dataclass
+class Turn:
+    user: int
+    assistant: int
+    tool: int
+
+    @property
+    def tokens(self) -> int:
+        return self.user + self.assistant + self.tool
+
+
+@dataclass
+class StrategyResult:
+    strategy: str
+    turns: int
+    input_tokens: int = 0
+    output_tokens: int = 0
+    summary_calls: int = 0
+    peak_context: int = 0
+    turn_inputs: list[int] = field(default_factory=list)
+    turn_latency_ms: list[float] = field(default_factory=list)
+
+    def cost(self, pricing: dict[str, float]) -> float:
+        return (self.input_tokens * pricing["input"] + self.output_tokens * pricing["output"]) / 1_000_000
+
+
+class HistoryRun:
+    def __init__(self, strategy: str, turns: int, system_tokens: int, latency: LatencyModel, keep_turns: bool) -> None:
+        self.result = StrategyResult(strategy=strategy, turns=turns)
+        self.system_tokens = system_tokens
+        self.latency = latency
+        self.keep_turns = keep_turns
+        self.pending_ms = 0.0
+
+    def summarize(self, tokens: int, config: StrategyConfig) -> int:
+        summary = min(config.summary_max, round(tokens * config.summary_ratio))
+        self.result.input_tokens += tokens + SUMMARY_PROMPT_TOKENS
+        self.result.output_tokens += summary
+        self.result.summary_calls += 1
+        # Summaries run inline before the next call, so their latency lands on that turn.
+        self.pending_ms += self.latency.call_ms(tokens + SUMMARY_PROMPT_TOKENS, summary)
+        return summary
+
+    def call(self, context: int, turn: Turn) -> None:
+        prompt = self.system_tokens + context + turn.user + turn.tool
+        result = self.result
+        result.input_tokens += prompt
+        result.output_tokens += turn.assistant
+        result.peak_context = max(result.peak_context, prompt)
+        if self.keep_turns:
+            result.turn_inputs.append(prompt)
+            result.turn_latency_ms.append(self.pending_ms + self.latency.call_ms(prompt, turn.assistant))
+        self.pending_ms = 0.0
+
+
+def run_full(turns: list[Turn], run: HistoryRun) -> StrategyResult:
+    history = 0
+    for turn in turns:
+        run.call(history, turn)
+        history += turn.tokens
+    return run.result
+
+
+def run_sliding(turns: list[Turn], run: HistoryRun, config: StrategyConfig) -> StrategyResult:
+    window: deque[int] = deque()
+    history = 0
+    for turn in turns:
+        run.call(history, turn)
+        window.append(turn.tokens)
+        history += turn.tokens
+        if len(window) > config.window:
+            history -= window.popleft()
+    return run.result
+
+
+def run_summary(turns: list[Turn], run: HistoryRun, config: StrategyConfig) -> StrategyResult:
+    summary = raw = raw_turns = 0
+    for turn in turns:
+        if raw_turns == config.summary_every:
+            summary = run.summarize(summary + raw, config)
+            raw = raw_turns = 0
+        run.call(summary + raw, turn)
+        raw += turn.tokens
+        raw_turns += 1
+    return run.result
+
+
+def run_hierarchical(turns: list[Turn], run: HistoryRun, config: StrategyConfig) -> StrategyResult:
+    top = raw = raw_turns = 0
+    leaves: list[int] = []
+    for turn in turns:
+        if raw_turns == config.summary_every:
+            leaves.append(run.summarize(raw, config))
+            raw = raw_turns = 0
+            if len(leaves) == config.fanout:
+                top = run.summarize(top + sum(leaves), config)
+                leaves.clear()
+        run.call(top + sum(leaves) + raw, turn)
+        raw += turn.tokens
+        raw_turns += 1
+    return run.result
+
+
+def sample_session(shape: SessionShape, rng: random.Random) -> list[Turn]:
+    columns = zip(
+        shape.user.sample(rng, shape.turns),
+        shape.assistant.sample(rng, shape.turns),
+        shape.tool.sample(rng, shape.turns),
+    )
+    return [Turn(user, assistant, tool) for user, assistant, tool in columns]
+
+
+def simulate_session(
+    turns: list[Turn],
+    system_tokens: int,
+    config: StrategyConfig,
+    latency: LatencyModel,
+    keep_turns: bool = True,
+) -> dict[str, StrategyResult]:
+    def new_run(strategy: str) -> HistoryRun:
+        return HistoryRun(strategy, len(turns), system_tokens, latency, keep_turns)
+
+    return {
+        "full": run_full(turns, new_run("full")),
+        "sliding": run_sliding(turns, new_run("sliding"), config),
+        "summary": run_summary(turns, new_run("summary"), config),
+        "hierarchical": run_hierarchical(turns, new_run("hierarchical"), config),
+    }
+
+
+def load_model_pricing() -> dict[str, dict[str, float]]:
+    # Pricing comes from the FinOps skill next door, or from estimate_cost inside the bundle.
+    parents = Path(__file__).resolve().parents
+    if len(parents) > 3:
+        scripts = parents[3] / "Agent-FinOps" / "agent-finops" / "scripts"
+        if scripts.is_dir() and str(scripts) not in sys.path:
+            sys.path.append(str(scripts))
+    try:
+        from estimate_cost import MODEL_PRICING
+    except ImportError:
+        return {}
+    return MODEL_PRICING
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+@dataclass
+class StrategySummary:
+    strategy: str
+    sessions: int
+    input_tokens: float
+    output_tokens: float
+    summary_calls: float
+    peak_context: float
+    turn_inputs: list[float]
+    latency_p50: float
+    latency_p95: float
+    latency_last: float
+    costs: dict[str, float]
+
+
+def run_shape(
+    shape: SessionShape,
+    config: StrategyConfig,
+    latency: LatencyModel,
+    models: dict[str, dict[str, float]],
+    samples: int,
+    seed: int = 0,
+) -> list[StrategySummary]:
+    rng = random.Random(seed)
+    runs = [simulate_session(sample_session(shape, rng), shape.system_tokens, config, latency) for _ in range(samples)]
+    summaries = []
+    for strategy in STRATEGIES:
+        results = [run[strategy] for run in runs]
+        latencies = [ms for r in results for ms in r.turn_latency_ms]
+        summaries.append(StrategySummary(
+            strategy=strategy,
+            sessions=samples,
+            input_tokens=sum(r.input_tokens for r in results) / samples,
+            output_tokens=sum(r.output_tokens for r in results) / samples,
+            summary_calls=sum(r.summary_calls for r in results) / samples,
+            peak_context=sum(r.peak_context for r in results) / samples,
+            turn_inputs=[sum(r.turn_inputs[t] for r in results) / samples for t in range(shape.turns)],
+            latency_p50=percentile(latencies, 50),
+            latency_p95=percentile(latencies, 95),
+            latency_last=sum(r.turn_latency_ms[-1] for r in results) / samples,
+            costs={model: sum(r.cost(pricing) for r in results) / samples for model, pricing in models.items()},
+        ))
+    return summaries
+
+
+def random_shape(rng: random.Random, max_turns: int, system_tokens: int) -> SessionShape:
+    return SessionShape(
+        turns=max(2, round(math.exp(rng.uniform(math.log(2), math.log(max_turns))))),
+        system_tokens=system_tokens,
+        user=TokenDist(rng.uniform(30, 500)),
+        assistant=TokenDist(rng.uniform(80, 1200)),
+        tool=TokenDist(rng.choice([0.0, rng.uniform(100, 4000)]), 1.0),
+    )
+
+
+@dataclass
+class BucketStats:
+    label: str
+    sessions: int = 0
+    input_tokens: dict[str, float] = field(default_factory=lambda: dict.fromkeys(STRATEGIES, 0.0))
+    costs: dict[str, float] = field(default_factory=lambda: dict.fromkeys(STRATEGIES, 0.0))
+    cheaper_than_full: dict[str, int] = field(default_factory=lambda: dict.fromkeys(STRATEGIES, 0))
+
+
+@dataclass
+class SweepReport:
+    sessions: int
+    model: str
+    buckets: list[BucketStats]
+    growth_exponent: dict[str, float]
+
+
+def bucket_label(turns: int) -> str:
+    lower = 1
+    for upper in TURN_BUCKETS:
+        if turns <= upper:
+            return f"{lower}-{upper}"
+        lower = upper + 1
+    return f"{lower}+"
+
+
+def sweep_shapes(
+    sessions: int,
+    config: StrategyConfig,
+    latency: LatencyModel,
+    pricing: dict[str, float],
+    model: str,
+    max_turns: int = 200,
+    system_tokens: int = 1500,
+    seed: int = 0,
+) -> SweepReport:
+    rng = random.Random(seed)
+    labels = [bucket_label(upper) for upper in TURN_BUCKETS] + [bucket_label(TURN_BUCKETS[-1] + 1)]
+    buckets = {label: BucketStats(label) for label in labels}
+    # Cumulative input tokens against turn count on log-log axes; the slope is the growth exponent.
+    fit = {s: [0.0, 0.0, 0.0, 0.0, 0] for s in STRATEGIES}
+
+    for _ in range(sessions):
+        shape = random_shape(rng, max_turns, system_tokens)
+        results = simulate_session(sample_session(shape, rng), system_tokens, config, latency, keep_turns=False)
+        bucket = buckets[bucket_label(shape.turns)]
+        bucket.sessions += 1
+        full_cost = results["full"].cost(pricing)
+        x = math.log(shape.turns)
+        for strategy, result in results.items():
+            cost = result.cost(pricing)
+            bucket.input_tokens[strategy] += result.input_tokens
+            bucket.costs[strategy] += cost
+            bucket.cheaper_than_full[strategy] += cost < full_cost
+            y = math.log(max(result.input_tokens, 1))
+            sums = fit[strategy]
+            sums[0] += x
+            sums[1] += y
+            sums[2] += x * x
+            sums[3] += x * y
+            sums[4] += 1
+
+    growth = {}
+    for strategy, (sx, sy, sxx, sxy, n) in fit.items():
+        denominator = n * sxx - sx * sx
+        growth[strategy] = (n * sxy - sx * sy) / denominator if n > 1 and denominator else 0.0
+
+    return SweepReport(
+        sessions=sessions,
+        model=model,
+        buckets=[b for b in buckets.values() if b.sessions],
+        growth_exponent=growth,
+    )
+
+
+def checkpoints(turns: int) -> list[int]:
+    return sorted({1, *(max(1, round(turns * q)) for q in (0.25, 0.5, 0.75)), turns})
+
+
+def format_shape(shape: SessionShape, config: StrategyConfig, summaries: list[StrategySummary]) -> str:
+    lines: list[str] = [
+        f"\n📈 Context Growth Simulation: {shape.turns} turns, {summaries[0].sessions} sampled sessions",
+        f"   Per turn: user ~{shape.user.mean:.0f}, assistant ~{shape.assistant.mean:.0f}, "
+        f"tool ~{shape.tool.mean:.0f} tokens; system {shape.system_tokens}",
+        f"   Sliding window {config.window} turns; summarize every {config.summary_every} turns at "
+        f"{config.summary_ratio:.0%} (max {config.summary_max}); hierarchy fanout {config.fanout}",
+    ]
+    full = summaries[0]
+    lines.append(
+        f"\n   {'Strategy':<13} {'Input tok':>11} {'vs full':>8} {'Peak ctx':>9} {'Summaries':>9} "
+        f"{'P50 ms':>8} {'P95 ms':>8} {'Last ms':>8}"
+    )
+    lines.append(f"   {'─' * 13} {'─' * 11} {'─' * 8} {'─' * 9} {'─' * 9} {'─' * 8} {'─' * 8} {'─' * 8}")
+    for s in summaries:
+        lines.append(
+            f"   {s.strategy:<13} {s.input_tokens:>11,.0f} {s.input_tokens / full.input_tokens:>8.0%} "
+            f"{s.peak_context:>9,.0f} {s.summary_calls:>9.1f} {s.latency_p50:>8.0f} {s.latency_p95:>8.0f} "
+            f"{s.latency_last:>8.0f}"
+        )
+
+    marks = checkpoints(shape.turns)
+    lines.append("\n   Input tokens per turn")
+    lines.append(f"   {'Strategy':<13} " + " ".join(f"{'t' + str(t):>8}" for t in marks))
+    for s in summaries:
+        lines.append(f"   {s.strategy:<13} " + " ".join(f"{s.turn_inputs[t - 1]:>8,.0f}" for t in marks))
+
+    models = list(full.costs)
+    if models:
+        lines.append("\n   Cost per session")
+        lines.append(f"   {'Model':<20} " + " ".join(f"{s:>13}" for s in STRATEGIES))
+        for model in models:
+            lines.append(f"   {model:<20} " + " ".join(f"{'$' + format(s.costs[model], '.4f'):>13}" for s in summaries))
+    else:
+        lines.append("\n   ℹ️  Agent-FinOps pricing not found — cost columns omitted")
+    return "\n".join(lines)
+
+
+def format_sweep(report: SweepReport) -> str:
+    lines: list[str] = [f"\n📈 Context Growth Sweep: {report.sessions:,} session shapes (costs at {report.model})"]
+    lines.append(
+        "   Growth exponent (cumulative input ~ turns^k): "
+        + ", ".join(f"{s} {report.growth_exponent[s]:.2f}" for s in STRATEGIES)
+    )
+    lines.append(f"\n   {'Turns':<9} {'Sessions':>8} " + " ".join(f"{s:>19}" for s in STRATEGIES))
+    lines.append(f"   {'─' * 9} {'─' * 8} " + " ".join("─" * 19 for _ in STRATEGIES))
+    for bucket in report.buckets:
+        full = bucket.input_tokens["full"] or 1.0
+        cells = []
+        for strategy in STRATEGIES:
+            mean_cost = bucket.costs[strategy] / bucket.sessions
+            price = f"${mean_cost:.4f}"
+            if strategy == "full":
+                cells.append(f"{price:>19}")
+            else:
+                cells.append(
+                    f"{bucket.input_tokens[strategy] / full:>5.0%} {price:>8} "
+                    f"{bucket.cheaper_than_full[strategy] / bucket.sessions:>4.0%}"
+                )
+        lines.append(f"   {bucket.label:<9} {bucket.sessions:>8,} " + " ".join(cells))
+    lines.append("\n   Cells: input tokens vs full, mean cost per session, share of sessions cheaper than full history")
+    return "\n".join(lines)
+
+
+def summary_to_dict(summary: StrategySummary) -> dict:
+    return {
+        "strategy": summary.strategy,
+        "input_tokens": round(summary.input_tokens, 1),
+        "output_tokens": round(summary.output_tokens, 1),
+        "summary_calls": round(summary.summary_calls, 2),
+        "peak_context": round(summary.peak_context, 1),
+        "latency_ms": {
+            "p50": round(summary.latency_p50, 1),
+            "p95": round(summary.latency_p95, 1),
+            "last_turn": round(summary.latency_last, 1),
+        },
+        "turn_inputs": [round(v, 1) for v in summary.turn_inputs],
+        "costs": {model: round(cost, 6) for model, cost in summary.costs.items()},
+    }
+
+
+def sweep_to_dict(report: SweepReport) -> dict:
+    return {
+        "sessions": report.sessions,
+        "model": report.model,
+        "growth_exponent": {s: round(k, 3) for s, k in report.growth_exponent.items()},
+        "buckets": [
+            {
+                "turns": b.label,
+                "sessions": b.sessions,
+                "mean_input_tokens": {s: round(b.input_tokens[s] / b.sessions, 1) for s in STRATEGIES},
+                "mean_cost": {s: round(b.costs[s] / b.sessions, 6) for s in STRATEGIES},
+                "cheaper_than_full": {s: round(b.cheaper_than_full[s] / b.sessions, 4) for s in STRATEGIES},
+            }
+            for b in report.buckets
+        ],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Simulate multi-turn context growth under full history, sliding window and summarization strategies",
+    )
+    parser.add_argument("--turns", type=int, default=40, help="Turns per session (default: 40)")
+    parser.add_argument("--system-tokens", type=int, default=1500, help="System prompt tokens (default: 1500)")
+    parser.add_argument("--user-tokens", type=float, default=150, help="Mean user tokens per turn (default: 150)")
+    parser.add_argument("--assistant-tokens", type=float, default=400, help="Mean assistant tokens per turn (default: 400)")
+    parser.add_argument("--tool-tokens", type=float, default=600, help="Mean tool-result tokens per turn (default: 600)")
+    parser.add_argument("--cv", type=float, default=0.5, help="Coefficient of variation of user/assistant tokens (default: 0.5)")
+    parser.add_argument("--window", type=int, default=6, help="Sliding window size in turns (default: 6)")
+    parser.add_argument("--summary-every", type=int, default=8, help="Summarize after this many raw turns (default: 8)")
+    parser.add_argument("--summary-ratio", type=float, default=0.15, help="Summary size as a share of its input (default: 0.15)")
+    parser.add_argument("--summary-max", type=int, default=1500, help="Maximum summary tokens (default: 1500)")
+    parser.add_argument("--fanout", type=int, default=4, help="Leaf summaries merged per hierarchical level (default: 4)")
+    parser.add_argument("--prefill-ms", type=float, default=40.0, help="Prefill milliseconds per 1K input tokens (default: 40)")
+    parser.add_argument("--first-token-ms", type=float, default=300.0, help="Fixed per-call latency in ms (default: 300)")
+    parser.add_argument("--decode-ms", type=float, default=15.0, help="Milliseconds per output token (default: 15)")
+    parser.add_argument(
+        "--models", default=",".join(DEFAULT_MODELS),
+        help=f"Comma-separated MODEL_PRICING models, or 'all' (default: {','.join(DEFAULT_MODELS)})",
+    )
+    parser.add_argument("--samples", type=int, default=200, help="Sessions sampled per shape (default: 200)")
+    parser.add_argument("--sweep", type=int, metavar="N", help="Sweep N random session shapes instead of one")
+    parser.add_argument("--max-turns", type=int, default=200, help="Longest session in --sweep (default: 200)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format (default: text)")
+
+    args = parser.parse_args()
+
+    if min(args.turns, args.window, args.summary_every, args.fanout, args.samples, args.max_turns) < 1:
+        print("Error: turns, window, summary-every, fanout, samples and max-turns must be >= 1", file=sys.stderr)
+        sys.exit(1)
+    if args.fanout < 2:
+        print("Error: --fanout must be >= 2", file=sys.stderr)
+        sys.exit(1)
+
+    pricing = load_model_pricing()
+    names = list(pricing) if args.models == "all" else [m.strip() for m in args.models.split(",") if m.strip()]
+    unknown = [m for m in names if pricing and m not in pricing]
+    if unknown:
+        print(f"Error: Unknown model: {', '.join(unknown)}", file=sys.stderr)
+        sys.exit(1)
+    models = {m: pricing[m] for m in names if m in pricing}
+
+    config = StrategyConfig(
+        window=args.window,
+        summary_every=args.summary_every,
+        summary_ratio=args.summary_ratio,
+        summary_max=args.summary_max,
+        fanout=args.fanout,
+    )
+    latency = LatencyModel(args.prefill_ms, args.first_token_ms, args.decode_ms)
+
+    if args.sweep:
+        if not models:
+            print("Error: --sweep needs Agent-FinOps MODEL_PRICING for costs", file=sys.stderr)
+            sys.exit(1)
+        model = next(iter(models))
+        report = sweep_shapes(
+            args.sweep, config, latency, models[model], model, args.max_turns, args.system_tokens, args.seed,
+        )
+        print(json.dumps(sweep_to_dict(report), indent=2) if args.format == "json" else format_sweep(report))
+        return
+
+    shape = SessionShape(
+        turns=args.turns,
+        system_tokens=args.system_tokens,
+        user=TokenDist(args.user_tokens, args.cv),
+        assistant=TokenDist(args.assistant_tokens, args.cv),
+        tool=TokenDist(args.tool_tokens, 1.0),
+    )
+    summaries = run_shape(shape, config, latency, models, args.samples, args.seed)
+    if args.format == "json":
+        print(json.dumps({"turns": shape.turns, "samples": args.samples, "strategies": [summary_to_dict(s) for s in summaries]}, indent=2))
+    else:
+        print(format_shape(shape, config, summaries))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+
+import argparse
+import hashlib
+import heapq
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+DEFAULT_INDEX = Path(".skill-index.bin")
+
+MAGIC = b"SKIX"
+VERSION = 1
+HEADER = struct.Struct("<4sIIIIIdQQQQQQ")
+FILE_REC = struct.Struct("<IIQQII32s")
+SECTION_REC = struct.Struct("<9I")
+TERM_REC = struct.Struct("<4I")
+PAIR_REC = struct.Struct("<II")
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+HEADING_WEIGHT = 3
+
+FRONTMATTER = re.compile(r"\A---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+HEADING = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+WORD = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this to was were will with "
+    "when use used using you your".split()
+)
+
+
+@dataclass
+class Section:
+    heading: str
+    start_line: int
+    end_line: int
+    tokens: int
+    terms: Counter = field(default_factory=Counter)
+
+    @property
+    def length(self) -> int:
+        return sum(self.terms.values())
+
+
+@dataclass
+class IndexedFile:
+    path: str
+    mtime_ns: int
+    size: int
+    sha256: bytes
+    sections: list[Section] = field(default_factory=list)
+
+
+@dataclass
+class BuildStats:
+    files: int = 0
+    reused: int = 0
+    rehashed: int = 0
+    analyzed: int = 0
+    removed: int = 0
+    sections: int = 0
+    terms: int = 0
+    bytes: int = 0
+    elapsed_s: float = 0.0
+
+
+@dataclass
+class SearchHit:
+    score: float
+    path: str
+    heading: str
+    start_line: int
+    end_line: int
+    tokens: int
+
+
+def tokenize(text: str) -> list[str]:
+    return [word for word in WORD.findall(text.lower()) if len(word) > 1 and word not in STOPWORDS]
+
+
+def split_sections(content: str) -> list[Section]:
+    lines = content.split("\n")
+    sections: list[Section] = []
+    body_start = 0
+
+    match = FRONTMATTER.match(content)
+    if match:
+        body_start = match.group(0).count("\n")
+        fields = dict(re.findall(r"^(\w+):\s*(.+)$", match.group(1), re.MULTILINE))
+        section = Section("(frontmatter)", 1, body_start, len(match.group(0)) // 4)
+        section.terms.update(tokenize(fields.get("name", "").replace("-", " ")) * HEADING_WEIGHT)
+        section.terms.update(tokenize(fields.get("description", "")))
+        sections.append(section)
+
+    current = Section("(preamble)", body_start + 1, body_start, 0)
+    chars = 0
+    in_fence = False
+    for line_num, line in enumerate(lines[body_start:], start=body_start + 1):
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        heading = None if in_fence else HEADING.match(line)
+        if heading:
+            if current.end_line >= current.start_line and (current.terms or current.heading != "(preamble)"):
+                current.tokens = chars // 4
+                sections.append(current)
+            current = Section(heading.group(2), line_num, line_num, 0)
+            current.terms.update(tokenize(heading.group(2)) * HEADING_WEIGHT)
+            chars = len(line) + 1
+            continue
+        current.end_line = line_num
+        current.terms.update(tokenize(line))
+        chars += len(line) + 1
+
+    if current.terms or current.heading != "(preamble)":
+        current.tokens = chars // 4
+        sections.append(current)
+    return sections
+
+
+def discover_files(root: Path) -> list[Path]:
+    patterns = ("*/*/SKILL.md", "*/*/references/*.md", "*/SKILL.md", "*/references/*.md")
+    return sorted({path for pattern in patterns for path in root.glob(pattern)})
+
+
+class SkillIndex:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.handle = path.open("rb")
+        try:
+            self.buffer = mmap.mmap(self.handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.handle.close()
+            raise ValueError(f"{path} is empty")
+        header = HEADER.unpack_from(self.buffer, 0)
+        magic, version = header[0], header[1]
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} skill index")
+        (self.file_count, self.section_count, self.term_count, self.forward_count, self.avgdl,
+         self.files_off, self.sections_off, self.terms_off, self.postings_off, self.forward_off,
+         self.strings_off) = header[2:]
+
+    def close(self) -> None:
+        self.buffer.close()
+        self.handle.close()
+
+    def __enter__(self) -> "SkillIndex":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def string(self, offset: int, length: int) -> str:
+        start = self.strings_off + offset
+        return self.buffer[start:start + length].decode("utf-8")
+
+    def file(self, index: int) -> tuple[str, int, int, int, int, bytes]:
+        path_off, path_len, mtime_ns, size, first, count, digest = FILE_REC.unpack_from(
+            self.buffer, self.files_off + index * FILE_REC.size
+        )
+        return self.string(path_off, path_len), mtime_ns, size, first, count, digest
+
+    def section(self, index: int) -> tuple[int, ...]:
+        return SECTION_REC.unpack_from(self.buffer, self.sections_off + index * SECTION_REC.size)
+
+    def term(self, index: int) -> tuple[str, int, int]:
+        term_off, term_len, df, postings_start = TERM_REC.unpack_from(self.buffer, self.terms_off + index * TERM_REC.size)
+        return self.string(term_off, term_len), df, postings_start
+
+    def find_term(self, term: str) -> int | None:
+        low, high = 0, self.term_count
+        while low < high:
+            middle = (low + high) // 2
+            candidate = self.term(middle)[0]
+            if candidate < term:
+                low = middle + 1
+            elif candidate > term:
+                high = middle
+            else:
+                return middle
+        return None
+
+    def search(self, query: str, limit: int = 5) -> list[SearchHit]:
+        scores: dict[int, float] = {}
+        for term in set(tokenize(query)):
+            term_id = self.find_term(term)
+            if term_id is None:
+                continue
+            _, df, start = self.term(term_id)
+            idf = math.log(1 + (self.section_count - df + 0.5) / (df + 0.5))
+            for offset in range(start, start + df):
+                section_id, tf = PAIR_REC.unpack_from(self.buffer, self.postings_off + offset * PAIR_REC.size)
+                length = self.section(section_id)[6]
+                norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * length / self.avgdl)
+                scores[section_id] = scores.get(section_id, 0.0) + idf * tf * (BM25_K1 + 1) / norm
+
+        hits: list[SearchHit] = []
+        for section_id, score in heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0])):
+            file_index, heading_off, heading_len, start_line, end_line, tokens, _, _, _ = self.section(section_id)
+            hits.append(SearchHit(
+                score=score,
+                path=self.file(file_index)[0],
+                heading=self.string(heading_off, heading_len),
+                start_line=start_line,
+                end_line=end_line,
+                tokens=tokens,
+            ))
+        return hits
+
+    def load_files(self) -> dict[str, IndexedFile]:
+        terms = [self.term(index)[0] for index in range(self.term_count)]
+        files: dict[str, IndexedFile] = {}
+        for index in range(self.file_count):
+            path, mtime_ns, size, first, count, digest = self.file(index)
+            indexed = IndexedFile(path, mtime_ns, size, digest)
+            for section_id in range(first, first + count):
+                _, heading_off, heading_len, start_line, end_line, tokens, _, forward_start, forward_len = self.section(section_id)
+                section = Section(self.string(heading_off, heading_len), start_line, end_line, tokens)
+                for offset in range(forward_start, forward_start + forward_len):
+                    term_id, tf = PAIR_REC.unpack_from(self.buffer, self.forward_off + offset * PAIR_REC.size)
+                    section.terms[terms[term_id]] = tf
+                indexed.sections.append(section)
+            files[path] = indexed
+        return files
+
+
+def write_index(path: Path, files: list[IndexedFile]) -> tuple[int, int]:
+    strings = bytearray()
+    string_offsets: dict[str, tuple[int, int]] = {}
+
+    def intern(text: str) -> tuple[int, int]:
+        if text not in string_offsets:
+            encoded = text.encode("utf-8")
+            string_offsets[text] = (len(strings), len(encoded))
+            strings.extend(encoded)
+        return string_offsets[text]
+
+    sections = [(file_index, section) for file_index, indexed in enumerate(files) for section in indexed.sections]
+    vocabulary = sorted({term for _, section in sections for term in section.terms})
+    term_ids = {term: term_id for term_id, term in enumerate(vocabulary)}
+    postings: list[list[tuple[int, int]]] = [[] for _ in vocabulary]
+
+    file_blob = bytearray()
+    first = 0
+    for indexed in files:
+        path_off, path_len = intern(indexed.path)
+        file_blob += FILE_REC.pack(path_off, path_len, indexed.mtime_ns, indexed.size, first, len(indexed.sections), indexed.sha256)
+        first += len(indexed.sections)
+
+    section_blob = bytearray()
+    forward_blob = bytearray()
+    forward_count = 0
+    total_length = 0
+    for section_id, (file_index, section) in enumerate(sections):
+        heading_off, heading_len = intern(section.heading)
+        entries = sorted((term_ids[term], tf) for term, tf in section.terms.items())
+        for term_id, tf in entries:
+            postings[term_id].append((section_id, tf))
+            forward_blob += PAIR_REC.pack(term_id, tf)
+        section_blob += SECTION_REC.pack(
+            file_index, heading_off, heading_len, section.start_line, section.end_line,
+            section.tokens, section.length, forward_count, len(entries),
+        )
+        forward_count += len(entries)
+        total_length += section.length
+
+    term_blob = bytearray()
+    posting_blob = bytearray()
+    posting_count = 0
+    for term, entries in zip(vocabulary, postings):
+        term_off, term_len = intern(term)
+        term_blob += TERM_REC.pack(term_off, term_len, len(entries), posting_count)
+        for entry in entries:
+            posting_blob += PAIR_REC.pack(*entry)
+        posting_count += len(entries)
+
+    avgdl = total_length / len(sections) if sections else 1.0
+    files_off = HEADER.size
+    sections_off = files_off + len(file_blob)
+    terms_off = sections_off + len(section_blob)
+    postings_off = terms_off + len(term_blob)
+    forward_off = postings_off + len(posting_blob)
+    strings_off = forward_off + len(forward_blob)
+    header = HEADER.pack(
+        MAGIC, VERSION, len(files), len(sections), len(vocabulary), forward_count, avgdl or 1.0,
+        files_off, sections_off, terms_off, postings_off, forward_off, strings_off,
+    )
+
+    partial = path.with_name(path.name + ".tmp")
+    with partial.open("wb") as handle:
+        for blob in (header, file_blob, section_blob, term_blob, posting_blob, forward_blob, strings):
+            handle.write(blob)
+    os.replace(partial, path)
+    return len(sections), len(vocabulary)
+
+
+def build_index(root: Path, index_path: Path, full: bool = False) -> BuildStats:
+    started = time.perf_counter()
+    stats = BuildStats()
+    previous: dict[str, IndexedFile] = {}
+    if index_path.exists() and not full:
+        try:
+            with SkillIndex(index_path) as index:
+                previous = index.load_files()
+        except (ValueError, struct.error):
+            previous = {}
+
+    files: list[IndexedFile] = []
+    for source in discover_files(root):
+        relative = source.relative_to(root).as_posix()
+        stat = source.stat()
+        old = previous.pop(relative, None)
+        if old and old.mtime_ns == stat.st_mtime_ns and old.size == stat.st_size:
+            stats.reused += 1
+            files.append(old)
+            continue
+
+        data = source.read_bytes()
+        digest = hashlib.sha256(data).digest()
+        if old and old.sha256 == digest:
+            stats.rehashed += 1
+            sections = old.sections
+        else:
+            stats.analyzed += 1
+            sections = split_sections(data.decode("utf-8", errors="replace").replace("\r\n", "\n"))
+        files.append(IndexedFile(relative, stat.st_mtime_ns, stat.st_size, digest, sections))
+
+    stats.removed = len(previous)
+    stats.files = len(files)
+    stats.sections, stats.terms = write_index(index_path, files)
+    stats.bytes = index_path.stat().st_size
+    stats.elapsed_s = time.perf_counter() - started
+    return stats
+
+
+def read_section(root: Path, hit: SearchHit) -> str:
+    lines = (root / hit.path).read_text(encoding="utf-8").split("\n")
+    return "\n".join(lines[hit.start_line - 1:hit.end_line])
+
+
+def select_within_budget(hits: list[SearchHit], budget: int) -> list[SearchHit]:
+    selected: list[SearchHit] = []
+    used = 0
+    for hit in hits:
+        if used + hit.tokens <= budget:
+            selected.append(hit)
+            used += hit.tokens
+    return selected
+
+
+def format_build(stats: BuildStats, index_path: Path) -> str:
+    return "\n".join([
+        f"\n🗂️  Skill index: {index_path} ({stats.bytes / 1024:.1f} KiB)",
+        f"   Files: {stats.files} ({stats.reused} unchanged, {stats.rehashed} re-hashed, "
+        f"{stats.analyzed} analyzed, {stats.removed} removed)",
+        f"   Sections: {stats.sections}, terms: {stats.terms}",
+        f"   Built in {stats.elapsed_s * 1000:.1f}ms",
+    ])
+
+
+def format_hits(query: str, hits: list[SearchHit], elapsed_ms: float) -> str:
+    lines = [f"\n🔎 \"{query}\" — {len(hits)} sections in {elapsed_ms:.2f}ms ({sum(hit.tokens for hit in hits):,} tokens)"]
+    for rank, hit in enumerate(hits, start=1):
+        lines.append(
+            f"   {rank:>2}. {hit.score:6.2f}  {hit.path}:{hit.start_line}-{hit.end_line}  "
+            f"{hit.heading}  (~{hit.tokens:,} tokens)"
+        )
+    if not hits:
+        lines.append("   No matching sections")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    # Default to the checkout's skills/ directory; outside a checkout (e.g. a zipapp bundle) --root is required.
+    parents = Path(__file__).resolve().parents
+    skills_root = parents[3] if len(parents) > 3 and parents[3].name == "skills" and parents[3].is_dir() else None
+
+    parser = argparse.ArgumentParser(
+        description="Build a memory-mapped BM25 index over SKILL.md files and references, and query it for just-in-time context",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="Build or incrementally refresh the index")
+    build.add_argument("--root", type=Path, default=skills_root, help="Skills directory (default: this repo's skills/)")
+    build.add_argument("--index", type=Path, default=DEFAULT_INDEX, help=f"Index file (default: {DEFAULT_INDEX})")
+    build.add_argument("--full", action="store_true", help="Ignore the existing index and re-analyze every file")
+
+    search = sub.add_parser("search", help="Return BM25-ranked sections with their token cost")
+    search.add_argument("query", help="Search query")
+    search.add_argument("--root", type=Path, default=skills_root, help="Skills directory (default: this repo's skills/)")
+    search.add_argument("--index", type=Path, default=DEFAULT_INDEX, help=f"Index file (default: {DEFAULT_INDEX})")
+    search.add_argument("-k", "--limit", type=int, default=5, help="Sections to return (default: 5)")
+    search.add_argument("--budget", type=int, help="Keep only the best sections that fit this many tokens")
+    search.add_argument("--refresh", action="store_true", help="Refresh the index for changed files before searching")
+    search.add_argument("--show", action="store_true", help="Print the text of each returned section")
+    search.add_argument("--format", choices=["text", "json"], default="text", help="Output format (default: text)")
+
+    args = parser.parse_args()
+
+    if args.root is None:
+        parser.error("--root is required outside a skills checkout")
+    if not args.root.is_dir():
+        print(f"Error: Directory not found: {args.root}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.command == "build":
+        print(format_build(build_index(args.root, args.index, args.full), args.index))
+        return
+
+    if args.refresh or not args.index.exists():
+        build_index(args.root, args.index)
+
+    started = time.perf_counter()
+    try:
+        with SkillIndex(args.index) as index:
+            hits = index.search(args.query, args.limit)
+    except (ValueError, struct.error) as exc:
+        print(f"Error: {exc} (rebuild with: skill_index.py build --full)", file=sys.stderr)
+        sys.exit(1)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if args.budget is not None:
+        hits = select_within_budget(hits, args.budget)
+
+    if args.format == "json":
+        print(json.dumps({
+            "query": args.query,
+            "elapsed_ms": round(elapsed_ms, 3),
+            "results": [
+                {**vars(hit), "score": round(hit.score, 4), **({"text": read_section(args.root, hit)} if args.show else {})}
+                for hit in hits
+            ],
+        }, indent=2))
+        return
+
+    print(format_hits(args.query, hits, elapsed_ms))
+    if args.show:
+        for hit in hits:
+            print(f"\n--- {hit.path}:{hit.start_line}-{hit.end_line} ---\n{read_section(args.root, hit)}")
+
+
+if __name__ == "__main__":
+    main()
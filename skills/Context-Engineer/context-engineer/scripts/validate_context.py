@@ -3,8 +3,10 @@
 import argparse
 import re
 import sys
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import ModuleType
 
 MEMORY_TIERS = {
     "episodic": r"(?:episodic|conversation|session|short[- ]?term)\s*(?:memory|context|store)",
@@ -45,6 +47,11 @@ class ContextReport:
     has_retrieval_strategy: bool = False
     estimated_static_tokens: int = 0
     issues: list[ValidationResult] = field(default_factory=list)
+    skipped_checks: list[str] = field(default_factory=list)
+
+    @property
+    def partial(self) -> bool:
+        return bool(self.skipped_checks)
 
     @property
     def score(self) -> int:
@@ -62,61 +69,139 @@ def estimate_tokens(content: str) -> int:
     return len(content) // 4
 
 
-def validate_file(file_path: Path) -> ContextReport:
-    content = file_path.read_text(encoding="utf-8")
-    lines = content.split("\n")
-    report = ContextReport(file_path=file_path)
-    report.estimated_static_tokens = estimate_tokens(content)
+LINE_RULES: list[tuple[str, str, re.Pattern, str]] = [
+    (code, severity, re.compile(pattern, re.IGNORECASE), message)
+    for code, severity, pattern, message in ANTI_PATTERNS
+]
 
-    for tier_name, pattern in MEMORY_TIERS.items():
-        if re.search(pattern, content, re.IGNORECASE):
-            report.tiers_found.append(tier_name)
-        else:
-            report.tiers_missing.append(tier_name)
+Content = str | bytes | memoryview
 
-    report.has_budget = any(
-        re.search(p, content, re.IGNORECASE) for p in BUDGET_INDICATORS
-    )
 
-    report.has_eviction = bool(re.search(
-        r"(?:evict|eviction|expire|ttl|lru|fifo|priority[- ]?queue|drop[- ]?oldest)",
-        content, re.IGNORECASE,
-    ))
-
-    report.has_retrieval_strategy = bool(re.search(
-        r"(?:retriev|fetch|load|query|search|embed|vector|similarity|rag)\s",
-        content, re.IGNORECASE,
-    ))
-
-    if not report.has_budget:
-        report.issues.append(ValidationResult(
-            code="C010",
-            severity="WARNING",
-            line=None,
-            message="No token budget or context limit defined",
+def decode_content(content: Content) -> str:
+    text = content if isinstance(content, str) else str(content, "utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def load_scheduler() -> ModuleType:
+    parents = Path(__file__).resolve().parents
+    tools = str(parents[4] / "tools") if len(parents) > 4 else ""
+    if tools and Path(tools, "check_scheduler.py").is_file() and tools not in sys.path:
+        sys.path.append(tools)
+    try:
+        import check_scheduler
+    except ImportError:
+        raise ValueError("--time-budget needs check_scheduler.py, which is not installed next to this script") from None
+    return check_scheduler
+
+
+def build_checks(
+    content: str,
+    report: ContextReport,
+    line_rules: list[tuple[str, str, re.Pattern, str]],
+    split_rules: bool = False,
+) -> list[tuple]:
+    lines = content.split("\n")
+
+    def memory_tiers() -> None:
+        for tier_name, pattern in MEMORY_TIERS.items():
+            if re.search(pattern, content, re.IGNORECASE):
+                report.tiers_found.append(tier_name)
+            else:
+                report.tiers_missing.append(tier_name)
+
+        report.has_eviction = bool(re.search(
+            r"(?:evict|eviction|expire|ttl|lru|fifo|priority[- ]?queue|drop[- ]?oldest)",
+            content, re.IGNORECASE,
         ))
 
-    if not report.has_eviction and report.tiers_found:
-        report.issues.append(ValidationResult(
-            code="C011",
-            severity="WARNING",
-            line=None,
-            message="Memory tiers defined but no eviction policy found",
+        if not report.has_eviction and report.tiers_found:
+            report.issues.append(ValidationResult(
+                code="C011",
+                severity="WARNING",
+                line=None,
+                message="Memory tiers defined but no eviction policy found",
+            ))
+
+    def token_budget() -> None:
+        report.has_budget = any(
+            re.search(p, content, re.IGNORECASE) for p in BUDGET_INDICATORS
+        )
+
+        if not report.has_budget:
+            report.issues.append(ValidationResult(
+                code="C010",
+                severity="WARNING",
+                line=None,
+                message="No token budget or context limit defined",
+            ))
+
+    def retrieval_strategy() -> None:
+        report.has_retrieval_strategy = bool(re.search(
+            r"(?:retriev|fetch|load|query|search|embed|vector|similarity|rag)\s",
+            content, re.IGNORECASE,
         ))
 
-    for line_num, line in enumerate(lines, start=1):
-        for code, severity, pattern, message in ANTI_PATTERNS:
-            if re.search(pattern, line, re.IGNORECASE):
-                report.issues.append(ValidationResult(
-                    code=code,
-                    severity=severity,
-                    line=line_num,
-                    message=message,
-                ))
+    def scan_lines(rules: list[tuple[str, str, re.Pattern, str]]) -> Callable[[], None]:
+        def scan() -> None:
+            for line_num, line in enumerate(lines, start=1):
+                for code, severity, pattern, message in rules:
+                    if pattern.search(line):
+                        report.issues.append(ValidationResult(
+                            code=code,
+                            severity=severity,
+                            line=line_num,
+                            message=message,
+                        ))
+        return scan
+
+    checks = [
+        ("memory_tiers", "WARNING", 1, memory_tiers, False),
+        ("token_budget", "WARNING", 0, token_budget, False),
+        ("retrieval_strategy", "INFO", 0, retrieval_strategy, False),
+    ]
+    if split_rules:
+        checks.extend((rule[0], rule[1], 2, scan_lines([rule]), True) for rule in line_rules)
+    elif line_rules:
+        checks.append(("line_rules", "WARNING", 2, scan_lines(line_rules), True))
+    return checks
+
+
+def validate_file(file_path: Path, time_budget_ms: float | None = None) -> ContextReport:
+    return validate_content(file_path.read_text(encoding="utf-8"), file_path, time_budget_ms=time_budget_ms)
+
+
+def validate_content(
+    content: Content,
+    file_path: Path | str = "<inline>",
+    line_rules: list[tuple[str, str, re.Pattern, str]] = LINE_RULES,
+    time_budget_ms: float | None = None,
+) -> ContextReport:
+    content = decode_content(content)
+    report = ContextReport(file_path=Path(file_path))
+    report.estimated_static_tokens = estimate_tokens(content)
 
+    if time_budget_ms is None:
+        for _, _, _, run, _ in sorted(build_checks(content, report, line_rules), key=lambda check: check[2]):
+            run()
+    else:
+        report.skipped_checks = load_scheduler().run_checks(
+            "validate_context",
+            build_checks(content, report, line_rules, split_rules=True),
+            report.issues,
+            content,
+            time_budget_ms,
+            lambda sample: build_checks(sample, ContextReport(file_path=Path(file_path)), line_rules, split_rules=True),
+        )
     return report
 
 
+def validate_batch(items: Iterable[tuple[str, Content]]) -> Iterator[ContextReport]:
+    for item_id, content in items:
+        yield validate_content(content, item_id)
+
+
 def format_report(report: ContextReport) -> str:
     lines: list[str] = [f"\n🧠 Context Architecture Validation: {report.file_path}"]
     lines.append(f"   Memory tiers: {', '.join(report.tiers_found) or 'None detected'}")
@@ -125,7 +210,10 @@ def format_report(report: ContextReport) -> str:
     lines.append(f"   Token budget: {'✅ Defined' if report.has_budget else '❌ Missing'}")
     lines.append(f"   Eviction policy: {'✅ Found' if report.has_eviction else '❌ Missing'}")
     lines.append(f"   Static tokens: ~{report.estimated_static_tokens:,}")
-    lines.append(f"   Score: {report.score}/10")
+    score = "not scored (partial run)" if report.partial else f"{report.score}/10"
+    lines.append(f"   Score: {score}")
+    if report.partial:
+        lines.append(f"   ⏱️  Partial: time budget reached, skipped {', '.join(report.skipped_checks)}")
 
     if report.issues:
         lines.append("\n   Issues:")
@@ -147,8 +235,17 @@ def main() -> None:
     )
     parser.add_argument("files", type=Path, nargs="+", help="Context config file(s)")
     parser.add_argument("--strict", action="store_true", help="Exit 1 on any warnings")
+    parser.add_argument(
+        "--time-budget", type=float, metavar="MS",
+        help="Run the most valuable checks first and stop after MS milliseconds per file; skipped checks are listed",
+    )
 
     args = parser.parse_args()
+    if args.time_budget is not None:
+        try:
+            load_scheduler()
+        except ValueError as exc:
+            parser.error(str(exc))
     exit_code = 0
 
     for file_path in args.files:
@@ -157,10 +254,10 @@ def main() -> None:
             exit_code = 1
             continue
 
-        report = validate_file(file_path)
+        report = validate_file(file_path, args.time_budget)
         print(format_report(report))
 
-        if args.strict and any(i.severity in ("ERROR", "WARNING") for i in report.issues):
+        if args.strict and (report.partial or any(i.severity in ("ERROR", "WARNING") for i in report.issues)):
             exit_code = 1
 
     sys.exit(exit_code)
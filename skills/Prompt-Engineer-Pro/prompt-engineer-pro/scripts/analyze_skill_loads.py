@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+DEFAULT_CACHE = Path(".skill-load-cache.json")
+CACHE_VERSION = 1
+
+FRONTMATTER = re.compile(r"\A---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+FRONTMATTER_FIELD = re.compile(r"^(name|description):\s*(.+)$", re.MULTILINE)
+
+
+def estimate_tokens(content: str) -> int:
+    return len(content) // 4
+
+
+@dataclass
+class FileStats:
+    tokens: int
+    name: str = ""
+    description: str = ""
+
+
+@dataclass
+class Skill:
+    name: str
+    path: Path
+    stub_tokens: int
+    body_tokens: int
+    references: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def reference_tokens(self) -> int:
+        return sum(self.references.values())
+
+
+@dataclass
+class LoadSet:
+    label: str
+    tokens: int
+    tasks: int = 0
+
+
+@dataclass
+class LoadReport:
+    base_tokens: int
+    index_tokens: int
+    monolithic_tokens: int
+    skills: list[Skill] = field(default_factory=list)
+    single: list[LoadSet] = field(default_factory=list)
+    observed: list[LoadSet] = field(default_factory=list)
+    task_tokens: list[int] = field(default_factory=list)
+    unknown_trace_entries: int = 0
+    cache_hits: int = 0
+    cache_rehashed: int = 0
+    cache_misses: int = 0
+
+    @property
+    def peak_tokens(self) -> int:
+        return max(self.task_tokens, default=0)
+
+    @property
+    def mean_tokens(self) -> float:
+        return sum(self.task_tokens) / len(self.task_tokens) if self.task_tokens else 0.0
+
+
+class FileCache:
+    def __init__(self, path: Path | None) -> None:
+        self.path = path
+        self.entries: dict[str, dict] = {}
+        self.hits = 0
+        self.rehashed = 0
+        self.misses = 0
+        self.dirty = False
+        if path and path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (json.JSONDecodeError, OSError):
+                data = {}
+            if data.get("version") == CACHE_VERSION:
+                self.entries = data.get("files", {})
+
+    def stats(self, path: Path) -> FileStats:
+        key = str(path.resolve())
+        stat = path.stat()
+        entry = self.entries.get(key)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            self.hits += 1
+            return FileStats(entry["tokens"], entry["name"], entry["description"])
+
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        if entry and entry["sha256"] == digest:
+            self.rehashed += 1
+        else:
+            self.misses += 1
+            content = data.decode("utf-8", errors="replace")
+            name, description = parse_frontmatter(content)
+            entry = {"sha256": digest, "tokens": estimate_tokens(content), "name": name, "description": description}
+        entry.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        self.entries[key] = entry
+        self.dirty = True
+        return FileStats(entry["tokens"], entry["name"], entry["description"])
+
+    def save(self) -> None:
+        if not self.path or not self.dirty:
+            return
+        partial = self.path.with_name(self.path.name + ".tmp")
+        partial.write_text(json.dumps({"version": CACHE_VERSION, "files": self.entries}, sort_keys=True), encoding="utf-8")
+        os.replace(partial, self.path)
+
+
+def parse_frontmatter(content: str) -> tuple[str, str]:
+    match = FRONTMATTER.match(content)
+    if not match:
+        return "", ""
+    fields = dict(FRONTMATTER_FIELD.findall(match.group(1)))
+    return fields.get("name", "").strip(), fields.get("description", "").strip()
+
+
+def discover_skills(root: Path, cache: FileCache) -> list[Skill]:
+    skills: list[Skill] = []
+    for skill_md in sorted({*root.glob("*/*/SKILL.md"), *root.glob("*/SKILL.md")}):
+        stats = cache.stats(skill_md)
+        name = stats.name or skill_md.parent.name
+        skill = Skill(
+            name=name,
+            path=skill_md,
+            stub_tokens=estimate_tokens(f"- {name}: {stats.description}"),
+            body_tokens=stats.tokens,
+        )
+        for reference in sorted((skill_md.parent / "references").glob("*.md")):
+            skill.references[reference.name] = cache.stats(reference).tokens
+        skills.append(skill)
+    return skills
+
+
+def load_trace(lines: list[str]) -> list[list[str]]:
+    tasks: list[list[str]] = []
+    for line_num, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"trace line {line_num}: {exc}") from exc
+        if isinstance(record, dict):
+            record = [*record.get("skills", []), *record.get("references", [])]
+        if not isinstance(record, list):
+            raise ValueError(f"trace line {line_num}: expected a list or {{\"skills\": [...], \"references\": [...]}}")
+        tasks.append([str(entry) for entry in record])
+    return tasks
+
+
+def resolve_task(task: list[str], skills: dict[str, Skill]) -> tuple[dict[str, set[str]], int]:
+    loads: dict[str, set[str]] = {}
+    unknown = 0
+    for entry in task:
+        name, _, reference = entry.partition("/")
+        skill = skills.get(name)
+        if skill is None:
+            unknown += 1
+            continue
+        refs = loads.setdefault(name, set())
+        if reference:
+            reference = reference if reference.endswith(".md") else f"{reference}.md"
+            if reference in skill.references:
+                refs.add(reference)
+            else:
+                unknown += 1
+    return loads, unknown
+
+
+def load_set_tokens(report: LoadReport, skills: dict[str, Skill], loads: dict[str, set[str]]) -> int:
+    tokens = report.base_tokens + report.index_tokens
+    for name, references in loads.items():
+        skill = skills[name]
+        tokens += skill.body_tokens + sum(skill.references[reference] for reference in references)
+    return tokens
+
+
+def load_set_label(loads: dict[str, set[str]]) -> str:
+    parts = []
+    for name in sorted(loads):
+        refs = sorted(loads[name])
+        parts.append(f"{name}[{', '.join(ref.removesuffix('.md') for ref in refs)}]" if refs else name)
+    return " + ".join(parts) or "(base only)"
+
+
+def analyze_loads(base: str, skills: list[Skill], tasks: list[list[str]], with_references: bool = False) -> LoadReport:
+    report = LoadReport(
+        base_tokens=estimate_tokens(base),
+        index_tokens=sum(skill.stub_tokens for skill in skills),
+        monolithic_tokens=estimate_tokens(base) + sum(skill.body_tokens + skill.reference_tokens for skill in skills),
+        skills=skills,
+    )
+    by_name = {skill.name: skill for skill in skills}
+
+    for skill in skills:
+        loads = {skill.name: set(skill.references) if with_references else set()}
+        report.single.append(LoadSet(label=load_set_label(loads), tokens=load_set_tokens(report, by_name, loads)))
+
+    observed: dict[str, LoadSet] = {}
+    counts: Counter[str] = Counter()
+    for task in tasks:
+        loads, unknown = resolve_task(task, by_name)
+        report.unknown_trace_entries += unknown
+        label = load_set_label(loads)
+        if label not in observed:
+            observed[label] = LoadSet(label=label, tokens=load_set_tokens(report, by_name, loads))
+        counts[label] += 1
+        report.task_tokens.append(observed[label].tokens)
+
+    for label, load_set in observed.items():
+        load_set.tasks = counts[label]
+    report.observed = sorted(observed.values(), key=lambda load_set: (-load_set.tasks, -load_set.tokens))
+    return report
+
+
+def report_to_dict(report: LoadReport) -> dict:
+    return {
+        "base_tokens": report.base_tokens,
+        "index_tokens": report.index_tokens,
+        "monolithic_tokens": report.monolithic_tokens,
+        "skills": [
+            {
+                "name": skill.name,
+                "path": str(skill.path),
+                "stub_tokens": skill.stub_tokens,
+                "body_tokens": skill.body_tokens,
+                "references": skill.references,
+            }
+            for skill in report.skills
+        ],
+        "single_skill_sets": [{"load_set": s.label, "tokens": s.tokens} for s in report.single],
+        "observed_sets": [{"load_set": s.label, "tokens": s.tokens, "tasks": s.tasks} for s in report.observed],
+        "tasks": len(report.task_tokens),
+        "peak_tokens": report.peak_tokens,
+        "mean_tokens": round(report.mean_tokens, 1),
+        "unknown_trace_entries": report.unknown_trace_entries,
+    }
+
+
+def format_report(report: LoadReport, base_path: str) -> str:
+    mono = report.monolithic_tokens
+
+    def share(tokens: float) -> str:
+        return f"{tokens / mono:.0%}" if mono else "-"
+
+    lines = [f"\n🧩 Skill Injection Load Sets: {base_path} + {len(report.skills)} skills"]
+    lines.append(f"   Base prompt:        {report.base_tokens:>8,} tokens")
+    lines.append(f"   Skill index:        {report.index_tokens:>8,} tokens (name + description stubs, always loaded)")
+    lines.append(f"   Monolithic prompt:  {mono:>8,} tokens (base + every SKILL.md + every reference)")
+
+    lines.append(f"\n   {'Single-skill load set':<48} {'Tokens':>8} {'vs mono':>8}")
+    for load_set in sorted(report.single, key=lambda s: -s.tokens):
+        lines.append(f"   {load_set.label[:48]:<48} {load_set.tokens:>8,} {share(load_set.tokens):>8}")
+
+    if report.task_tokens:
+        lines.append(f"\n   {'Observed load set':<48} {'Tokens':>8} {'Tasks':>6}")
+        for load_set in report.observed[:15]:
+            lines.append(f"   {load_set.label[:48]:<48} {load_set.tokens:>8,} {load_set.tasks:>6}")
+        if len(report.observed) > 15:
+            lines.append(f"   … {len(report.observed) - 15} more load sets")
+        lines.append(f"\n   Tasks: {len(report.task_tokens)}")
+        lines.append(f"   Peak context:    {report.peak_tokens:>8,} tokens ({share(report.peak_tokens)} of monolithic)")
+        lines.append(f"   Average context: {report.mean_tokens:>8,.0f} tokens ({share(report.mean_tokens)} of monolithic)")
+        if mono:
+            lines.append(f"   ✅ Skill injection saves {mono - report.mean_tokens:,.0f} tokens per task on average")
+        if report.unknown_trace_entries:
+            lines.append(f"   ⚠️  {report.unknown_trace_entries} trace entries name unknown skills or references")
+
+    lines.append(
+        f"\n   Cache: {report.cache_hits} unchanged, {report.cache_rehashed} re-hashed, {report.cache_misses} analyzed"
+    )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    # Default to the checkout's skills/ directory; outside a checkout (e.g. a zipapp bundle) --skills is required.
+    parents = Path(__file__).resolve().parents
+    skills_root = parents[3] if len(parents) > 3 and parents[3].name == "skills" and parents[3].is_dir() else None
+
+    parser = argparse.ArgumentParser(
+        description="Compare skill-injection load sets (base prompt + SKILL.md libraries) against a monolithic prompt",
+    )
+    parser.add_argument("base", type=Path, help="Base system prompt file")
+    parser.add_argument("--skills", type=Path, default=skills_root, help="Skills directory laid out as */*/SKILL.md (default: this repo's skills/)")
+    parser.add_argument("--trace", type=Path, help="JSONL task trace: one task per line, a list of skill or skill/reference names")
+    parser.add_argument("--with-references", action="store_true", help="Single-skill sets load every reference of the skill")
+    parser.add_argument("--cache", type=Path, default=DEFAULT_CACHE, help=f"Per-file hash cache (default: {DEFAULT_CACHE})")
+    parser.add_argument("--no-cache", action="store_true", help="Analyze every file without reading or writing the cache")
+    parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format (default: text)")
+
+    args = parser.parse_args()
+
+    if args.skills is None:
+        parser.error("--skills is required outside a skills checkout")
+
+    for path in (args.base, args.skills, args.trace):
+        if path and not path.exists():
+            print(f"Error: File not found: {path}", file=sys.stderr)
+            sys.exit(1)
+
+    cache = FileCache(None if args.no_cache else args.cache)
+    skills = discover_skills(args.skills, cache)
+    if not skills:
+        print(f"Error: No SKILL.md files found under {args.skills}", file=sys.stderr)
+        sys.exit(1)
+
+    tasks: list[list[str]] = []
+    if args.trace:
+        try:
+            tasks = load_trace(args.trace.read_text(encoding="utf-8").splitlines())
+        except ValueError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            sys.exit(1)
+
+    report = analyze_loads(args.base.read_text(encoding="utf-8"), skills, tasks, args.with_references)
+    report.cache_hits, report.cache_rehashed, report.cache_misses = cache.hits, cache.rehashed, cache.misses
+    cache.save()
+
+    if args.format == "json":
+        print(json.dumps(report_to_dict(report), indent=2))
+    else:
+        print(format_report(report, str(args.base)))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,14 @@ import argparse
 import json
 import re
 import sys
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import ModuleType
+
+
+DEFAULT_MODEL = "gpt-4o"
+DEFAULT_MONTHLY_CALLS = 10_000
 
 
 @dataclass
@@ -20,6 +26,7 @@ class ToolDefinition:
     has_safety_flag: bool = False
     param_count: int = 0
     raw_block: str = ""
+    tokens: int = 0
 
 
 @dataclass
@@ -29,6 +36,26 @@ class ToolAnalysisReport:
     tools: list[ToolDefinition] = field(default_factory=list)
     quality_score: int = 0
     issues: list[str] = field(default_factory=list)
+    prompt_tokens: int = 0
+    tool_tokens: int = 0
+
+
+@dataclass
+class ToolCost:
+    name: str
+    line: int
+    tokens: int
+    prompt_share: float
+    cost_per_call: float | None = None
+    monthly_cost: float | None = None
+
+
+@dataclass
+class CostRanking:
+    model: str
+    monthly_calls: int
+    input_price_per_m: float | None
+    tools: list[ToolCost] = field(default_factory=list)
 
 
 def extract_xml_tools(content: str) -> list[ToolDefinition]:
@@ -187,7 +214,97 @@ def analyze_tool_quality(tool: ToolDefinition) -> None:
     ))
 
 
-def generate_report(file_path: Path, tools: list[ToolDefinition]) -> ToolAnalysisReport:
+Content = str | bytes | memoryview
+
+
+def decode_content(content: Content) -> str:
+    text = content if isinstance(content, str) else str(content, "utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def load_finops() -> ModuleType | None:
+    # A checkout keeps the FinOps scripts in a sibling skill; a bundle ships them side by side.
+    parents = Path(__file__).resolve().parents
+    if len(parents) > 3:
+        scripts = parents[3] / "Agent-FinOps" / "agent-finops" / "scripts"
+        if scripts.is_dir() and str(scripts) not in sys.path:
+            sys.path.append(str(scripts))
+    try:
+        import estimate_cost
+    except ImportError:
+        return None
+    return estimate_cost
+
+
+def load_model_pricing() -> dict[str, dict[str, float]]:
+    finops = load_finops()
+    return finops.MODEL_PRICING if finops else {}
+
+
+def measure_tool_tokens(tools: list[ToolDefinition]) -> None:
+    starts = sorted({tool.line for tool in tools})
+    for tool in tools:
+        block_lines = tool.raw_block.split("\n")
+        later = [line for line in starts if line > tool.line]
+        span = min(len(block_lines), later[0] - tool.line) if later else len(block_lines)
+        tool.tokens = len("\n".join(block_lines[:span])) // 4
+
+
+def rank_tool_costs(
+    report: ToolAnalysisReport,
+    model: str = DEFAULT_MODEL,
+    monthly_calls: int = DEFAULT_MONTHLY_CALLS,
+    pricing: dict[str, dict[str, float]] | None = None,
+) -> CostRanking:
+    pricing = load_model_pricing() if pricing is None else pricing
+    price = pricing.get(model, {}).get("input")
+    ranking = CostRanking(model=model, monthly_calls=monthly_calls, input_price_per_m=price)
+
+    for tool in sorted(report.tools, key=lambda t: (-t.tokens, t.line)):
+        cost = ToolCost(
+            name=tool.name,
+            line=tool.line,
+            tokens=tool.tokens,
+            prompt_share=tool.tokens / report.prompt_tokens if report.prompt_tokens else 0.0,
+        )
+        if price is not None:
+            cost.cost_per_call = tool.tokens / 1_000_000 * price
+            cost.monthly_cost = cost.cost_per_call * monthly_calls
+        ranking.tools.append(cost)
+
+    return ranking
+
+
+def extract_tools(content: str) -> list[ToolDefinition]:
+    tools = extract_xml_tools(content)
+    if not tools:
+        tools = extract_xml_action_tags(content)
+    if not tools:
+        tools = extract_function_tools(content)
+    if not tools:
+        tools = extract_markdown_tools(content)
+    return tools
+
+
+def analyze_content(content: Content, file_path: Path | str = "<inline>") -> ToolAnalysisReport:
+    content = decode_content(content)
+    tools = extract_tools(content)
+    measure_tool_tokens(tools)
+
+    report = generate_report(file_path, tools)
+    report.prompt_tokens = len(content) // 4
+    report.tool_tokens = sum(tool.tokens for tool in tools)
+    return report
+
+
+def analyze_batch(items: Iterable[tuple[str, Content]]) -> Iterator[ToolAnalysisReport]:
+    for item_id, content in items:
+        yield analyze_content(content, item_id)
+
+
+def generate_report(file_path: Path | str, tools: list[ToolDefinition]) -> ToolAnalysisReport:
     report = ToolAnalysisReport(
         file_path=str(file_path),
         total_tools=len(tools),
@@ -233,7 +350,7 @@ def generate_report(file_path: Path, tools: list[ToolDefinition]) -> ToolAnalysi
     return report
 
 
-def format_text(report: ToolAnalysisReport) -> str:
+def format_text(report: ToolAnalysisReport, costs: CostRanking | None = None) -> str:
     lines: list[str] = []
     lines.append(f"{'=' * 60}")
     lines.append(f"  TOOL SPECIFICATION ANALYSIS")
@@ -261,6 +378,21 @@ def format_text(report: ToolAnalysisReport) -> str:
                 icon = "✅" if passed else "❌"
                 lines.append(f"     {icon} {label}")
 
+    if costs is not None and costs.tools:
+        share = report.tool_tokens / report.prompt_tokens if report.prompt_tokens else 0.0
+        lines.append(f"\n  CONTEXT COST ({costs.model}, {costs.monthly_calls:,} calls/month)")
+        lines.append(f"  {'-' * 40}")
+        lines.append(f"  Tool definitions: ~{report.tool_tokens:,} of ~{report.prompt_tokens:,} prompt tokens ({share:.0%})")
+        if costs.input_price_per_m is None:
+            lines.append(f"  (no pricing for {costs.model} — install agent-finops or pick a known --model)")
+        lines.append(f"\n  {'#':>3}  {'Tool':<24} {'Tokens':>7} {'Share':>6} {'$/call':>9} {'$/month':>9}")
+        for rank, cost in enumerate(costs.tools, start=1):
+            per_call = f"{cost.cost_per_call:9.5f}" if cost.cost_per_call is not None else f"{'—':>9}"
+            monthly = f"{cost.monthly_cost:9.2f}" if cost.monthly_cost is not None else f"{'—':>9}"
+            lines.append(
+                f"  {rank:>3}  {cost.name[:24]:<24} {cost.tokens:>7,} {cost.prompt_share:>6.1%} {per_call} {monthly}"
+            )
+
     if report.issues:
         lines.append(f"\n  ISSUES")
         lines.append(f"  {'-' * 40}")
@@ -271,11 +403,13 @@ def format_text(report: ToolAnalysisReport) -> str:
     return "\n".join(lines)
 
 
-def format_json_output(report: ToolAnalysisReport) -> str:
-    return json.dumps({
+def analysis_to_dict(report: ToolAnalysisReport, costs: CostRanking | None = None) -> dict:
+    data = {
         "file": report.file_path,
         "total_tools": report.total_tools,
         "quality_score": report.quality_score,
+        "prompt_tokens": report.prompt_tokens,
+        "tool_tokens": report.tool_tokens,
         "tools": [
             {
                 "name": t.name,
@@ -287,11 +421,34 @@ def format_json_output(report: ToolAnalysisReport) -> str:
                 "has_examples": t.has_examples,
                 "has_error_handling": t.has_error_handling,
                 "has_safety_flag": t.has_safety_flag,
+                "tokens": t.tokens,
             }
             for t in report.tools
         ],
         "issues": report.issues,
-    }, indent=2)
+    }
+    if costs is not None:
+        data["cost_ranking"] = {
+            "model": costs.model,
+            "monthly_calls": costs.monthly_calls,
+            "input_price_per_m": costs.input_price_per_m,
+            "tools": [
+                {
+                    "name": c.name,
+                    "line": c.line,
+                    "tokens": c.tokens,
+                    "prompt_share": round(c.prompt_share, 4),
+                    "cost_per_call": round(c.cost_per_call, 6) if c.cost_per_call is not None else None,
+                    "monthly_cost": round(c.monthly_cost, 2) if c.monthly_cost is not None else None,
+                }
+                for c in costs.tools
+            ],
+        }
+    return data
+
+
+def format_json_output(report: ToolAnalysisReport, costs: CostRanking | None = None) -> str:
+    return json.dumps(analysis_to_dict(report, costs), indent=2)
 
 
 def main() -> None:
@@ -299,39 +456,66 @@ def main() -> None:
         description="Analyze tool specifications in AI agent system prompts",
     )
     parser.add_argument(
-        "prompt_file",
+        "prompt_files",
         type=Path,
-        help="Path to the system prompt file to analyze",
+        nargs="+",
+        metavar="prompt_file",
+        help="Path(s) to the system prompt file(s) to analyze",
     )
     parser.add_argument(
         "--format",
-        choices=["text", "json"],
+        choices=["text", "json", "ndjson"],
         default="text",
-        help="Output format (default: text)",
+        help="Output format; ndjson streams one report per line (default: text)",
+    )
+    parser.add_argument(
+        "--model",
+        default=DEFAULT_MODEL,
+        help=f"Model whose input pricing is used for the cost ranking (default: {DEFAULT_MODEL})",
+    )
+    parser.add_argument(
+        "--monthly-calls",
+        type=int,
+        default=DEFAULT_MONTHLY_CALLS,
+        help=f"Calls per month for the projected monthly cost (default: {DEFAULT_MONTHLY_CALLS:,})",
     )
 
     args = parser.parse_args()
 
-    if not args.prompt_file.exists():
-        print(f"Error: File not found: {args.prompt_file}", file=sys.stderr)
-        sys.exit(1)
-
-    content = args.prompt_file.read_text(encoding="utf-8")
+    if args.format == "json" and len(args.prompt_files) > 1:
+        parser.error("--format json takes one file; use --format ndjson for several")
 
-    tools = extract_xml_tools(content)
-    if not tools:
-        tools = extract_xml_action_tags(content)
-    if not tools:
-        tools = extract_function_tools(content)
-    if not tools:
-        tools = extract_markdown_tools(content)
+    writer = None
+    if args.format == "ndjson":
+        from report_stream import NdjsonWriter
+        writer = NdjsonWriter()
 
-    report = generate_report(args.prompt_file, tools)
+    pricing = load_model_pricing()
+    if pricing and args.model not in pricing:
+        print(f"Error: Unknown model: {args.model} (known: {', '.join(pricing)})", file=sys.stderr)
+        sys.exit(1)
 
-    if args.format == "json":
-        print(format_json_output(report))
-    else:
-        print(format_text(report))
+    exit_code = 0
+    for prompt_file in args.prompt_files:
+        if not prompt_file.exists():
+            print(f"Error: File not found: {prompt_file}", file=sys.stderr)
+            exit_code = 1
+            continue
+
+        report = analyze_content(prompt_file.read_text(encoding="utf-8"), prompt_file)
+        costs = rank_tool_costs(report, args.model, args.monthly_calls, pricing)
+
+        if writer is not None:
+            writer.write(analysis_to_dict(report, costs))
+            writer.flush()
+        elif args.format == "json":
+            print(format_json_output(report, costs))
+        else:
+            print(format_text(report, costs))
+
+    if writer is not None:
+        writer.close()
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 
-import argparse
 import re
 import sys
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from report_stream import NdjsonWriter, SarifWriter
 
 
 @dataclass
@@ -28,13 +32,47 @@ LINT_RULES: list[tuple[str, str, str | None, str]] = [
     ("P010", "WARNING", r"(?:always|never|must)\s+(?:always|never|must)", "Redundant emphasis — single modifier sufficient"),
 ]
 
+LINE_RULES: list[tuple[str, str, re.Pattern, str]] = [
+    (code, severity, re.compile(pattern, re.IGNORECASE), message)
+    for code, severity, pattern, message in LINT_RULES
+    if code != "P001" and pattern
+]
+
+STRUCTURE_PATTERN = re.compile(r"<\w+>|^#{1,6}\s", re.MULTILINE)
+
+RULE_PHRASE_PATTERN = re.compile(r"((?:always|never|must|do not)\s+.{10,50})", re.IGNORECASE)
+
+SUMMARY_RULES: list[tuple[str, str, str]] = [
+    ("P011", "WARNING", "Prompt exceeds 2,000 lines — consider modularizing"),
+    ("P012", "WARNING", "Prompt exceeds 100,000 chars — excessive context consumption"),
+    ("P013", "INFO", "Blocks of 5+ consecutive empty lines"),
+    ("P014", "WARNING", "Same rule repeated 3+ times"),
+]
+
+
+Content = str | bytes | memoryview
+
+
+def decode_content(content: Content) -> str:
+    text = content if isinstance(content, str) else str(content, "utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
 
 def lint_file(file_path: Path) -> list[LintResult]:
-    content = file_path.read_text(encoding="utf-8")
+    return lint_content(file_path.read_text(encoding="utf-8"))
+
+
+def lint_content(
+    content: Content,
+    line_rules: list[tuple[str, str, re.Pattern, str]] = LINE_RULES,
+) -> list[LintResult]:
+    content = decode_content(content)
     lines = content.split("\n")
     results: list[LintResult] = []
 
-    has_structure = bool(re.search(r"<\w+>|^#{1,6}\s", content, re.MULTILINE))
+    has_structure = bool(STRUCTURE_PATTERN.search(content))
     if not has_structure and len(lines) > 30:
         results.append(LintResult(
             code="P001",
@@ -44,10 +82,8 @@ def lint_file(file_path: Path) -> list[LintResult]:
         ))
 
     for line_num, line in enumerate(lines, start=1):
-        for code, severity, pattern, message in LINT_RULES:
-            if code == "P001":
-                continue
-            if pattern and re.search(pattern, line, re.IGNORECASE):
+        for code, severity, pattern, message in line_rules:
+            if pattern.search(line):
                 results.append(LintResult(
                     code=code,
                     severity=severity,
@@ -82,10 +118,7 @@ def lint_file(file_path: Path) -> list[LintResult]:
 
     seen_rules: dict[str, list[int]] = {}
     for line_num, line in enumerate(lines, start=1):
-        match = re.search(
-            r"((?:always|never|must|do not)\s+.{10,50})",
-            line, re.IGNORECASE,
-        )
+        match = RULE_PHRASE_PATTERN.search(line)
         if match:
             normalized = re.sub(r"\s+", " ", match.group(1).lower().strip())
             seen_rules.setdefault(normalized, []).append(line_num)
@@ -102,6 +135,11 @@ def lint_file(file_path: Path) -> list[LintResult]:
     return results
 
 
+def lint_batch(items: Iterable[tuple[str, Content]]) -> Iterator[tuple[str, list[LintResult]]]:
+    for item_id, content in items:
+        yield item_id, lint_content(content)
+
+
 def format_results(results: list[LintResult], file_path: Path) -> str:
     if not results:
         return f"✅ {file_path}: No issues found"
@@ -125,7 +163,22 @@ def format_results(results: list[LintResult], file_path: Path) -> str:
     return "\n".join(lines)
 
 
+def rule_catalog() -> list[tuple[str, str]]:
+    return [(code, message) for code, _, _, message in LINT_RULES] + [
+        (code, message) for code, _, message in SUMMARY_RULES
+    ]
+
+
+def emit_results(writer: "NdjsonWriter | SarifWriter", results: list[LintResult], file_path: Path) -> None:
+    uri = file_path.as_posix()
+    for result in results:
+        writer.add_result(result.code, result.severity, result.message, uri, result.line)
+    writer.flush()
+
+
 def main() -> None:
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Quick lint check for AI agent system prompts",
     )
@@ -140,9 +193,24 @@ def main() -> None:
         action="store_true",
         help="Exit with code 1 if any warnings or errors found",
     )
+    parser.add_argument(
+        "--format",
+        choices=["text", "ndjson", "sarif"],
+        default="text",
+        help="Output format; ndjson and sarif stream one finding at a time (default: text)",
+    )
 
     args = parser.parse_args()
 
+    writer = None
+    if args.format == "ndjson":
+        from report_stream import NdjsonWriter
+        writer = NdjsonWriter()
+    elif args.format == "sarif":
+        from report_stream import SarifWriter
+        writer = SarifWriter()
+        writer.begin_run("lint_prompt", rule_catalog())
+
     exit_code = 0
     for file_path in args.files:
         if not file_path.exists():
@@ -151,13 +219,18 @@ def main() -> None:
             continue
 
         results = lint_file(file_path)
-        print(format_results(results, file_path))
+        if writer is None:
+            print(format_results(results, file_path))
+        else:
+            emit_results(writer, results, file_path)
 
         if args.strict and any(
             r.severity in ("ERROR", "WARNING") for r in results
         ):
             exit_code = 1
 
+    if writer is not None:
+        writer.close()
     sys.exit(exit_code)
 
 
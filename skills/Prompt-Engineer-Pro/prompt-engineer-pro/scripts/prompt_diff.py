@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+
+import argparse
+import difflib
+import json
+import re
+import subprocess
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from analyze_tools import load_finops
+from lint_prompt import LINE_RULES as LINT_LINE_RULES
+from lint_prompt import lint_content
+from validate_prompt import (
+    ANTI_PATTERN_REGEXES,
+    ANTI_PATTERNS,
+    SECTION_REGEXES,
+    AuditReport,
+    SectionCheck,
+    analyze_tool_specs,
+    audit_content,
+    calculate_score,
+    check_prompt_hygiene,
+    decode_content,
+    detect_anti_patterns,
+)
+
+
+@dataclass
+class Hunk:
+    old_start: int
+    old_lines: list[str]
+    new_start: int
+    new_lines: list[str]
+
+
+@dataclass
+class DiffFinding:
+    tool: str
+    code: str
+    severity: str
+    line: int | None
+    message: str
+
+
+@dataclass
+class ModelDelta:
+    model: str
+    old_cost: float
+    new_cost: float
+
+    @property
+    def delta(self) -> float:
+        return self.new_cost - self.old_cost
+
+
+@dataclass
+class PromptDiff:
+    old_label: str
+    new_label: str
+    old_lines: int
+    new_lines: int
+    hunks: list[Hunk] = field(default_factory=list)
+    old_tokens: int = 0
+    new_tokens: int = 0
+    old_score: int = 0
+    new_score: int = 0
+    old_rating: str = ""
+    new_rating: str = ""
+    old_finops_score: int | None = None
+    new_finops_score: int | None = None
+    costs: list[ModelDelta] = field(default_factory=list)
+    new_findings: list[DiffFinding] = field(default_factory=list)
+    resolved_findings: list[DiffFinding] = field(default_factory=list)
+    rechecked: list[str] = field(default_factory=list)
+    elapsed_s: float = 0.0
+
+    @property
+    def changed_lines(self) -> int:
+        return sum(len(hunk.old_lines) + len(hunk.new_lines) for hunk in self.hunks)
+
+
+def read_version(spec: str) -> str:
+    path = Path(spec)
+    if path.exists():
+        return path.read_text(encoding="utf-8")
+    revision, sep, name = spec.partition(":")
+    if not sep or not revision:
+        raise FileNotFoundError(f"File not found: {spec}")
+    result = subprocess.run(["git", "show", f"{revision}:{name}"], capture_output=True)
+    if result.returncode != 0:
+        message = result.stderr.decode("utf-8", errors="replace").strip()
+        raise FileNotFoundError(f"Cannot read {spec} from git: {message}")
+    return result.stdout.decode("utf-8")
+
+
+def diff_hunks(old: list[str], new: list[str]) -> list[Hunk]:
+    prefix = 0
+    limit = min(len(old), len(new))
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old[-1 - suffix] == new[-1 - suffix]:
+        suffix += 1
+
+    old_mid = old[prefix:len(old) - suffix]
+    new_mid = new[prefix:len(new) - suffix]
+    hunks: list[Hunk] = []
+    matcher = difflib.SequenceMatcher(None, old_mid, new_mid)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag != "equal":
+            hunks.append(Hunk(prefix + i1 + 1, old_mid[i1:i2], prefix + j1 + 1, new_mid[j1:j2]))
+    return hunks
+
+
+def scan_lines(
+    tool: str,
+    lines: list[str],
+    start: int,
+    rules: list[tuple[str, str, re.Pattern, str]],
+) -> list[DiffFinding]:
+    findings: list[DiffFinding] = []
+    for line_num, line in enumerate(lines, start=start):
+        for code, severity, pattern, message in rules:
+            if pattern.search(line):
+                findings.append(DiffFinding(tool, code, severity, line_num, message))
+    return findings
+
+
+def changed_matches(regex: re.Pattern, hunks: list[Hunk]) -> bool:
+    return any(
+        regex.search(line.lower())
+        for hunk in hunks
+        for line in (*hunk.old_lines, *hunk.new_lines)
+    )
+
+
+def audit_old_version(content: str, new_report: AuditReport, hunks: list[Hunk], rechecked: list[str]) -> AuditReport:
+    lowered = content.lower()
+    lines = content.split("\n")
+    report = AuditReport(file_path="<old>", total_lines=len(lines), total_chars=len(content))
+
+    for section in new_report.sections_found:
+        check = SectionCheck(name=section.name, patterns=section.patterns, present=section.present, line=section.line)
+        if changed_matches(SECTION_REGEXES[section.name], hunks):
+            rechecked.append(f"section:{section.name}")
+            match = SECTION_REGEXES[section.name].search(lowered)
+            check.present = bool(match)
+            check.line = lowered.count("\n", 0, match.start()) + 1 if match else None
+        report.sections_found.append(check)
+
+    affected = {name: regex for name, regex in ANTI_PATTERN_REGEXES.items() if changed_matches(regex, hunks)}
+    rechecked.extend(f"anti_pattern:{name}" for name in affected)
+    report.findings.extend(detect_anti_patterns(content, report.sections_found, affected))
+    unaffected = {
+        message for name, pattern, message in ANTI_PATTERNS
+        if name in ANTI_PATTERN_REGEXES and name not in affected
+    }
+    report.findings.extend(
+        finding for finding in new_report.findings
+        if finding.category == "anti_pattern" and finding.message in unaffected
+    )
+    report.findings.extend(analyze_tool_specs(content))
+    report.findings.extend(check_prompt_hygiene(content))
+    report.score, report.rating = calculate_score(report.sections_found, report.findings)
+    return report
+
+
+def finding_key(finding: DiffFinding) -> tuple[str, str, str]:
+    return finding.tool, finding.code, finding.message
+
+
+def compare_findings(old: list[DiffFinding], new: list[DiffFinding]) -> tuple[list[DiffFinding], list[DiffFinding]]:
+    remaining = Counter(finding_key(finding) for finding in old)
+    added: list[DiffFinding] = []
+    for finding in new:
+        key = finding_key(finding)
+        if remaining[key]:
+            remaining[key] -= 1
+        else:
+            added.append(finding)
+
+    remaining = Counter(finding_key(finding) for finding in new)
+    resolved: list[DiffFinding] = []
+    for finding in old:
+        key = finding_key(finding)
+        if remaining[key]:
+            remaining[key] -= 1
+        else:
+            resolved.append(finding)
+    return added, resolved
+
+
+def audit_findings(report: AuditReport) -> list[DiffFinding]:
+    return [
+        DiffFinding("validate_prompt", finding.category, finding.severity.value, finding.line, finding.message)
+        for finding in report.findings
+    ]
+
+
+def unchanged_ranges(total: int, hunks: list[Hunk], side: str) -> list[tuple[int, int]]:
+    ranges: list[tuple[int, int]] = []
+    cursor = 1
+    for hunk in hunks:
+        start = hunk.old_start if side == "old" else hunk.new_start
+        length = len(hunk.old_lines) if side == "old" else len(hunk.new_lines)
+        if start > cursor:
+            ranges.append((cursor, start - 1))
+        cursor = start + length
+    if cursor <= total:
+        ranges.append((cursor, total))
+    return ranges
+
+
+def diff_prompts(old_content: str, new_content: str, old_label: str = "old", new_label: str = "new") -> PromptDiff:
+    started = time.perf_counter()
+    old_content = decode_content(old_content)
+    new_content = decode_content(new_content)
+    old_lines = old_content.split("\n")
+    new_lines = new_content.split("\n")
+
+    diff = PromptDiff(old_label, new_label, len(old_lines), len(new_lines))
+    diff.hunks = diff_hunks(old_lines, new_lines)
+
+    new_audit = audit_content(new_content, new_label)
+    old_audit = audit_old_version(old_content, new_audit, diff.hunks, diff.rechecked) if diff.hunks else new_audit
+    diff.old_score, diff.old_rating = old_audit.score, old_audit.rating
+    diff.new_score, diff.new_rating = new_audit.score, new_audit.rating
+    old_findings = audit_findings(old_audit)
+    new_findings = audit_findings(new_audit)
+
+    for side, content, findings in (("old", old_content, old_findings), ("new", new_content, new_findings)):
+        findings.extend(
+            DiffFinding("lint_prompt", result.code, result.severity, result.line, result.message)
+            for result in lint_content(content, line_rules=[])
+        )
+        for hunk in diff.hunks:
+            start, lines = (hunk.old_start, hunk.old_lines) if side == "old" else (hunk.new_start, hunk.new_lines)
+            findings.extend(scan_lines("lint_prompt", lines, start, LINT_LINE_RULES))
+
+    finops = load_finops()
+    if finops is None:
+        diff.old_tokens = len(old_content) // 4
+        diff.new_tokens = len(new_content) // 4
+    else:
+        old_report = finops.validate_content(old_content, old_label, line_rules=[])
+        new_report = finops.validate_content(new_content, new_label, line_rules=[])
+        diff.old_tokens = finops.estimate_tokens(old_content)
+        diff.new_tokens = finops.estimate_tokens(new_content)
+
+        shared_warnings = 0
+        warning_rules = [rule for rule in finops.LINE_RULES if rule[1] == "WARNING"]
+        for first, last in unchanged_ranges(len(new_lines), diff.hunks, "new"):
+            region = new_lines[first - 1:last]
+            text = "\n".join(region)
+            rules = [rule for rule in warning_rules if rule[2].search(text)]
+            shared_warnings += len(scan_lines("estimate_cost", region, first, rules)) if rules else 0
+
+        for side, report, findings in (("old", old_report, old_findings), ("new", new_report, new_findings)):
+            findings.extend(
+                DiffFinding("estimate_cost", issue.code, issue.severity, issue.line, issue.message)
+                for issue in report.issues
+            )
+            hunk_issues: list[DiffFinding] = []
+            for hunk in diff.hunks:
+                start, lines = (hunk.old_start, hunk.old_lines) if side == "old" else (hunk.new_start, hunk.new_lines)
+                hunk_issues.extend(scan_lines("estimate_cost", lines, start, finops.LINE_RULES))
+            findings.extend(hunk_issues)
+            warnings = shared_warnings + sum(1 for finding in hunk_issues if finding.severity == "WARNING")
+            score = max(0, min(10, report.score - warnings))
+            if side == "old":
+                diff.old_finops_score = score
+            else:
+                diff.new_finops_score = score
+
+        models = list(dict.fromkeys([*old_report.models_detected, *new_report.models_detected])) or finops.DEFAULT_MODELS
+        diff.costs = [
+            ModelDelta(
+                model,
+                finops.estimate_call(model, diff.old_tokens).cost_per_call,
+                finops.estimate_call(model, diff.new_tokens).cost_per_call,
+            )
+            for model in models
+        ]
+
+    diff.new_findings, diff.resolved_findings = compare_findings(old_findings, new_findings)
+    diff.elapsed_s = time.perf_counter() - started
+    return diff
+
+
+def signed(value: float, fmt: str = ",") -> str:
+    return f"{value:+{fmt}}"
+
+
+def format_diff(diff: PromptDiff) -> str:
+    lines = [f"\n🔀 Prompt diff: {diff.old_label} → {diff.new_label}"]
+    lines.append(
+        f"   {len(diff.hunks)} hunks, {diff.changed_lines} changed lines "
+        f"({diff.old_lines:,} → {diff.new_lines:,} lines)"
+    )
+    lines.append(f"   Tokens: {diff.old_tokens:,} → {diff.new_tokens:,} ({signed(diff.new_tokens - diff.old_tokens)})")
+    lines.append(
+        f"   Prompt score: {diff.old_score}/10 {diff.old_rating} → {diff.new_score}/10 {diff.new_rating} "
+        f"({signed(diff.new_score - diff.old_score)})"
+    )
+    if diff.old_finops_score is not None and diff.new_finops_score is not None:
+        lines.append(
+            f"   FinOps score: {diff.old_finops_score}/10 → {diff.new_finops_score}/10 "
+            f"({signed(diff.new_finops_score - diff.old_finops_score)})"
+        )
+
+    if diff.costs:
+        lines.append(f"\n   {'Model':<22} {'Old $/call':>11} {'New $/call':>11} {'Delta':>11} {'Δ per 10K':>10}")
+        for cost in diff.costs:
+            lines.append(
+                f"   {cost.model:<22} ${cost.old_cost:>10.5f} ${cost.new_cost:>10.5f} "
+                f"{signed(cost.delta, ',.5f'):>11} {signed(cost.delta * 10_000, ',.2f'):>10}"
+            )
+
+    icons = {"ERROR": "❌", "WARNING": "⚠️ ", "INFO": "ℹ️ "}
+    lines.append(f"\n   New findings ({len(diff.new_findings)}):")
+    for finding in diff.new_findings:
+        loc = f":{finding.line}" if finding.line else ""
+        lines.append(f"     {icons[finding.severity]} {finding.tool} {finding.code}{loc} {finding.message}")
+    lines.append(f"   Resolved findings ({len(diff.resolved_findings)}):")
+    for finding in diff.resolved_findings:
+        loc = f":{finding.line}" if finding.line else ""
+        lines.append(f"     ✅ {finding.tool} {finding.code}{loc} {finding.message}")
+
+    rechecked = f", re-checked on old version: {', '.join(diff.rechecked)}" if diff.rechecked else ""
+    lines.append(f"\n   Evaluated in {diff.elapsed_s * 1000:.1f}ms{rechecked}")
+    return "\n".join(lines)
+
+
+def diff_to_dict(diff: PromptDiff) -> dict:
+    return {
+        "old": diff.old_label,
+        "new": diff.new_label,
+        "hunks": [
+            {"old_start": h.old_start, "old_count": len(h.old_lines), "new_start": h.new_start, "new_count": len(h.new_lines)}
+            for h in diff.hunks
+        ],
+        "tokens": {"old": diff.old_tokens, "new": diff.new_tokens, "delta": diff.new_tokens - diff.old_tokens},
+        "score": {"old": diff.old_score, "new": diff.new_score, "delta": diff.new_score - diff.old_score},
+        "finops_score": (
+            {"old": diff.old_finops_score, "new": diff.new_finops_score,
+             "delta": diff.new_finops_score - diff.old_finops_score}
+            if diff.old_finops_score is not None and diff.new_finops_score is not None else None
+        ),
+        "cost_per_call": [
+            {"model": c.model, "old": round(c.old_cost, 6), "new": round(c.new_cost, 6), "delta": round(c.delta, 6)}
+            for c in diff.costs
+        ],
+        "new_findings": [vars(finding) for finding in diff.new_findings],
+        "resolved_findings": [vars(finding) for finding in diff.resolved_findings],
+        "rechecked": diff.rechecked,
+        "elapsed_ms": round(diff.elapsed_s * 1000, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Diff two prompt versions, re-evaluating only changed hunks and the document checks they affect",
+    )
+    parser.add_argument("old", help="Old version: a file, or REV:path read with git show (e.g. HEAD:./prompt.md)")
+    parser.add_argument("new", help="New version: a file, or REV:path")
+    parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format (default: text)")
+    parser.add_argument("--strict", action="store_true", help="Exit with code 1 if the change adds errors or warnings or lowers the score")
+
+    args = parser.parse_args()
+
+    try:
+        old_content = read_version(args.old)
+        new_content = read_version(args.new)
+    except (FileNotFoundError, UnicodeDecodeError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    diff = diff_prompts(old_content, new_content, args.old, args.new)
+    if args.format == "json":
+        print(json.dumps(diff_to_dict(diff), indent=2))
+    else:
+        print(format_diff(diff))
+
+    if args.strict:
+        regressed = diff.new_score < diff.old_score or any(f.severity in ("ERROR", "WARNING") for f in diff.new_findings)
+        sys.exit(1 if regressed else 0)
+
+
+if __name__ == "__main__":
+    main()
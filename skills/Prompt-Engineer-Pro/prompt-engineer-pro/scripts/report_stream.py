@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+import json
+import sys
+from typing import TextIO
+
+SARIF_VERSION = "2.1.0"
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_LEVELS = {"ERROR": "error", "WARNING": "warning", "INFO": "note"}
+
+
+class NdjsonWriter:
+    def __init__(self, stream: TextIO | None = None) -> None:
+        self.stream = stream or sys.stdout
+        self.records = 0
+
+    def write(self, record: dict) -> None:
+        self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.records += 1
+
+    def add_result(self, rule_id: str, severity: str, message: str, uri: str, line: int | None = None) -> None:
+        self.write({"file": uri, "code": rule_id, "severity": severity, "line": line, "message": message})
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "NdjsonWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class SarifWriter:
+    def __init__(self, stream: TextIO | None = None) -> None:
+        self.stream = stream or sys.stdout
+        self.runs = 0
+        self.results = 0
+        self.in_run = False
+        self.rule_index: dict[str, int] = {}
+        self.stream.write(f'{{"version": "{SARIF_VERSION}", "$schema": "{SARIF_SCHEMA}", "runs": [')
+
+    def begin_run(self, tool: str, rules: list[tuple[str, str]], information_uri: str | None = None) -> None:
+        if self.in_run:
+            self.end_run()
+        driver: dict = {"name": tool}
+        if information_uri:
+            driver["informationUri"] = information_uri
+        driver["rules"] = [{"id": rule_id, "shortDescription": {"text": text}} for rule_id, text in rules]
+        self.rule_index = {rule_id: index for index, (rule_id, _) in enumerate(rules)}
+        separator = ",\n" if self.runs else "\n"
+        self.stream.write(f'{separator}{{"tool": {json.dumps({"driver": driver}, ensure_ascii=False)}, "results": [')
+        self.in_run = True
+        self.results = 0
+
+    def add_result(self, rule_id: str, severity: str, message: str, uri: str, line: int | None = None) -> None:
+        location: dict = {"artifactLocation": {"uri": uri}}
+        if line:
+            location["region"] = {"startLine": line}
+        result: dict = {
+            "ruleId": rule_id,
+            "level": SARIF_LEVELS.get(severity, "none"),
+            "message": {"text": message},
+            "locations": [{"physicalLocation": location}],
+        }
+        if rule_id in self.rule_index:
+            result["ruleIndex"] = self.rule_index[rule_id]
+        separator = ",\n" if self.results else "\n"
+        self.stream.write(separator + json.dumps(result, ensure_ascii=False))
+        self.results += 1
+
+    def end_run(self) -> None:
+        self.stream.write("\n]}")
+        self.in_run = False
+        self.runs += 1
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+    def close(self) -> None:
+        if self.in_run:
+            self.end_run()
+        self.stream.write("\n]}\n")
+        self.flush()
+
+    def __enter__(self) -> "SarifWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
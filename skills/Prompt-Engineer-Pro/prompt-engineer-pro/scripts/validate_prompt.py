@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
 
-import argparse
-import json
 import re
 import sys
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from report_stream import SarifWriter
 
 
 class Severity(Enum):
@@ -42,6 +46,11 @@ class AuditReport:
     score: int = 0
     max_score: int = 10
     rating: str = "Not Rated"
+    skipped_checks: list[str] = field(default_factory=list)
+
+    @property
+    def partial(self) -> bool:
+        return bool(self.skipped_checks)
 
 
 SECTION_DEFINITIONS: dict[str, list[str]] = {
@@ -140,6 +149,29 @@ ANTI_PATTERNS: list[tuple[str, str, str]] = [
     ),
 ]
 
+def single_line(pattern: str) -> str:
+    return pattern.replace(r"\s", r"[^\S\n]")
+
+
+def fold_case(pattern: str) -> str:
+    return re.sub(
+        r"\\.|[^\\]+",
+        lambda m: m.group(0) if m.group(0).startswith("\\") else m.group(0).lower(),
+        pattern,
+    )
+
+
+SECTION_REGEXES: dict[str, re.Pattern] = {
+    name: re.compile("|".join(f"(?:{fold_case(single_line(p))})" for p in patterns))
+    for name, patterns in SECTION_DEFINITIONS.items()
+}
+
+ANTI_PATTERN_REGEXES: dict[str, re.Pattern] = {
+    name: re.compile(fold_case(single_line(pattern)))
+    for name, pattern, _ in ANTI_PATTERNS
+    if pattern is not None
+}
+
 TOOL_SPEC_PATTERNS: list[tuple[str, str]] = [
     ("typed_parameters", r"type:\s*(string|number|boolean|integer|object|array)"),
     ("required_fields", r"required:\s*(true|false|\[)"),
@@ -149,6 +181,24 @@ TOOL_SPEC_PATTERNS: list[tuple[str, str]] = [
     ("descriptions", r"description:\s*[\"']"),
 ]
 
+TOOL_SPEC_REGEXES: dict[str, re.Pattern] = {
+    name: re.compile(fold_case(pattern)) for name, pattern in TOOL_SPEC_PATTERNS
+}
+
+HAS_TOOLS = re.compile(r"<tool|## tools|function\s*\(|parameters?:")
+
+RULE_PHRASE = re.compile(r"(?:always|never|must|do not|don't)\s+.{10,60}")
+
+
+Content = str | bytes | memoryview
+
+
+def decode_content(content: Content) -> str:
+    text = content if isinstance(content, str) else str(content, "utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
 
 def read_prompt_file(file_path: Path) -> str:
     return file_path.read_text(encoding="utf-8")
@@ -166,33 +216,37 @@ def count_structural_elements(content: str) -> dict[str, int]:
 
 
 def check_sections(content: str) -> list[SectionCheck]:
-    lines = content.lower().split("\n")
+    lowered = content.lower()
     results: list[SectionCheck] = []
 
     for section_name, patterns in SECTION_DEFINITIONS.items():
         check = SectionCheck(name=section_name, patterns=patterns)
-        for line_num, line in enumerate(lines, start=1):
-            for pattern in patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    check.present = True
-                    check.line = line_num
-                    break
-            if check.present:
-                break
+        match = SECTION_REGEXES[section_name].search(lowered)
+        if match:
+            check.present = True
+            check.line = lowered.count("\n", 0, match.start()) + 1
         results.append(check)
 
     return results
 
 
-def detect_anti_patterns(content: str) -> list[Finding]:
+def detect_anti_patterns(
+    content: str,
+    sections: list[SectionCheck] | None = None,
+    regexes: dict[str, re.Pattern] = ANTI_PATTERN_REGEXES,
+    names: set[str] | None = None,
+) -> list[Finding]:
     findings: list[Finding] = []
-    lines = content.split("\n")
-    structural = count_structural_elements(content)
+    lowered = content.lower()
 
     for ap_name, pattern, message in ANTI_PATTERNS:
+        if names is not None and ap_name not in names:
+            continue
+
         if ap_name == "wall_of_text":
+            structural = count_structural_elements(content)
             if structural["xml_tags"] == 0 and structural["headers"] <= 2:
-                if len(lines) > 50:
+                if content.count("\n") + 1 > 50:
                     findings.append(Finding(
                         severity=Severity.ERROR,
                         category="anti_pattern",
@@ -202,11 +256,7 @@ def detect_anti_patterns(content: str) -> list[Finding]:
             continue
 
         if ap_name == "redundant_rules":
-            rule_phrases = re.findall(
-                r"(?:always|never|must|do not|don't)\s+.{10,60}",
-                content, re.IGNORECASE,
-            )
-            normalized = [re.sub(r"\s+", " ", p.lower().strip()) for p in rule_phrases]
+            normalized = [re.sub(r"\s+", " ", p.strip()) for p in RULE_PHRASE.findall(lowered)]
             from collections import Counter
             counts = Counter(normalized)
             repeated = {phrase: count for phrase, count in counts.items() if count >= 3}
@@ -219,7 +269,7 @@ def detect_anti_patterns(content: str) -> list[Finding]:
             continue
 
         if ap_name == "silent_failure":
-            sections = check_sections(content)
+            sections = sections if sections is not None else check_sections(content)
             error_section = next(
                 (s for s in sections if s.name == "error_handling"), None,
             )
@@ -232,27 +282,25 @@ def detect_anti_patterns(content: str) -> list[Finding]:
                 ))
             continue
 
-        if pattern is None:
+        if pattern is None or ap_name not in regexes:
             continue
 
-        for line_num, line in enumerate(lines, start=1):
-            if re.search(pattern, line, re.IGNORECASE):
-                findings.append(Finding(
-                    severity=Severity.WARNING,
-                    category="anti_pattern",
-                    message=message,
-                    line=line_num,
-                ))
-                break
+        match = regexes[ap_name].search(lowered)
+        if match:
+            findings.append(Finding(
+                severity=Severity.WARNING,
+                category="anti_pattern",
+                message=message,
+                line=lowered.count("\n", 0, match.start()) + 1,
+            ))
 
     return findings
 
 
 def analyze_tool_specs(content: str) -> list[Finding]:
     findings: list[Finding] = []
-    has_tools = bool(re.search(
-        r"<tool|## tools|function\s*\(|parameters?:", content, re.IGNORECASE,
-    ))
+    lowered = content.lower()
+    has_tools = bool(HAS_TOOLS.search(lowered))
 
     if not has_tools:
         findings.append(Finding(
@@ -262,9 +310,8 @@ def analyze_tool_specs(content: str) -> list[Finding]:
         ))
         return findings
 
-    for check_name, pattern in TOOL_SPEC_PATTERNS:
-        matches = re.findall(pattern, content, re.IGNORECASE)
-        if not matches:
+    for check_name, _ in TOOL_SPEC_PATTERNS:
+        if not TOOL_SPEC_REGEXES[check_name].search(lowered):
             severity = Severity.WARNING if check_name in (
                 "typed_parameters", "descriptions",
             ) else Severity.INFO
@@ -289,7 +336,7 @@ def check_prompt_hygiene(content: str) -> list[Finding]:
             severity=Severity.WARNING,
             category="hygiene",
             message=f"Prompt is {total_lines} lines. Consider splitting into base + skills.",
-            suggestion="Use Skill Injection pattern (01-skill-injection.md) to modularize.",
+            suggestion="Use Skill Injection pattern (01-skill-injection.md) to modularize; size the load sets with analyze_skill_loads.py.",
         ))
 
     if total_chars > 100000:
@@ -350,20 +397,85 @@ def calculate_score(
     return score, rating
 
 
-def run_audit(file_path: Path) -> AuditReport:
-    content = read_prompt_file(file_path)
+def load_scheduler() -> ModuleType:
+    parents = Path(__file__).resolve().parents
+    tools = str(parents[4] / "tools") if len(parents) > 4 else ""
+    if tools and Path(tools, "check_scheduler.py").is_file() and tools not in sys.path:
+        sys.path.append(tools)
+    try:
+        import check_scheduler
+    except ImportError:
+        raise ValueError("--time-budget needs check_scheduler.py, which is not installed next to this script") from None
+    return check_scheduler
+
+
+def build_checks(
+    content: str,
+    report: AuditReport,
+    anti_patterns: dict[str, re.Pattern],
+    split_rules: bool = False,
+) -> list[tuple]:
+    def sections() -> None:
+        report.sections_found = check_sections(content)
+
+    def detect(names: set[str] | None) -> Callable[[], None]:
+        def run() -> None:
+            report.findings.extend(detect_anti_patterns(content, report.sections_found or None, anti_patterns, names))
+        return run
+
+    def tool_specs() -> None:
+        report.findings.extend(analyze_tool_specs(content))
+
+    def hygiene() -> None:
+        report.findings.extend(check_prompt_hygiene(content))
+
+    checks = [("sections", "WARNING", 0, sections, False)]
+    if split_rules:
+        checks.extend(
+            (name, "ERROR" if name == "wall_of_text" else "WARNING", 1, detect({name}), False)
+            for name, pattern, _ in ANTI_PATTERNS
+            if pattern is None or name in anti_patterns
+        )
+    else:
+        checks.append(("anti_patterns", "ERROR", 1, detect(None), False))
+    checks.append(("tool_specs", "WARNING", 2, tool_specs, False))
+    checks.append(("hygiene", "WARNING", 3, hygiene, False))
+    return checks
+
+
+def run_audit(file_path: Path, time_budget_ms: float | None = None) -> AuditReport:
+    return audit_content(read_prompt_file(file_path), str(file_path), time_budget_ms=time_budget_ms)
+
+
+def audit_content(
+    content: Content,
+    file_path: str = "<inline>",
+    anti_patterns: dict[str, re.Pattern] = ANTI_PATTERN_REGEXES,
+    time_budget_ms: float | None = None,
+) -> AuditReport:
+    content = decode_content(content)
     lines = content.split("\n")
 
     report = AuditReport(
-        file_path=str(file_path),
+        file_path=file_path,
         total_lines=len(lines),
         total_chars=len(content),
     )
 
-    report.sections_found = check_sections(content)
-    report.findings.extend(detect_anti_patterns(content))
-    report.findings.extend(analyze_tool_specs(content))
-    report.findings.extend(check_prompt_hygiene(content))
+    if time_budget_ms is None:
+        for _, _, _, run, _ in sorted(build_checks(content, report, anti_patterns), key=lambda check: check[2]):
+            run()
+    else:
+        report.skipped_checks = load_scheduler().run_checks(
+            "validate_prompt",
+            build_checks(content, report, anti_patterns, split_rules=True),
+            report.findings,
+            content,
+            time_budget_ms,
+            lambda sample: build_checks(
+                sample, AuditReport(file_path=file_path, total_lines=0, total_chars=len(sample)), anti_patterns, split_rules=True,
+            ),
+        )
     report.score, report.rating = calculate_score(
         report.sections_found, report.findings,
     )
@@ -371,6 +483,11 @@ def run_audit(file_path: Path) -> AuditReport:
     return report
 
 
+def audit_batch(items: Iterable[tuple[str, Content]]) -> Iterator[AuditReport]:
+    for item_id, content in items:
+        yield audit_content(content, item_id)
+
+
 def format_text_report(report: AuditReport) -> str:
     lines: list[str] = []
     lines.append(f"{'=' * 60}")
@@ -378,7 +495,12 @@ def format_text_report(report: AuditReport) -> str:
     lines.append(f"{'=' * 60}")
     lines.append(f"  File:  {report.file_path}")
     lines.append(f"  Lines: {report.total_lines}  |  Chars: {report.total_chars:,}")
-    lines.append(f"  Score: {report.score}/{report.max_score} ({report.rating})")
+    if report.partial:
+        lines.append("  Score: not scored (partial run)")
+    else:
+        lines.append(f"  Score: {report.score}/{report.max_score} ({report.rating})")
+    if report.partial:
+        lines.append(f"  Partial: time budget reached, skipped {', '.join(report.skipped_checks)}")
     lines.append(f"{'=' * 60}")
 
     lines.append(f"\n  SECTION COVERAGE")
@@ -410,14 +532,14 @@ def format_text_report(report: AuditReport) -> str:
     return "\n".join(lines)
 
 
-def format_json_report(report: AuditReport) -> str:
-    return json.dumps({
+def report_to_dict(report: AuditReport) -> dict:
+    data = {
         "file": report.file_path,
         "lines": report.total_lines,
         "chars": report.total_chars,
-        "score": report.score,
+        "score": None if report.partial else report.score,
         "max_score": report.max_score,
-        "rating": report.rating,
+        "rating": None if report.partial else report.rating,
         "sections": [
             {"name": s.name, "present": s.present, "line": s.line}
             for s in report.sections_found
@@ -432,47 +554,107 @@ def format_json_report(report: AuditReport) -> str:
             }
             for f in report.findings
         ],
-    }, indent=2)
+    }
+    if report.partial:
+        data["skipped_checks"] = report.skipped_checks
+    return data
+
+
+FINDING_CATEGORIES: list[tuple[str, str]] = [
+    ("anti_pattern", "Prompt anti-pattern"),
+    ("tools", "Incomplete tool specification"),
+    ("hygiene", "Prompt size and whitespace hygiene"),
+]
+
+
+def emit_sarif_results(writer: "SarifWriter", report: AuditReport) -> None:
+    uri = Path(report.file_path).as_posix()
+    for finding in report.findings:
+        writer.add_result(finding.category, finding.severity.value, finding.message, uri, finding.line)
+
+
+def format_json_report(report: AuditReport) -> str:
+    import json
+
+    return json.dumps(report_to_dict(report), indent=2)
 
 
 def main() -> None:
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Validate and audit AI agent system prompts",
     )
     parser.add_argument(
-        "prompt_file",
+        "prompt_files",
         type=Path,
-        help="Path to the system prompt file to audit",
+        nargs="+",
+        metavar="prompt_file",
+        help="Path(s) to the system prompt file(s) to audit",
     )
     parser.add_argument(
         "--format",
-        choices=["text", "json"],
+        choices=["text", "json", "ndjson", "sarif"],
         default="text",
-        help="Output format (default: text)",
+        help="Output format; ndjson (one report per line) and sarif stream as files are audited (default: text)",
     )
     parser.add_argument(
         "--strict",
         action="store_true",
         help="Exit with code 1 if any errors found",
     )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        metavar="MS",
+        help="Run the most valuable checks first and stop after MS milliseconds per file; skipped checks are listed",
+    )
 
     args = parser.parse_args()
+    if args.time_budget is not None:
+        try:
+            load_scheduler()
+        except ValueError as exc:
+            parser.error(str(exc))
+
+    if args.format == "json" and len(args.prompt_files) > 1:
+        parser.error("--format json takes one file; use --format ndjson for several")
+
+    writer = None
+    if args.format == "ndjson":
+        from report_stream import NdjsonWriter
+        writer = NdjsonWriter()
+    elif args.format == "sarif":
+        from report_stream import SarifWriter
+        writer = SarifWriter()
+        writer.begin_run("validate_prompt", FINDING_CATEGORIES)
+
+    exit_code = 0
+    for prompt_file in args.prompt_files:
+        if not prompt_file.exists():
+            print(f"Error: File not found: {prompt_file}", file=sys.stderr)
+            exit_code = 1
+            continue
 
-    if not args.prompt_file.exists():
-        print(f"Error: File not found: {args.prompt_file}", file=sys.stderr)
-        sys.exit(1)
-
-    report = run_audit(args.prompt_file)
-
-    if args.format == "json":
-        print(format_json_report(report))
-    else:
-        print(format_text_report(report))
-
-    if args.strict:
-        error_count = sum(1 for f in report.findings if f.severity == Severity.ERROR)
-        if error_count > 0:
-            sys.exit(1)
+        report = run_audit(prompt_file, args.time_budget)
+
+        if args.format == "ndjson":
+            writer.write(report_to_dict(report))
+            writer.flush()
+        elif args.format == "sarif":
+            emit_sarif_results(writer, report)
+            writer.flush()
+        elif args.format == "json":
+            print(format_json_report(report))
+        else:
+            print(format_text_report(report))
+
+        if args.strict and (report.partial or any(f.severity == Severity.ERROR for f in report.findings)):
+            exit_code = 1
+
+    if writer is not None:
+        writer.close()
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
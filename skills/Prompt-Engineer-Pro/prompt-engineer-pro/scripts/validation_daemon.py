@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import signal
+import stat
+import sys
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from lint_prompt import lint_batch, lint_content
+from validate_prompt import audit_batch, audit_content, report_to_dict
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+MAX_BODY_BYTES = 64 * 1024 * 1024
+
+
+class RpcError(Exception):
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+@dataclass
+class DaemonStats:
+    started: float = field(default_factory=time.time)
+    requests: int = 0
+    prompts: int = 0
+    errors: int = 0
+    latencies_ms: deque = field(default_factory=lambda: deque(maxlen=10_000))
+
+    def percentile(self, pct: float) -> float:
+        if not self.latencies_ms:
+            return 0.0
+        ordered = sorted(self.latencies_ms)
+        return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def validate_items(items: list[tuple[str, str]]) -> list[dict]:
+    return [{"id": report.file_path, "report": report_to_dict(report)} for report in audit_batch(items)]
+
+
+def lint_items(items: list[tuple[str, str]]) -> list[dict]:
+    return [
+        {"id": item_id, "findings": [asdict(result) for result in results]}
+        for item_id, results in lint_batch(items)
+    ]
+
+
+METHODS = {
+    "validate_prompt": validate_items,
+    "lint_prompt": lint_items,
+}
+
+
+def is_socket(path: Path) -> bool:
+    # lstat, so a symlink at --socket is never followed and never counts as a stale socket.
+    try:
+        return stat.S_ISSOCK(path.lstat().st_mode)
+    except FileNotFoundError:
+        return False
+
+
+def warm_worker() -> None:
+    audit_content("<identity>warm-up</identity>")
+    lint_content("# warm-up")
+
+
+def parse_items(params: object) -> list[tuple[str, str]]:
+    if isinstance(params, dict) and "items" not in params:
+        params = {"items": [params]}
+    if not isinstance(params, dict) or not isinstance(params.get("items"), list):
+        raise RpcError(INVALID_PARAMS, "params must be {\"items\": [{\"id\", \"content\"}]} or {\"id\", \"content\"}")
+
+    items: list[tuple[str, str]] = []
+    for index, item in enumerate(params["items"]):
+        if not isinstance(item, dict) or not isinstance(item.get("content"), str):
+            raise RpcError(INVALID_PARAMS, f"item {index} must have string 'content'")
+        items.append((str(item.get("id", index)), item["content"]))
+    return items
+
+
+class ValidationDaemon:
+    def __init__(self, workers: int) -> None:
+        self.stats = DaemonStats()
+        self.workers = workers
+        self.pool = self.start_pool()
+        warm_worker()
+
+    def start_pool(self) -> ProcessPoolExecutor | None:
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=warm_worker) if self.workers > 0 else None
+
+    async def dispatch(self, method: str, params: object) -> object:
+        if method == "stats":
+            return {
+                "uptime_s": round(time.time() - self.stats.started, 3),
+                "requests": self.stats.requests,
+                "prompts": self.stats.prompts,
+                "errors": self.stats.errors,
+                "workers": self.workers,
+                "latency_ms": {
+                    "p50": round(self.stats.percentile(50), 3),
+                    "p99": round(self.stats.percentile(99), 3),
+                },
+            }
+        if method not in METHODS:
+            raise RpcError(METHOD_NOT_FOUND, f"Unknown method: {method}")
+
+        items = parse_items(params)
+        handler = METHODS[method]
+        started = time.perf_counter()
+
+        # Validation always leaves the event loop when there is a pool, so one large document
+        # cannot stall other clients; --workers 0 keeps everything inline.
+        if self.pool is None or not items:
+            results = handler(items)
+        else:
+            loop = asyncio.get_running_loop()
+            size = math.ceil(len(items) / self.workers)
+            chunks = [items[i:i + size] for i in range(0, len(items), size)]
+            try:
+                parts = await asyncio.gather(*(loop.run_in_executor(self.pool, handler, chunk) for chunk in chunks))
+            except BrokenProcessPool:
+                self.pool.shutdown(wait=False)
+                self.pool = self.start_pool()
+                raise
+            results = [result for part in parts for result in part]
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.stats.prompts += len(items)
+        if items:
+            self.stats.latencies_ms.append(elapsed_ms / len(items))
+        return {"results": results}
+
+    async def handle_rpc(self, body: bytes) -> dict:
+        self.stats.requests += 1
+        request_id = None
+        try:
+            try:
+                request = json.loads(body)
+            except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+                raise RpcError(PARSE_ERROR, f"Parse error: {exc}")
+            if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+                raise RpcError(INVALID_REQUEST, "Request must be a JSON-RPC 2.0 object with a method")
+            request_id = request.get("id")
+            result = await self.dispatch(request["method"], request.get("params", {}))
+            return {"jsonrpc": "2.0", "id": request_id, "result": result}
+        except RpcError as exc:
+            self.stats.errors += 1
+            return {"jsonrpc": "2.0", "id": request_id, "error": {"code": exc.code, "message": exc.message}}
+        except Exception as exc:
+            self.stats.errors += 1
+            return {
+                "jsonrpc": "2.0", "id": request_id,
+                "error": {"code": INTERNAL_ERROR, "message": f"Internal error: {type(exc).__name__}: {exc}"},
+            }
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers: dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0) or 0)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                if not request_line.startswith(b"POST") or length > MAX_BODY_BYTES:
+                    keep_alive = False
+                    status, payload = "400 Bad Request", {
+                        "jsonrpc": "2.0", "id": None,
+                        "error": {"code": INVALID_REQUEST, "message": "POST a JSON-RPC body"},
+                    }
+                else:
+                    status, payload = "200 OK", await self.handle_rpc(await reader.readexactly(length))
+
+                data = json.dumps(payload).encode()
+                writer.write(
+                    f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        except asyncio.CancelledError:
+            # Shutdown cancels idle keep-alive connections; end quietly instead of logging a traceback.
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, socket_path: Path | None, host: str, port: int) -> asyncio.AbstractServer:
+        if socket_path:
+            if is_socket(socket_path):
+                socket_path.unlink()
+            elif os.path.lexists(socket_path):
+                raise FileExistsError(f"{socket_path} exists and is not a socket; refusing to replace it")
+            return await asyncio.start_unix_server(self.handle_connection, path=str(socket_path))
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    def close(self) -> None:
+        if self.pool:
+            self.pool.shutdown()
+
+
+async def rpc_call(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, method: str, params: dict, request_id: int) -> dict:
+    body = json.dumps({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}).encode()
+    writer.write(
+        f"POST / HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    await reader.readline()
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value.strip())
+    return json.loads(await reader.readexactly(length))
+
+
+async def run_benchmark(prompt: str, requests: int, workers: int, method: str) -> list[float]:
+    daemon = ValidationDaemon(workers)
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = Path(tmp) / "validators.sock"
+        server = await daemon.start(socket_path, "", 0)
+        reader, writer = await asyncio.open_unix_connection(str(socket_path))
+        latencies: list[float] = []
+        try:
+            for request_id in range(requests):
+                started = time.perf_counter()
+                response = await rpc_call(reader, writer, method, {"id": str(request_id), "content": prompt}, request_id)
+                latencies.append((time.perf_counter() - started) * 1000)
+                if "error" in response:
+                    raise RuntimeError(response["error"]["message"])
+        finally:
+            writer.close()
+            await writer.wait_closed()
+            await asyncio.sleep(0.01)
+            server.close()
+            await server.wait_closed()
+            daemon.close()
+    return latencies
+
+
+async def serve(daemon: ValidationDaemon, socket_path: Path | None, host: str, port: int) -> None:
+    server = await daemon.start(socket_path, host, port)
+    where = socket_path or "http://{}:{}".format(*server.sockets[0].getsockname()[:2])
+    print(f"🛰️  Validation daemon listening on {where} ({daemon.workers} workers)", file=sys.stderr)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+    try:
+        async with server:
+            await stop.wait()
+    finally:
+        daemon.close()
+        if socket_path and is_socket(socket_path):
+            socket_path.unlink()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Long-lived prompt validation daemon — JSON-RPC 2.0 over HTTP on a Unix socket or localhost port",
+    )
+    parser.add_argument("--socket", type=Path, help="Unix socket path to listen on")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP host when no --socket is given (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port when no --socket is given (default: 8765)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes for batches; 0 runs inline")
+    parser.add_argument("--bench", type=Path, metavar="PROMPT", help="Benchmark round-trip latency with this prompt and exit")
+    parser.add_argument("--requests", type=int, default=1000, help="Benchmark request count (default: 1000)")
+    parser.add_argument("--method", choices=sorted(METHODS), default="validate_prompt", help="Benchmark method")
+    parser.add_argument("--budget-ms", type=float, default=5.0, help="Benchmark p99 budget; exit 1 if exceeded (default: 5)")
+
+    args = parser.parse_args()
+
+    if args.bench:
+        if not args.bench.exists():
+            print(f"Error: File not found: {args.bench}", file=sys.stderr)
+            sys.exit(1)
+        prompt = args.bench.read_text(encoding="utf-8")
+        latencies = sorted(asyncio.run(run_benchmark(prompt, args.requests, args.workers, args.method)))
+        p50 = latencies[len(latencies) // 2]
+        p99 = latencies[max(0, math.ceil(0.99 * len(latencies)) - 1)]
+        icon = "✅" if p99 <= args.budget_ms else "❌"
+        print(f"\n⚡ Daemon round-trip benchmark: {args.bench} ({args.method}, {len(latencies)} requests)")
+        print(f"   p50 {p50:.2f}ms  p99 {p99:.2f}ms  max {latencies[-1]:.2f}ms")
+        print(f"   {icon} p99 budget {args.budget_ms:.1f}ms")
+        sys.exit(0 if p99 <= args.budget_ms else 1)
+
+    try:
+        asyncio.run(serve(ValidationDaemon(args.workers), args.socket, args.host, args.port))
+    except OSError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
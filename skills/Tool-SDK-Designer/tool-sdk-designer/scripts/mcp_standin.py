@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from validate_toolspec import extract_json_tools, iter_json_tools
+
+PROTOCOL_VERSION = "2024-11-05"
+SERVER_INFO = {"name": "agent-architect-mcp-standin", "version": "1.0"}
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+
+SCHEMA_KEYS = ("inputSchema", "input_schema", "parameters", "params")
+JSON_TYPES = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+SAMPLE_VALUES = {"string": "sample", "integer": 1, "number": 1.5, "boolean": True, "array": [], "object": {}}
+
+
+class RpcError(Exception):
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+@dataclass
+class McpTool:
+    name: str
+    description: str
+    input_schema: dict
+
+    def to_mcp(self) -> dict:
+        return {"name": self.name, "description": self.description, "inputSchema": self.input_schema}
+
+
+@dataclass
+class BenchReport:
+    label: str
+    tools: int
+    concurrency: int
+    list_bytes: int = 0
+    list_rtt_ms: float = 0.0
+    encode_ms: float = 0.0
+    decode_ms: float = 0.0
+    call_latencies_ms: list[float] = field(default_factory=list)
+    call_errors: int = 0
+    wall_time: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        return len(self.call_latencies_ms) / self.wall_time if self.wall_time > 0 else 0.0
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def load_tools(content: str) -> list[McpTool]:
+    tools: list[McpTool] = []
+    for spec, item in zip(extract_json_tools(content), iter_json_tools(content)):
+        func = item.get("function", item)
+        schema = next((func[key] for key in SCHEMA_KEYS if isinstance(func.get(key), dict)), None)
+        tools.append(McpTool(
+            name=spec.name,
+            description=func.get("description", "") if spec.has_description else "",
+            input_schema=schema or {"type": "object", "properties": {}},
+        ))
+    return tools
+
+
+def synthetic_tools(count: int, properties: int, seed: int = 0) -> list[McpTool]:
+    rng = random.Random(seed)
+    kinds = list(SAMPLE_VALUES)
+    tools: list[McpTool] = []
+    for number in range(count):
+        props = {
+            f"field_{index}": {
+                "type": rng.choice(kinds),
+                "description": f"Parameter {index} of tool {number}: " + "detail " * rng.randint(2, 12),
+            }
+            for index in range(properties)
+        }
+        tools.append(McpTool(
+            name=f"tool_{number:04d}",
+            description=f"Synthetic tool {number} for transport benchmarking. " * 2,
+            input_schema={"type": "object", "properties": props, "required": list(props)[: max(1, properties // 2)]},
+        ))
+    return tools
+
+
+def check_arguments(schema: dict, arguments: dict) -> list[str]:
+    problems = [f"missing required argument: {name}" for name in schema.get("required", []) if name not in arguments]
+    properties = schema.get("properties", {})
+    for name, value in arguments.items():
+        expected = properties.get(name, {}).get("type")
+        if name not in properties:
+            if schema.get("additionalProperties") is False:
+                problems.append(f"unexpected argument: {name}")
+        elif expected in JSON_TYPES and not isinstance(value, JSON_TYPES[expected]):
+            problems.append(f"argument {name} should be {expected}")
+    return problems
+
+
+def sample_arguments(schema: dict) -> dict:
+    return {
+        name: SAMPLE_VALUES.get(prop.get("type") if isinstance(prop, dict) else None, "sample")
+        for name, prop in schema.get("properties", {}).items()
+    }
+
+
+class StandinServer:
+    def __init__(self, tools: list[McpTool], handler_ms: float = 0.0) -> None:
+        self.tools = {tool.name: tool for tool in tools}
+        self.listing = {"tools": [tool.to_mcp() for tool in tools]}
+        self.handler_ms = handler_ms
+        self.calls = 0
+
+    async def dispatch(self, method: str, params: dict) -> dict:
+        if method == "initialize":
+            return {"protocolVersion": PROTOCOL_VERSION, "capabilities": {"tools": {}}, "serverInfo": SERVER_INFO}
+        if method == "ping":
+            return {}
+        if method == "tools/list":
+            return self.listing
+        if method == "tools/call":
+            return await self.call_tool(params)
+        raise RpcError(METHOD_NOT_FOUND, f"Unknown method: {method}")
+
+    async def call_tool(self, params: dict) -> dict:
+        tool = self.tools.get(params.get("name"))
+        if tool is None:
+            raise RpcError(INVALID_PARAMS, f"Unknown tool: {params.get('name')}")
+        arguments = params.get("arguments") or {}
+        if not isinstance(arguments, dict):
+            raise RpcError(INVALID_PARAMS, "arguments must be an object")
+        self.calls += 1
+        problems = check_arguments(tool.input_schema, arguments)
+        if problems:
+            return {"content": [{"type": "text", "text": "; ".join(problems)}], "isError": True}
+        if self.handler_ms:
+            await asyncio.sleep(self.handler_ms / 1000)
+        return {"content": [{"type": "text", "text": f"{tool.name} ok ({len(arguments)} arguments)"}], "isError": False}
+
+    async def handle_line(self, line: bytes) -> dict | None:
+        request_id = None
+        try:
+            try:
+                request = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+                raise RpcError(PARSE_ERROR, f"Parse error: {exc}")
+            if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+                raise RpcError(INVALID_REQUEST, "Request must be a JSON-RPC 2.0 object with a method")
+            if "id" not in request:
+                return None
+            request_id = request["id"]
+            params = request.get("params") or {}
+            if not isinstance(params, dict):
+                raise RpcError(INVALID_PARAMS, "params must be an object")
+            return {"jsonrpc": "2.0", "id": request_id, "result": await self.dispatch(request["method"], params)}
+        except RpcError as exc:
+            return {"jsonrpc": "2.0", "id": request_id, "error": {"code": exc.code, "message": exc.message}}
+
+    async def serve_stdio(self) -> None:
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader(limit=64 * 1024 * 1024)
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+        out = sys.stdout.buffer
+        pending: set[asyncio.Task] = set()
+
+        async def respond(line: bytes) -> None:
+            response = await self.handle_line(line)
+            if response is not None:
+                out.write(json.dumps(response, separators=(",", ":")).encode() + b"\n")
+                out.flush()
+
+        while line := await reader.readline():
+            if not line.strip():
+                continue
+            task = asyncio.create_task(respond(line))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        if pending:
+            await asyncio.gather(*pending)
+
+
+class StdioClient:
+    def __init__(self, process: asyncio.subprocess.Process) -> None:
+        self.process = process
+        self.next_id = 0
+        self.waiting: dict[int, asyncio.Future] = {}
+        self.reader_task = asyncio.create_task(self.read_responses())
+
+    async def read_responses(self) -> None:
+        while line := await self.process.stdout.readline():
+            response = json.loads(line)
+            future = self.waiting.pop(response.get("id"), None)
+            if future is not None and not future.done():
+                future.set_result((response, len(line)))
+        for future in self.waiting.values():
+            if not future.done():
+                future.set_exception(ConnectionError("MCP stand-in server closed its stdout"))
+
+    async def request(self, method: str, params: dict | None = None) -> tuple[dict, int]:
+        self.next_id += 1
+        future = asyncio.get_running_loop().create_future()
+        self.waiting[self.next_id] = future
+        message = {"jsonrpc": "2.0", "id": self.next_id, "method": method, "params": params or {}}
+        self.process.stdin.write(json.dumps(message, separators=(",", ":")).encode() + b"\n")
+        await self.process.stdin.drain()
+        response, size = await future
+        if "error" in response:
+            raise RpcError(response["error"]["code"], response["error"]["message"])
+        return response["result"], size
+
+    async def notify(self, method: str) -> None:
+        self.process.stdin.write(json.dumps({"jsonrpc": "2.0", "method": method}).encode() + b"\n")
+        await self.process.stdin.drain()
+
+    async def close(self) -> None:
+        self.process.stdin.close()
+        await self.process.wait()
+        await self.reader_task
+
+
+def time_codec(payload: dict, repeats: int) -> tuple[float, float]:
+    started = time.perf_counter()
+    for _ in range(repeats):
+        encoded = json.dumps(payload, separators=(",", ":"))
+    encode_ms = (time.perf_counter() - started) * 1000 / repeats
+    started = time.perf_counter()
+    for _ in range(repeats):
+        json.loads(encoded)
+    decode_ms = (time.perf_counter() - started) * 1000 / repeats
+    return encode_ms, decode_ms
+
+
+async def run_benchmark(
+    label: str,
+    catalog: Path,
+    tool_count: int,
+    calls: int,
+    concurrency: int,
+    handler_ms: float,
+    seed: int = 0,
+) -> BenchReport:
+    env = {**os.environ, "PYTHONPATH": str(Path(__file__).resolve().parent)}
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-c", "import mcp_standin; mcp_standin.main()",
+        "serve", str(catalog), "--handler-ms", str(handler_ms),
+        stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE, env=env, limit=64 * 1024 * 1024,
+    )
+    client = StdioClient(process)
+    report = BenchReport(label=label, tools=tool_count, concurrency=concurrency)
+    try:
+        await client.request("initialize", {
+            "protocolVersion": PROTOCOL_VERSION, "capabilities": {}, "clientInfo": {"name": "mcp-standin-bench", "version": "1.0"},
+        })
+        await client.notify("notifications/initialized")
+
+        started = time.perf_counter()
+        listing, report.list_bytes = await client.request("tools/list")
+        report.list_rtt_ms = (time.perf_counter() - started) * 1000
+        report.encode_ms, report.decode_ms = time_codec(listing, repeats=max(3, min(200, 2_000_000 // max(1, report.list_bytes))))
+
+        tools = listing["tools"]
+        if not tools:
+            return report
+        rng = random.Random(seed)
+        plan = [rng.choice(tools) for _ in range(calls)]
+        arguments = {tool["name"]: sample_arguments(tool.get("inputSchema", {})) for tool in tools}
+        queue = iter(plan)
+
+        async def worker() -> None:
+            for tool in queue:
+                call_started = time.perf_counter()
+                try:
+                    result, _ = await client.request("tools/call", {"name": tool["name"], "arguments": arguments[tool["name"]]})
+                except RpcError:
+                    report.call_errors += 1
+                    continue
+                report.call_latencies_ms.append((time.perf_counter() - call_started) * 1000)
+                if result.get("isError"):
+                    report.call_errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        report.wall_time = time.perf_counter() - started
+    finally:
+        await client.close()
+    return report
+
+
+def format_reports(reports: list[BenchReport]) -> str:
+    first = reports[0]
+    lines = [f"\n🔌 MCP stand-in benchmark (stdio JSON-RPC, concurrency {first.concurrency}, {len(first.call_latencies_ms)} calls per run)"]
+    lines.append(
+        f"\n   {'Catalog':<18} {'Tools':>6} {'tools/list':>11} {'list RTT':>9} {'encode':>8} {'decode':>8} "
+        f"{'call p50':>9} {'call p99':>9} {'calls/s':>9}"
+    )
+    for report in reports:
+        lines.append(
+            f"   {report.label[:18]:<18} {report.tools:>6} {report.list_bytes / 1024:>8.1f}KiB {report.list_rtt_ms:>7.1f}ms "
+            f"{report.encode_ms:>6.2f}ms {report.decode_ms:>6.2f}ms "
+            f"{percentile(report.call_latencies_ms, 50):>7.2f}ms {percentile(report.call_latencies_ms, 99):>7.2f}ms "
+            f"{report.throughput:>9,.0f}"
+        )
+    errors = sum(report.call_errors for report in reports)
+    if errors:
+        lines.append(f"\n   ⚠️  {errors} tool calls returned errors (arguments failed schema checks)")
+    if len(reports) > 1:
+        smallest, largest = reports[0], reports[-1]
+        if smallest.list_bytes and smallest.throughput:
+            lines.append(
+                f"\n   📈 {largest.label} vs {smallest.label}: tools/list {largest.list_bytes / smallest.list_bytes:.1f}x larger, "
+                f"call throughput {largest.throughput / smallest.throughput:.2f}x"
+            )
+    return "\n".join(lines)
+
+
+def report_to_dict(report: BenchReport) -> dict:
+    return {
+        "catalog": report.label,
+        "tools": report.tools,
+        "concurrency": report.concurrency,
+        "list_bytes": report.list_bytes,
+        "list_rtt_ms": round(report.list_rtt_ms, 3),
+        "encode_ms": round(report.encode_ms, 4),
+        "decode_ms": round(report.decode_ms, 4),
+        "calls": len(report.call_latencies_ms),
+        "call_errors": report.call_errors,
+        "call_latency_ms": {
+            "p50": round(percentile(report.call_latencies_ms, 50), 3),
+            "p95": round(percentile(report.call_latencies_ms, 95), 3),
+            "p99": round(percentile(report.call_latencies_ms, 99), 3),
+        },
+        "calls_per_s": round(report.throughput, 1),
+    }
+
+
+def read_catalog(path: Path) -> list[McpTool]:
+    if not path.exists():
+        print(f"Error: File not found: {path}", file=sys.stderr)
+        sys.exit(1)
+    tools = load_tools(path.read_text(encoding="utf-8"))
+    if not tools:
+        print(f"Error: No JSON tool definitions found in {path}", file=sys.stderr)
+        sys.exit(1)
+    return tools
+
+
+async def run_benchmarks(args: argparse.Namespace, catalogs: list[tuple[str, Path, int]]) -> list[BenchReport]:
+    return [
+        await run_benchmark(label, path, count, args.calls, args.concurrency, args.handler_ms, args.seed)
+        for label, path, count in catalogs
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Local MCP stand-in server (stdio JSON-RPC) serving parsed tool specs, with a latency benchmark",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    serve = sub.add_parser("serve", help="Serve a JSON tool catalog over stdio until stdin closes")
+    serve.add_argument("catalog", type=Path, help="JSON tool catalog (list, {\"tools\": [...]} or {\"functions\": [...]})")
+    serve.add_argument("--handler-ms", type=float, default=0.0, help="Synthetic handler latency per call (default: 0)")
+
+    bench = sub.add_parser("bench", help="Measure tools/list size, codec time, and call latency")
+    bench.add_argument("catalogs", type=Path, nargs="*", help="JSON tool catalog(s) to benchmark")
+    bench.add_argument("--synthetic", type=int, metavar="TOOLS", help="Benchmark generated catalogs with this many tools")
+    bench.add_argument("--properties", default="2,8,32", help="Comma-separated parameter counts per synthetic tool (default: 2,8,32)")
+    bench.add_argument("--calls", type=int, default=2000, help="tools/call requests per catalog (default: 2000)")
+    bench.add_argument("--concurrency", type=int, default=8, help="Calls in flight at once (default: 8)")
+    bench.add_argument("--handler-ms", type=float, default=0.0, help="Synthetic handler latency per call (default: 0)")
+    bench.add_argument("--seed", type=int, default=0, help="Random seed for call mix and synthetic catalogs (default: 0)")
+    bench.add_argument("--format", choices=["text", "json"], default="text", help="Output format (default: text)")
+
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        server = StandinServer(read_catalog(args.catalog), args.handler_ms)
+        try:
+            asyncio.run(server.serve_stdio())
+        except KeyboardInterrupt:
+            pass
+        return
+
+    if args.concurrency < 1 or args.calls < 0:
+        parser.error("--concurrency must be at least 1 and --calls non-negative")
+    if not args.catalogs and not args.synthetic:
+        parser.error("provide a catalog file or --synthetic")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        catalogs = [(path.name, path, len(read_catalog(path))) for path in args.catalogs]
+        if args.synthetic:
+            try:
+                sizes = [int(value) for value in args.properties.split(",") if value.strip()]
+            except ValueError:
+                parser.error("--properties must be comma-separated integers")
+            for size in sizes:
+                path = Path(tmp) / f"synthetic-{size}.json"
+                tools = synthetic_tools(args.synthetic, size, args.seed)
+                path.write_text(json.dumps({"tools": [tool.to_mcp() for tool in tools]}), encoding="utf-8")
+                catalogs.append((f"{args.synthetic}x{size} params", path, len(tools)))
+
+        reports = asyncio.run(run_benchmarks(args, catalogs))
+
+    if args.format == "json":
+        print(json.dumps([report_to_dict(report) for report in reports], indent=2))
+    else:
+        print(format_reports(reports))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+
+import argparse
+import heapq
+import json
+import random
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from validate_toolspec import iter_json_tools
+
+STUB_BASE_TOKENS = 12
+CANDIDATE_NEIGHBORS = 24
+NAME_SEPARATORS = re.compile(r"[_.:/-]")
+
+
+@dataclass
+class CatalogTool:
+    name: str
+    tokens: int
+    sessions: int = 0
+
+
+@dataclass
+class Shard:
+    shard_id: str
+    name: str
+    tools: list[str]
+    tokens: int
+    stub_tokens: int
+    load_probability: float
+    eager: bool = False
+
+    @property
+    def expected_tokens(self) -> float:
+        if self.eager:
+            return float(self.tokens)
+        return self.load_probability * self.tokens + self.stub_tokens
+
+
+@dataclass
+class ShardPlan:
+    tools: int
+    sessions: int
+    max_group_size: int
+    baseline_tokens: int
+    shards: list[Shard] = field(default_factory=list)
+    unknown_trace_tools: int = 0
+    merges: int = 0
+    elapsed_s: float = 0.0
+
+    @property
+    def expected_tokens(self) -> float:
+        return sum(shard.expected_tokens for shard in self.shards)
+
+    @property
+    def savings(self) -> float:
+        return self.baseline_tokens - self.expected_tokens
+
+    @property
+    def savings_ratio(self) -> float:
+        return self.savings / self.baseline_tokens if self.baseline_tokens else 0.0
+
+
+def estimate_tokens(content: str) -> int:
+    return len(content) // 4
+
+
+def load_catalog(content: str) -> list[CatalogTool]:
+    tools: dict[str, CatalogTool] = {}
+    for item in iter_json_tools(content):
+        func = item.get("function", item)
+        name = func.get("name") if isinstance(func, dict) else None
+        if not name:
+            continue
+        tools[name] = CatalogTool(name=name, tokens=max(1, estimate_tokens(json.dumps(item))))
+    return list(tools.values())
+
+
+def load_trace(lines: list[str]) -> list[list[str]]:
+    sessions: list[list[str]] = []
+    for line_num, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"trace line {line_num}: {exc}") from exc
+        names = record.get("tools") if isinstance(record, dict) else record
+        if not isinstance(names, list):
+            raise ValueError(f"trace line {line_num}: expected a list of tool names or {{\"tools\": [...]}}")
+        sessions.append([str(name) for name in names])
+    return sessions
+
+
+def name_prefix(name: str) -> str:
+    parts = NAME_SEPARATORS.split(name, maxsplit=1)
+    return parts[0] if len(parts) > 1 else ""
+
+
+def shard_label(names: list[str]) -> str:
+    if len(names) == 1:
+        return names[0]
+    prefixes = {name_prefix(name) for name in names}
+    if len(prefixes) == 1 and "" not in prefixes:
+        return prefixes.pop()
+    return f"{names[0]}+{len(names) - 1}"
+
+
+class ShardPlanner:
+    def __init__(
+        self,
+        tools: list[CatalogTool],
+        sessions: list[list[str]],
+        max_group_size: int,
+        default_usage: float,
+        eager_threshold: float,
+    ) -> None:
+        self.tools = tools
+        self.max_group_size = max_group_size
+        self.default_usage = default_usage
+        self.eager_threshold = eager_threshold
+        self.session_count = len(sessions)
+        self.unknown = 0
+
+        index = {tool.name: position for position, tool in enumerate(tools)}
+        self.bits = [0] * len(tools)
+        self.cooccur: list[dict[int, int]] = [{} for _ in tools]
+        for session_num, names in enumerate(sessions):
+            members = sorted({index[name] for name in names if name in index})
+            self.unknown += sum(1 for name in names if name not in index)
+            bit = 1 << session_num
+            for member in members:
+                self.bits[member] |= bit
+                tools[member].sessions += 1
+            if len(members) > 1:
+                for member in members:
+                    counts = self.cooccur[member]
+                    for other in members:
+                        if other != member:
+                            counts[other] = counts.get(other, 0) + 1
+
+        self.groups: dict[int, list[int]] = {position: [position] for position in range(len(tools))}
+        self.group_bits: dict[int, int] = dict(enumerate(self.bits))
+        self.group_miss: dict[int, float] = {position: 1.0 - default_usage for position in range(len(tools))}
+        self.group_tokens: dict[int, int] = {position: tool.tokens for position, tool in enumerate(tools)}
+        self.group_chars: dict[int, int] = {position: len(tool.name) for position, tool in enumerate(tools)}
+        self.group_cost: dict[int, float] = {position: self.cost(position) for position in range(len(tools))}
+        self.versions: dict[int, int] = {position: 0 for position in range(len(tools))}
+        self.neighbors: dict[int, set[int]] = {}
+        self.next_id = len(tools)
+        self.merges = 0
+
+    def probability(self, bits: int, miss: float) -> float:
+        if self.session_count:
+            return bits.bit_count() / self.session_count
+        return 1.0 - miss
+
+    def stub(self, group: int) -> int:
+        return STUB_BASE_TOKENS + self.group_chars[group] // 4
+
+    def expected(self, probability: float, tokens: int, stub: int) -> float:
+        # Eager shards are always loaded, so a merge that crosses the threshold pays full price.
+        if probability >= self.eager_threshold:
+            return float(tokens)
+        return probability * tokens + stub
+
+    def cost(self, group: int) -> float:
+        probability = self.probability(self.group_bits[group], self.group_miss[group])
+        return self.expected(probability, self.group_tokens[group], self.stub(group))
+
+    def merge_gain(self, a: int, b: int) -> float | None:
+        if len(self.groups[a]) + len(self.groups[b]) > self.max_group_size:
+            return None
+        probability = self.probability(self.group_bits[a] | self.group_bits[b], self.group_miss[a] * self.group_miss[b])
+        stub = STUB_BASE_TOKENS + (self.group_chars[a] + self.group_chars[b] + 2) // 4
+        merged = self.expected(probability, self.group_tokens[a] + self.group_tokens[b], stub)
+        return self.group_cost[a] + self.group_cost[b] - merged
+
+    def seed_neighbors(self) -> None:
+        by_prefix: dict[str, list[int]] = {}
+        for position, tool in enumerate(self.tools):
+            by_prefix.setdefault(name_prefix(tool.name), []).append(position)
+            counts = self.cooccur[position]
+            self.neighbors[position] = set(heapq.nlargest(CANDIDATE_NEIGHBORS, counts, key=counts.__getitem__))
+
+        for position, neighbors in self.neighbors.items():
+            for other in neighbors:
+                self.neighbors[other].add(position)
+
+        for prefix, members in by_prefix.items():
+            if not prefix or len(members) < 2:
+                continue
+            for left, right in zip(members, members[1:]):
+                self.neighbors[left].add(right)
+                self.neighbors[right].add(left)
+
+    def push(self, heap: list, a: int, b: int) -> None:
+        gain = self.merge_gain(a, b)
+        if gain is not None and gain > 0:
+            first, second = min(a, b), max(a, b)
+            heapq.heappush(heap, (-gain, first, second, self.versions[first], self.versions[second]))
+
+    def merge(self, a: int, b: int) -> int:
+        group = self.next_id
+        self.next_id += 1
+        self.groups[group] = self.groups.pop(a) + self.groups.pop(b)
+        self.group_bits[group] = self.group_bits.pop(a) | self.group_bits.pop(b)
+        self.group_miss[group] = self.group_miss.pop(a) * self.group_miss.pop(b)
+        self.group_tokens[group] = self.group_tokens.pop(a) + self.group_tokens.pop(b)
+        self.group_chars[group] = self.group_chars.pop(a) + self.group_chars.pop(b) + 2
+        self.group_cost.pop(a)
+        self.group_cost.pop(b)
+        self.group_cost[group] = self.cost(group)
+        self.versions[group] = 0
+        self.versions.pop(a)
+        self.versions.pop(b)
+
+        neighbors = (self.neighbors.pop(a) | self.neighbors.pop(b)) - {a, b}
+        for neighbor in neighbors:
+            self.neighbors[neighbor].discard(a)
+            self.neighbors[neighbor].discard(b)
+            self.neighbors[neighbor].add(group)
+        self.neighbors[group] = neighbors
+        self.merges += 1
+        return group
+
+    def pack_cold(self) -> None:
+        cold = sorted(
+            (group for group in self.groups if self.group_bits[group] == 0 and self.session_count),
+            key=lambda group: self.tools[self.groups[group][0]].name,
+        )
+        current: int | None = None
+        for group in cold:
+            if current is not None and len(self.groups[current]) + len(self.groups[group]) <= self.max_group_size:
+                current = self.merge(current, group)
+            else:
+                current = group
+
+    def plan(self) -> list[Shard]:
+        self.seed_neighbors()
+        heap: list = []
+        for a, neighbors in self.neighbors.items():
+            for b in neighbors:
+                if a < b:
+                    self.push(heap, a, b)
+
+        while heap:
+            _, a, b, version_a, version_b = heapq.heappop(heap)
+            if self.versions.get(a) != version_a or self.versions.get(b) != version_b:
+                continue
+            group = self.merge(a, b)
+            for neighbor in self.neighbors[group]:
+                self.push(heap, group, neighbor)
+
+        self.pack_cold()
+
+        shards: list[Shard] = []
+        for group, members in self.groups.items():
+            names = sorted(self.tools[member].name for member in members)
+            probability = self.probability(self.group_bits[group], self.group_miss[group])
+            shards.append(Shard(
+                shard_id="",
+                name=shard_label(names),
+                tools=names,
+                tokens=self.group_tokens[group],
+                stub_tokens=self.stub(group),
+                load_probability=probability,
+                eager=probability >= self.eager_threshold,
+            ))
+
+        shards.sort(key=lambda shard: (not shard.eager, -shard.load_probability, shard.name))
+        for number, shard in enumerate(shards, start=1):
+            shard.shard_id = f"shard-{number:03d}"
+        return shards
+
+
+def plan_shards(
+    tools: list[CatalogTool],
+    sessions: list[list[str]],
+    max_group_size: int = 16,
+    default_usage: float = 0.05,
+    eager_threshold: float = 0.5,
+) -> ShardPlan:
+    started = time.perf_counter()
+    planner = ShardPlanner(tools, sessions, max_group_size, default_usage, eager_threshold)
+    plan = ShardPlan(
+        tools=len(tools),
+        sessions=len(sessions),
+        max_group_size=max_group_size,
+        baseline_tokens=sum(tool.tokens for tool in tools),
+    )
+    plan.shards = planner.plan()
+    plan.unknown_trace_tools = planner.unknown
+    plan.merges = planner.merges
+    plan.elapsed_s = time.perf_counter() - started
+    return plan
+
+
+def synthetic_catalog(tool_count: int, session_count: int, seed: int) -> tuple[list[CatalogTool], list[list[str]]]:
+    rng = random.Random(seed)
+    namespaces = [f"ns{number:03d}" for number in range(max(1, tool_count // 12))]
+    tools = [
+        CatalogTool(name=f"{namespaces[position % len(namespaces)]}_tool{position}", tokens=rng.randint(60, 600))
+        for position in range(tool_count)
+    ]
+    members: dict[str, list[str]] = {}
+    for tool in tools:
+        members.setdefault(name_prefix(tool.name), []).append(tool.name)
+    popularity = [1.0 / (rank + 1) for rank in range(len(namespaces))]
+
+    sessions: list[list[str]] = []
+    for _ in range(session_count):
+        used: set[str] = set()
+        for namespace in rng.choices(namespaces, weights=popularity, k=rng.randint(1, 3)):
+            pool = members[namespace]
+            used.update(rng.sample(pool, k=min(len(pool), rng.randint(1, 4))))
+        sessions.append(sorted(used))
+    return tools, sessions
+
+
+def plan_to_dict(plan: ShardPlan) -> dict:
+    return {
+        "version": 1,
+        "max_group_size": plan.max_group_size,
+        "tools": plan.tools,
+        "sessions": plan.sessions,
+        "baseline_tokens": plan.baseline_tokens,
+        "expected_tokens": round(plan.expected_tokens, 1),
+        "expected_savings": round(plan.savings, 1),
+        "savings_ratio": round(plan.savings_ratio, 4),
+        "shards": [
+            {
+                "id": shard.shard_id,
+                "name": shard.name,
+                "eager": shard.eager,
+                "load_probability": round(shard.load_probability, 4),
+                "tokens": shard.tokens,
+                "stub_tokens": 0 if shard.eager else shard.stub_tokens,
+                "tools": shard.tools,
+            }
+            for shard in plan.shards
+        ],
+    }
+
+
+def format_plan(plan: ShardPlan, limit: int) -> str:
+    eager = [shard for shard in plan.shards if shard.eager]
+    lines = [f"\n🧩 Tool Catalog Shard Plan ({plan.tools} tools, {plan.sessions} sessions, max {plan.max_group_size}/shard)"]
+    lines.append(f"   Shards: {len(plan.shards)} ({len(eager)} eager, {len(plan.shards) - len(eager)} lazy)")
+    lines.append(f"   Baseline:  {plan.baseline_tokens:>10,} schema tokens per request (full catalog)")
+    lines.append(f"   Expected:  {plan.expected_tokens:>10,.0f} schema tokens per request (eager + stubs + lazy loads)")
+    lines.append(f"   Savings:   {plan.savings:>10,.0f} tokens per request ({plan.savings_ratio:.1%})")
+    if plan.unknown_trace_tools:
+        lines.append(f"   ⚠️  {plan.unknown_trace_tools} trace entries name tools not in the catalog")
+
+    lines.append(f"\n   {'Shard':<10} {'Name':<22} {'Tools':>5} {'Tokens':>7} {'P(load)':>8} {'E[tokens]':>10}")
+    for shard in plan.shards[:limit]:
+        mode = " eager" if shard.eager else ""
+        lines.append(
+            f"   {shard.shard_id:<10} {shard.name[:22]:<22} {len(shard.tools):>5} {shard.tokens:>7,} "
+            f"{shard.load_probability:>8.1%} {shard.expected_tokens:>10.1f}{mode}"
+        )
+    if len(plan.shards) > limit:
+        lines.append(f"   … {len(plan.shards) - limit} more shards (see --output manifest)")
+    lines.append(f"\n   Planned in {plan.elapsed_s * 1000:.0f}ms ({plan.merges} merges)")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Plan lazily loaded tool shards that minimize expected per-request schema tokens",
+    )
+    parser.add_argument("catalog", type=Path, nargs="?", help="JSON tool catalog (list, {\"tools\": [...]} or {\"functions\": [...]})")
+    parser.add_argument("--trace", type=Path, help="JSONL usage trace: one session per line, a list of tool names or {\"tools\": [...]}")
+    parser.add_argument("--max-group-size", type=int, default=16, help="Maximum tools per shard (default: 16)")
+    parser.add_argument("--default-usage", type=float, default=0.05, help="Per-tool usage probability when no trace is given (default: 0.05)")
+    parser.add_argument("--eager-threshold", type=float, default=0.5, help="Always load shards used by at least this share of requests (default: 0.5)")
+    parser.add_argument("--output", type=Path, help="Write the shard manifest JSON here")
+    parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format (default: text)")
+    parser.add_argument("--show", type=int, default=20, help="Shards to list in text output (default: 20)")
+    parser.add_argument("--synthetic", type=int, metavar="TOOLS", help="Plan a generated catalog of this many tools instead of a file")
+    parser.add_argument("--sessions", type=int, default=5000, help="Sessions in the generated trace (default: 5000)")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for --synthetic (default: 7)")
+
+    args = parser.parse_args()
+
+    if args.max_group_size < 1:
+        parser.error("--max-group-size must be at least 1")
+    if not 0.0 <= args.default_usage <= 1.0:
+        parser.error("--default-usage must be between 0 and 1")
+
+    if args.synthetic:
+        tools, sessions = synthetic_catalog(args.synthetic, args.sessions, args.seed)
+    elif args.catalog:
+        if not args.catalog.exists():
+            print(f"Error: File not found: {args.catalog}", file=sys.stderr)
+            sys.exit(1)
+        tools = load_catalog(args.catalog.read_text(encoding="utf-8"))
+        if not tools:
+            print(f"Error: No JSON tool definitions found in {args.catalog}", file=sys.stderr)
+            sys.exit(1)
+        sessions = []
+        if args.trace:
+            if not args.trace.exists():
+                print(f"Error: File not found: {args.trace}", file=sys.stderr)
+                sys.exit(1)
+            try:
+                sessions = load_trace(args.trace.read_text(encoding="utf-8").splitlines())
+            except ValueError as exc:
+                print(f"Error: {exc}", file=sys.stderr)
+                sys.exit(1)
+    else:
+        parser.error("provide a catalog file or --synthetic")
+
+    plan = plan_shards(tools, sessions, args.max_group_size, args.default_usage, args.eager_threshold)
+    manifest = plan_to_dict(plan)
+
+    if args.output:
+        args.output.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+
+    if args.format == "json":
+        print(json.dumps(manifest, indent=2))
+    else:
+        print(format_plan(plan, args.show))
+        if args.output:
+            print(f"   Manifest written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,10 @@ import argparse
 import json
 import re
 import sys
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import ModuleType
 
 SPEC_FORMATS = {
     "xml": r"<(?:function|tool|command)\b[^>]*>",
@@ -58,6 +60,11 @@ class ToolSpecReport:
     tools: list[ToolSpec] = field(default_factory=list)
     quality_coverage: dict[str, bool] = field(default_factory=dict)
     issues: list[ValidationResult] = field(default_factory=list)
+    skipped_checks: list[str] = field(default_factory=list)
+
+    @property
+    def partial(self) -> bool:
+        return bool(self.skipped_checks)
 
     @property
     def score(self) -> int:
@@ -76,23 +83,27 @@ def detect_format(content: str) -> str | None:
     return None
 
 
-def extract_json_tools(content: str) -> list[ToolSpec]:
-    tools: list[ToolSpec] = []
+def iter_json_tools(content: str) -> list[dict]:
     try:
         data = json.loads(content)
         tool_list = data if isinstance(data, list) else data.get("tools", data.get("functions", []))
-        if isinstance(tool_list, list):
-            for item in tool_list:
-                if isinstance(item, dict):
-                    func = item.get("function", item)
-                    tool = ToolSpec(
-                        name=func.get("name", "unknown"),
-                        has_description=bool(func.get("description", "")),
-                        has_params="parameters" in func or "params" in func,
-                    )
-                    tools.append(tool)
-    except (json.JSONDecodeError, TypeError):
-        pass
+    except (json.JSONDecodeError, TypeError, AttributeError):
+        return []
+    if not isinstance(tool_list, list):
+        return []
+    return [item for item in tool_list if isinstance(item, dict)]
+
+
+def extract_json_tools(content: str) -> list[ToolSpec]:
+    tools: list[ToolSpec] = []
+    for item in iter_json_tools(content):
+        func = item.get("function", item)
+        tool = ToolSpec(
+            name=func.get("name", "unknown"),
+            has_description=bool(func.get("description", "")),
+            has_params="parameters" in func or "params" in func,
+        )
+        tools.append(tool)
     return tools
 
 
@@ -104,61 +115,140 @@ def count_md_tools(content: str) -> int:
     return len(re.findall(r"^##\s+\w+", content, re.MULTILINE))
 
 
-def validate_file(file_path: Path) -> ToolSpecReport:
-    content = file_path.read_text(encoding="utf-8")
-    lines = content.split("\n")
-    report = ToolSpecReport(file_path=file_path)
+LINE_RULES: list[tuple[str, str, re.Pattern, str]] = [
+    (code, severity, re.compile(pattern, re.IGNORECASE), message)
+    for code, severity, pattern, message in ANTI_PATTERNS
+]
 
-    report.format_detected = detect_format(content)
+Content = str | bytes | memoryview
 
-    if report.format_detected == "json_schema":
-        report.tools = extract_json_tools(content)
-        report.tool_count = len(report.tools)
-    elif report.format_detected == "xml":
-        report.tool_count = count_xml_tools(content)
-    elif report.format_detected == "markdown":
-        report.tool_count = count_md_tools(content)
 
-    for indicator_name, pattern in QUALITY_INDICATORS.items():
-        report.quality_coverage[indicator_name] = bool(
-            re.search(pattern, content, re.IGNORECASE | re.MULTILINE)
-        )
+def decode_content(content: Content) -> str:
+    text = content if isinstance(content, str) else str(content, "utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
 
-    if not report.quality_coverage.get("description"):
-        report.issues.append(ValidationResult(
-            code="T010", severity="WARNING", line=None,
-            message="No tool descriptions found",
-        ))
-
-    if not report.quality_coverage.get("examples"):
-        report.issues.append(ValidationResult(
-            code="T011", severity="INFO", line=None,
-            message="No usage examples found — add at least one per tool",
-        ))
-
-    if not report.quality_coverage.get("safety_flag"):
-        report.issues.append(ValidationResult(
-            code="T012", severity="INFO", line=None,
-            message="No safety flags found — consider marking destructive tools",
-        ))
-
-    for line_num, line in enumerate(lines, start=1):
-        for code, severity, pattern, message in ANTI_PATTERNS:
-            if re.search(pattern, line, re.IGNORECASE):
-                report.issues.append(ValidationResult(
-                    code=code, severity=severity, line=line_num, message=message,
-                ))
+def load_scheduler() -> ModuleType:
+    parents = Path(__file__).resolve().parents
+    tools = str(parents[4] / "tools") if len(parents) > 4 else ""
+    if tools and Path(tools, "check_scheduler.py").is_file() and tools not in sys.path:
+        sys.path.append(tools)
+    try:
+        import check_scheduler
+    except ImportError:
+        raise ValueError("--time-budget needs check_scheduler.py, which is not installed next to this script") from None
+    return check_scheduler
+
+
+def build_checks(
+    content: str,
+    report: ToolSpecReport,
+    line_rules: list[tuple[str, str, re.Pattern, str]],
+    split_rules: bool = False,
+) -> list[tuple]:
+    lines = content.split("\n")
 
+    def tool_format() -> None:
+        report.format_detected = detect_format(content)
+
+        if report.format_detected == "json_schema":
+            report.tools = extract_json_tools(content)
+            report.tool_count = len(report.tools)
+        elif report.format_detected == "xml":
+            report.tool_count = count_xml_tools(content)
+        elif report.format_detected == "markdown":
+            report.tool_count = count_md_tools(content)
+
+    def quality_indicators() -> None:
+        for indicator_name, pattern in QUALITY_INDICATORS.items():
+            report.quality_coverage[indicator_name] = bool(
+                re.search(pattern, content, re.IGNORECASE | re.MULTILINE)
+            )
+
+        if not report.quality_coverage.get("description"):
+            report.issues.append(ValidationResult(
+                code="T010", severity="WARNING", line=None,
+                message="No tool descriptions found",
+            ))
+
+        if not report.quality_coverage.get("examples"):
+            report.issues.append(ValidationResult(
+                code="T011", severity="INFO", line=None,
+                message="No usage examples found — add at least one per tool",
+            ))
+
+        if not report.quality_coverage.get("safety_flag"):
+            report.issues.append(ValidationResult(
+                code="T012", severity="INFO", line=None,
+                message="No safety flags found — consider marking destructive tools",
+            ))
+
+    def scan_lines(rules: list[tuple[str, str, re.Pattern, str]]) -> Callable[[], None]:
+        def scan() -> None:
+            for line_num, line in enumerate(lines, start=1):
+                for code, severity, pattern, message in rules:
+                    if pattern.search(line):
+                        report.issues.append(ValidationResult(
+                            code=code, severity=severity, line=line_num, message=message,
+                        ))
+        return scan
+
+    checks = [
+        ("tool_format", "INFO", 0, tool_format, False),
+        ("quality_indicators", "WARNING", 0, quality_indicators, False),
+    ]
+    if split_rules:
+        checks.extend((rule[0], rule[1], 1, scan_lines([rule]), True) for rule in line_rules)
+    elif line_rules:
+        checks.append(("line_rules", "WARNING", 1, scan_lines(line_rules), True))
+    return checks
+
+
+def validate_file(file_path: Path, time_budget_ms: float | None = None) -> ToolSpecReport:
+    return validate_content(file_path.read_text(encoding="utf-8"), file_path, time_budget_ms=time_budget_ms)
+
+
+def validate_content(
+    content: Content,
+    file_path: Path | str = "<inline>",
+    line_rules: list[tuple[str, str, re.Pattern, str]] = LINE_RULES,
+    time_budget_ms: float | None = None,
+) -> ToolSpecReport:
+    content = decode_content(content)
+    report = ToolSpecReport(file_path=Path(file_path))
+
+    if time_budget_ms is None:
+        for _, _, _, run, _ in sorted(build_checks(content, report, line_rules), key=lambda check: check[2]):
+            run()
+    else:
+        report.skipped_checks = load_scheduler().run_checks(
+            "validate_toolspec",
+            build_checks(content, report, line_rules, split_rules=True),
+            report.issues,
+            content,
+            time_budget_ms,
+            lambda sample: build_checks(sample, ToolSpecReport(file_path=Path(file_path)), line_rules, split_rules=True),
+        )
     return report
 
 
+def validate_batch(items: Iterable[tuple[str, Content]]) -> Iterator[ToolSpecReport]:
+    for item_id, content in items:
+        yield validate_content(content, item_id)
+
+
 def format_report(report: ToolSpecReport) -> str:
     lines: list[str] = [f"\n🔧 Tool Specification Validation: {report.file_path}"]
     lines.append(f"   Format:   {report.format_detected or 'Not detected'}")
     lines.append(f"   Tools:    {report.tool_count}")
     coverage = sum(1 for v in report.quality_coverage.values() if v)
     lines.append(f"   Quality:  {coverage}/{len(QUALITY_INDICATORS)} indicators present")
-    lines.append(f"   Score:    {report.score}/10")
+    score = "not scored (partial run)" if report.partial else f"{report.score}/10"
+    lines.append(f"   Score:    {score}")
+    if report.partial:
+        lines.append(f"   ⏱️  Partial: time budget reached, skipped {', '.join(report.skipped_checks)}")
 
     if report.quality_coverage:
         lines.append("\n   Quality Indicators:")
@@ -186,8 +276,17 @@ def main() -> None:
     )
     parser.add_argument("files", type=Path, nargs="+", help="Tool spec file(s)")
     parser.add_argument("--strict", action="store_true", help="Exit 1 on any warnings")
+    parser.add_argument(
+        "--time-budget", type=float, metavar="MS",
+        help="Run the most valuable checks first and stop after MS milliseconds per file; skipped checks are listed",
+    )
 
     args = parser.parse_args()
+    if args.time_budget is not None:
+        try:
+            load_scheduler()
+        except ValueError as exc:
+            parser.error(str(exc))
     exit_code = 0
 
     for file_path in args.files:
@@ -196,10 +295,10 @@ def main() -> None:
             exit_code = 1
             continue
 
-        report = validate_file(file_path)
+        report = validate_file(file_path, args.time_budget)
         print(format_report(report))
 
-        if args.strict and any(i.severity in ("ERROR", "WARNING") for i in report.issues):
+        if args.strict and (report.partial or any(i.severity in ("ERROR", "WARNING") for i in report.issues)):
             exit_code = 1
 
     sys.exit(exit_code)
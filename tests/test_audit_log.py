@@ -0,0 +1,32 @@
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "skills/Agent-Safety-Architect/agent-safety-architect/scripts"))
+
+from audit_log import AuditLog, AuditReader
+
+
+def test_concurrent_rotation_keeps_range_scans_complete(tmp_path):
+    with AuditLog(tmp_path, durability="sync", segment_bytes=4096) as log:
+        def writer(worker):
+            for n in range(300):
+                log.append({"worker": worker, "n": n, "pad": "x" * 40})
+
+        threads = [threading.Thread(target=writer, args=(worker,)) for worker in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    reader = AuditReader(tmp_path)
+    entries = list(reader.scan())
+    timestamps = [entry.timestamp_ns for entry in entries]
+    assert len(entries) == 1200
+    assert len(reader.segments) > 1
+    assert timestamps == sorted(timestamps)
+    assert reader.verify()["errors"] == []
+
+    since, until = timestamps[600], timestamps[899]
+    expected = [entry.seq for entry in entries if since <= entry.timestamp_ns <= until]
+    assert [entry.seq for entry in AuditReader(tmp_path).scan(since, until)] == expected
@@ -0,0 +1,40 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "skills/Agent-Safety-Architect/agent-safety-architect/scripts"))
+
+from permission_zones import ALLOW, APPROVAL, DENY, REFERENCE_ZONES, compile_zones
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return compile_zones(REFERENCE_ZONES, home="/home/agent", cwd="/work")
+
+
+@pytest.mark.parametrize("command", [
+    "rm -rf /", "rm -fr /", "rm -r -f /", "rm -rfv /", "rm -f -r -- /", "rm -rf /*", "rm -rf //",
+    "rm -rf ~", "rm -rf ~/", "rm -rf ~/.", "/bin/rm -rf /",
+])
+def test_destructive_rm_is_denied_however_flags_and_targets_are_spelled(matcher, command):
+    assert matcher.check_command(command).verdict == DENY
+
+
+@pytest.mark.parametrize("command", [
+    "find . -exec rm -rf / ;", r"find . -exec rm {} \;", "find . -name '*.tmp' -delete",
+    "find src -execdir ls {} +", "find . -fprint /tmp/out", "rg --pre=cat x", "rg x --pre cat",
+])
+def test_exec_capable_options_need_approval(matcher, command):
+    assert matcher.check_command(command).verdict == APPROVAL
+
+
+@pytest.mark.parametrize("command, verdict", [
+    ("find . -name '*.py'", ALLOW),
+    ("ls -l -a src/", ALLOW),
+    ("rm -rf build", APPROVAL),
+    ("python3 -Bc 'import os'", APPROVAL),
+    ("python3 -m pytest -q", ALLOW),
+])
+def test_flag_normalization_keeps_ordinary_verdicts(matcher, command, verdict):
+    assert matcher.check_command(command).verdict == verdict
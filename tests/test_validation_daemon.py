@@ -0,0 +1,43 @@
+import asyncio
+import socket
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "skills/Prompt-Engineer-Pro/prompt-engineer-pro/scripts"))
+
+from validation_daemon import ValidationDaemon, is_socket
+
+
+async def start_and_close(socket_path: Path) -> None:
+    server = await ValidationDaemon(0).start(socket_path, "", 0)
+    server.close()
+    await server.wait_closed()
+
+
+def test_start_refuses_to_replace_a_regular_file(tmp_path):
+    target = tmp_path / "notes.txt"
+    target.write_text("keep me")
+    with pytest.raises(FileExistsError):
+        asyncio.run(start_and_close(target))
+    assert target.read_text() == "keep me"
+
+
+def test_start_refuses_to_replace_a_symlink(tmp_path):
+    target = tmp_path / "notes.txt"
+    target.write_text("keep me")
+    link = tmp_path / "validators.sock"
+    link.symlink_to(target)
+    with pytest.raises(FileExistsError):
+        asyncio.run(start_and_close(link))
+    assert link.is_symlink() and target.read_text() == "keep me"
+
+
+def test_start_replaces_a_stale_socket(tmp_path):
+    socket_path = tmp_path / "validators.sock"
+    stale = socket.socket(socket.AF_UNIX)
+    stale.bind(str(socket_path))
+    stale.close()
+    asyncio.run(start_and_close(socket_path))
+    assert is_socket(socket_path)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from build_bundle import DEFAULT_OUTPUT, ROOT, build_bundle
+
+LINT_SCRIPT = ROOT / "skills" / "Prompt-Engineer-Pro" / "prompt-engineer-pro" / "scripts" / "lint_prompt.py"
+DEFAULT_SAMPLE = ROOT / "skills" / "Prompt-Engineer-Pro" / "prompt-engineer-pro" / "SKILL.md"
+
+
+def time_commands(commands: list[list[str]], runs: int) -> list[float]:
+    samples: list[list[float]] = [[] for _ in commands]
+    for command in commands:
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    for _ in range(runs):
+        for command, timings in zip(commands, samples):
+            started = time.perf_counter()
+            subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            timings.append((time.perf_counter() - started) * 1000)
+    return [statistics.median(timings) for timings in samples]
+
+
+def import_breakdown(bundle: Path, sample: Path, limit: int) -> list[tuple[float, str]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", str(bundle), "lint_prompt", str(sample)],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    rows: list[tuple[float, str]] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if not name.startswith("  "):
+            continue
+        rows.append((int(cumulative) / 1000, name.strip()))
+    return sorted(rows, reverse=True)[:limit]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark cold-start time of lint_prompt as a script and from the zipapp bundle",
+    )
+    parser.add_argument("--sample", type=Path, default=DEFAULT_SAMPLE, help="Prompt file to lint (default: Prompt Engineer Pro SKILL.md)")
+    parser.add_argument("--bundle", type=Path, default=DEFAULT_OUTPUT, help="Bundle to benchmark; rebuilt before timing")
+    parser.add_argument("--runs", type=int, default=21, help="Timed runs per command (default: 21)")
+    parser.add_argument("--budget-ms", type=float, default=50.0, help="Bundle startup budget above bare interpreter start; exit 1 if exceeded (default: 50)")
+    parser.add_argument("--breakdown", type=int, default=0, metavar="N", help="Show the N slowest top-level imports of the bundled linter")
+
+    args = parser.parse_args()
+
+    if not args.sample.exists():
+        print(f"Error: File not found: {args.sample}", file=sys.stderr)
+        sys.exit(1)
+
+    build_bundle(args.bundle)
+    python = sys.executable
+    baseline, script, bundled = time_commands([
+        [python, "-c", "pass"],
+        [python, str(LINT_SCRIPT), str(args.sample)],
+        [python, str(args.bundle), "lint_prompt", str(args.sample)],
+    ], args.runs)
+    overhead = bundled - baseline
+    within = overhead <= args.budget_ms
+
+    print(f"\n⏱️  Cold start: lint_prompt {args.sample.name} (median of {args.runs})")
+    print(f"   {'python3 -c pass':<28} {baseline:7.1f}ms")
+    print(f"   {'lint_prompt.py (script)':<28} {script:7.1f}ms  (+{script - baseline:.1f}ms)")
+    print(f"   {'agent-architect.pyz':<28} {bundled:7.1f}ms  (+{overhead:.1f}ms)")
+
+    if args.breakdown:
+        print("\n   Slowest imports (cumulative):")
+        for elapsed, name in import_breakdown(args.bundle, args.sample, args.breakdown):
+            print(f"   • {name:<24} {elapsed:6.1f}ms")
+
+    icon = "✅" if within else "❌"
+    print(f"\n   {icon} Startup overhead {overhead:.1f}ms (budget {args.budget_ms:.1f}ms)")
+    sys.exit(0 if within else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+import argparse
+import importlib.util
+import py_compile
+import re
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_OUTPUT = ROOT / "dist" / "agent-architect.pyz"
+INTERPRETER = "/usr/bin/env python3"
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+EXTRA_MODULES = (
+    "tools/rule_registry.py",
+    "tools/corpus_report.py",
+    "tools/rule_telemetry.py",
+    "tools/check_scheduler.py",
+)
+ENTRY_POINT = re.compile(r"^def main\(", re.MULTILINE)
+
+DISPATCHER = '''import sys
+
+VALIDATORS = {validators!r}
+
+
+def usage() -> str:
+    lines = ["usage: agent-architect.pyz <validator> [args ...]", "", "validators:"]
+    lines += [f"  {{name:<22}} {{skill}}" for name, skill in VALIDATORS.items()]
+    return "\\n".join(lines)
+
+
+def main() -> None:
+    if len(sys.argv) < 2 or sys.argv[1] in ("-h", "--help", "list"):
+        print(usage())
+        sys.exit(0 if len(sys.argv) >= 2 else 2)
+
+    name = sys.argv[1].removesuffix(".py")
+    if name not in VALIDATORS:
+        print(f"Error: Unknown validator: {{name}}\\n\\n{{usage()}}", file=sys.stderr)
+        sys.exit(2)
+
+    sys.argv = [f"{{sys.argv[0]}} {{name}}", *sys.argv[2:]]
+    __import__(name).main()
+
+
+main()
+'''
+
+
+def discover_scripts(root: Path) -> dict[str, Path]:
+    scripts: dict[str, Path] = {}
+    for path in [*sorted(root.glob("skills/*/*/scripts/*.py")), *(root / extra for extra in EXTRA_MODULES)]:
+        if path.stem in scripts:
+            raise ValueError(f"Duplicate module name {path.stem}: {scripts[path.stem]} and {path}")
+        scripts[path.stem] = path
+    return scripts
+
+
+def compile_module(source: Path, name: str, workdir: Path) -> bytes:
+    target = workdir / f"{name}.pyc"
+    py_compile.compile(
+        str(source),
+        cfile=str(target),
+        dfile=f"{name}.py",
+        doraise=True,
+        invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+    )
+    return target.read_bytes()
+
+
+def add_entry(archive: zipfile.ZipFile, name: str, data: bytes) -> None:
+    info = zipfile.ZipInfo(name, date_time=ZIP_EPOCH)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.external_attr = 0o644 << 16
+    archive.writestr(info, data, compresslevel=9)
+
+
+def build_bundle(output: Path, root: Path = ROOT, interpreter: str = INTERPRETER) -> dict[str, Path]:
+    scripts = discover_scripts(root)
+    validators = {
+        name: path.parent.parent.name if path.parent.name == "scripts" else path.parent.name
+        for name, path in scripts.items()
+        if ENTRY_POINT.search(path.read_text(encoding="utf-8"))
+    }
+    dispatcher = DISPATCHER.format(validators=validators)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    partial = output.with_suffix(output.suffix + ".tmp")
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        (workdir / "__main__.py").write_text(dispatcher, encoding="utf-8")
+        with partial.open("wb") as handle:
+            handle.write(f"#!{interpreter}\n".encode())
+            with zipfile.ZipFile(handle, "w") as archive:
+                add_entry(archive, "__main__.py", dispatcher.encode())
+                add_entry(archive, "__main__.pyc", compile_module(workdir / "__main__.py", "__main__", workdir))
+                for name, path in scripts.items():
+                    add_entry(archive, f"{name}.py", path.read_bytes())
+                    add_entry(archive, f"{name}.pyc", compile_module(path, name, workdir))
+    partial.chmod(0o755)
+    partial.replace(output)
+    return scripts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Bundle every skill validator into one executable zipapp with precompiled bytecode",
+    )
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help=f"Bundle path (default: {DEFAULT_OUTPUT.relative_to(ROOT)})")
+    parser.add_argument("--python", default=INTERPRETER, help=f"Shebang interpreter (default: {INTERPRETER})")
+
+    args = parser.parse_args()
+
+    try:
+        scripts = build_bundle(args.output, interpreter=args.python)
+    except (ValueError, py_compile.PyCompileError, OSError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    magic = importlib.util.MAGIC_NUMBER.hex()
+    print(f"\n📦 Built {args.output} ({args.output.stat().st_size / 1024:.1f} KiB)")
+    print(f"   {len(scripts)} modules, bytecode for Python {sys.version_info.major}.{sys.version_info.minor} (magic {magic})")
+    for name, path in scripts.items():
+        print(f"   • {name:<22} {path.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
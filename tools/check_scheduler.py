@@ -0,0 +1,66 @@
+import time
+from collections.abc import Callable, Sequence
+from typing import NamedTuple
+
+# Shared --time-budget scheduler for the skill validators. Each validator describes its analysis as
+# (name, severity, slot, run, per_line) checks; slots fix where a check's issues land in the report.
+# The repo keeps this file in tools/; the bundle and packed .skill archives ship it next to the
+# validator scripts, and a validator refuses --time-budget when it cannot import it.
+
+SEVERITY_VALUE = {"ERROR": 4.0, "WARNING": 2.0, "INFO": 1.0}
+CALIBRATION_CHARS = 4096
+# Seconds per input character, keyed by (validator, check): check names repeat across validators.
+CHECK_COSTS: dict[tuple[str, str], float] = {}
+
+
+class Check(NamedTuple):
+    name: str
+    severity: str
+    slot: int
+    run: Callable[[], None]
+    per_line: bool = False
+
+
+def run_checks(
+    validator: str,
+    checks: Sequence[tuple],
+    issues: list,
+    content: str,
+    time_budget_ms: float,
+    sample_checks: Callable[[str], Sequence[tuple]] | None = None,
+) -> list[str]:
+    started = time.perf_counter()
+    checks = [Check(*check) for check in checks]
+    costs = {check.name: CHECK_COSTS.get((validator, check.name)) for check in checks}
+    deadline = started + time_budget_ms / 1000
+    # First sight of a check: time every check on a prefix so the first budgeted run can already plan.
+    if sample_checks and None in costs.values():
+        sample = content[:CALIBRATION_CHARS]
+        for check in map(Check._make, sample_checks(sample)):
+            check_started = time.perf_counter()
+            check.run()
+            costs[check.name] = (time.perf_counter() - check_started) / max(len(sample), 1)
+    chars = len(content)
+    order = sorted(range(len(checks)), key=lambda i: (costs[checks[i].name] or 0.0) / SEVERITY_VALUE[checks[i].severity])
+
+    keyed = []
+    skipped: list[int] = []
+    for index in order:
+        check = checks[index]
+        check_started = time.perf_counter()
+        if check_started + (costs[check.name] or 0.0) * chars > deadline:
+            skipped.append(index)
+            continue
+        before = len(issues)
+        check.run()
+        costs[check.name] = (time.perf_counter() - check_started) / max(chars, 1)
+        keyed.extend(
+            ((check.slot, (issue.line or 0) if check.per_line else 0, index, position), issue)
+            for position, issue in enumerate(issues[before:])
+        )
+    CHECK_COSTS.update(((validator, name), cost) for name, cost in costs.items() if cost is not None)
+
+    # Checks run out of order under a budget; slots restore the report's usual issue order.
+    keyed.sort(key=lambda item: item[0])
+    issues[:] = [issue for _, issue in keyed]
+    return [checks[index].name for index in sorted(skipped)]
@@ -0,0 +1,553 @@
+#!/usr/bin/env python3
+
+import argparse
+import fnmatch
+import heapq
+import html
+import itertools
+import json
+import os
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from rule_registry import VALIDATOR_SKILLS, RegistryError, RuleCounter, RuleEngine, RuleRegistry, report_findings
+
+SKETCH_K = 200
+QUANTILES = (0.5, 0.9, 0.99)
+SCORE_RANGE = range(0, 11)
+TOKEN_BUCKETS = 32
+SEVERITIES = ("ERROR", "WARNING", "INFO")
+
+
+class QuantileSketch:
+    # KLL sketch: level h holds items of weight 2**h; a full level is sorted and every
+    # other item is promoted, so memory stays O(k) however many values are added.
+    # Offsets alternate per level instead of being random, which keeps reports reproducible.
+
+    def __init__(self, k: int = SKETCH_K) -> None:
+        self.k = k
+        self.levels: list[list[float]] = [[]]
+        self.offsets: list[int] = [0]
+        self.capacities = [self.capacity(0)]
+        self.max_retained = self.capacities[0]
+        self.count = 0
+        self.retained = 0
+        self.minimum = float("inf")
+        self.maximum = float("-inf")
+
+    def capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, int(self.k * (2 / 3) ** depth) + 1)
+
+    def add(self, value: float) -> None:
+        self.levels[0].append(value)
+        self.count += 1
+        self.retained += 1
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        if self.retained >= self.max_retained:
+            self.compact()
+
+    def compact(self) -> None:
+        for level, items in enumerate(self.levels):
+            if len(items) < self.capacities[level]:
+                continue
+            if level + 1 == len(self.levels):
+                self.levels.append([])
+                self.offsets.append(0)
+                self.capacities = [self.capacity(h) for h in range(len(self.levels))]
+                self.max_retained = sum(self.capacities)
+            items.sort()
+            offset = self.offsets[level]
+            self.offsets[level] ^= 1
+            kept = items[-1:] if len(items) % 2 else []
+            self.levels[level + 1].extend(items[offset:len(items) - len(kept):2])
+            self.levels[level] = kept
+            self.retained = sum(len(items) for items in self.levels)
+            return
+
+    def quantile(self, q: float) -> float | None:
+        if not self.count:
+            return None
+        weighted = sorted((value, 1 << level) for level, items in enumerate(self.levels) for value in items)
+        total = sum(weight for _, weight in weighted)
+        target = q * total
+        seen = 0
+        for value, weight in weighted:
+            seen += weight
+            if seen >= target:
+                return min(max(value, self.minimum), self.maximum)
+        return self.maximum
+
+    def to_dict(self) -> dict:
+        summary: dict = {"count": self.count, "retained": self.retained}
+        if self.count:
+            summary["min"] = self.minimum
+            summary["max"] = self.maximum
+            summary.update({f"p{round(q * 100)}": self.quantile(q) for q in QUANTILES})
+        return summary
+
+
+@dataclass
+class ValidatorStats:
+    files: int = 0
+    score_sketch: QuantileSketch = field(default_factory=QuantileSketch)
+    score_histogram: list[int] = field(default_factory=lambda: [0] * len(SCORE_RANGE))
+    score_total: int = 0
+    severities: Counter = field(default_factory=Counter)
+    lowest: list[tuple[int, int, str]] = field(default_factory=list)
+
+
+@dataclass
+class ValidatorResult:
+    score: int | None
+    findings: list[tuple[str, str]]
+    sections: list[str] = field(default_factory=list)
+
+
+@dataclass
+class FileSummary:
+    file_path: str
+    size: int
+    tokens: int
+    results: dict[str, ValidatorResult]
+
+
+class CorpusScanner:
+    def __init__(self, validators: tuple[str, ...], telemetry: bool = False) -> None:
+        self.registry = RuleRegistry()
+        self.engine = RuleEngine(self.registry, list(validators), telemetry=telemetry)
+        self.section_names: list[str] = []
+        self.anti_patterns: list[tuple[str, str]] = []
+        if "validate_prompt" in validators:
+            module = self.registry.module("validate_prompt")
+            self.section_names = list(module.SECTION_DEFINITIONS)
+            self.anti_patterns = [(message, name) for name, _, message in module.ANTI_PATTERNS]
+
+    def rule_code(self, validator: str, code: str, message: str) -> str:
+        if validator == "validate_prompt" and code == "anti_pattern":
+            return next((name for prefix, name in self.anti_patterns if message.startswith(prefix)), code)
+        return code
+
+    def summarize(self, file_path: Path) -> FileSummary | None:
+        try:
+            content = file_path.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return None
+        results: dict[str, ValidatorResult] = {}
+        for validator, report in self.engine.run(content, file_path).items():
+            results[validator] = ValidatorResult(
+                score=getattr(report, "score", None),
+                findings=[
+                    (self.rule_code(validator, code, message), severity)
+                    for code, severity, _, message in report_findings(validator, report)
+                ],
+                sections=[s.name for s in report.sections_found if s.present] if validator == "validate_prompt" else [],
+            )
+        return FileSummary(file_path.as_posix(), len(content.encode("utf-8")), len(content) // 4, results)
+
+
+@dataclass
+class ChunkResult:
+    summaries: list[FileSummary | None]
+    counters: dict[tuple[str, str], RuleCounter]
+    lines: int
+
+
+SCANNERS: dict[tuple[tuple[str, ...], bool], CorpusScanner] = {}
+
+
+def get_scanner(validators: tuple[str, ...], telemetry: bool = False) -> CorpusScanner:
+    key = (validators, telemetry)
+    if key not in SCANNERS:
+        SCANNERS[key] = CorpusScanner(validators, telemetry)
+    return SCANNERS[key]
+
+
+def summarize_chunk(paths: list[Path], validators: tuple[str, ...], telemetry: bool = False) -> ChunkResult:
+    scanner = get_scanner(validators, telemetry)
+    scanner.engine.counters = {}
+    lines = scanner.engine.stats.lines
+    summaries = [scanner.summarize(path) for path in paths]
+    return ChunkResult(summaries, scanner.engine.counters, scanner.engine.stats.lines - lines)
+
+
+def token_bucket(tokens: int) -> int:
+    return min(TOKEN_BUCKETS - 1, max(0, tokens.bit_length() - 1))
+
+
+def bucket_label(bucket: int) -> str:
+    low = 0 if bucket == 0 else 1 << bucket
+    high = (1 << (bucket + 1)) - 1
+    return f"{low:,}–{high:,}" if bucket < TOKEN_BUCKETS - 1 else f"{low:,}+"
+
+
+class CorpusAggregator:
+    def __init__(self, validators: list[str], section_names: list[str], worst: int = 10) -> None:
+        self.validators = validators
+        self.section_names = section_names
+        self.worst = worst
+        self.files = 0
+        self.skipped = 0
+        self.bytes = 0
+        self.token_sketch = QuantileSketch()
+        self.token_histogram = [0] * TOKEN_BUCKETS
+        self.token_total = 0
+        self.stats = {validator: ValidatorStats() for validator in validators}
+        self.rule_hits: Counter = Counter()
+        self.rule_files: Counter = Counter()
+        self.sections: Counter = Counter()
+        self.counters: dict[tuple[str, str], RuleCounter] = {}
+        self.lines = 0
+        self.sequence = 0
+
+    def add_counters(self, counters: dict[tuple[str, str], RuleCounter]) -> None:
+        for key, counter in counters.items():
+            total = self.counters.setdefault(key, RuleCounter())
+            total.evaluations += counter.evaluations
+            total.matches += counter.matches
+            total.seconds += counter.seconds
+
+    def add(self, summary: FileSummary) -> None:
+        self.files += 1
+        self.bytes += summary.size
+        self.token_sketch.add(summary.tokens)
+        self.token_histogram[token_bucket(summary.tokens)] += 1
+        self.token_total += summary.tokens
+
+        for validator, result in summary.results.items():
+            stats = self.stats[validator]
+            stats.files += 1
+            for code, severity in result.findings:
+                self.rule_hits[(validator, code)] += 1
+                stats.severities[severity] += 1
+            for code in {code for code, _ in result.findings}:
+                self.rule_files[(validator, code)] += 1
+            self.sections.update(result.sections)
+
+            if result.score is not None:
+                stats.score_sketch.add(result.score)
+                stats.score_histogram[min(max(result.score, 0), len(SCORE_RANGE) - 1)] += 1
+                stats.score_total += result.score
+                self.sequence += 1
+                heapq.heappush(stats.lowest, (-result.score, -self.sequence, summary.file_path))
+                if len(stats.lowest) > self.worst:
+                    heapq.heappop(stats.lowest)
+
+
+def iter_corpus(paths: Iterable[Path], pattern: str) -> Iterator[Path]:
+    for path in paths:
+        if not path.is_dir():
+            yield path
+            continue
+        for directory, dirnames, filenames in os.walk(path):
+            dirnames[:] = sorted(name for name in dirnames if not name.startswith("."))
+            for name in sorted(filenames):
+                if fnmatch.fnmatch(name, pattern):
+                    yield Path(directory) / name
+
+
+def iter_listed(source: str) -> Iterator[Path]:
+    handle = sys.stdin if source == "-" else open(source, encoding="utf-8")
+    try:
+        for line in handle:
+            if line.strip():
+                yield Path(line.strip())
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+
+def iter_chunks(
+    files: Iterable[Path],
+    validators: tuple[str, ...],
+    workers: int = 1,
+    telemetry: bool = False,
+    chunk_size: int = 32,
+) -> Iterator[ChunkResult]:
+    files = iter(files)
+    chunks = iter(lambda: list(itertools.islice(files, chunk_size)), [])
+    if workers == 1:
+        for chunk in chunks:
+            yield summarize_chunk(chunk, validators, telemetry)
+        return
+
+    # Keep at most two chunks per worker in flight so memory does not grow with the corpus.
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(summarize_chunk, chunk, validators, telemetry))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def build_report(
+    aggregator: CorpusAggregator,
+    files: Iterable[Path],
+    workers: int = 1,
+    telemetry: bool = False,
+) -> float:
+    started = time.perf_counter()
+    for chunk in iter_chunks(files, tuple(aggregator.validators), workers, telemetry):
+        aggregator.add_counters(chunk.counters)
+        aggregator.lines += chunk.lines
+        for summary in chunk.summaries:
+            if summary is None:
+                aggregator.skipped += 1
+            else:
+                aggregator.add(summary)
+    return time.perf_counter() - started
+
+
+def aggregate_to_dict(aggregator: CorpusAggregator, elapsed_s: float, top: int) -> dict:
+    files = aggregator.files
+    validators: dict[str, dict] = {}
+    for validator, stats in aggregator.stats.items():
+        entry: dict = {"files": stats.files, "findings": {severity: stats.severities[severity] for severity in SEVERITIES}}
+        if stats.score_sketch.count:
+            entry["score"] = {
+                "mean": round(stats.score_total / stats.score_sketch.count, 2),
+                **stats.score_sketch.to_dict(),
+                "histogram": dict(zip(map(str, SCORE_RANGE), stats.score_histogram)),
+            }
+            entry["lowest"] = [
+                {"file": path, "score": -score} for score, _, path in sorted(stats.lowest, reverse=True)
+            ]
+        validators[validator] = entry
+
+    rules = [
+        {
+            "validator": validator,
+            "code": code,
+            "hits": hits,
+            "files": aggregator.rule_files[(validator, code)],
+            "file_rate": round(aggregator.rule_files[(validator, code)] / files, 4) if files else 0.0,
+        }
+        for (validator, code), hits in sorted(aggregator.rule_hits.items(), key=lambda item: (-item[1], item[0]))[:top]
+    ]
+
+    summary: dict = {
+        "files": files,
+        "skipped": aggregator.skipped,
+        "bytes": aggregator.bytes,
+        "elapsed_s": round(elapsed_s, 3),
+        "tokens": {
+            "total": aggregator.token_total,
+            **aggregator.token_sketch.to_dict(),
+            "histogram": [
+                {"range": bucket_label(bucket), "files": count}
+                for bucket, count in enumerate(aggregator.token_histogram)
+                if count
+            ],
+        },
+        "validators": validators,
+        "top_rules": rules,
+    }
+    if aggregator.section_names:
+        summary["section_coverage"] = {
+            name: round(aggregator.sections[name] / files, 4) if files else 0.0
+            for name in aggregator.section_names
+        }
+    return summary
+
+
+def bar(count: int, largest: int, width: int = 30) -> str:
+    return "█" * max(1 if count else 0, round(width * count / largest)) if largest else ""
+
+
+def format_text(summary: dict) -> str:
+    tokens = summary["tokens"]
+    lines = [
+        f"\n📊 Corpus report — {summary['files']:,} files ({summary['bytes'] / 1_048_576:.1f} MiB) "
+        f"in {summary['elapsed_s']:.1f}s",
+    ]
+    if summary["skipped"]:
+        lines.append(f"   ⚠️  {summary['skipped']} unreadable files skipped")
+    if not summary["files"]:
+        return "\n".join(lines)
+
+    lines.append(
+        f"\n🔢 Tokens: {tokens['total']:,} total  p50 {tokens['p50']:,.0f}  p90 {tokens['p90']:,.0f}  "
+        f"p99 {tokens['p99']:,.0f}  max {tokens['max']:,.0f}"
+    )
+    largest = max(row["files"] for row in tokens["histogram"])
+    for row in tokens["histogram"]:
+        lines.append(f"   {row['range']:>16}  {row['files']:>7,}  {bar(row['files'], largest)}")
+
+    for validator, entry in summary["validators"].items():
+        counts = entry["findings"]
+        lines.append(
+            f"\n🧪 {validator}: ❌ {counts['ERROR']:,}  ⚠️  {counts['WARNING']:,}  ℹ️  {counts['INFO']:,}"
+        )
+        score = entry.get("score")
+        if not score:
+            continue
+        lines.append(
+            f"   Score mean {score['mean']}/10  p50 {score['p50']:.0f}  p90 {score['p90']:.0f}  "
+            f"min {score['min']:.0f}  max {score['max']:.0f}"
+        )
+        largest = max(score["histogram"].values())
+        for value, count in score["histogram"].items():
+            if count:
+                lines.append(f"   {value:>4}  {count:>7,}  {bar(count, largest)}")
+        if entry["lowest"]:
+            lowest = ", ".join(f"{row['file']} ({row['score']})" for row in entry["lowest"][:3])
+            lines.append(f"   Lowest: {lowest}")
+
+    if summary["top_rules"]:
+        lines.append("\n🚩 Most-triggered rules")
+        for rule in summary["top_rules"]:
+            lines.append(
+                f"   {rule['validator'] + ':' + rule['code']:<40} {rule['hits']:>8,} hits  "
+                f"{rule['files']:>7,} files ({rule['file_rate']:.1%})"
+            )
+
+    if "section_coverage" in summary:
+        lines.append("\n📑 Section coverage (validate_prompt)")
+        for name, rate in summary["section_coverage"].items():
+            lines.append(f"   {name:<20} {rate:6.1%}  {bar(round(rate * 1000), 1000, 20)}")
+
+    return "\n".join(lines)
+
+
+def html_bars(rows: list[tuple[str, int | float, str]]) -> str:
+    largest = max((value for _, value, _ in rows), default=0) or 1
+    cells = "".join(
+        f"<tr><td>{html.escape(label)}</td><td class=n>{html.escape(text)}</td>"
+        f"<td><div class=bar style=\"width:{100 * value / largest:.1f}%\"></div></td></tr>"
+        for label, value, text in rows
+    )
+    return f"<table>{cells}</table>"
+
+
+def format_html(summary: dict) -> str:
+    tokens = summary["tokens"]
+    parts = [
+        "<!doctype html><html><head><meta charset=utf-8><title>Corpus report</title><style>"
+        "body{font:14px system-ui,sans-serif;margin:2em;max-width:960px}"
+        "table{border-collapse:collapse;width:100%;margin-bottom:1.5em}td,th{padding:2px 8px;text-align:left}"
+        "td.n{text-align:right;white-space:nowrap;width:1%}td:last-child{width:60%}"
+        ".bar{background:#4a7bd0;height:12px}</style></head><body>",
+        f"<h1>Corpus report</h1><p>{summary['files']:,} files, {summary['bytes'] / 1_048_576:.1f} MiB, "
+        f"{summary['skipped']} skipped, {summary['elapsed_s']:.1f}s</p>",
+    ]
+    if summary["files"]:
+        parts.append(
+            f"<h2>Tokens</h2><p>{tokens['total']:,} total · p50 {tokens['p50']:,.0f} · p90 {tokens['p90']:,.0f} · "
+            f"p99 {tokens['p99']:,.0f} · max {tokens['max']:,.0f}</p>"
+        )
+        parts.append(html_bars([(row["range"], row["files"], f"{row['files']:,}") for row in tokens["histogram"]]))
+
+    for validator, entry in summary["validators"].items():
+        counts = entry["findings"]
+        parts.append(
+            f"<h2>{html.escape(validator)}</h2><p>{counts['ERROR']:,} errors · {counts['WARNING']:,} warnings · "
+            f"{counts['INFO']:,} info</p>"
+        )
+        score = entry.get("score")
+        if score:
+            parts.append(
+                f"<p>Score mean {score['mean']}/10 · p50 {score['p50']:.0f} · p90 {score['p90']:.0f}</p>"
+            )
+            parts.append(html_bars([(value, count, f"{count:,}") for value, count in score["histogram"].items()]))
+            if entry["lowest"]:
+                rows = "".join(
+                    f"<li>{html.escape(row['file'])} ({row['score']})</li>" for row in entry["lowest"]
+                )
+                parts.append(f"<details><summary>Lowest scores</summary><ul>{rows}</ul></details>")
+
+    if summary["top_rules"]:
+        parts.append("<h2>Most-triggered rules</h2>")
+        parts.append(html_bars([
+            (f"{rule['validator']}:{rule['code']}", rule["hits"], f"{rule['hits']:,} hits · {rule['file_rate']:.1%} of files")
+            for rule in summary["top_rules"]
+        ]))
+
+    if "section_coverage" in summary:
+        parts.append("<h2>Section coverage</h2>")
+        parts.append(html_bars([(name, rate, f"{rate:.1%}") for name, rate in summary["section_coverage"].items()]))
+
+    parts.append("</body></html>\n")
+    return "".join(parts)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Stream a prompt corpus through the validators and fold the results into one aggregate report",
+    )
+    parser.add_argument("paths", type=Path, nargs="*", help="Files or directories to scan")
+    parser.add_argument("--files-from", metavar="FILE", help="Read file paths one per line from FILE ('-' for stdin)")
+    parser.add_argument("--glob", default="*.md", help="File name pattern inside directories (default: *.md)")
+    parser.add_argument(
+        "--validators",
+        default=",".join(VALIDATOR_SKILLS),
+        help="Comma-separated validators to run (default: all)",
+    )
+    parser.add_argument("--workers", type=int, help="Parallel validation workers (default: CPU count)")
+    parser.add_argument("--top", type=int, default=20, help="Rules to list in the most-triggered table (default: 20)")
+    parser.add_argument("--worst", type=int, default=10, help="Lowest-scoring files to keep per validator (default: 10)")
+    parser.add_argument("--format", choices=["text", "json", "html"], default="text", help="Output format (default: text)")
+    parser.add_argument("--output", type=Path, help="Write the report to this file instead of stdout")
+    parser.add_argument("--telemetry", type=Path, metavar="DB", help="Append per-rule evaluation, match and timing counters to this SQLite database")
+
+    args = parser.parse_args()
+
+    if not args.paths and not args.files_from:
+        parser.error("provide at least one path, or --files-from")
+    missing = [path for path in args.paths if not path.exists()]
+    if missing:
+        print(f"Error: File not found: {missing[0]}", file=sys.stderr)
+        sys.exit(1)
+
+    validators = [name.strip() for name in args.validators.split(",") if name.strip()]
+    unknown = [name for name in validators if name not in VALIDATOR_SKILLS]
+    if unknown:
+        print(f"Error: Unknown validator(s): {', '.join(unknown)}", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        scanner = get_scanner(tuple(validators), args.telemetry is not None)
+    except RegistryError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    aggregator = CorpusAggregator(validators, scanner.section_names, worst=args.worst)
+    files = iter_corpus(args.paths, args.glob)
+    if args.files_from:
+        files = itertools.chain(files, iter_corpus(iter_listed(args.files_from), args.glob))
+    started_at = time.time()
+    elapsed = build_report(aggregator, files, args.workers or os.cpu_count() or 1, args.telemetry is not None)
+    summary = aggregate_to_dict(aggregator, elapsed, args.top)
+
+    if args.telemetry:
+        from rule_telemetry import TelemetryStore
+
+        with TelemetryStore(args.telemetry) as store:
+            store.record_run("corpus_report", aggregator.counters, aggregator.files, aggregator.lines, elapsed, started_at)
+
+    if args.format == "json":
+        output = json.dumps(summary, indent=2, ensure_ascii=False) + "\n"
+    elif args.format == "html":
+        output = format_html(summary)
+    else:
+        output = format_text(summary) + "\n"
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        partial = args.output.with_name(args.output.name + ".tmp")
+        partial.write_text(output, encoding="utf-8")
+        os.replace(partial, args.output)
+        print(f"✅ Wrote {args.format} report for {summary['files']:,} files to {args.output}")
+    else:
+        sys.stdout.write(output)
+
+
+if __name__ == "__main__":
+    main()
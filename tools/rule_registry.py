@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+
+import argparse
+import importlib
+import json
+import re
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SKILL_PACKS: dict[str, tuple[str, ...]] = {
+    "prompt-engineer-pro": ("lint_prompt", "validate_prompt"),
+    "agent-orchestrator": ("validate_topology",),
+    "context-engineer": ("validate_context",),
+    "agent-safety-architect": ("validate_safety",),
+    "tool-sdk-designer": ("validate_toolspec",),
+    "agent-finops": ("estimate_cost",),
+}
+
+VALIDATOR_SKILLS: dict[str, str] = {
+    validator: skill for skill, validators in SKILL_PACKS.items() for validator in validators
+}
+
+SEVERITY_ICONS = {"ERROR": "❌", "WARNING": "⚠️ ", "INFO": "ℹ️ "}
+
+
+# Shared rules name their subscribers only; the regex itself lives in the skills' rule packs. The
+# first scope owns the pattern and the other scopes must carry the identical string.
+@dataclass(frozen=True)
+class SharedRule:
+    rule_id: str
+    description: str
+    scopes: tuple[str, ...]
+
+
+SHARED_RULES: list[SharedRule] = [
+    SharedRule(
+        rule_id="vague-error-handling",
+        description="Best-effort wording in place of an explicit recovery path",
+        scopes=("lint_prompt:P006", "validate_prompt:swallowed_errors"),
+    ),
+]
+
+
+class RegistryError(Exception):
+    pass
+
+
+@dataclass
+class Subscriber:
+    validator: str
+    code: str
+    severity: str
+    message: str
+    first_only: bool = False
+
+
+@dataclass
+class EngineStats:
+    rules: int = 0
+    patterns: int = 0
+    lines: int = 0
+    searches: int = 0
+    elapsed_s: float = 0.0
+
+
+@dataclass
+class RuleCounter:
+    evaluations: int = 0
+    matches: int = 0
+    seconds: float = 0.0
+
+
+DOCUMENT_CHECKS = "document"
+
+
+class RuleRegistry:
+    def __init__(self, root: Path = ROOT) -> None:
+        self.root = root
+        self.modules: dict[str, ModuleType] = {}
+        self.loaded_skills: set[str] = set()
+
+    def load_skill(self, skill: str) -> None:
+        if skill in self.loaded_skills:
+            return
+        for scripts in self.root.glob(f"skills/*/{skill}/scripts"):
+            if str(scripts) not in sys.path:
+                sys.path.insert(0, str(scripts))
+        for name in SKILL_PACKS[skill]:
+            self.modules[name] = importlib.import_module(name)
+        self.loaded_skills.add(skill)
+
+    def module(self, validator: str) -> ModuleType:
+        if validator not in VALIDATOR_SKILLS:
+            raise RegistryError(f"Unknown validator: {validator}")
+        self.load_skill(VALIDATOR_SKILLS[validator])
+        return self.modules[validator]
+
+    def pack_rules(self, validator: str) -> list[tuple[str, str, str, str, bool]]:
+        module = self.module(validator)
+        if validator == "validate_prompt":
+            return [
+                (name, "WARNING", pattern, message, True)
+                for name, pattern, message in module.ANTI_PATTERNS
+                if pattern is not None
+            ]
+        return [
+            (code, severity, compiled.pattern, message, False)
+            for code, severity, compiled, message in module.LINE_RULES
+        ]
+
+
+class RuleEngine:
+    def __init__(self, registry: RuleRegistry, validators: list[str], telemetry: bool = False) -> None:
+        self.registry = registry
+        self.validators = validators
+        self.stats = EngineStats()
+        self.telemetry = telemetry
+        self.counters: dict[tuple[str, str], RuleCounter] = {}
+
+        rules = [
+            (f"{validator}:{rule[0]}", validator, rule)
+            for validator in validators
+            for rule in registry.pack_rules(validator)
+        ]
+
+        # Each shared rule's pattern comes from the first selected scope in declaration order.
+        patterns = {scope: rule[2] for scope, _, rule in rules}
+        self.shared_patterns: dict[str, str] = {}
+        for rule in SHARED_RULES:
+            for scope in rule.scopes:
+                if scope not in patterns:
+                    continue
+                expected = self.shared_patterns.setdefault(rule.rule_id, patterns[scope])
+                if patterns[scope] != expected:
+                    raise RegistryError(f"{scope} has drifted from shared rule {rule.rule_id}")
+
+        groups: dict[str, list[Subscriber]] = {}
+        for _, validator, (code, severity, pattern, message, first_only) in rules:
+            groups.setdefault(pattern, []).append(Subscriber(validator, code, severity, message, first_only))
+            self.stats.rules += 1
+
+        self.compiled: list[tuple[re.Pattern, list[Subscriber]]] = [
+            (re.compile(pattern, re.IGNORECASE), subscribers) for pattern, subscribers in groups.items()
+        ]
+        self.stats.patterns = len(self.compiled)
+
+    def evaluate(self, content: str) -> dict[str, list[tuple[str, str, int, str]]]:
+        if self.telemetry:
+            return self.evaluate_timed(content)
+        started = time.perf_counter()
+        hits: dict[str, list[tuple[str, str, int, str]]] = {validator: [] for validator in self.validators}
+        reported: set[tuple[str, str]] = set()
+        lines = content.split("\n")
+
+        for line_num, line in enumerate(lines, start=1):
+            for pattern, subscribers in self.compiled:
+                if not pattern.search(line):
+                    continue
+                for subscriber in subscribers:
+                    if subscriber.first_only:
+                        if (subscriber.validator, subscriber.code) in reported:
+                            continue
+                        reported.add((subscriber.validator, subscriber.code))
+                    hits[subscriber.validator].append(
+                        (subscriber.code, subscriber.severity, line_num, subscriber.message)
+                    )
+
+        self.stats.lines += len(lines)
+        self.stats.searches += len(lines) * len(self.compiled)
+        self.stats.elapsed_s += time.perf_counter() - started
+        return hits
+
+    def evaluate_timed(self, content: str) -> dict[str, list[tuple[str, str, int, str]]]:
+        # Pattern-major order so each pattern is timed once per document rather than once per
+        # line; hits are re-sorted into the line-major order evaluate() produces.
+        started = time.perf_counter()
+        ordered: list[tuple[int, int, int, Subscriber]] = []
+        lines = content.split("\n")
+        reported: set[tuple[str, str]] = set()
+
+        for group, (pattern, subscribers) in enumerate(self.compiled):
+            group_started = time.perf_counter()
+            matched = [line_num for line_num, line in enumerate(lines, start=1) if pattern.search(line)]
+            share = (time.perf_counter() - group_started) / len(subscribers)
+            for position, subscriber in enumerate(subscribers):
+                counter = self.counter(subscriber.validator, subscriber.code)
+                counter.evaluations += len(lines)
+                counter.seconds += share
+                for line_num in matched:
+                    counter.matches += 1
+                    if subscriber.first_only:
+                        if (subscriber.validator, subscriber.code) in reported:
+                            continue
+                        reported.add((subscriber.validator, subscriber.code))
+                    ordered.append((line_num, group, position, subscriber))
+
+        hits: dict[str, list[tuple[str, str, int, str]]] = {validator: [] for validator in self.validators}
+        for line_num, _, _, subscriber in sorted(ordered, key=lambda item: item[:3]):
+            hits[subscriber.validator].append((subscriber.code, subscriber.severity, line_num, subscriber.message))
+
+        self.stats.lines += len(lines)
+        self.stats.searches += len(lines) * len(self.compiled)
+        self.stats.elapsed_s += time.perf_counter() - started
+        return hits
+
+    def counter(self, validator: str, code: str) -> RuleCounter:
+        key = (validator, code)
+        if key not in self.counters:
+            self.counters[key] = RuleCounter()
+        return self.counters[key]
+
+    def run(self, content: str, file_path: Path) -> dict[str, object]:
+        hits = self.evaluate(content)
+        if not self.telemetry:
+            return {
+                validator: self.merge(validator, content, file_path, hits[validator])
+                for validator in self.validators
+            }
+
+        reports: dict[str, object] = {}
+        for validator in self.validators:
+            started = time.perf_counter()
+            reports[validator] = self.merge(validator, content, file_path, hits[validator])
+            counter = self.counter(validator, DOCUMENT_CHECKS)
+            counter.evaluations += 1
+            counter.matches += len(report_findings(validator, reports[validator])) - len(hits[validator])
+            counter.seconds += time.perf_counter() - started
+        return reports
+
+    def merge(self, validator: str, content: str, file_path: Path, hits: list[tuple[str, str, int, str]]) -> object:
+        module = self.registry.module(validator)
+        if validator == "lint_prompt":
+            results = module.lint_content(content, line_rules=[])
+            results.extend(module.LintResult(code, severity, line, message) for code, severity, line, message in hits)
+            return results
+        if validator == "validate_prompt":
+            report = module.audit_content(content, str(file_path), anti_patterns={})
+            report.findings.extend(
+                module.Finding(module.Severity(severity), "anti_pattern", message, line)
+                for _, severity, line, message in hits
+            )
+            report.score, report.rating = module.calculate_score(report.sections_found, report.findings)
+            return report
+        report = module.validate_content(content, file_path, line_rules=[])
+        report.issues.extend(module.ValidationResult(code, severity, line, message) for code, severity, line, message in hits)
+        return report
+
+
+def report_findings(validator: str, report: object) -> list[tuple[str, str, int | None, str]]:
+    if validator == "lint_prompt":
+        return [(r.code, r.severity, r.line, r.message) for r in report]
+    if validator == "validate_prompt":
+        return [(f.category, f.severity.value, f.line, f.message) for f in report.findings]
+    return [(i.code, i.severity, i.line, i.message) for i in report.issues]
+
+
+def format_shared_rules(engine: RuleEngine) -> str:
+    lines = [f"\n🧩 Shared rules ({len(SHARED_RULES)})"]
+    for rule in SHARED_RULES:
+        lines.append(f"   {rule.rule_id}: {rule.description}")
+        lines.append(f"      /{engine.shared_patterns.get(rule.rule_id, '?')}/i")
+        for scope in rule.scopes:
+            lines.append(f"      • {scope}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Run several validators in one pass, evaluating each distinct line rule once and fanning hits out",
+    )
+    parser.add_argument("files", type=Path, nargs="*", help="Prompt/config file(s) to check")
+    parser.add_argument(
+        "--validators",
+        default=",".join(VALIDATOR_SKILLS),
+        help="Comma-separated validators to run (default: all)",
+    )
+    parser.add_argument("--format", choices=["text", "ndjson"], default="text", help="Output format (default: text)")
+    parser.add_argument("--check", action="store_true", help="Load every rule pack, verify shared rules have not drifted, and exit")
+    parser.add_argument("--stats", action="store_true", help="Print rule deduplication and timing statistics to stderr")
+    parser.add_argument("--telemetry", type=Path, metavar="DB", help="Append per-rule evaluation, match and timing counters to this SQLite database")
+    parser.add_argument("--strict", action="store_true", help="Exit with code 1 if any errors or warnings found")
+
+    args = parser.parse_args()
+
+    validators = [name.strip() for name in args.validators.split(",") if name.strip()]
+    if args.check:
+        validators = list(VALIDATOR_SKILLS)
+    unknown = [name for name in validators if name not in VALIDATOR_SKILLS]
+    if unknown:
+        print(f"Error: Unknown validator(s): {', '.join(unknown)}", file=sys.stderr)
+        sys.exit(1)
+
+    registry = RuleRegistry()
+    try:
+        engine = RuleEngine(registry, validators, telemetry=args.telemetry is not None)
+    except RegistryError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.check:
+        print(format_shared_rules(engine))
+        print(f"\n✅ {engine.stats.rules} rules from {len(validators)} validators → {engine.stats.patterns} distinct patterns")
+        sys.exit(0)
+
+    if not args.files:
+        parser.error("provide at least one file, or --check")
+
+    exit_code = 0
+    files = 0
+    started_at, started = time.time(), time.perf_counter()
+    for file_path in args.files:
+        if not file_path.exists():
+            print(f"Error: File not found: {file_path}", file=sys.stderr)
+            exit_code = 1
+            continue
+
+        reports = engine.run(file_path.read_text(encoding="utf-8"), file_path)
+        files += 1
+        if args.format == "text":
+            print(f"\n📋 {file_path}")
+        for validator, report in reports.items():
+            findings = sorted(report_findings(validator, report), key=lambda item: item[2] or 0)
+            if args.format == "ndjson":
+                for code, severity, line, message in findings:
+                    print(json.dumps({
+                        "file": file_path.as_posix(), "validator": validator,
+                        "code": code, "severity": severity, "line": line, "message": message,
+                    }, ensure_ascii=False))
+            else:
+                score = getattr(report, "score", None)
+                suffix = f" (score {score}/10)" if score is not None else ""
+                print(f"   {validator}: {len(findings)} findings{suffix}")
+                for code, severity, line, message in findings:
+                    loc = f":{line}" if line else ""
+                    print(f"     {SEVERITY_ICONS[severity]} {code}{loc} {message}")
+            if args.strict and any(severity in ("ERROR", "WARNING") for _, severity, _, _ in findings):
+                exit_code = 1
+        sys.stdout.flush()
+
+    if args.telemetry:
+        from rule_telemetry import TelemetryStore
+
+        with TelemetryStore(args.telemetry) as store:
+            store.record_run("rule_registry", engine.counters, files, engine.stats.lines,
+                             time.perf_counter() - started, started_at)
+
+    if args.stats:
+        stats = engine.stats
+        print(
+            f"\n📊 {stats.rules} line rules → {stats.patterns} distinct patterns; "
+            f"{stats.searches:,} searches over {stats.lines:,} lines in {stats.elapsed_s * 1000:.1f}ms",
+            file=sys.stderr,
+        )
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
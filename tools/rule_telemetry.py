@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+from rule_registry import DOCUMENT_CHECKS, RuleCounter
+
+DEFAULT_DB = Path(".rule-telemetry.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    tool TEXT NOT NULL,
+    files INTEGER NOT NULL,
+    lines INTEGER NOT NULL,
+    elapsed_s REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rule_counts (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    validator TEXT NOT NULL,
+    code TEXT NOT NULL,
+    evaluations INTEGER NOT NULL,
+    matches INTEGER NOT NULL,
+    seconds REAL NOT NULL,
+    PRIMARY KEY (run_id, validator, code)
+);
+CREATE INDEX IF NOT EXISTS runs_started_at ON runs(started_at);
+"""
+
+RANK_QUERY = """
+SELECT rule_counts.validator, rule_counts.code,
+       COUNT(DISTINCT rule_counts.run_id), SUM(evaluations), SUM(matches), SUM(seconds)
+FROM rule_counts JOIN runs ON runs.id = rule_counts.run_id
+WHERE runs.started_at >= ? AND (? IS NULL OR rule_counts.validator = ?)
+GROUP BY rule_counts.validator, rule_counts.code
+"""
+
+
+class TelemetryStore:
+    def __init__(self, path: Path = DEFAULT_DB) -> None:
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "TelemetryStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def record_run(
+        self,
+        tool: str,
+        counters: dict[tuple[str, str], RuleCounter],
+        files: int,
+        lines: int,
+        elapsed_s: float,
+        started_at: float | None = None,
+    ) -> int:
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (started_at, tool, files, lines, elapsed_s) VALUES (?, ?, ?, ?, ?)",
+                (started_at or time.time(), tool, files, lines, elapsed_s),
+            )
+            run_id = cursor.lastrowid
+            self.connection.executemany(
+                "INSERT INTO rule_counts VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (run_id, validator, code, counter.evaluations, counter.matches, counter.seconds)
+                    for (validator, code), counter in sorted(counters.items())
+                ],
+            )
+        return run_id
+
+    def rank(self, since: float = 0.0, validator: str | None = None) -> list[dict]:
+        rows = []
+        for name, code, runs, evaluations, matches, seconds in self.connection.execute(
+            RANK_QUERY, (since, validator, validator),
+        ):
+            rows.append({
+                "validator": name,
+                "code": code,
+                "runs": runs,
+                "evaluations": evaluations,
+                "matches": matches,
+                "seconds": seconds,
+                "hit_rate": matches / evaluations if evaluations else 0.0,
+                "us_per_evaluation": seconds * 1e6 / evaluations if evaluations else 0.0,
+                "ms_per_finding": seconds * 1000 / matches if matches else None,
+            })
+        # Rules that never fire cost time for nothing, so they rank first, most expensive first.
+        rows.sort(key=lambda row: (row["matches"] > 0, -(row["ms_per_finding"] or row["seconds"])))
+        return rows
+
+    def runs(self, limit: int = 20) -> list[dict]:
+        return [
+            {"id": run_id, "started_at": started_at, "tool": tool, "files": files, "lines": lines, "elapsed_s": elapsed_s}
+            for run_id, started_at, tool, files, lines, elapsed_s in self.connection.execute(
+                "SELECT id, started_at, tool, files, lines, elapsed_s FROM runs ORDER BY id DESC LIMIT ?", (limit,),
+            )
+        ]
+
+
+def format_rank(rows: list[dict], limit: int) -> str:
+    if not rows:
+        return "\nNo telemetry recorded yet. Run rule_registry.py or corpus_report.py with --telemetry."
+    runs = max(row["runs"] for row in rows)
+    dead = [row for row in rows if not row["matches"] and row["code"] != DOCUMENT_CHECKS]
+    lines = [
+        f"\n📈 Rule cost per finding ({len(rows)} rules, up to {runs} runs)",
+        f"   {'Rule':<36} {'Evals':>11} {'Hits':>8} {'Hit rate':>9} {'µs/eval':>8} {'ms/finding':>11}",
+    ]
+    for row in rows[:limit]:
+        per_finding = f"{row['ms_per_finding']:.3f}" if row["ms_per_finding"] is not None else "never hit"
+        lines.append(
+            f"   {row['validator'] + ':' + row['code']:<36} {row['evaluations']:>11,} {row['matches']:>8,} "
+            f"{row['hit_rate']:>9.3%} {row['us_per_evaluation']:>8.2f} {per_finding:>11}"
+        )
+    if len(rows) > limit:
+        lines.append(f"   … {len(rows) - limit} more")
+    if dead:
+        lines.append(f"\n🪦 {len(dead)} rules never fired: {', '.join(row['validator'] + ':' + row['code'] for row in dead)}")
+    return "\n".join(lines)
+
+
+def format_runs(rows: list[dict]) -> str:
+    lines = [f"\n🗂️  Last {len(rows)} runs"]
+    for row in rows:
+        stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(row["started_at"]))
+        lines.append(
+            f"   #{row['id']:<5} {stamp}  {row['tool']:<14} {row['files']:>7,} files {row['lines']:>10,} lines  "
+            f"{row['elapsed_s']:8.2f}s"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Query per-rule telemetry recorded by rule_registry.py and corpus_report.py --telemetry",
+    )
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB, help=f"Telemetry database (default: {DEFAULT_DB})")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rank = sub.add_parser("rank", help="Rank rules by cost per finding; rules that never fire come first")
+    rank.add_argument("--since-days", type=float, help="Only include runs from the last N days")
+    rank.add_argument("--validator", help="Only include one validator")
+    rank.add_argument("--limit", type=int, default=30, help="Rows to show in text output (default: 30)")
+    rank.add_argument("--format", choices=["text", "json"], default="text", help="Output format (default: text)")
+
+    runs = sub.add_parser("runs", help="List recorded runs")
+    runs.add_argument("--limit", type=int, default=20, help="Runs to show (default: 20)")
+    runs.add_argument("--format", choices=["text", "json"], default="text", help="Output format (default: text)")
+
+    args = parser.parse_args()
+
+    if not args.db.exists():
+        print(f"Error: File not found: {args.db}", file=sys.stderr)
+        sys.exit(1)
+
+    with TelemetryStore(args.db) as store:
+        if args.command == "rank":
+            since = time.time() - args.since_days * 86400 if args.since_days else 0.0
+            rows = store.rank(since, args.validator)
+            print(json.dumps(rows, indent=2) if args.format == "json" else format_rank(rows, args.limit))
+        else:
+            rows = store.runs(args.limit)
+            print(json.dumps(rows, indent=2) if args.format == "json" else format_runs(rows))
+
+
+if __name__ == "__main__":
+    main()
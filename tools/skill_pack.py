@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+
+import argparse
+import io
+import json
+import os
+import re
+import statistics
+import struct
+import sys
+import time
+import zipfile
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+MANIFEST_NAME = ".skill-manifest.json"
+MANIFEST_VERSION = 1
+LOCAL_HEADER = struct.Struct("<4sHHHHHIIIHH")
+LOCAL_SIGNATURE = b"PK\x03\x04"
+EXCLUDED_PARTS = {"__pycache__", ".git", ".pytest_cache", ".mypy_cache"}
+FRONTMATTER_NAME = re.compile(r"\A---\s*\n(?:.*\n)*?name:\s*(\S+)", re.MULTILINE)
+# Repo modules that skill scripts import lazily; an archive carries a copy in scripts/ so the
+# installed skill does not depend on this checkout's tools/.
+SHARED_SCRIPTS = (ROOT / "tools" / "check_scheduler.py",)
+
+
+class SkillArchiveError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class Member:
+    name: str
+    offset: int
+    compressed: int
+    size: int
+    crc32: int
+    method: int
+    tokens: int
+
+
+def estimate_tokens(data: bytes) -> int:
+    return len(data) // 4
+
+
+def skill_name(skill_dir: Path) -> str:
+    skill_md = skill_dir / "SKILL.md"
+    if not skill_md.exists():
+        raise SkillArchiveError(f"No SKILL.md in {skill_dir}")
+    match = FRONTMATTER_NAME.match(skill_md.read_text(encoding="utf-8"))
+    return match.group(1) if match else skill_dir.name
+
+
+def collect_files(skill_dir: Path) -> list[tuple[str, bytes]]:
+    files: list[tuple[str, bytes]] = []
+    for path in sorted(skill_dir.rglob("*")):
+        relative = path.relative_to(skill_dir)
+        if not path.is_file() or path.suffix == ".pyc" or EXCLUDED_PARTS & set(relative.parts):
+            continue
+        if any(part.startswith(".") for part in relative.parts):
+            continue
+        files.append((relative.as_posix(), path.read_bytes()))
+    for shared in SHARED_SCRIPTS:
+        needed = f"import {shared.stem}\n".encode()
+        if any(name.startswith("scripts/") and needed in data for name, data in files):
+            files.append((f"scripts/{shared.name}", shared.read_bytes()))
+            files.sort()
+    return files
+
+
+def add_entry(archive: zipfile.ZipFile, name: str, data: bytes, compress: bool) -> None:
+    info = zipfile.ZipInfo(name, date_time=ZIP_EPOCH)
+    info.compress_type = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    info.create_system = 3
+    info.external_attr = 0o644 << 16
+    archive.writestr(info, data, compresslevel=9 if compress else None)
+
+
+def render_archive(prefix: str, files: list[tuple[str, bytes]], manifest: dict) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        add_entry(archive, f"{prefix}/{MANIFEST_NAME}", json.dumps(manifest, sort_keys=True).encode(), compress=False)
+        for relative, data in files:
+            add_entry(archive, f"{prefix}/{relative}", data, compress=True)
+    return buffer.getvalue()
+
+
+def read_members(data: bytes) -> dict[str, Member]:
+    members: dict[str, Member] = {}
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        for info in archive.infolist():
+            _, _, _, _, _, _, _, _, _, name_len, extra_len = LOCAL_HEADER.unpack_from(data, info.header_offset)
+            members[info.filename] = Member(
+                name=info.filename,
+                offset=info.header_offset + LOCAL_HEADER.size + name_len + extra_len,
+                compressed=info.compress_size,
+                size=info.file_size,
+                crc32=info.CRC,
+                method=info.compress_type,
+                tokens=0,
+            )
+    return members
+
+
+def pack_skill(skill_dir: Path, output: Path) -> dict:
+    prefix = skill_name(skill_dir)
+    files = collect_files(skill_dir)
+    tokens = {relative: estimate_tokens(data) for relative, data in files}
+    manifest: dict = {"version": MANIFEST_VERSION, "skill": prefix, "files": {}}
+
+    for _ in range(8):
+        data = render_archive(prefix, files, manifest)
+        members = read_members(data)
+        table = {
+            relative: [
+                members[f"{prefix}/{relative}"].offset,
+                members[f"{prefix}/{relative}"].compressed,
+                members[f"{prefix}/{relative}"].size,
+                members[f"{prefix}/{relative}"].crc32,
+                members[f"{prefix}/{relative}"].method,
+                tokens[relative],
+            ]
+            for relative, _ in files
+        }
+        if table == manifest["files"]:
+            break
+        manifest["files"] = table
+    else:
+        raise SkillArchiveError(f"Manifest offsets for {skill_dir} did not converge")
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    partial = output.with_name(output.name + ".tmp")
+    partial.write_bytes(data)
+    os.replace(partial, output)
+    return manifest
+
+
+class SkillArchive:
+    def __init__(self, path: Path) -> None:
+        # Published skills may be a directory wrapping <name>.skill, or an unpacked skill directory.
+        if path.is_dir() and (path / path.name).is_file():
+            path = path / path.name
+        self.path = path
+        self.directory = path if path.is_dir() else None
+        self.fd: int | None = None
+        if self.directory is not None:
+            self.prefix, self.members, self.indexed = self.scan_directory()
+            return
+        self.fd = os.open(path, os.O_RDONLY)
+        try:
+            self.prefix, self.members, self.indexed = self.load_manifest()
+        except Exception:
+            os.close(self.fd)
+            raise
+
+    def close(self) -> None:
+        if self.fd is not None:
+            os.close(self.fd)
+
+    def __enter__(self) -> "SkillArchive":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def load_manifest(self) -> tuple[str, dict[str, Member], bool]:
+        header = os.pread(self.fd, LOCAL_HEADER.size, 0)
+        if len(header) < LOCAL_HEADER.size or header[:4] != LOCAL_SIGNATURE:
+            raise SkillArchiveError(f"{self.path} is not a zip archive")
+        fields = LOCAL_HEADER.unpack(header)
+        method, compressed, name_len, extra_len = fields[3], fields[7], fields[9], fields[10]
+        name = os.pread(self.fd, name_len, LOCAL_HEADER.size).decode("utf-8")
+        prefix, _, leaf = name.partition("/")
+        if leaf == MANIFEST_NAME and method == zipfile.ZIP_STORED:
+            raw = os.pread(self.fd, compressed, LOCAL_HEADER.size + name_len + extra_len)
+            manifest = json.loads(raw)
+            if manifest.get("version") == MANIFEST_VERSION:
+                members = {
+                    relative: Member(relative, *values)
+                    for relative, values in manifest["files"].items()
+                }
+                return manifest["skill"], members, True
+        return self.scan_central_directory()
+
+    def scan_central_directory(self) -> tuple[str, dict[str, Member], bool]:
+        with open(self.path, "rb") as handle:
+            data = handle.read()
+        try:
+            raw = read_members(data)
+        except zipfile.BadZipFile as exc:
+            raise SkillArchiveError(f"{self.path}: {exc}") from exc
+        prefixes = {name.partition("/")[0] for name in raw}
+        prefix = prefixes.pop() if len(prefixes) == 1 else ""
+        members: dict[str, Member] = {}
+        for name, member in raw.items():
+            if name.endswith("/"):
+                continue
+            relative = name.partition("/")[2] if prefix else name
+            members[relative] = Member(relative, member.offset, member.compressed, member.size, member.crc32,
+                                       member.method, member.size // 4)
+        return prefix, members, False
+
+    def scan_directory(self) -> tuple[str, dict[str, Member], bool]:
+        if not (self.path / "SKILL.md").is_file():
+            raise SkillArchiveError(f"{self.path} is a directory without SKILL.md or a .skill archive")
+        members: dict[str, Member] = {}
+        for path in [self.path / "SKILL.md", *sorted((self.path / "references").glob("*.md"))]:
+            relative = path.relative_to(self.path).as_posix()
+            size = path.stat().st_size
+            members[relative] = Member(relative, 0, size, size, 0, zipfile.ZIP_STORED, size // 4)
+        return skill_name(self.path), members, False
+
+    def names(self) -> list[str]:
+        return sorted(self.members)
+
+    def read(self, relative: str) -> bytes:
+        member = self.members.get(relative)
+        if member is None:
+            raise SkillArchiveError(f"{relative} not found in {self.path}")
+        if self.directory is not None:
+            return (self.directory / relative).read_bytes()
+        raw = os.pread(self.fd, member.compressed, member.offset)
+        if member.method == zipfile.ZIP_DEFLATED:
+            data = zlib.decompress(raw, -15)
+        elif member.method == zipfile.ZIP_STORED:
+            data = raw
+        else:
+            raise SkillArchiveError(f"{relative}: unsupported compression method {member.method}")
+        if zlib.crc32(data) != member.crc32:
+            raise SkillArchiveError(f"{relative}: CRC mismatch in {self.path}")
+        return data
+
+    def read_text(self, relative: str) -> str:
+        return self.read(relative).decode("utf-8")
+
+
+def discover_skill_dirs(root: Path) -> list[Path]:
+    return sorted(path.parent for path in root.glob("skills/*/*/SKILL.md"))
+
+
+def time_loads(path: Path, member: str, runs: int) -> tuple[float, float]:
+    indexed: list[float] = []
+    unzipped: list[float] = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        with SkillArchive(path) as archive:
+            archive.read(member)
+        indexed.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        with zipfile.ZipFile(path) as archive:
+            prefix = archive.namelist()[0].partition("/")[0]
+            archive.read(f"{prefix}/{member}")
+        unzipped.append((time.perf_counter() - started) * 1000)
+    return statistics.median(indexed), statistics.median(unzipped)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Build deterministic .skill archives with an offset manifest, and read members by random access",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    pack = sub.add_parser("pack", help="Package skill directories into .skill archives")
+    pack.add_argument("skills", type=Path, nargs="*", help="Skill directories containing SKILL.md (default: every skill in this repo)")
+    pack.add_argument("--output-dir", type=Path, default=ROOT / "dist" / "skills", help="Directory for .skill files (default: dist/skills)")
+
+    listing = sub.add_parser("ls", help="List members with sizes and token counts")
+    listing.add_argument("archive", type=Path, help=".skill archive")
+
+    cat = sub.add_parser("cat", help="Print one member, e.g. SKILL.md or references/01-skill-injection.md")
+    cat.add_argument("archive", type=Path, help=".skill archive")
+    cat.add_argument("member", help="Member path relative to the skill directory")
+
+    bench = sub.add_parser("bench", help="Time opening an archive and reading one member")
+    bench.add_argument("archive", type=Path, help=".skill archive")
+    bench.add_argument("--member", default="SKILL.md", help="Member to read (default: SKILL.md)")
+    bench.add_argument("--runs", type=int, default=200, help="Timed loads (default: 200)")
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == "pack":
+            skill_dirs = args.skills or discover_skill_dirs(ROOT)
+            print(f"\n📦 Packaging {len(skill_dirs)} skills → {args.output_dir}")
+            for skill_dir in skill_dirs:
+                name = skill_name(skill_dir)
+                output = args.output_dir / f"{name}.skill"
+                manifest = pack_skill(skill_dir, output)
+                total = sum(values[5] for values in manifest["files"].values())
+                print(f"   • {output.name:<30} {len(manifest['files']):>3} files  {output.stat().st_size / 1024:7.1f} KiB  ~{total:,} tokens")
+            return
+
+        if not args.archive.exists():
+            print(f"Error: File not found: {args.archive}", file=sys.stderr)
+            sys.exit(1)
+
+        if args.command == "ls":
+            with SkillArchive(args.archive) as archive:
+                if archive.directory is not None:
+                    source = "unpacked directory"
+                else:
+                    source = "manifest" if archive.indexed else "no manifest, read from central directory"
+                print(f"\n📦 {archive.path} — skill {archive.prefix or '?'} ({source})")
+                for name in archive.names():
+                    member = archive.members[name]
+                    zipped = f"{member.compressed:>8,} B zipped" if archive.directory is None else f"{'':>15}"
+                    print(f"   {name:<48} {member.size:>8,} B  {zipped}  ~{member.tokens:,} tokens")
+        elif args.command == "cat":
+            with SkillArchive(args.archive) as archive:
+                sys.stdout.write(archive.read_text(args.member))
+        else:
+            with SkillArchive(args.archive) as archive:
+                if archive.directory is not None:
+                    raise SkillArchiveError(f"{archive.path} is an unpacked directory; bench needs a .skill archive")
+                label = "SkillArchive (manifest)" if archive.indexed else "SkillArchive (no manifest)"
+                path = archive.path
+            indexed, unzipped = time_loads(path, args.member, args.runs)
+            print(f"\n⏱️  Load {args.member} from {path} (median of {args.runs})")
+            print(f"   {label:<28} {indexed:7.3f}ms")
+            print(f"   {'zipfile (central directory)':<28} {unzipped:7.3f}ms")
+    except SkillArchiveError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()